@@ -0,0 +1,13 @@
+"""
+Framework Benchmarks
+
+Measures the test framework itself rather than the application:
+- bench_framework: BasePage / NextJSWaits micro-benchmarks (startup,
+  navigate_to, find_element patterns, snapshot, waits)
+- bench_profiles: startup and per-navigation cost of each Chrome launch profile
+- fixture_site: frozen HTML snapshots of TestData.PAGES on a local server,
+  the pages every suite runs against
+
+Run a suite with `python -m benchmarks.<suite>` from the selenium directory;
+results are written to BENCHMARK_DIR as JSON.
+"""
@@ -0,0 +1,265 @@
+"""
+Framework Benchmark
+
+Micro-benchmarks of the framework's own cost (BasePage, NextJSWaits)
+against the frozen fixture site, so a change can be judged on numbers
+that don't move with the dev server:
+- startup: driver launch (Chrome with a launch profile, or DomDriver) and
+  page object construction
+- navigate: raw driver.get() of the home page, then navigate_to() of
+  every TestData.PAGES route (the difference is the framework's overhead)
+- find: find_element by CSS and XPath, visible / zero-wait presence hits
+  and misses, find_by_testid from a warm index
+- snapshot: one snapshot() of N locators against the N find_element
+  round-trips it replaces; testid_index() build
+- waits: wait_until_settled on a settled page, an explicit wait that is
+  already satisfied, network idle
+
+Every benchmark is the median of BENCHMARK_REPEAT runs after
+BENCHMARK_WARMUP warmup runs. Results record the commit, driver, profile
+and fixture fingerprint; --compare prints the change against an earlier
+results file.
+
+Usage:
+    python -m benchmarks.bench_framework
+    python -m benchmarks.bench_framework --driver dom --groups find,snapshot
+    cp reports/benchmarks/framework.json /tmp/before.json   # then change BasePage ...
+    python -m benchmarks.bench_framework --compare /tmp/before.json
+"""
+
+import argparse
+import sys
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from page_objects.base_page import BasePage
+from utils.chrome_profiles import PROFILES
+from utils.dom_driver import DomDriver
+from utils.locators import testid
+from utils.test_data import TestData
+from utils.waits import NextJSWaits
+
+from .fixture_site import FixtureSite
+from .harness import compare_results, format_results, launch_chrome, measure, quit_driver, write_results
+
+
+GROUPS = ("startup", "navigate", "find", "snapshot", "waits")
+
+# Never rendered by any fixture page
+MISSING = testid("benchmark-missing-element")
+
+
+class FrameworkBench:
+    """Runs the benchmark groups on one driver against a FixtureSite."""
+
+    def __init__(self, site, driver="chrome", profile="fast", repeat=None, warmup=None, snapshot_size=None):
+        """
+        Args:
+            site: Started FixtureSite
+            driver: "chrome" or "dom" (DomDriver)
+            profile: Chrome launch profile
+            repeat: Timed runs per benchmark (default: BENCHMARK_REPEAT)
+            warmup: Warmup runs (default: BENCHMARK_WARMUP)
+            snapshot_size: Locators per snapshot (default: BENCHMARK_SNAPSHOT_SIZE)
+        """
+        self.site = site
+        self.driver_kind = driver
+        self.profile = profile
+        self.repeat = repeat
+        self.warmup = warmup
+        self.snapshot_size = snapshot_size or TestData.BENCHMARK_SNAPSHOT_SIZE
+        self.results = []
+        self.skipped = []  # (benchmark, reason)
+        self.driver = None
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def run(self, groups=GROUPS, pages=None):
+        """
+        Run the benchmark groups (one shared session after startup).
+
+        Args:
+            groups: Names from GROUPS, run in that order
+            pages: {name: path} for navigate (default: the site's pages)
+
+        Returns:
+            List of BenchResult
+        """
+        if "startup" in groups:
+            self.startup()
+        self.driver = self._launch()
+        try:
+            if "navigate" in groups:
+                self.navigate(pages or self.site.pages)
+            for group in ("find", "snapshot", "waits"):
+                if group in groups:
+                    getattr(self, group)()
+        finally:
+            quit_driver(self.driver)
+            self.driver = None
+        return self.results
+
+    def startup(self):
+        """Driver launch until the session answers (quit untimed); page object construction."""
+        self._measure(f"startup [{self._label}]", self._launch, teardown=quit_driver)
+        driver = self._launch()
+        try:
+            self._measure("BasePage()", lambda: BasePage(driver, base_url=self.site.url))
+        finally:
+            quit_driver(driver)
+
+    def navigate(self, pages):
+        """driver.get() of the home page, then navigate_to() of every route."""
+        home = pages.get("home", "/")
+        self._measure(f"driver.get {home}", lambda: self.driver.get(self.site.url + home))
+        page = self._page()
+        for path in pages.values():
+            self._measure(f"navigate_to {path}", lambda: page.navigate_to(path), path=path)
+
+    def find(self):
+        """Element lookup patterns on the home page."""
+        page, testids = self._open_home()
+        if not testids:
+            return
+        present = testid(testids[0])
+        xpath = (By.XPATH, f"//*[@data-testid='{testids[0]}']")
+        page.testid_index()
+
+        self._measure("find_element css", lambda: page.find_element(present))
+        self._measure("find_element xpath", lambda: page.find_element(xpath))
+        self._measure("find_visible_element", lambda: page.find_visible_element(present))
+        self._measure("find_elements [data-testid]", lambda: page.find_elements((By.CSS_SELECTOR, "[data-testid]")))
+        self._measure("find_by_testid (warm index)", lambda: page.find_by_testid(testids[0]))
+        self._measure("is_present hit (zero wait)", lambda: page.is_present(present))
+        self._measure("is_present miss (zero wait)", lambda: page.is_present(MISSING))
+        self._measure("is_absent (zero wait)", lambda: page.is_absent(MISSING))
+        self._measure("find_element miss (timeout=0)", lambda: _missing(page))
+
+    def snapshot(self):
+        """One snapshot() of N locators against N find_element round-trips."""
+        page, testids = self._open_home()
+        if not testids:
+            return
+        locators = {value: testid(value) for value in testids[:self.snapshot_size]}
+        size = len(locators)
+
+        def one_by_one():
+            return [page.find_element(locator, timeout=0).text for locator in locators.values()]
+
+        self._measure(f"snapshot {size} locators", lambda: page.snapshot(locators), locators=size)
+        self._measure(f"snapshot {size} locators (polling)", lambda: page.snapshot(locators, timeout=2),
+                      locators=size)
+        self._measure(f"find_element + .text x{size}", one_by_one, locators=size)
+        self._measure("testid_index build", lambda: page.testid_index(refresh=True))
+
+    def waits(self):
+        """Waits on a page that is already settled."""
+        page, testids = self._open_home()
+        NextJSWaits.wait_until_settled(self.driver, timeout=5)
+        self._measure("wait_until_settled quiet_ms=100",
+                      lambda: NextJSWaits.wait_until_settled(self.driver, timeout=5, quiet_ms=100))
+        self._measure("wait_until_settled quiet_ms=0",
+                      lambda: NextJSWaits.wait_until_settled(self.driver, timeout=5, quiet_ms=0))
+        if testids:
+            self._measure("wait_for_element_visible (satisfied)",
+                          lambda: page.wait_for_element_visible(testid(testids[0])))
+        self._measure("wait_for_network_idle idle_ms=100",
+                      lambda: NextJSWaits.wait_for_network_idle(self.driver, idle_ms=100, timeout=5))
+
+    @property
+    def meta(self):
+        """Run conditions stored with the results."""
+        return {
+            "driver": self.driver_kind,
+            "profile": self.profile if self.driver_kind == "chrome" else None,
+            "fixtures": self.site.fingerprint,
+            "skeleton_pages": sorted(path for path, source in self.site.sources.items() if source == "skeleton"),
+            "perf_collect": TestData.PERF_COLLECT,
+        }
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    @property
+    def _label(self):
+        return self.profile if self.driver_kind == "chrome" else "dom"
+
+    def _launch(self):
+        if self.driver_kind == "dom":
+            return DomDriver()
+        return launch_chrome(self.profile)
+
+    def _page(self):
+        return BasePage(self.driver, base_url=self.site.url, timeout=TestData.EXPLICIT_WAIT)
+
+    def _open_home(self):
+        """Home page loaded and its first data-testids (lookups need present elements)."""
+        page = self._page()
+        page.navigate_to(self.site.pages.get("home", "/"))
+        testids = list(page.testid_index().elements)
+        if not testids:
+            self.skipped.append(("find / snapshot / waits", "home fixture has no data-testid elements"))
+        return page, testids
+
+    def _measure(self, name, run, teardown=None, **params):
+        try:
+            result = measure(name, run, repeat=self.repeat, warmup=self.warmup, teardown=teardown, **params)
+        except WebDriverException as exc:
+            # DomDriver has no JavaScript, XPath or network tracking
+            self.skipped.append((name, (exc.msg or type(exc).__name__).split(";")[0]))
+            return None
+        self.results.append(result)
+        return result
+
+
+def _missing(page):
+    try:
+        page.find_element(MISSING, timeout=0)
+    except TimeoutException:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_framework", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--driver", choices=("chrome", "dom"), default="chrome")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="fast", help="Chrome launch profile")
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"Comma list of: {', '.join(GROUPS)}")
+    parser.add_argument("--repeat", type=int, default=TestData.BENCHMARK_REPEAT)
+    parser.add_argument("--warmup", type=int, default=TestData.BENCHMARK_WARMUP)
+    parser.add_argument("--site-dir", default=TestData.BENCHMARK_SITE_DIR, help="Fixture snapshots")
+    parser.add_argument("--compare", metavar="JSON", help="Earlier framework.json to compare medians with")
+    args = parser.parse_args(argv)
+
+    groups = [group.strip() for group in args.groups.split(",") if group.strip()]
+    unknown = [group for group in groups if group not in GROUPS]
+    if unknown:
+        parser.error(f"unknown group(s): {', '.join(unknown)}")
+
+    with FixtureSite(directory=args.site_dir) as site:
+        bench = FrameworkBench(site, args.driver, args.profile, repeat=args.repeat, warmup=args.warmup)
+        print(f"🌐 Fixture site {site.url} (fingerprint {site.fingerprint})")
+        if bench.meta["skeleton_pages"]:
+            print(f"⚠️  {len(bench.meta['skeleton_pages'])} page(s) without a snapshot use the skeleton page "
+                  f"(python -m benchmarks.fixture_site capture)")
+        results = bench.run(groups)
+
+    for line in format_results(results):
+        print(line)
+    for name, reason in bench.skipped:
+        print(f"  ⏭️  {name}: {reason}")
+    if args.compare:
+        for line in compare_results(args.compare, results, **bench.meta):
+            print(line)
+    print(f"Results: {write_results('framework', results, **bench.meta)}")
+    return 0
+
+
+__all__ = ['FrameworkBench', 'GROUPS', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Launch Profile Benchmark
+
+Cost of each Chrome launch profile (utils.chrome_profiles):
+- startup: webdriver.Chrome() until the session answers (quit untimed)
+- navigation: driver.get() of each TestData.PAGES route, per profile,
+  on one warm session
+
+Pages come from the frozen fixture site (benchmarks.fixture_site) unless
+--base-url points at a running app.
+
+Usage:
+    python -m benchmarks.bench_profiles
+    python -m benchmarks.bench_profiles --profiles fast,perf-measure --repeat 10
+    python -m benchmarks.bench_profiles --base-url http://localhost:9002
+"""
+
+import argparse
+import contextlib
+import sys
+
+from utils.chrome_profiles import PROFILES
+from utils.test_data import TestData
+
+from .fixture_site import FixtureSite
+from .harness import format_results, launch_chrome, measure, quit_driver, write_results
+
+
+def bench_startup(profile, repeat=None, warmup=None):
+    """Seconds to launch a session with this profile."""
+    return measure(f"startup [{profile}]", lambda: launch_chrome(profile), repeat=repeat, warmup=warmup,
+                   teardown=quit_driver, profile=profile)
+
+
+def bench_navigation(profile, base_url=None, paths=None, repeat=None, warmup=None):
+    """Seconds per driver.get() of each route, on one session."""
+    base_url = (base_url or TestData.BASE_URL).rstrip("/")
+    paths = paths or list(TestData.PAGES.values())
+    driver = launch_chrome(profile)
+    try:
+        results = []
+        for path in paths:
+            results.append(measure(f"navigate {path} [{profile}]", lambda: driver.get(base_url + path),
+                                   repeat=repeat, warmup=warmup, profile=profile, path=path))
+        return results
+    finally:
+        quit_driver(driver)
+
+
+def run(profiles=None, base_url=None, paths=None, repeat=None, warmup=None):
+    """Startup and navigation results for every profile."""
+    results = []
+    for profile in profiles or list(PROFILES):
+        results.append(bench_startup(profile, repeat=repeat, warmup=warmup))
+        results.extend(bench_navigation(profile, base_url, paths, repeat=repeat, warmup=warmup))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_profiles", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="Comma list of profile names")
+    parser.add_argument("--base-url", default=None, help="Application URL (default: the fixture site)")
+    parser.add_argument("--paths", default=None, help="Comma list of routes (default: TestData.PAGES)")
+    parser.add_argument("--repeat", type=int, default=TestData.BENCHMARK_REPEAT)
+    parser.add_argument("--warmup", type=int, default=TestData.BENCHMARK_WARMUP)
+    args = parser.parse_args(argv)
+
+    profiles = [name.strip() for name in args.profiles.split(",") if name.strip()]
+    unknown = [name for name in profiles if name not in PROFILES]
+    if unknown:
+        parser.error(f"unknown profile(s): {', '.join(unknown)}")
+    paths = args.paths.split(",") if args.paths else None
+    with contextlib.ExitStack() as stack:
+        base_url, meta = args.base_url, {"base_url": args.base_url}
+        if not base_url:
+            site = stack.enter_context(FixtureSite())
+            base_url, meta = site.url, {"fixtures": site.fingerprint}
+        results = run(profiles, base_url, paths, repeat=args.repeat, warmup=args.warmup)
+    for line in format_results(results):
+        print(line)
+    print(f"Results: {write_results('profiles', results, **meta)}")
+    return 0
+
+
+__all__ = ['bench_startup', 'bench_navigation', 'run', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+Fixture Site
+
+Frozen HTML snapshots of TestData.PAGES served from a local HTTP server,
+so framework benchmarks don't measure the Next.js dev server:
+- capture: fetch each route once (server HTML, or the rendered DOM with
+  --rendered), inline its stylesheets and strip scripts, preloads and
+  prefetches; snapshots land in BENCHMARK_SITE_DIR with a manifest
+- FixtureSite: ThreadingHTTPServer on 127.0.0.1 (random port) answering
+  from memory; routes without a snapshot get a skeleton page carrying
+  every exact data-testid the page objects expect
+- fingerprint: hash of everything served; results are only comparable
+  between runs with the same fingerprint
+
+Usage:
+    python -m benchmarks.fixture_site capture                  # from BASE_URL
+    python -m benchmarks.fixture_site capture --rendered       # hydrated DOM via Chrome
+    python -m benchmarks.fixture_site serve                    # browse the fixtures
+
+    with FixtureSite() as site:
+        driver.get(site.url + "/blog")
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from utils.locators import LOCATORS
+from utils.test_data import TestData
+
+
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>|<script\b[^>]*/>", re.I | re.S)
+NOSCRIPT_TAG = re.compile(r"<noscript\b[^>]*>.*?</noscript\s*>", re.I | re.S)
+LINK_TAG = re.compile(r"<link\b[^>]*>", re.I)
+ATTRIBUTE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+DROPPED_LINKS = {"preload", "modulepreload", "prefetch", "dns-prefetch", "preconnect", "manifest"}
+
+MANIFEST = "manifest.json"
+
+
+def snapshot_file(path):
+    """File name of a route's snapshot ("/" -> index.html, "/ai/chat" -> ai__chat.html)."""
+    name = path.strip("/").replace("/", "__")
+    return f"{name or 'index'}.html"
+
+
+def freeze(page_html, page_url, session=None):
+    """
+    Make a page static: stylesheets inlined, scripts and resource hints removed.
+
+    Args:
+        page_html: Captured HTML
+        page_url: URL it came from (resolves stylesheet hrefs)
+        session: requests.Session for the stylesheets
+
+    Returns:
+        HTML string
+    """
+    session = session or requests.Session()
+    stylesheets = {}
+
+    def link(match):
+        attrs = _attributes(match.group(0))
+        rel = set(attrs.get("rel", "").lower().split())
+        if rel & DROPPED_LINKS:
+            return ""
+        if "stylesheet" not in rel or not attrs.get("href"):
+            return match.group(0)
+        href = urljoin(page_url, html.unescape(attrs["href"]))
+        if href not in stylesheets:
+            try:
+                response = session.get(href, timeout=30)
+                stylesheets[href] = response.text if response.ok else ""
+            except requests.RequestException:
+                stylesheets[href] = ""
+        return f"<style data-href=\"{html.escape(urlsplit(href).path)}\">{stylesheets[href]}</style>"
+
+    page_html = SCRIPT_TAG.sub("", page_html)
+    page_html = NOSCRIPT_TAG.sub("", page_html)
+    return LINK_TAG.sub(link, page_html)
+
+
+def capture(base_url=None, pages=None, directory=None, rendered=False):
+    """
+    Snapshot routes into directory (overwrites earlier snapshots).
+
+    Args:
+        base_url: Application URL (default: TestData.BASE_URL)
+        pages: {name: path} (default: TestData.PAGES)
+        directory: Target (default: BENCHMARK_SITE_DIR)
+        rendered: Take document.documentElement.outerHTML from Chrome after
+                  the page settles instead of the server HTML
+
+    Returns:
+        Manifest dict
+    """
+    base_url = (base_url or TestData.BASE_URL).rstrip("/")
+    pages = pages or TestData.PAGES
+    directory = directory or TestData.BENCHMARK_SITE_DIR
+    os.makedirs(directory, exist_ok=True)
+    session = requests.Session()
+    manifest = {"base_url": base_url, "rendered": rendered,
+                "captured": time.strftime("%Y-%m-%dT%H:%M:%S"), "pages": {}}
+
+    driver = None
+    if rendered:
+        from utils.waits import NextJSWaits
+        from .harness import launch_chrome
+        driver = launch_chrome("fast")
+    try:
+        for name, path in pages.items():
+            url = base_url + path
+            if driver:
+                driver.get(url)
+                NextJSWaits.wait_until_settled(driver, timeout=10)
+                page_html = "<!DOCTYPE html>" + driver.execute_script(
+                    "return document.documentElement.outerHTML;")
+            else:
+                response = session.get(url, timeout=60)
+                response.raise_for_status()
+                page_html = response.text
+            body = freeze(page_html, url, session).encode("utf-8")
+            with open(os.path.join(directory, snapshot_file(path)), "wb") as f:
+                f.write(body)
+            manifest["pages"][path] = {"name": name, "file": snapshot_file(path),
+                                       "bytes": len(body), "sha256": hashlib.sha256(body).hexdigest()}
+            print(f"📸 {path:<16} {len(body):>9,} bytes")
+    finally:
+        if driver:
+            driver.quit()
+
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def skeleton_page(path, testids=None):
+    """Stand-in page for a route without a snapshot: every exact data-testid once."""
+    testids = sorted(LOCATORS.load_page_objects().testids()["exact"]) if testids is None else testids
+    items = "\n".join(f'    <div data-testid="{html.escape(value)}">{html.escape(value)}</div>'
+                      for value in testids)
+    return (f"<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+            f"<title>Fixture {html.escape(path)}</title></head>\n<body>\n"
+            f"  <nav><a href=\"/\">Home</a></nav>\n  <main>\n{items}\n  </main>\n</body></html>\n")
+
+
+class FixtureSite:
+    """Local server for the frozen pages (use as a context manager)."""
+
+    def __init__(self, pages=None, directory=None, host="127.0.0.1", port=0):
+        """
+        Args:
+            pages: {name: path} to serve (default: TestData.PAGES)
+            directory: Snapshot directory (default: BENCHMARK_SITE_DIR)
+            host: Interface to bind
+            port: Port (0 = any free port)
+        """
+        self.pages = pages or TestData.PAGES
+        self.directory = directory or TestData.BENCHMARK_SITE_DIR
+        self.host = host
+        self.port = port
+        self.bodies = {}   # path -> bytes
+        self.sources = {}  # path -> "snapshot" | "skeleton"
+        self._server = None
+        self._thread = None
+        self._load()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def fingerprint(self):
+        """Short hash of every served page (same fingerprint = comparable results)."""
+        digest = hashlib.sha256()
+        for path in sorted(self.bodies):
+            digest.update(path.encode() + b"\0" + self.bodies[path])
+        return digest.hexdigest()[:12]
+
+    def start(self):
+        bodies = self.bodies
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the dev server
+            disable_nagle_algorithm = True  # headers and body are separate writes
+
+            def do_GET(self):
+                path = urlsplit(self.path).path.rstrip("/") or "/"
+                body = bodies.get(path)
+                self.send_response(200 if body is not None else 404)
+                body = body if body is not None else b""
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _load(self):
+        testids = None
+        for path in self.pages.values():
+            file = os.path.join(self.directory, snapshot_file(path))
+            if os.path.exists(file):
+                with open(file, "rb") as f:
+                    self.bodies[path] = f.read()
+                self.sources[path] = "snapshot"
+                continue
+            if testids is None:
+                testids = sorted(LOCATORS.load_page_objects().testids()["exact"])
+            self.bodies[path] = skeleton_page(path, testids).encode("utf-8")
+            self.sources[path] = "skeleton"
+
+
+def _attributes(tag):
+    return {match.group(1).lower(): next(v for v in match.groups()[1:] if v is not None)
+            for match in ATTRIBUTE.finditer(tag)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="fixture_site", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    capture_parser = sub.add_parser("capture", help="Snapshot TestData.PAGES from the app")
+    capture_parser.add_argument("--base-url", default=TestData.BASE_URL)
+    capture_parser.add_argument("--rendered", action="store_true", help="Hydrated DOM via Chrome")
+    serve_parser = sub.add_parser("serve", help="Serve the snapshots until Ctrl+C")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    for command in (capture_parser, serve_parser):
+        command.add_argument("--dir", default=TestData.BENCHMARK_SITE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "capture":
+        manifest = capture(args.base_url, directory=args.dir, rendered=args.rendered)
+        print(f"✅ {len(manifest['pages'])} page(s) in {args.dir}")
+        return 0
+
+    with FixtureSite(directory=args.dir, port=args.port) as site:
+        skeletons = [path for path, source in site.sources.items() if source == "skeleton"]
+        print(f"🌐 {site.url} (fingerprint {site.fingerprint})")
+        if skeletons:
+            print(f"⚠️  No snapshot (skeleton page): {', '.join(skeletons)}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+__all__ = ['FixtureSite', 'capture', 'freeze', 'skeleton_page', 'snapshot_file', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Benchmark Harness
+
+Shared plumbing for the framework's self-benchmarks:
+- measure(): warmup runs, then N timed runs; median, min, max and IQR
+- Results as JSON under BENCHMARK_DIR (one file per suite) so runs can be
+  compared before/after a framework change
+- compare_results(): median change per benchmark against an earlier
+  results file (e.g. one written on the previous commit)
+- launch_chrome(): a Chrome session for a launch profile, built exactly
+  like the test suite's (utils.chrome_profiles + cached driver resolution)
+
+Usage:
+    result = measure("navigate_to /blog", lambda: page.navigate_to("/blog"), repeat=15, warmup=3)
+    write_results("navigation", [result], fixtures="549d2e78f16e")
+    for line in compare_results("baseline.json", [result]):
+        print(line)
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from utils.chrome_profiles import chrome_options
+from utils.driver_resolver import DriverResolver
+from utils.test_data import TestData
+
+
+@dataclass
+class BenchResult:
+    """Timings of one benchmark, in seconds."""
+    name: str
+    samples: list = field(default_factory=list)
+    warmup: int = 0
+    params: dict = field(default_factory=dict)
+
+    @property
+    def median(self):
+        return statistics.median(self.samples) if self.samples else None
+
+    @property
+    def iqr(self):
+        if len(self.samples) < 4:
+            return None
+        quartiles = statistics.quantiles(self.samples, n=4)
+        return quartiles[2] - quartiles[0]
+
+    def to_dict(self):
+        data = asdict(self)
+        data.update(median=self.median, iqr=self.iqr,
+                    min=min(self.samples, default=None), max=max(self.samples, default=None))
+        return data
+
+
+def measure(name, run, repeat=None, warmup=None, setup=None, teardown=None, **params):
+    """
+    Time run() repeat times after warmup untimed runs.
+
+    Args:
+        name: Benchmark name
+        run: Callable to time (its return value is passed to teardown)
+        repeat: Timed runs (default: BENCHMARK_REPEAT)
+        warmup: Untimed runs first (default: BENCHMARK_WARMUP)
+        setup: Callable before each run, outside the timing
+        teardown: Callable(result of run) after each run, outside the timing
+        params: Extra labels stored with the result
+
+    Returns:
+        BenchResult
+    """
+    repeat = TestData.BENCHMARK_REPEAT if repeat is None else repeat
+    warmup = TestData.BENCHMARK_WARMUP if warmup is None else warmup
+    result = BenchResult(name, warmup=warmup, params=params)
+    for index in range(warmup + repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        value = run()
+        elapsed = time.perf_counter() - started
+        if teardown:
+            teardown(value)
+        if index >= warmup:
+            result.samples.append(elapsed)
+    return result
+
+
+def write_results(suite, results, directory=None, **meta):
+    """
+    Write a suite's results to BENCHMARK_DIR/<suite>.json.
+
+    Args:
+        suite: Suite name (file name)
+        results: BenchResults
+        directory: Output directory (default: BENCHMARK_DIR)
+        meta: Run conditions stored alongside (driver, profile, fixtures ...)
+
+    Returns:
+        Path written
+    """
+    directory = directory or TestData.BENCHMARK_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{suite}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "suite": suite,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_revision(),
+            "machine": {"python": platform.python_version(), "platform": platform.platform()},
+            "meta": meta,
+            "results": [result.to_dict() for result in results],
+        }, f, indent=2)
+    return path
+
+
+def compare_results(baseline_path, results, **meta):
+    """
+    Median change of each benchmark against an earlier results file.
+
+    Args:
+        baseline_path: JSON written by write_results()
+        results: Current BenchResults
+        meta: Current run conditions; differences from the baseline's are
+              reported first (numbers from other fixtures or drivers don't compare)
+
+    Returns:
+        Report lines
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    lines = [f"vs {baseline_path} ({baseline.get('commit') or '?'}, {baseline.get('time', '?')})"]
+    for key, value in meta.items():
+        before = baseline.get("meta", {}).get(key)
+        if before is not None and before != value:
+            lines.append(f"  ⚠️  {key} differs: {before} -> {value}")
+    medians = {entry["name"]: entry.get("median") for entry in baseline.get("results", [])}
+    for result in results:
+        before = medians.get(result.name)
+        if not before or result.median is None:
+            lines.append(f"  {result.name:<44} {'(new)' if before is None else '(no samples)'}")
+            continue
+        change = (result.median - before) / before * 100
+        lines.append(f"  {result.name:<44} {before * 1000:9.2f}ms -> {result.median * 1000:9.2f}ms  {change:+6.1f}%")
+    return lines
+
+
+def format_results(results):
+    """One line per benchmark: median, IQR, min-max."""
+    lines = []
+    for result in results:
+        if not result.samples:
+            lines.append(f"  {result.name:<44} (no samples)")
+            continue
+        iqr = f"±{result.iqr * 1000:.1f}" if result.iqr is not None else "     "
+        lines.append(f"  {result.name:<44} {result.median * 1000:9.2f}ms {iqr:>8}  "
+                     f"[{min(result.samples) * 1000:.2f} - {max(result.samples) * 1000:.2f}]  n={len(result.samples)}")
+    return lines
+
+
+_RESOLVER = DriverResolver()
+
+
+def launch_chrome(profile=None, headless=None):
+    """Start Chrome with a launch profile (the caller quits it)."""
+    resolution = _RESOLVER.resolve("chrome")
+    driver = webdriver.Chrome(service=ChromeService(executable_path=resolution.path),
+                              options=chrome_options(profile, headless=headless))
+    driver.implicitly_wait(0)
+    return driver
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+__all__ = ['BenchResult', 'measure', 'write_results', 'compare_results', 'format_results',
+           'launch_chrome', 'quit_driver']
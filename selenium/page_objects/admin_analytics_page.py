@@ -17,18 +17,23 @@ class AdminAnalyticsPage(BasePage):
     DELETE_CONFIRM = (By.CSS_SELECTOR, "[data-testid='admin-analytics-delete-confirm']")
     DELETE_ACTION = (By.CSS_SELECTOR, "[data-testid='admin-analytics-delete-action']")
 
+    # Every keystroke in the token field reloads stats from /api/analytics
+    ANALYTICS_REQUEST = "/api/analytics"
+
     def __init__(self, driver, base_url=None, timeout=15):
         super().__init__(driver, base_url=base_url or self.base_url, timeout=timeout)
 
     def load(self):
         self.navigate_to("/admin/analytics")
         self.wait_for_page_load()
+        # Public stats are fetched on mount
+        self.wait_for_network_idle(idle_ms=100, url_filter=self.ANALYTICS_REQUEST)
 
     def authenticate(self, token: str):
         try:
             self.fill_text(self.AUTH_INPUT, token)
             # authentication triggers loadStats
-            self.wait_for_page_load()
+            self.wait_for_network_idle(idle_ms=100, url_filter=self.ANALYTICS_REQUEST)
         except Exception:
             pass
 
@@ -1,6 +1,6 @@
 from selenium.webdriver.common.by import By
 from page_objects.base_page import BasePage
-import re
+from utils.locators import DynamicTestId
 
 
 class AdminMessagesPage(BasePage):
@@ -18,6 +18,7 @@ class AdminMessagesPage(BasePage):
     LIST = (By.CSS_SELECTOR, "[data-testid='admin-messages-list']")
     EMPTY = (By.CSS_SELECTOR, "[data-testid='admin-messages-empty']")
     DETAIL = (By.CSS_SELECTOR, "[data-testid='admin-message-detail']")
+    MESSAGE = DynamicTestId("admin-message-{}")
 
     def __init__(self, driver, base_url=None, timeout=15):
         super().__init__(driver, base_url=base_url or self.base_url, timeout=timeout)
@@ -25,6 +26,8 @@ class AdminMessagesPage(BasePage):
     def load(self):
         self.navigate_to("/admin/messages")
         self.wait_for_page_load()
+        # Messages are fetched from /api/contact on mount
+        self.wait_for_network_idle(idle_ms=100, url_filter="/api/contact")
         # Wait for the page container to be loaded with extended timeout
         try:
             self.wait_for_element(self.PAGE, timeout=15)
@@ -33,37 +36,24 @@ class AdminMessagesPage(BasePage):
             self.wait_for_element(self.TITLE, timeout=15)
 
     def is_loaded(self):
-        # Check both page container and title visible
+        # Check both page container and title visible (one round-trip)
         try:
-            page_visible = self.is_element_displayed(self.PAGE)
-            title_visible = self.is_element_displayed(self.TITLE)
-            return page_visible and title_visible
+            snap = self.snapshot({"page": self.PAGE, "title": self.TITLE}, timeout=2, visible=True)
+            return snap.all_visible()
         except Exception:
             return False
 
     def get_counts(self):
-        total = 0
-        unread = 0
-        read = 0
-        try:
-            total_el = self.find_element(self.TOTAL, timeout=2)
-            total = int(total_el.text.strip())
-        except Exception:
-            pass
-
-        try:
-            unread_el = self.find_element(self.UNREAD, timeout=2)
-            unread = int(unread_el.text.strip())
-        except Exception:
-            pass
-
-        try:
-            read_el = self.find_element(self.READ, timeout=2)
-            read = int(read_el.text.strip())
-        except Exception:
-            pass
-
-        return {"total": total, "unread": unread, "read": read}
+        snap = self.snapshot(
+            {"total": self.TOTAL, "unread": self.UNREAD, "read": self.READ}, timeout=2
+        )
+        counts = {}
+        for name in ("total", "unread", "read"):
+            try:
+                counts[name] = int(snap[name].text.strip())
+            except ValueError:
+                counts[name] = 0
+        return counts
 
     def click_export(self):
         if self.is_element_displayed(self.EXPORT):
@@ -78,6 +68,5 @@ class AdminMessagesPage(BasePage):
             return []
 
     def select_message(self, message_id):
-        locator = (By.CSS_SELECTOR, f"[data-testid='admin-message-{message_id}']")
-        self.click(locator)
+        self.click(self.MESSAGE(message_id))
         self.wait_for_element_visible(self.DETAIL)
@@ -4,25 +4,78 @@ Base Page Object Model Class
 Provides common functionality for all page objects:
 - Driver management
 - Smart wait conditions
+- Performance metrics per navigation (PerfCollector)
+- Batched DOM snapshots (one round-trip for many locators)
+- Locator registry (class locators validated at import) and a one-pass
+  data-testid index
 - Element interaction methods
 - Screenshot capability
 - Error handling
 
 All page objects should inherit from BasePage.
 """
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from utils.waits import NextJSWaits
+from utils.dom_snapshot import SNAPSHOT_SCRIPT, PageSnapshot, script_args
+from utils.locators import LOCATORS, TESTID_INDEX_SCRIPT, TestIdIndex, testid
+from utils.test_data import TestData
+from utils.artifacts import artifact_path
+from utils.perf import PerfCollector
+from utils.network import NetworkTracker
+import sys
 import time
 import os
-from datetime import datetime
+
+
+class SlowLookups:
+    """
+    Negative element lookups (element never showed up) that took longer
+    than TestData.SLOW_LOOKUP_THRESHOLD. Reset and reported per test by conftest.
+    """
+
+    entries = []
+
+    @classmethod
+    def record(cls, locator, seconds, timeout):
+        """Record a failed lookup if it was slow."""
+        if seconds < TestData.SLOW_LOOKUP_THRESHOLD:
+            return
+        cls.entries.append({
+            "locator": f"{locator[0]}={locator[1]}" if isinstance(locator, tuple) else str(locator),
+            "seconds": round(seconds, 3),
+            "timeout": timeout,
+            "caller": cls._caller(),
+        })
+
+    @classmethod
+    def reset(cls):
+        """Forget recorded lookups (start of a test)."""
+        cls.entries = []
+
+    @staticmethod
+    def _caller():
+        """Name of the first page-object or test function outside base_page.py."""
+        frame = sys._getframe(2)
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        return frame.f_code.co_name if frame else "?"
 
 
 class BasePage:
     """Base class for all page objects."""
 
+    # Explicit waits poll this often (WebDriverWait's default is 0.5s)
+    POLL_FREQUENCY = 0.1
+
+    def __init_subclass__(cls, **kwargs):
+        """Validate and register the subclass's locators (a bad selector fails the import)."""
+        super().__init_subclass__(**kwargs)
+        LOCATORS.register_class(cls)
+
     def __init__(self, driver, base_url="http://localhost:9002", timeout=15):
         """
         Initialize page object.
@@ -37,16 +90,51 @@ class BasePage:
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
         self.actions = ActionChains(driver)
+        self.perf = PerfCollector(driver)
+        self.last_perf = None  # metrics of the last measured navigation
+        self._testid_index = None  # TestIdIndex of the current page state
 
     # ============================================================================
     # NAVIGATION METHODS
     # ============================================================================
 
     def navigate_to(self, path):
-        """Navigate to a specific path on the site."""
+        """
+        Navigate to a specific path on the site.
+        With TestData.PERF_COLLECT on, every navigation is also measured.
+        """
         url = f"{self.base_url}{path}"
+        collect = TestData.PERF_COLLECT and not getattr(self.driver, "dom_only", False)
+        if collect:
+            self.perf.install()  # once per session; observers must exist before the page loads
+        NextJSWaits.install_settle_shim(self.driver)
+        self._testid_index = None
         self.driver.get(url)
-        time.sleep(0.5)  # Small buffer for initial render
+        self.wait_until_settled(timeout=0.5)  # Small buffer for initial render
+        if collect:
+            self.last_perf = self.perf.collect(path)
+            self.perf.write_report(self.last_perf)
+
+    def measure_navigation(self, path, settle_timeout=5):
+        """
+        Navigate to a path and collect its performance metrics.
+        Waits for the page to settle first so LCP and CLS are final.
+        
+        Args:
+            path: Route to load (e.g. "/blog")
+            settle_timeout: Maximum settle wait before harvesting
+            
+        Returns:
+            Metrics dict (see PerfCollector); also written as the route's JSON report
+        """
+        self.perf.install()
+        NextJSWaits.install_settle_shim(self.driver)
+        self._testid_index = None
+        self.driver.get(f"{self.base_url}{path}")
+        self.wait_until_settled(timeout=settle_timeout)
+        self.last_perf = self.perf.collect(path)
+        self.perf.write_report(self.last_perf)
+        return self.last_perf
 
     def navigate_to_home(self):
         """Navigate to home page."""
@@ -65,14 +153,15 @@ class BasePage:
             expected_path: Expected path (e.g., "/blog", "/projects")
             timeout: Wait timeout in seconds (default: self.timeout)
         """
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
+        timeout = self.timeout if timeout is None else timeout
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY)
         wait.until(lambda d: expected_path in d.current_url)
 
     def refresh_page(self):
         """Refresh the current page."""
+        self._testid_index = None
         self.driver.refresh()
-        time.sleep(0.5)
+        self.wait_until_settled(timeout=0.5)
 
     # ============================================================================
     # ELEMENT FINDING METHODS
@@ -89,9 +178,7 @@ class BasePage:
         Returns:
             WebElement
         """
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self._until(EC.presence_of_element_located(locator), locator, timeout)
 
     def find_elements(self, locator, timeout=None):
         """
@@ -104,10 +191,7 @@ class BasePage:
         Returns:
             List of WebElements
         """
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until(EC.presence_of_all_elements_located(locator))
-        return self.driver.find_elements(*locator)
+        return self._until(EC.presence_of_all_elements_located(locator), locator, timeout)
 
     def find_clickable_element(self, locator, timeout=None):
         """
@@ -121,9 +205,7 @@ class BasePage:
         Returns:
             WebElement (clickable)
         """
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self._until(EC.element_to_be_clickable(locator), locator, timeout)
 
     def find_visible_element(self, locator, timeout=None):
         """
@@ -136,9 +218,142 @@ class BasePage:
         Returns:
             WebElement (visible)
         """
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self._until(EC.visibility_of_element_located(locator), locator, timeout)
+
+    def is_present(self, locator, timeout=0):
+        """
+        Check if element is in the DOM.
+        
+        Args:
+            locator: Tuple of (By.X, "selector")
+            timeout: Seconds to wait for it (0 = single zero-wait probe)
+            
+        Returns:
+            bool
+        """
+        if timeout == 0:
+            return len(self.driver.find_elements(*locator)) > 0
+        try:
+            self.find_element(locator, timeout=timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def is_absent(self, locator, timeout=0):
+        """
+        Check if element is NOT in the DOM.
+        
+        Args:
+            locator: Tuple of (By.X, "selector")
+            timeout: Seconds to wait for it to go away (0 = single zero-wait probe)
+            
+        Returns:
+            bool
+        """
+        if timeout == 0:
+            return len(self.driver.find_elements(*locator)) == 0
+        try:
+            self._until(lambda d: len(d.find_elements(*locator)) == 0, locator, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def _until(self, condition, locator, timeout=None):
+        """
+        Run an explicit wait; the only place BasePage waits for elements.
+        Negative results that cost more than the slow-lookup threshold
+        are recorded in SlowLookups. timeout=0 checks the condition once
+        (WebDriverWait would still sleep a full poll interval on a miss).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if timeout == 0:
+            try:
+                value = condition(self.driver)
+            except NoSuchElementException:
+                value = None
+            if value:
+                return value
+            raise TimeoutException(f"{locator} not satisfied (zero wait)")
+        started = time.monotonic()
+        try:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY)
+            return wait.until(condition)
+        except TimeoutException:
+            SlowLookups.record(locator, time.monotonic() - started, timeout)
+            raise
+
+    # ============================================================================
+    # BATCHED QUERIES
+    # ============================================================================
+
+    def snapshot(self, locators, timeout=0, visible=False, require=None):
+        """
+        Read presence, visibility, text, attributes and rect of many
+        locators in one execute_script round-trip.
+
+        Args:
+            locators: Dict of {name: (By.X, "selector")}
+            timeout: Seconds to re-poll until the locators are present
+                     (0 = single zero-wait snapshot)
+            visible: When polling, also require the locators to be visible
+            require: Names that must be satisfied when polling (default: all);
+                     the rest are read as-is, e.g. "should be absent" checks
+
+        Returns:
+            PageSnapshot (snap["name"].present / .visible / .text / .count ...)
+        """
+        specs, max_texts = script_args(locators)
+
+        def take(driver):
+            return PageSnapshot.from_script_result(
+                locators, driver.execute_script(SNAPSHOT_SCRIPT, specs, max_texts)
+            )
+
+        if timeout == 0:
+            return take(self.driver)
+
+        last = [None]
+
+        def complete(driver):
+            last[0] = take(driver)
+            missing = last[0].missing(visible=visible)
+            if require is not None:
+                missing = [name for name in missing if name in require]
+            return last[0] if not missing else False
+
+        try:
+            return self._until(complete, ("snapshot", ", ".join(locators)), timeout)
+        except TimeoutException:
+            return last[0] if last[0] is not None else take(self.driver)
+
+    def testid_index(self, refresh=False):
+        """
+        Every [data-testid] element of the page, from one execute_script.
+        Cached until the next navigation or interaction through this page
+        object; pass refresh=True after changing the page any other way.
+        
+        Returns:
+            TestIdIndex (first element per testid)
+        """
+        if self._testid_index is None or refresh:
+            self._testid_index = TestIdIndex(self.driver.execute_script(TESTID_INDEX_SCRIPT))
+        return self._testid_index
+
+    def find_by_testid(self, value, timeout=None):
+        """
+        Element with a data-testid: from the index when present, otherwise
+        an explicit wait (the element may not have rendered yet).
+        
+        Args:
+            value: Concrete testid (e.g. BlogPage.POST_CARD.id(3))
+            timeout: Wait timeout when the index doesn't have it
+        """
+        element = self.testid_index().get(value)
+        if element is not None:
+            return element
+        element = self.find_element(testid(value), timeout)
+        self._testid_index = None  # the page changed since the index was built
+        return element
 
     # ============================================================================
     # ELEMENT INTERACTION METHODS
@@ -147,16 +362,19 @@ class BasePage:
     def click(self, locator):
         """Click an element."""
         element = self.find_clickable_element(locator)
+        self._testid_index = None
         element.click()
 
     def submit_form(self, locator):
         """Submit a form."""
         element = self.find_element(locator)
+        self._testid_index = None
         element.submit()
 
     def fill_text(self, locator, text):
         """Fill a text input field."""
         element = self.find_clickable_element(locator)
+        self._testid_index = None
         element.clear()
         element.send_keys(text)
 
@@ -170,12 +388,15 @@ class BasePage:
         element = self.find_element(locator)
         return element.get_attribute(attribute)
 
-    def is_element_displayed(self, locator):
-        """Check if element is displayed."""
+    def is_element_displayed(self, locator, timeout=2):
+        """
+        Check if element is displayed.
+        A missing element costs up to `timeout`; use is_absent() for fast negatives.
+        """
         try:
-            element = self.find_element(locator, timeout=2)
+            element = self.find_element(locator, timeout=timeout)
             return element.is_displayed()
-        except:
+        except (TimeoutException, StaleElementReferenceException):
             return False
 
     def is_element_enabled(self, locator):
@@ -187,7 +408,7 @@ class BasePage:
         """Hover over an element."""
         element = self.find_element(locator)
         self.actions.move_to_element(element).perform()
-        time.sleep(0.3)  # Small wait for hover state to render
+        self.wait_until_settled(timeout=0.3)  # Small wait for hover state to render
 
     def double_click(self, locator):
         """Double-click an element."""
@@ -203,7 +424,7 @@ class BasePage:
         """Scroll to element and make it visible."""
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        self.wait_until_settled(timeout=0.5)
 
     def scroll_to_top(self):
         """Scroll to top of page."""
@@ -235,15 +456,11 @@ class BasePage:
 
     def wait_for_text(self, locator, text, timeout=None):
         """Wait for element to contain specific text."""
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until(EC.text_to_be_present_in_element(locator, text))
+        self._until(EC.text_to_be_present_in_element(locator, text), locator, timeout)
 
     def wait_for_element_to_disappear(self, locator, timeout=None):
         """Wait for element to disappear from DOM."""
-        timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until(EC.invisibility_of_element_located(locator))
+        self._until(EC.invisibility_of_element_located(locator), locator, timeout)
 
     def wait_for_animation_complete(self, locator, timeout=1):
         """
@@ -305,18 +522,16 @@ class BasePage:
         Take screenshot of current page.
         
         Args:
-            filename: Optional custom filename (default: auto-generated timestamp)
+            filename: Optional custom filename (default: auto-generated unique name)
             
         Returns:
-            Path to screenshot file
+            Path to screenshot file (inside this xdist worker's directory)
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-        
-        # Create screenshots directory if it doesn't exist
-        os.makedirs("screenshots", exist_ok=True)
-        filepath = f"screenshots/{filename}"
+            filepath = artifact_path("screenshot")
+        else:
+            name, suffix = os.path.splitext(filename)
+            filepath = artifact_path(name, suffix=suffix or ".png", unique=False)
         
         self.driver.save_screenshot(filepath)
         return filepath
@@ -460,8 +675,54 @@ class BasePage:
         time.sleep(seconds)
 
     def wait_for_framer_animation(self, duration=0.8):
-        """Wait for Framer Motion animation (default 0.8s)."""
-        time.sleep(duration)
+        """Wait for Framer Motion animation (default 0.8s upper bound)."""
+        self.wait_until_settled(timeout=duration)
+
+    def wait_until_settled(self, timeout=None, quiet_ms=100):
+        """
+        Wait until the page is quiet (network, animations, DOM, fonts).
+        Returns as soon as it is; timeout is only an upper bound.
+        
+        Args:
+            timeout: Maximum wait in seconds (default: self.timeout)
+            quiet_ms: Required mutation-free window in milliseconds
+            
+        Returns:
+            bool: True if the page settled before the timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return NextJSWaits.wait_until_settled(self.driver, timeout=timeout, quiet_ms=quiet_ms)
+
+    @property
+    def network(self):
+        """NetworkTracker of this driver (in-flight fetch/XHR)."""
+        return NetworkTracker.for_driver(self.driver)
+
+    def wait_for_network_idle(self, idle_ms=500, url_filter=None, timeout=None):
+        """
+        Wait until no (matching) request has been in flight for idle_ms.
+        
+        Args:
+            idle_ms: Required quiet window in milliseconds
+            url_filter: Only count these requests (e.g. "/api/")
+            timeout: Maximum wait in seconds (default: self.timeout)
+            
+        Returns:
+            bool: True if the network went idle
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return self.network.wait_for_network_idle(idle_ms=idle_ms, url_filter=url_filter, timeout=timeout)
+
+    def wait_for_response(self, url_pattern, timeout=None, method=None):
+        """
+        Wait for a request matching url_pattern to complete since the last
+        self.network.mark() (call it before the triggering action).
+        
+        Returns:
+            Response dict: {url, method, status, duration}
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return self.network.wait_for_response(url_pattern, timeout=timeout, method=method)
 
     def wait_for_page_load(self):
         """Wait for page to load (document.readyState = complete)."""
@@ -19,6 +19,7 @@ Test coverage:
 
 from selenium.webdriver.common.by import By
 from page_objects.base_page import BasePage
+from utils.locators import DynamicTestId
 
 
 class BlogPage(BasePage):
@@ -44,6 +45,13 @@ class BlogPage(BasePage):
     BLOG_POST_EXCERPTS = (By.CSS_SELECTOR, "[data-testid^='blog-post-excerpt-']")
     BLOG_POST_DATES = (By.CSS_SELECTOR, "[data-testid^='blog-post-date-']")
 
+    # Per-post / per-tag test ids
+    BLOG_POST_CARD = DynamicTestId("blog-post-card-{}")
+    BLOG_POST_TITLE = DynamicTestId("blog-post-title-{}")
+    BLOG_POST_EXCERPT = DynamicTestId("blog-post-excerpt-{}")
+    BLOG_POST_DATE = DynamicTestId("blog-post-date-{}")
+    BLOG_FILTER_TAG_ITEM = DynamicTestId("blog-filter-tag-{}")
+
     # ============================================================================
     # PAGE LOAD & VERIFICATION
     # ============================================================================
@@ -62,7 +70,7 @@ class BlogPage(BasePage):
 
     def get_blog_title_text(self):
         """Get blog page title text."""
-        return self.get_element_text(self.BLOG_TITLE)
+        return self.get_text(self.BLOG_TITLE)
 
     # ============================================================================
     # BLOG POST INTERACTIONS
@@ -75,23 +83,19 @@ class BlogPage(BasePage):
 
     def get_blog_post_title(self, index):
         """Get title of blog post at given index."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='blog-post-title-{index}']")
-        return self.get_element_text(locator)
+        return self.find_by_testid(self.BLOG_POST_TITLE.id(index)).text
 
     def get_blog_post_excerpt(self, index):
         """Get excerpt/summary of blog post at given index."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='blog-post-excerpt-{index}']")
-        return self.get_element_text(locator)
+        return self.find_by_testid(self.BLOG_POST_EXCERPT.id(index)).text
 
     def get_blog_post_date(self, index):
         """Get publication date of blog post at given index."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='blog-post-date-{index}']")
-        return self.get_element_text(locator)
+        return self.find_by_testid(self.BLOG_POST_DATE.id(index)).text
 
     def click_blog_post(self, index):
         """Click on blog post at given index to open it."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='blog-post-card-{index}']")
-        self.click_element(locator)
+        self.click(self.BLOG_POST_CARD(index))
 
     # ============================================================================
     # FILTER INTERACTIONS
@@ -104,8 +108,7 @@ class BlogPage(BasePage):
 
     def click_filter_tag(self, tag_name):
         """Click on a specific tag filter."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='blog-filter-tag-{tag_name}']")
-        self.click_element(locator)
+        self.click(self.BLOG_FILTER_TAG_ITEM(tag_name))
 
     def is_filter_clear_button_visible(self):
         """Check if clear filter button is visible."""
@@ -116,7 +119,7 @@ class BlogPage(BasePage):
 
     def click_filter_clear(self):
         """Click clear filter button."""
-        self.click_element(self.BLOG_FILTER_CLEAR)
+        self.click(self.BLOG_FILTER_CLEAR)
 
     # ============================================================================
     # ASSERTIONS (for test use)
@@ -133,7 +136,7 @@ class BlogPage(BasePage):
         assert count > 0, f"Expected blog posts to be visible, found {count}"
 
     def verify_blog_post_has_metadata(self, index):
-        """Assert blog post has title, excerpt, and date."""
+        """Assert blog post has title, excerpt, and date (one DOM pass for all three)."""
         title = self.get_blog_post_title(index)
         excerpt = self.get_blog_post_excerpt(index)
         date = self.get_blog_post_date(index)
@@ -159,10 +162,9 @@ class BlogPage(BasePage):
 
     def verify_post_links_accessible(self):
         """Verify all blog post cards are clickable links."""
-        count = self.get_blog_post_count()
-        for i in range(min(3, count)):  # Check first 3 posts
-            card = self.find_element((By.CSS_SELECTOR, f"[data-testid='blog-post-card-{i}']"))
-            assert card, f"Blog post card {i} not found"
+        self.wait_for_element(self.BLOG_POST_CARDS)
+        cards = self.testid_index(refresh=True).matching(self.BLOG_POST_CARD)
+        for i, (_, card) in enumerate(cards[:3]):  # Check first 3 posts
             # Verify it's a link or clickable
             parent = card.find_element(By.XPATH, "./parent::*")
             assert parent.tag_name in ['a', 'button', 'div'], f"Post {i} not in clickable container"
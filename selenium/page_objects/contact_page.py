@@ -1,5 +1,8 @@
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
+from utils.locators import DynamicTestId
 
 
 class ContactPage(BasePage):
@@ -18,10 +21,13 @@ class ContactPage(BasePage):
     CONTACT_INPUT_SUBJECT = (By.CSS_SELECTOR, "[data-testid='contact-input-subject']")
     CONTACT_INPUT_MESSAGE = (By.CSS_SELECTOR, "[data-testid='contact-input-message']")
     CONTACT_SUBMIT_BUTTON = (By.CSS_SELECTOR, "[data-testid='contact-submit-button']")
+    # Screen-reader live region: "Message sent successfully! ..." / "Error: ..."
+    CONTACT_STATUS = (By.CSS_SELECTOR, "[data-testid='contact-form'] [role='status']")
     CONTACT_METHOD_EMAIL = (By.CSS_SELECTOR, "[data-testid='contact-method-email']")
     CONTACT_METHOD_GITHUB = (By.CSS_SELECTOR, "[data-testid='contact-method-github']")
     CONTACT_METHOD_LINKEDIN = (By.CSS_SELECTOR, "[data-testid='contact-method-linkedin']")
     CONTACT_METHOD_TWITTER = (By.CSS_SELECTOR, "[data-testid='contact-method-twitter/x']")
+    CONTACT_METHOD = DynamicTestId("contact-method-{}")
     
     def load_page(self):
         """Load the Contact page."""
@@ -98,7 +104,7 @@ class ContactPage(BasePage):
             subject = self.find_element(self.CONTACT_INPUT_SUBJECT).get_attribute('value')
             message = self.find_element(self.CONTACT_INPUT_MESSAGE).get_attribute('value')
             return {'name': name, 'email': email, 'subject': subject, 'message': message}
-        except:
+        except TimeoutException:
             return None
     
     def submit_form(self):
@@ -109,6 +115,24 @@ class ContactPage(BasePage):
             return True
         return False
     
+    def submit_form_and_wait_for_response(self, timeout=10):
+        """
+        Submit the contact form and wait for the POST /api/contact it sends.
+        
+        Returns:
+            Response dict: {url, method, status, duration}
+        """
+        self.network.mark()
+        self.submit_form()
+        return self.wait_for_response("/api/contact", timeout=timeout, method="POST")
+    
+    def wait_for_status(self, text, timeout=None):
+        """Wait for the form's live status region to contain text (it is visually hidden)."""
+        self._until(
+            EC.text_to_be_present_in_element_attribute(self.CONTACT_STATUS, "textContent", text),
+            self.CONTACT_STATUS, timeout,
+        )
+    
     def is_submit_button_visible(self):
         """Check if submit button is visible."""
         return self.is_element_displayed(self.CONTACT_SUBMIT_BUTTON)
@@ -120,21 +144,14 @@ class ContactPage(BasePage):
     
     def get_contact_method(self, method_name):
         """Get a contact method element by name (email, github, linkedin, twitter/x)."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='contact-method-{method_name}']")
-        element = self.find_element(locator, timeout=2)
+        element = self.find_element(self.CONTACT_METHOD(method_name), timeout=2)
         return element
     
     def get_available_contact_methods(self):
         """Get list of available contact methods."""
         methods = ['email', 'github', 'linkedin', 'twitter/x']
-        available = []
-        for method in methods:
-            try:
-                self.get_contact_method(method)
-                available.append(method)
-            except:
-                pass
-        return available
+        # Zero-wait probes: the methods render with the page, so a miss is final
+        return [method for method in methods if self.is_present(self.CONTACT_METHOD(method))]
     
     def click_contact_method(self, method_name):
         """Click on a contact method."""
@@ -11,7 +11,6 @@ Usage:
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from .base_page import BasePage
 
 
@@ -78,9 +77,14 @@ class HomePage(BasePage):
 
     def verify_page_loaded(self):
         """Verify home page loaded correctly."""
-        self.assert_element_visible(self.HERO_SECTION)
-        self.assert_element_visible(self.HERO_TITLE)
-        self.assert_element_text(self.HERO_TITLE, "Engineer Dev Mahn X")
+        snap = self.snapshot(
+            {"hero": self.HERO_SECTION, "title": self.HERO_TITLE},
+            timeout=self.timeout, visible=True,
+        )
+        assert snap["hero"].visible, f"Element not visible: {self.HERO_SECTION}"
+        assert snap["title"].visible, f"Element not visible: {self.HERO_TITLE}"
+        title = snap["title"].text
+        assert "Engineer Dev Mahn X" in title, f"Expected 'Engineer Dev Mahn X' in '{title}'"
 
     def verify_page_title(self):
         """Verify page title is correct."""
@@ -324,8 +328,8 @@ class HomePage(BasePage):
 
     def verify_h1_unique(self):
         """Verify page has only one H1 heading."""
-        h1_elements = self.find_elements((By.TAG_NAME, "h1"))
-        assert len(h1_elements) == 1, f"Expected 1 H1, found {len(h1_elements)}"
+        count = self.snapshot({"h1": (By.TAG_NAME, "h1")}, timeout=self.timeout)["h1"].count
+        assert count == 1, f"Expected 1 H1, found {count}"
 
     def verify_page_accessible(self):
         """Verify basic accessibility (heading hierarchy, etc)."""
@@ -1,4 +1,5 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
 
 
@@ -16,6 +17,8 @@ class OpenSourcePage(BasePage):
     OPENSOURCE_PHILOSOPHY_CONTENT = (By.CSS_SELECTOR, "[data-testid='opensource-philosophy-content']")
     OPENSOURCE_PHILOSOPHY_STATEMENT = (By.CSS_SELECTOR, "[data-testid='opensource-philosophy-statement']")
     OPENSOURCE_PHILOSOPHY_VALUES = (By.CSS_SELECTOR, "[data-testid='opensource-philosophy-values']")
+    PROJECT_CARDS = (By.CSS_SELECTOR, "[data-testid='opensource-projects-grid'] [data-testid^='opensource-project-']")
+    PHILOSOPHY_VALUE_BADGES = (By.CSS_SELECTOR, "[data-testid='opensource-philosophy-values'] [data-testid^='opensource-value-']")
     
     def load_page(self):
         """Load the Open Source page."""
@@ -49,12 +52,9 @@ class OpenSourcePage(BasePage):
         """Get count of open source projects displayed."""
         try:
             grid = self.find_element(self.OPENSOURCE_PROJECTS_GRID, timeout=2)
-            if grid:
-                projects = grid.find_elements(By.CSS_SELECTOR, "[data-testid^='opensource-project-']")
-                return len(projects)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        return len(grid.find_elements(By.CSS_SELECTOR, "[data-testid^='opensource-project-']"))
     
     def is_philosophy_section_visible(self):
         """Check if philosophy section is visible."""
@@ -69,38 +69,46 @@ class OpenSourcePage(BasePage):
         """Get the philosophy values."""
         try:
             values_container = self.find_element(self.OPENSOURCE_PHILOSOPHY_VALUES, timeout=2)
-            if values_container:
-                badges = values_container.find_elements(By.CSS_SELECTOR, "[data-testid^='opensource-value-']")
-                return [badge.text for badge in badges]
-        except:
-            pass
-        return []
+        except TimeoutException:
+            return []
+        badges = values_container.find_elements(By.CSS_SELECTOR, "[data-testid^='opensource-value-']")
+        return [badge.text for badge in badges]
     
     def verify_opensource_page_loaded(self):
         """Verify open source page has loaded successfully."""
-        return (self.is_opensource_container_visible() and 
-                self.is_element_displayed(self.OPENSOURCE_TITLE) and
-                self.is_projects_section_visible())
+        snap = self.snapshot({
+            "container": self.OPENSOURCE_CONTAINER,
+            "title": self.OPENSOURCE_TITLE,
+            "projects": self.OPENSOURCE_PROJECTS_SECTION,
+        }, timeout=2, visible=True)
+        return snap.all_visible()
     
     def verify_all_sections_present(self):
         """Verify all main sections are present."""
-        return (self.is_projects_section_visible() and
-                self.is_philosophy_section_visible())
+        snap = self.snapshot({
+            "projects": self.OPENSOURCE_PROJECTS_SECTION,
+            "philosophy": self.OPENSOURCE_PHILOSOPHY_SECTION,
+        }, timeout=2, visible=True)
+        return snap.all_visible()
     
     def verify_header_content(self):
         """Verify header has all required content."""
-        title = self.get_page_title()
-        subtitle = self.get_page_subtitle()
-        description = self.get_page_description()
-        return bool(title and subtitle and description)
+        snap = self.snapshot({
+            "title": self.OPENSOURCE_TITLE,
+            "subtitle": self.OPENSOURCE_SUBTITLE,
+            "description": self.OPENSOURCE_DESCRIPTION,
+        }, timeout=self.timeout)
+        return all(state.text for state in snap)
     
     def verify_philosophy_content(self):
         """Verify philosophy section has content."""
-        statement = self.get_philosophy_statement()
-        values = self.get_philosophy_values()
-        return bool(statement and len(values) > 0)
+        snap = self.snapshot({
+            "statement": self.OPENSOURCE_PHILOSOPHY_STATEMENT,
+            "values": self.PHILOSOPHY_VALUE_BADGES,
+        }, timeout=self.timeout)
+        return bool(snap["statement"].text and snap["values"].count > 0)
     
     def verify_projects_visible(self):
         """Verify projects are visible."""
-        count = self.get_projects_count()
-        return count > 0
+        snap = self.snapshot({"projects": self.PROJECT_CARDS}, timeout=2)
+        return snap["projects"].count > 0
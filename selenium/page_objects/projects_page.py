@@ -1,6 +1,8 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
+from utils.locators import DynamicTestId
 
 
 class ProjectsPage(BasePage):
@@ -16,14 +18,17 @@ class ProjectsPage(BasePage):
     PROJECTS_FILTER_CLEAR = (By.CSS_SELECTOR, "[data-testid='projects-filter-clear']")
     PROJECTS_FEATURED_GRID = (By.CSS_SELECTOR, "[data-testid='projects-featured-grid']")
     PROJECTS_GRID = (By.CSS_SELECTOR, "[data-testid='projects-grid']")
-    FEATURED_PROJECT_CARD = "project-card-featured-{}"
-    PROJECT_CARD = "project-card-{}"
-    FEATURED_PROJECT_TITLE = "project-title-featured-{}"
-    PROJECT_TITLE = "project-title-{}"
-    FEATURED_PROJECT_SUMMARY = "project-summary-featured-{}"
-    PROJECT_SUMMARY = "project-summary-{}"
-    FEATURED_PROJECT_TECH = "project-tech-featured-{}"
-    PROJECT_TECH = "project-tech-{}"
+    # Indexed by position; numeric placeholders keep "project-card-{}" off the featured cards
+    FEATURED_PROJECT_CARD = DynamicTestId("project-card-featured-{}", DynamicTestId.INDEX)
+    PROJECT_CARD = DynamicTestId("project-card-{}", DynamicTestId.INDEX)
+    FEATURED_PROJECT_TITLE = DynamicTestId("project-title-featured-{}", DynamicTestId.INDEX)
+    PROJECT_TITLE = DynamicTestId("project-title-{}", DynamicTestId.INDEX)
+    FEATURED_PROJECT_SUMMARY = DynamicTestId("project-summary-featured-{}", DynamicTestId.INDEX)
+    PROJECT_SUMMARY = DynamicTestId("project-summary-{}", DynamicTestId.INDEX)
+    FEATURED_PROJECT_TECH = DynamicTestId("project-tech-featured-{}", DynamicTestId.INDEX)
+    PROJECT_TECH = DynamicTestId("project-tech-{}", DynamicTestId.INDEX)
+    FILTER_CATEGORY_ITEM = DynamicTestId("projects-filter-category-{}")
+    FILTER_TECH_ITEM = DynamicTestId("projects-filter-tech-{}")
     
     def load_page(self):
         """Load the Projects page."""
@@ -62,13 +67,10 @@ class ProjectsPage(BasePage):
     
     def filter_by_category(self, category):
         """Filter projects by category."""
-        filter_element = (By.CSS_SELECTOR, f"[data-testid='projects-filter-category-{category}']")
-        button = self.find_element(filter_element)
-        if button:
-            self.scroll_to_element(button)
-            button.click()
-            return True
-        return False
+        locator = self.FILTER_CATEGORY_ITEM(category)
+        self.scroll_to_element(locator)
+        self.click(locator)  # BasePage.click drops the testid index the filter makes stale
+        return True
     
     def get_filter_technologies(self):
         """Get list of available technology filter buttons."""
@@ -80,13 +82,10 @@ class ProjectsPage(BasePage):
     
     def filter_by_technology(self, tech):
         """Filter projects by technology."""
-        filter_element = (By.CSS_SELECTOR, f"[data-testid='projects-filter-tech-{tech}']")
-        button = self.find_element(filter_element)
-        if button:
-            self.scroll_to_element(button)
-            button.click()
-            return True
-        return False
+        locator = self.FILTER_TECH_ITEM(tech)
+        self.scroll_to_element(locator)
+        self.click(locator)
+        return True
     
     def is_clear_filters_visible(self):
         """Check if clear filters button is visible."""
@@ -94,87 +93,63 @@ class ProjectsPage(BasePage):
     
     def click_clear_filters(self):
         """Click the clear filters button."""
-        button = self.find_element(self.PROJECTS_FILTER_CLEAR)
-        if button:
-            button.click()
-            return True
-        return False
+        self.click(self.PROJECTS_FILTER_CLEAR)
+        return True
     
     def get_featured_project_count(self):
         """Get count of featured projects displayed."""
         try:
             featured_grid = self.find_element(self.PROJECTS_FEATURED_GRID, timeout=2)
-            if featured_grid:
-                cards = featured_grid.find_elements(By.CSS_SELECTOR, "[data-testid^='project-card-featured-']")
-                return len(cards)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        return len(featured_grid.find_elements(*self.FEATURED_PROJECT_CARD.all()))
     
     def get_project_count(self):
         """Get count of projects displayed in main grid."""
         try:
             grid = self.find_element(self.PROJECTS_GRID, timeout=2)
-            if grid:
-                cards = grid.find_elements(By.CSS_SELECTOR, "[data-testid^='project-card-']")
-                # Filter out featured cards (which have 'featured-' in data-testid)
-                cards = [c for c in cards if 'featured' not in c.get_attribute('data-testid')]
-                return len(cards)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        cards = grid.find_elements(*self.PROJECT_CARD.all())
+        # The prefix also matches featured cards; PROJECT_CARD only matches numeric indices
+        return sum(1 for card in cards if self.PROJECT_CARD.matches(card.get_attribute('data-testid')))
     
     def get_project_title(self, index, is_featured=False):
         """Get project title by index."""
         try:
-            if is_featured:
-                locator = (By.CSS_SELECTOR, f"[data-testid='{self.FEATURED_PROJECT_TITLE.format(index)}']")
-            else:
-                locator = (By.CSS_SELECTOR, f"[data-testid='{self.PROJECT_TITLE.format(index)}']")
-            element = self.find_element(locator, timeout=2)
+            testid = (self.FEATURED_PROJECT_TITLE if is_featured else self.PROJECT_TITLE).id(index)
+            element = self.find_by_testid(testid, timeout=2)
             return element.text if element else None
-        except:
+        except TimeoutException:
             return None
     
     def get_project_summary(self, index, is_featured=False):
         """Get project summary by index."""
         try:
-            if is_featured:
-                locator = (By.CSS_SELECTOR, f"[data-testid='{self.FEATURED_PROJECT_SUMMARY.format(index)}']")
-            else:
-                locator = (By.CSS_SELECTOR, f"[data-testid='{self.PROJECT_SUMMARY.format(index)}']")
-            element = self.find_element(locator, timeout=2)
+            testid = (self.FEATURED_PROJECT_SUMMARY if is_featured else self.PROJECT_SUMMARY).id(index)
+            element = self.find_by_testid(testid, timeout=2)
             return element.text if element else None
-        except:
+        except TimeoutException:
             return None
     
     def get_project_technologies(self, index, is_featured=False):
         """Get technologies list for a project by index."""
-        if is_featured:
-            locator = (By.CSS_SELECTOR, f"[data-testid='{self.FEATURED_PROJECT_TECH.format(index)}']")
-        else:
-            locator = (By.CSS_SELECTOR, f"[data-testid='{self.PROJECT_TECH.format(index)}']")
+        testid = (self.FEATURED_PROJECT_TECH if is_featured else self.PROJECT_TECH).id(index)
         try:
-            element = self.find_element(locator, timeout=2)
+            element = self.find_by_testid(testid, timeout=2)
             if element:
                 tech_badges = element.find_elements(By.CSS_SELECTOR, "[class*='badge']")
                 return [badge.text for badge in tech_badges]
-        except:
+        except TimeoutException:
             pass
         return []
     
     def click_project(self, index, is_featured=False):
         """Click a project card by index."""
-        if is_featured:
-            locator = (By.CSS_SELECTOR, f"[data-testid='{self.FEATURED_PROJECT_CARD.format(index)}']")
-        else:
-            locator = (By.CSS_SELECTOR, f"[data-testid='{self.PROJECT_CARD.format(index)}']")
-        element = self.find_element(locator)
-        if element:
-            self.scroll_to_element(element)
-            element.click()
-            return True
-        return False
+        locator = (self.FEATURED_PROJECT_CARD if is_featured else self.PROJECT_CARD)(index)
+        self.scroll_to_element(locator)
+        self.click(locator)
+        return True
     
     def verify_projects_page_loaded(self):
         """Verify projects page has loaded successfully."""
@@ -195,5 +170,5 @@ class ProjectsPage(BasePage):
             summary = self.get_project_summary(index, is_featured)
             tech = self.get_project_technologies(index, is_featured)
             return bool(title and summary and len(tech) > 0)
-        except:
+        except TimeoutException:
             return False
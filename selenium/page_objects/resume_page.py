@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
+from utils.locators import DynamicTestId
 
 
 class ResumePage(BasePage):
@@ -23,6 +25,7 @@ class ResumePage(BasePage):
     RESUME_GITHUB_BUTTON = (By.CSS_SELECTOR, "[data-testid='resume-github-button']")
     RESUME_EMAIL_BUTTON = (By.CSS_SELECTOR, "[data-testid='resume-email-button']")
     RESUME_DOWNLOAD_BUTTON = (By.CSS_SELECTOR, "[data-testid='resume-download-button']")
+    PROJECT_NAME = DynamicTestId("resume-project-name-{}")
     
     def load_page(self):
         """Load the Resume page."""
@@ -56,12 +59,9 @@ class ResumePage(BasePage):
         """Get count of expertise cards."""
         try:
             grid = self.find_element(self.RESUME_EXPERTISE_GRID, timeout=2)
-            if grid:
-                cards = grid.find_elements(By.CSS_SELECTOR, "[class*='Card']")
-                return len(cards)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        return len(grid.find_elements(By.CSS_SELECTOR, "[class*='Card']"))
     
     def is_experience_section_visible(self):
         """Check if experience section is visible."""
@@ -71,14 +71,12 @@ class ResumePage(BasePage):
         """Get count of experience entries."""
         try:
             experience_list = self.find_element(self.RESUME_EXPERIENCE_LIST, timeout=2)
-            if experience_list:
-                entries = experience_list.find_elements(By.CSS_SELECTOR, "[data-testid^='resume-experience-']")
-                # Filter out non-numeric entries
-                entries = [e for e in entries if e.get_attribute('data-testid').split('-')[-1].isdigit()]
-                return len(entries)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        entries = experience_list.find_elements(By.CSS_SELECTOR, "[data-testid^='resume-experience-']")
+        # Filter out non-numeric entries
+        entries = [e for e in entries if e.get_attribute('data-testid').split('-')[-1].isdigit()]
+        return len(entries)
     
     def is_projects_section_visible(self):
         """Check if projects section is visible."""
@@ -88,22 +86,19 @@ class ResumePage(BasePage):
         """Get count of projects displayed."""
         try:
             grid = self.find_element(self.RESUME_PROJECTS_GRID, timeout=2)
-            if grid:
-                projects = grid.find_elements(By.CSS_SELECTOR, "[data-testid^='resume-project-']")
-                # Filter to only the main project cards (not title/role/impact)
-                projects = [p for p in projects if p.get_attribute('data-testid').split('-')[-1].isdigit()]
-                return len(projects)
-        except:
-            pass
-        return 0
+        except TimeoutException:
+            return 0
+        projects = grid.find_elements(By.CSS_SELECTOR, "[data-testid^='resume-project-']")
+        # Filter to only the main project cards (not title/role/impact)
+        projects = [p for p in projects if p.get_attribute('data-testid').split('-')[-1].isdigit()]
+        return len(projects)
     
     def get_project_name(self, index):
         """Get project name by index."""
-        locator = (By.CSS_SELECTOR, f"[data-testid='resume-project-name-{index}']")
         try:
-            element = self.find_element(locator, timeout=2)
+            element = self.find_by_testid(self.PROJECT_NAME.id(index), timeout=2)
             return element.text if element else None
-        except:
+        except TimeoutException:
             return None
     
     def is_contact_section_visible(self):
@@ -134,20 +129,28 @@ class ResumePage(BasePage):
     
     def verify_resume_page_loaded(self):
         """Verify resume page has loaded successfully."""
-        return (self.is_resume_container_visible() and 
-                self.is_element_displayed(self.RESUME_TITLE) and
-                self.is_expertise_section_visible())
+        snap = self.snapshot({
+            "container": self.RESUME_CONTAINER,
+            "title": self.RESUME_TITLE,
+            "expertise": self.RESUME_EXPERTISE_GRID,
+        }, timeout=2, visible=True)
+        return snap.all_visible()
     
     def verify_key_sections_present(self):
         """Verify all key sections are present."""
-        return (self.is_expertise_section_visible() and
-                self.is_experience_section_visible() and
-                self.is_projects_section_visible() and
-                self.is_contact_section_visible())
+        snap = self.snapshot({
+            "expertise": self.RESUME_EXPERTISE_GRID,
+            "experience": self.RESUME_EXPERIENCE_LIST,
+            "projects": self.RESUME_PROJECTS_GRID,
+            "contact": self.RESUME_CONTACT_CARD,
+        }, timeout=2, visible=True)
+        return snap.all_visible()
     
     def verify_header_content(self):
         """Verify header has all required content."""
-        title = self.get_resume_title()
-        subtitle = self.get_resume_subtitle()
-        statement = self.get_resume_statement()
-        return bool(title and subtitle and statement)
+        snap = self.snapshot({
+            "title": self.RESUME_TITLE,
+            "subtitle": self.RESUME_SUBTITLE,
+            "statement": self.RESUME_STATEMENT,
+        }, timeout=self.timeout)
+        return all(state.text for state in snap)
@@ -1,6 +1,10 @@
+import re
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 from page_objects.base_page import BasePage
+from utils.locators import DynamicTestId
 
 
 class SearchPage(BasePage):
@@ -13,7 +17,16 @@ class SearchPage(BasePage):
     ACTIVE_FILTERS = (By.CSS_SELECTOR, "[data-testid='search-active-filters']")
     ERROR = (By.CSS_SELECTOR, "[data-testid='search-error']")
     NO_RESULTS = (By.CSS_SELECTOR, "[data-testid='search-no-results']")
-    RESULTS_COUNT = (By.CSS_SELECTOR, "[data-testid='search-results-count']")
+    RESULT_CARD = (By.CSS_SELECTOR, "[data-testid='search-result-card']")
+    # Rendered once a search has answered: result cards or the no-results card
+    RESULTS_RENDERED = (By.CSS_SELECTOR, "[data-testid='search-result-card'], [data-testid='search-no-results']")
+    SUGGESTION = DynamicTestId("search-suggestion-{}")
+    FILTER_TYPE = DynamicTestId("search-filter-type-{}")
+    FILTER_TAG = DynamicTestId("search-filter-tag-{}")
+
+    # Search requests (suggestion lookups also hit /api/search, with suggestions=true)
+    SEARCH_REQUEST = re.compile(r"/api/search\?(?!.*suggestions=true)")
+    SUGGESTIONS_REQUEST = "/api/search"
 
     def __init__(self, driver, base_url=None, timeout=15):
         super().__init__(driver, base_url=base_url or self.base_url, timeout=timeout)
@@ -27,7 +40,12 @@ class SearchPage(BasePage):
     def enter_query(self, text):
         self.fill_text(self.SEARCH_INPUT, text)
 
+    def wait_for_suggestions(self, timeout=5):
+        # Every keystroke fires a suggestions request; wait until they have all returned
+        return self.wait_for_network_idle(idle_ms=200, url_filter=self.SUGGESTIONS_REQUEST, timeout=timeout)
+
     def submit_search(self):
+        self.network.mark()
         # Click button (preferred) to trigger search
         try:
             self.click(self.SEARCH_BUTTON)
@@ -35,18 +53,20 @@ class SearchPage(BasePage):
             # fallback: press enter on input
             self.press_enter_on_element(self.SEARCH_INPUT)
 
+    def wait_for_search_response(self, timeout=10):
+        """Wait for the /api/search call started by submit_search()."""
+        return self.wait_for_response(self.SEARCH_REQUEST, timeout=timeout)
+
     def get_suggestions(self):
         try:
             container = self.find_element(self.SUGGESTIONS, timeout=2)
-            buttons = container.find_elements(By.TAG_NAME, "button")
-            return [b.text for b in buttons]
-        except Exception:
+        except TimeoutException:
             return []
+        return [b.text for b in container.find_elements(By.TAG_NAME, "button")]
 
     def click_suggestion(self, suggestion_text):
-        locator = (By.CSS_SELECTOR, f"[data-testid='search-suggestion-{suggestion_text}']")
         try:
-            self.click(locator)
+            self.click(self.SUGGESTION(suggestion_text))
         except Exception:
             raise
 
@@ -56,20 +76,11 @@ class SearchPage(BasePage):
     def has_no_results(self):
         return self.is_element_displayed(self.NO_RESULTS)
 
-    def get_results_count(self):
-        try:
-            el = self.find_element(self.RESULTS_COUNT, timeout=2)
-            text = el.text or ""
-            # Expected format: Found N result(s)
-            import re
-            m = re.search(r"Found\s+(\d+)", text)
-            if m:
-                return int(m.group(1))
-        except Exception:
-            pass
-        # fallback: count result cards
-        items = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid^='search-result-']")
-        return len(items)
+    def get_results_count(self, timeout=2):
+        """Rendered result cards (waits up to timeout for results or the no-results card)."""
+        if not self.is_present(self.RESULTS_RENDERED, timeout=timeout):
+            return 0
+        return len(self.driver.find_elements(*self.RESULT_CARD))
 
     def focus_input_and_tab(self):
         el = self.find_clickable_element(self.SEARCH_INPUT)
@@ -81,9 +92,7 @@ class SearchPage(BasePage):
 
     # Filters
     def toggle_type_filter(self, type_name):
-        locator = (By.CSS_SELECTOR, f"[data-testid='search-filter-type-{type_name}']")
-        self.click(locator)
+        self.click(self.FILTER_TYPE(type_name))
 
     def toggle_tag_filter(self, tag_name):
-        locator = (By.CSS_SELECTOR, f"[data-testid='search-filter-tag-{tag_name}']")
-        self.click(locator)
+        self.click(self.FILTER_TAG(tag_name))
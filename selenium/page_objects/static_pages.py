@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from page_objects.base_page import BasePage
+from utils.locators import testid
 
 
 class StaticPage(BasePage):
@@ -16,15 +18,14 @@ class StaticPage(BasePage):
     def is_loaded(self):
         if not self.page_testid:
             return True
-        locator = (By.CSS_SELECTOR, f"[data-testid='{self.page_testid}']")
-        return self.is_element_displayed(locator)
+        return self.is_element_displayed(testid(self.page_testid))
 
     def get_page_title(self):
         """Get page title (h1 or first heading)."""
         try:
             title = self.find_element((By.TAG_NAME, "h1"))
             return title.text
-        except Exception:
+        except TimeoutException:
             return None
 
     def get_page_description(self):
@@ -32,7 +33,7 @@ class StaticPage(BasePage):
         try:
             desc = self.find_element((By.CSS_SELECTOR, "p[class*='muted']"), timeout=2)
             return desc.text
-        except Exception:
+        except TimeoutException:
             return None
 
 
@@ -85,7 +86,7 @@ class Models3DPage(StaticPage):
 
     def page_testid_locator(self):
         """Helper to get page testid locator."""
-        return (By.CSS_SELECTOR, f"[data-testid='{self.page_testid}']")
+        return testid(self.page_testid)
 
     def is_loaded(self):
         """Override with more resilient checking for 3D page."""
@@ -11,127 +11,304 @@ Handles:
 import pytest
 import os
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from dotenv import load_dotenv
-from datetime import datetime
 import sys
+import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.test_data import TestData
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import DriverResolver
+from utils.artifacts import artifact_path, worker_id
+from utils.artifact_writer import ArtifactWriter, capture_failure
+from utils.command_log import CommandLog
+from utils.command_profiler import CommandProfiler, clear_reports, format_report, html_panel, merge_reports
+from utils.perf import PerfCollector
+from utils.results_store import ResultsStore
+from utils.scheduling import DurationHistory, DurationRecorder, LongestFirstScheduling
+from utils.stub_server import ApiStub
+from utils.cdp_interceptor import FetchInterceptor
+from utils.rate_governor import RateGovernor
+from utils.dom_driver import DomDriver
+from utils.asset_cache import AssetCache
+from utils.profile_template import ProfileTemplate
+from utils.chrome_profiles import PROFILES, chrome_options, get_profile
+from utils.route_crawler import crawl, format_results
+from utils.impact import ImpactMap, changed_files, test_key
+from utils import js_coverage
+from utils import testid_coverage
+from page_objects.base_page import SlowLookups
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Driver binaries are resolved once per process and cached on disk per machine
+DRIVER_RESOLVER = DriverResolver()
+
+# Static asset replay (set up in pytest_configure; None unless --asset-replay)
+ASSET_CACHE = None
+
+# Pre-warmed Chrome profile (set up in pytest_configure; None unless --cache-mode warm)
+PROFILE_TEMPLATE = None
+
+# Failure bundles (set up in pytest_configure; None during --collect-only)
+ARTIFACT_WRITER = None
+
+# Per-test JS coverage (set up in pytest_configure; None unless --js-coverage)
+JS_COVERAGE = None
+
+# Live /api pacing (set up in pytest_configure; None unless --rate-governor)
+RATE_GOVERNOR = None
+
+# Run history (set up in pytest_configure; None when --no-results-store)
+RESULTS_STORE = None
+RESULTS_RUN_KEY = None
+PHASES_KEY = pytest.StashKey()
+
+
+# Markers that choose how a test runs, not its priority: a test carrying
+# only these still defaults to `feature`
+BACKEND_MARKERS = {"dom_only"}
+
 
 # ============================================================================
 # PYTEST HOOKS & CONFIGURATION
 # ============================================================================
 
-def pytest_configure(config):
-    """Configure pytest."""
-    config.addinivalue_line(
-        "markers", "smoke: mark test as smoke test (P0 - critical path)"
-    )
-    config.addinivalue_line(
-        "markers", "critical: mark test as critical path (P1)"
-    )
-    config.addinivalue_line(
-        "markers", "feature: mark test as feature test (P2)"
-    )
-    config.addinivalue_line(
-        "markers", "edge_case: mark test as edge case (P3)"
-    )
-
-
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection (add markers if not set)."""
+    """Modify test collection (add markers if not set, --changed-since selection)."""
     for item in items:
         # Add default marker if none specified
-        if not any(item.iter_markers()):
+        if not any(marker.name not in BACKEND_MARKERS for marker in item.iter_markers()):
             item.add_marker(pytest.mark.feature)
+    if TestData.CHANGED_SINCE:
+        _select_impacted(config, items)
+
+
+def _select_impacted(config, items):
+    """Keep only the tests the files changed since TestData.CHANGED_SINCE can affect."""
+    try:
+        changed = changed_files(TestData.CHANGED_SINCE)
+    except ValueError as exc:
+        raise pytest.UsageError(f"--changed-since: {exc}")
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    selection = ImpactMap().select(changed)
+    if selection.run_all:
+        if reporter:
+            reporter.write_line(f"🎯 Impact: {', '.join(selection.run_all_because[:3])} "
+                                f"can affect every test; running all")
+        return
+    selected, deselected = [], []
+    for item in items:
+        (selected if selection.selects(test_key(item)) else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    if reporter:
+        reporter.write_line(f"🎯 Impact: {len(changed)} changed file(s) since {TestData.CHANGED_SINCE} "
+                            f"-> {len(selected)} of {len(selected) + len(deselected)} test(s)")
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Hook to capture screenshots on failure."""
+    """Hook to capture screenshots on failure and store results for trend analysis."""
     outcome = yield
     rep = outcome.get_result()
     
-    # Take screenshot on failure
-    if rep.failed and call.when == "call":
+    _record_result(item, rep)
+    if rep.when == "call" and CommandProfiler.enabled:
+        _record_profile(item, rep)
+    
+    # Capture failure artifacts (written and compressed on the writer thread)
+    if rep.failed and call.when == "call" and ARTIFACT_WRITER is not None:
         driver = item.funcargs.get('driver')
         if driver:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            test_name = item.name
-            filename = f"screenshots/{test_name}_{timestamp}_FAILED.png"
-            
-            # Create screenshots directory
-            os.makedirs("screenshots", exist_ok=True)
-            
-            try:
-                driver.save_screenshot(filename)
-                print(f"\n📸 Screenshot saved: {filename}")
-            except:
-                print(f"\n⚠️ Failed to save screenshot")
+            # screenshots/<worker>/<test>_<timestamp>_<random>_FAILED.zip
+            filename = ARTIFACT_WRITER.submit(item.name, capture_failure(driver), meta={
+                "test": item.nodeid,
+                "worker": worker_id(),
+                "browser": TestData.BROWSER,
+                "error": rep.longreprtext[-4000:],
+            })
+            print(f"\n📸 Failure artifacts: {filename}")
+
+
+def _record_result(item, rep):
+    """Accumulate the test's phases; append it to the results store after teardown."""
+    if RESULTS_STORE is None:
+        return
+    phases = item.stash.setdefault(PHASES_KEY, {"duration": 0.0, "outcome": "passed"})
+    phases["duration"] += rep.duration
+    if rep.failed:
+        phases["outcome"] = "failed"
+    elif rep.skipped and phases["outcome"] == "passed":
+        phases["outcome"] = "skipped"
+    if rep.when == "call":
+        # Snapshot before fixture teardown adds the pool's reset commands
+        phases["commands"] = dict(CommandLog.counts)
+        phases["vitals"] = list(PerfCollector.measurements)
+    if rep.when == "teardown":
+        RESULTS_STORE.record_test(
+            RESULTS_RUN_KEY, item.nodeid, phases["outcome"], round(phases["duration"], 4),
+            worker=worker_id(), vitals=phases.get("vitals", ()), commands=phases.get("commands"),
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    Checks that run before any browser (or xdist worker) starts:
+    --testid-gate: every Python testid locator is rendered somewhere in src/
+    --preflight: every route answers over HTTP
+    """
+    config = session.config
+    if hasattr(config, "workerinput") or config.getoption("--collect-only"):
+        return
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if TestData.TESTID_GATE:
+        report = testid_coverage.analyze()
+        reporter.write_line(f"🧷 testid gate: {testid_coverage.summary(report)}")
+        for line in testid_coverage.format_report(report):
+            reporter.write_line(line)
+        if report.failed:
+            pytest.exit(f"testid gate failed: {len(report.dead)} dead locator(s), "
+                        f"{len(report.mismatches)} pattern mismatch(es)",
+                        returncode=pytest.ExitCode.TESTS_FAILED)
+    if not TestData.PREFLIGHT:
+        return
+    started = time.perf_counter()
+    results = crawl()
+    failed = [r for r in results if not r.ok]
+    reporter.write_line(f"🔎 Preflight: {len(results)} route(s) in "
+                        f"{time.perf_counter() - started:.2f}s, {len(failed)} failed")
+    for line in format_results(results):
+        reporter.write_line(line)
+    if failed:
+        pytest.exit(f"Preflight failed for {len(failed)} route(s)", returncode=pytest.ExitCode.TESTS_FAILED)
+
+
+def _record_profile(item, rep):
+    """Store the test's command profile and show it in the pytest-html report."""
+    profile = CommandProfiler.summarize(item.nodeid)
+    CommandProfiler.write(profile, worker=worker_id())
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return
+    rep.extras = getattr(rep, "extras", []) + [extras.html(html_panel(profile))]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the controller's results-store run to each xdist worker."""
+    node.workerinput["results_run_key"] = RESULTS_RUN_KEY
+
+
+def pytest_sessionfinish(session):
+    """Flush failure artifacts; close the results-store run (controller, or the only process without xdist)."""
+    if ARTIFACT_WRITER is not None:
+        ARTIFACT_WRITER.close()
+        stats = ARTIFACT_WRITER.stats
+        if stats["bundles"] or stats["evicted"]:
+            print(f"\n📸 {stats['bundles']} failure bundle(s), {stats['bytes'] / 1024:.0f} KB "
+                  f"written to {TestData.ARTIFACTS_DIR}/ ({stats['evicted']} old file(s) evicted)")
+    if JS_COVERAGE is not None:
+        JS_COVERAGE.close()
+        JS_COVERAGE.write_partial(worker_id())
+        if not hasattr(session.config, "workerinput"):
+            report = js_coverage.merge_partials()
+            if report["tests"]:
+                print(f"\n🧮 JS coverage ({TestData.JS_COVERAGE_DIR}/lcov.info):")
+                for line in js_coverage.format_summary(report, limit=5):
+                    print(f"   {line}")
+    if CommandProfiler.enabled and not hasattr(session.config, "workerinput"):
+        report = merge_reports()
+        if report["tests"]:
+            print(f"\n⏱️  Command profile ({TestData.PROFILE_DIR}/hot_paths.json):")
+            for line in format_report(report, limit=5):
+                print(f"   {line}")
+    if RESULTS_STORE is not None and not hasattr(session.config, "workerinput"):
+        RESULTS_STORE.finish_run(RESULTS_RUN_KEY)
+        print(f"\n📈 Results stored in {TestData.RESULTS_DB} "
+              f"(compare runs: python -m utils.perf_compare)")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Hand out the slowest tests first under `-n N` (uses the duration history)."""
+    recorder = config.pluginmanager.get_plugin("duration_recorder")
+    if recorder is None or config.getoption("--no-duration-scheduling"):
+        return None
+    if config.getvalue("dist") != "load":
+        return None  # --dist loadscope/loadfile/... keep xdist's own scheduler
+    return LongestFirstScheduling(config, log, history=recorder.history)
 
 
 # ============================================================================
-# FIXTURES - DRIVER SETUP/TEARDOWN
+# DRIVER FACTORIES
 # ============================================================================
 
-@pytest.fixture(scope="function")
-def chrome_driver():
-    """Create Chrome WebDriver instance."""
-    options = ChromeOptions()
-    
-    # Headless mode (from .env or default False)
-    if TestData.HEADLESS:
-        options.add_argument("--headless")
+def _service(service_class, browser):
+    """Build a driver service from the cached driver resolution."""
+    resolution = DRIVER_RESOLVER.resolve(browser)
+    print(f"\n🔧 {browser} driver: {resolution.path or 'Selenium Manager'} "
+          f"({resolution.source}, resolved in {resolution.seconds:.3f}s)")
+    return service_class(executable_path=resolution.path)
+
+
+def create_chrome_driver(profile_dir=None):
+    """
+    Launch a configured Chrome WebDriver (used by the driver pool).
     
-    # Common arguments
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+    Args:
+        profile_dir: user-data-dir to use (default: a clone of the warm
+                     profile template in warm cache mode, else a fresh temp profile)
+    """
+    # Warm cache mode: start from a clone of the pre-warmed profile template
+    if profile_dir is None and PROFILE_TEMPLATE is not None:
+        PROFILE_TEMPLATE.ensure(create_chrome_driver, TestData.PAGES.values())
+        profile_dir = PROFILE_TEMPLATE.clone()
     
-    # Logging
-    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    # Flags from the launch profile (--profile / CHROME_PROFILE; headless means --headless=new)
+    options = chrome_options(TestData.CHROME_PROFILE, profile_dir=profile_dir)
     
-    # Create service
-    service = ChromeService(ChromeDriverManager().install())
+    # Logging ("performance" carries the CDP Network.* events NetworkTracker reads)
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL", "performance": "ALL"})
     
-    # Create driver
-    driver = webdriver.Chrome(service=service, options=options)
+    # Create driver (re-resolve once if the cached chromedriver no longer matches Chrome)
+    try:
+        driver = webdriver.Chrome(service=_service(ChromeService, "chrome"), options=options)
+    except SessionNotCreatedException:
+        DRIVER_RESOLVER.invalidate("chrome")
+        driver = webdriver.Chrome(service=_service(ChromeService, "chrome"), options=options)
     
-    # Set timeouts
-    driver.implicitly_wait(TestData.IMPLICIT_WAIT)
+    # No implicit wait: it stacks on BasePage's explicit waits
+    driver.implicitly_wait(0)
     
     # Set window size
     driver.set_window_size(TestData.BROWSER_WIDTH, TestData.BROWSER_HEIGHT)
     
+    CommandLog.attach(driver)
+    
+    # Serve _next/static, fonts and images from the on-disk cache for the session's lifetime
+    if ASSET_CACHE is not None:
+        ASSET_CACHE.attach(driver)
+    
     print(f"\n✅ Chrome driver initialized")
     print(f"   Base URL: {TestData.BASE_URL}")
     print(f"   Viewport: {TestData.BROWSER_WIDTH}x{TestData.BROWSER_HEIGHT}")
-    print(f"   Headless: {TestData.HEADLESS}")
+    print(f"   Profile: {TestData.CHROME_PROFILE} "
+          f"({'headless' if get_profile().is_headless() else 'headed'})")
     
-    yield driver
-    
-    # Cleanup
-    print(f"\n🧹 Closing Chrome driver")
-    driver.quit()
+    return driver
 
 
-@pytest.fixture(scope="function")
-def firefox_driver():
-    """Create Firefox WebDriver instance."""
+def create_firefox_driver():
+    """Launch a configured Firefox WebDriver (used by the driver pool)."""
     options = FirefoxOptions()
     
     # Headless mode
@@ -142,20 +319,93 @@ def firefox_driver():
     options.add_argument("--width=" + str(TestData.BROWSER_WIDTH))
     options.add_argument("--height=" + str(TestData.BROWSER_HEIGHT))
     
-    # Create service
-    service = FirefoxService(GeckoDriverManager().install())
+    # Create driver (re-resolve once if the cached geckodriver no longer matches Firefox)
+    try:
+        driver = webdriver.Firefox(service=_service(FirefoxService, "firefox"), options=options)
+    except SessionNotCreatedException:
+        DRIVER_RESOLVER.invalidate("firefox")
+        driver = webdriver.Firefox(service=_service(FirefoxService, "firefox"), options=options)
     
-    # Create driver
-    driver = webdriver.Firefox(service=service, options=options)
+    # No implicit wait: it stacks on BasePage's explicit waits
+    driver.implicitly_wait(0)
     
-    # Set timeouts
-    driver.implicitly_wait(TestData.IMPLICIT_WAIT)
+    CommandLog.attach(driver)
     
     print(f"\n✅ Firefox driver initialized")
     
+    return driver
+
+
+def _create_pool(factory):
+    """Build a driver pool for the current worker."""
+    return DriverPool(
+        factory,
+        size=TestData.POOL_SIZE,
+        max_uses=TestData.POOL_MAX_USES,
+        window_size=(TestData.BROWSER_WIDTH, TestData.BROWSER_HEIGHT),
+        base_url=TestData.BASE_URL,
+    )
+
+
+def _print_pool_stats(pool, name):
+    stats = pool.stats
+    print(f"\n🧹 Closing {name} pool "
+          f"(created {stats['created']}, reused {stats['reused']}, "
+          f"recycled {stats['recycled']}, crashed {stats['crashed']})")
+    if ASSET_CACHE is not None and ASSET_CACHE.build_id:
+        stats = ASSET_CACHE.stats
+        print(f"🔧 Asset replay: {stats['hits']} hit(s), {stats['misses']} recorded, "
+              f"{stats['bytes_served'] / 1e6:.1f} MB served from cache")
+
+
+# ============================================================================
+# FIXTURES - DRIVER SETUP/TEARDOWN
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def chrome_pool():
+    """Warm Chrome sessions shared by all tests in this worker."""
+    pool = _create_pool(create_chrome_driver)
+    yield pool
+    _print_pool_stats(pool, "Chrome")
+    pool.shutdown()
+    if PROFILE_TEMPLATE is not None:
+        PROFILE_TEMPLATE.cleanup()
+
+
+@pytest.fixture(scope="session")
+def firefox_pool():
+    """Warm Firefox sessions shared by all tests in this worker."""
+    pool = _create_pool(create_firefox_driver)
+    yield pool
+    _print_pool_stats(pool, "Firefox")
+    pool.shutdown()
+
+
+@pytest.fixture(scope="function")
+def chrome_driver(chrome_pool, request):
+    """Lease a Chrome session from the pool (state is reset after the test)."""
+    with chrome_pool.lease() as driver:
+        if JS_COVERAGE is not None:
+            JS_COVERAGE.track(driver)
+        yield driver
+        if JS_COVERAGE is not None:
+            # Before the lease resets the session; merging happens off-thread
+            JS_COVERAGE.take(driver, test_key(request.node))
+
+
+@pytest.fixture(scope="function")
+def firefox_driver(firefox_pool):
+    """Lease a Firefox session from the pool (state is reset after the test)."""
+    with firefox_pool.lease() as driver:
+        yield driver
+
+
+@pytest.fixture(scope="function")
+def dom_driver():
+    """Browserless DomDriver (HTTP fetch + parsed HTML) for dom_only tests."""
+    driver = DomDriver()
     yield driver
-    
-    print(f"\n🧹 Closing Firefox driver")
     driver.quit()
 
 
@@ -163,16 +413,52 @@ def firefox_driver():
 def driver(request):
     """
     Primary driver fixture.
-    Uses browser specified in .env (default: chrome).
+    Uses browser specified in .env (default: chrome); tests marked
+    dom_only get a DomDriver instead (unless --no-dom-only).
     """
     browser = TestData.BROWSER.lower()
     
+    if TestData.DOM_ONLY and request.node.get_closest_marker("dom_only"):
+        return request.getfixturevalue("dom_driver")
     if browser == "firefox":
         return request.getfixturevalue("firefox_driver")
     else:  # Default to Chrome
         return request.getfixturevalue("chrome_driver")
 
 
+# ============================================================================
+# FIXTURES - API STUB
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def api_stub_backend():
+    """Fixture-backed /api/* responder shared by this worker's tests."""
+    return ApiStub(TestData.API_FIXTURES_DIR, latency=TestData.API_STUB_LATENCY)
+
+
+@pytest.fixture(scope="function")
+def api_stub(driver, api_stub_backend):
+    """
+    Answer the app's /api/* requests from recorded fixtures (CDP Fetch interception).
+    Yields the ApiStub for latency / error injection, or None when the stub is
+    off (--live-api) or the browser has no DevTools (tests then hit the live backend).
+    """
+    if not TestData.API_STUB or not FetchInterceptor.supported(driver):
+        yield None
+        return
+    
+    api_stub_backend.reset()
+    interceptor = FetchInterceptor(
+        driver, [f"{TestData.BASE_URL.rstrip('/')}/api/*"], api_stub_backend.intercept
+    )
+    interceptor.start()
+    
+    yield api_stub_backend
+    
+    interceptor.stop()
+    print(f"\n🔧 API stub answered {len(api_stub_backend.requests)} request(s)")
+
+
 # ============================================================================
 # FIXTURES - PAGE OBJECTS
 # ============================================================================
@@ -259,6 +545,93 @@ def test_logger(request):
     print(f"{'='*80}\n")
 
 
+@pytest.fixture(autouse=True)
+def reset_test_metrics():
+    """Start each test with empty WebDriver command counts, perf measurements and profile."""
+    CommandLog.reset()
+    PerfCollector.reset()
+    CommandProfiler.reset()
+
+
+@pytest.fixture(autouse=True)
+def slow_lookup_report(request):
+    """Count negative element lookups slower than SLOW_LOOKUP_THRESHOLD for each test."""
+    SlowLookups.reset()
+    
+    yield
+    
+    entries = SlowLookups.entries
+    if entries:
+        request.node.user_properties.append(("slow_negative_lookups", len(entries)))
+        request.node.user_properties.append(
+            ("slow_negative_lookup_seconds", round(sum(e["seconds"] for e in entries), 3))
+        )
+        print(f"\n🐢 {len(entries)} slow negative lookup(s):")
+        for entry in entries:
+            print(f"   {entry['seconds']:.2f}s  {entry['locator']}  (in {entry['caller']})")
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_governor(request):
+    """
+    Pace the live /api requests of browser tests to the app's rate limits
+    (--rate-governor); tests answered by the API stub are not paced.
+    """
+    if RATE_GOVERNOR is None or not {"driver", "chrome_driver"} & set(request.fixturenames):
+        yield
+        return
+    if TestData.API_STUB and "api_stub" in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("driver" if "driver" in request.fixturenames else "chrome_driver")
+    if not FetchInterceptor.supported(driver):
+        yield
+        return
+    
+    RATE_GOVERNOR.start_test(request.node.nodeid)
+    interceptor = FetchInterceptor(
+        driver, [f"{TestData.BASE_URL.rstrip('/')}/api/*"], RATE_GOVERNOR.intercept
+    )
+    interceptor.start()
+    
+    yield
+    
+    interceptor.stop()
+    entry = RATE_GOVERNOR.finish_test()
+    if entry and (entry["waited"] or entry["over_budget"]):
+        request.node.user_properties.append(("rate_limit_wait_seconds", round(entry["seconds"], 3)))
+        request.node.user_properties.append(("rate_limit_waits", entry["waited"]))
+        request.node.user_properties.append(("rate_limit_over_budget", entry["over_budget"]))
+        request.node.user_properties.append(("rate_limit_paths", entry["paths"]))
+        print(f"\n🚦 Waited {entry['seconds']:.2f}s on the rate-limit budget "
+              f"({entry['waited']} of {entry['requests']} /api request(s), {entry['over_budget']} over budget)")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Summarize slow negative lookups and rate-limit waits per test (works across xdist workers)."""
+    per_test, waits = {}, {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            props = dict(getattr(report, "user_properties", []) or [])
+            if "slow_negative_lookups" in props:
+                per_test[report.nodeid] = (
+                    props["slow_negative_lookups"], props["slow_negative_lookup_seconds"]
+                )
+            if "rate_limit_wait_seconds" in props:
+                waits[report.nodeid] = props
+    if per_test:
+        terminalreporter.write_sep("=", "slow negative lookups")
+        for nodeid, (count, seconds) in sorted(per_test.items(), key=lambda kv: -kv[1][1]):
+            terminalreporter.write_line(f"{seconds:7.2f}s  {count:3d} lookup(s)  {nodeid}")
+    if waits:
+        terminalreporter.write_sep("=", "rate-limit waits")
+        for nodeid, props in sorted(waits.items(), key=lambda kv: -kv[1]["rate_limit_wait_seconds"]):
+            over = f", {props['rate_limit_over_budget']} over budget" if props["rate_limit_over_budget"] else ""
+            paths = ", ".join(sorted(props["rate_limit_paths"]))
+            terminalreporter.write_line(f"{props['rate_limit_wait_seconds']:7.2f}s  "
+                                        f"{props['rate_limit_waits']:3d} wait(s){over}  {nodeid}  ({paths})")
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -276,9 +649,7 @@ def navigate_to_home(driver):
 def screenshot_on_failure(driver):
     """Take screenshot on test failure."""
     def _screenshot(name="failure"):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        os.makedirs("screenshots", exist_ok=True)
-        filename = f"screenshots/{name}_{timestamp}.png"
+        filename = artifact_path(name)
         driver.save_screenshot(filename)
         print(f"📸 Screenshot: {filename}")
     return _screenshot
@@ -318,7 +689,14 @@ def pytest_addoption(parser):
         "--headless",
         action="store_true",
         default=False,
-        help="Run tests in headless mode"
+        help="Run tests in headless mode (--headless=new; fast/dom/perf-measure profiles always are)"
+    )
+    parser.addoption(
+        "--profile",
+        action="store",
+        choices=sorted(PROFILES),
+        default=None,
+        help="Chrome launch profile: fast, dom (images off), fidelity, perf-measure (default: CHROME_PROFILE)"
     )
     parser.addoption(
         "--browser",
@@ -332,13 +710,220 @@ def pytest_addoption(parser):
         default="http://localhost:9002",
         help="Base URL for tests"
     )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=None,
+        help="Warm browser sessions kept per worker (default: POOL_SIZE or 1)"
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        action="store",
+        type=int,
+        default=None,
+        help="Tests a browser session serves before it is recycled (0 = never)"
+    )
+    parser.addoption(
+        "--perf-collect",
+        action="store_true",
+        default=False,
+        help="Measure web vitals on every navigate_to() and write per-route JSON reports"
+    )
+    parser.addoption(
+        "--results-db",
+        action="store",
+        default=None,
+        help="SQLite run history for perf_compare (default: RESULTS_DB or reports/results.sqlite)"
+    )
+    parser.addoption(
+        "--no-results-store",
+        action="store_true",
+        default=False,
+        help="Don't append this run to the results store"
+    )
+    parser.addoption(
+        "--duration-history",
+        action="store",
+        default=None,
+        help="Per-test duration history file (default: DURATION_HISTORY or .test_durations.json)"
+    )
+    parser.addoption(
+        "--no-duration-scheduling",
+        action="store_true",
+        default=False,
+        help="Use xdist's default load scheduling instead of slowest-tests-first"
+    )
+    parser.addoption(
+        "--asset-replay",
+        action="store_true",
+        default=False,
+        help="Record static assets on first use and replay them from ASSET_CACHE_DIR (Chrome)"
+    )
+    parser.addoption(
+        "--cache-mode",
+        action="store",
+        choices=("cold", "warm"),
+        default=None,
+        help="cold: empty browser profile per session; warm: clone a profile pre-warmed on every route (Chrome)"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=False,
+        help="Time every WebDriver command, wait and sleep; JSON in PROFILE_DIR, panel in the HTML report"
+    )
+    parser.addoption(
+        "--no-dom-only",
+        action="store_true",
+        default=False,
+        help="Run @pytest.mark.dom_only tests in the browser too (parity check)"
+    )
+    parser.addoption(
+        "--preflight",
+        action="store_true",
+        default=False,
+        help="Crawl every route over HTTP before launching browsers; abort the run on failures"
+    )
+    parser.addoption(
+        "--testid-gate",
+        action="store_true",
+        default=False,
+        help="Abort the run if a page-object testid is not rendered anywhere in src/ (static scan)"
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="REF",
+        help="Run only the tests affected by files changed since a git ref (test impact analysis)"
+    )
+    parser.addoption(
+        "--js-coverage",
+        action="store_true",
+        default=False,
+        help="Collect per-test JS coverage over CDP and map it to src/ (Chrome); lcov in JS_COVERAGE_DIR"
+    )
+    parser.addoption(
+        "--live-api",
+        action="store_true",
+        default=False,
+        help="Send /api/* requests to the real backend instead of the recorded fixtures"
+    )
+    parser.addoption(
+        "--rate-governor",
+        action="store_true",
+        default=False,
+        help="Hold live /api requests to the app's rate-limit budgets (shared across xdist workers)"
+    )
+    parser.addoption(
+        "--api-latency",
+        action="store",
+        type=float,
+        default=None,
+        help="Seconds of latency the API stub adds to every response (default: API_STUB_LATENCY or 0)"
+    )
 
 
 def pytest_configure(config):
-    """Configure pytest with command line options."""
+    """Register markers and configure pytest with command line options."""
+    config.addinivalue_line(
+        "markers", "smoke: mark test as smoke test (P0 - critical path)"
+    )
+    config.addinivalue_line(
+        "markers", "critical: mark test as critical path (P1)"
+    )
+    config.addinivalue_line(
+        "markers", "feature: mark test as feature test (P2)"
+    )
+    config.addinivalue_line(
+        "markers", "edge_case: mark test as edge case (P3)"
+    )
+    config.addinivalue_line(
+        "markers", "dom_only: test only reads server-rendered HTML; runs on DomDriver (no browser)"
+    )
+    config.addinivalue_line(
+        "markers", "unit: pure-Python test of a framework module (no browser, no app)"
+    )
+    
     if config.getoption("--headless"):
         TestData.HEADLESS = True
+    if config.getoption("--profile"):
+        TestData.CHROME_PROFILE = config.getoption("--profile")
     if config.getoption("--browser"):
         TestData.BROWSER = config.getoption("--browser")
     if config.getoption("--base-url"):
         TestData.BASE_URL = config.getoption("--base-url")
+    if config.getoption("--pool-size") is not None:
+        TestData.POOL_SIZE = config.getoption("--pool-size")
+    if config.getoption("--pool-max-uses") is not None:
+        TestData.POOL_MAX_USES = config.getoption("--pool-max-uses")
+    if config.getoption("--perf-collect"):
+        TestData.PERF_COLLECT = True
+    if config.getoption("--duration-history"):
+        TestData.DURATION_HISTORY = config.getoption("--duration-history")
+    if config.getoption("--asset-replay"):
+        TestData.ASSET_REPLAY = True
+    if config.getoption("--cache-mode"):
+        TestData.CACHE_MODE = config.getoption("--cache-mode")
+    if config.getoption("--no-dom-only"):
+        TestData.DOM_ONLY = False
+    if config.getoption("--profile-commands"):
+        TestData.PROFILE_COMMANDS = True
+    if config.getoption("--preflight"):
+        TestData.PREFLIGHT = True
+    if config.getoption("--testid-gate"):
+        TestData.TESTID_GATE = True
+    if config.getoption("--changed-since"):
+        TestData.CHANGED_SINCE = config.getoption("--changed-since")
+    if config.getoption("--js-coverage"):
+        TestData.JS_COVERAGE = True
+    if config.getoption("--live-api"):
+        TestData.API_STUB = False
+    if config.getoption("--api-latency") is not None:
+        TestData.API_STUB_LATENCY = config.getoption("--api-latency")
+    if config.getoption("--rate-governor"):
+        TestData.RATE_GOVERNOR = True
+    
+    if config.getoption("--results-db"):
+        TestData.RESULTS_DB = config.getoption("--results-db")
+    
+    # One results-store run per session; workers join the controller's run
+    global RESULTS_STORE, RESULTS_RUN_KEY
+    if not config.getoption("--no-results-store") and not config.getoption("--collect-only"):
+        RESULTS_STORE = ResultsStore(TestData.RESULTS_DB)
+        if hasattr(config, "workerinput"):
+            RESULTS_RUN_KEY = config.workerinput.get("results_run_key")
+        RESULTS_RUN_KEY = RESULTS_RUN_KEY or RESULTS_STORE.start_run(
+            browser=TestData.BROWSER, cache_mode=TestData.CACHE_MODE
+        )
+    
+    if TestData.PROFILE_COMMANDS and not config.getoption("--collect-only"):
+        if not hasattr(config, "workerinput"):
+            clear_reports()  # workers append to fresh files
+        CommandProfiler.install()
+    
+    global JS_COVERAGE
+    if TestData.JS_COVERAGE and not config.getoption("--collect-only"):
+        if not hasattr(config, "workerinput"):
+            js_coverage.clear_partials()  # workers write fresh partials
+        JS_COVERAGE = js_coverage.CoverageCollector()
+    
+    global RATE_GOVERNOR
+    if TestData.RATE_GOVERNOR and not config.getoption("--collect-only"):
+        RATE_GOVERNOR = RateGovernor()
+    
+    global ARTIFACT_WRITER
+    if not config.getoption("--collect-only"):
+        ARTIFACT_WRITER = ArtifactWriter()
+    
+    global ASSET_CACHE, PROFILE_TEMPLATE
+    if TestData.ASSET_REPLAY and not config.getoption("--collect-only"):
+        ASSET_CACHE = AssetCache(TestData.ASSET_CACHE_DIR, TestData.BASE_URL)
+    if TestData.CACHE_MODE == "warm" and not config.getoption("--collect-only"):
+        PROFILE_TEMPLATE = ProfileTemplate(TestData.PROFILE_TEMPLATE_DIR, TestData.BASE_URL)
+    
+    # Durations are recorded by the controller only (it sees every worker's reports)
+    if not hasattr(config, "workerinput"):
+        history = DurationHistory(TestData.DURATION_HISTORY)
+        config.pluginmanager.register(DurationRecorder(history), "duration_recorder")
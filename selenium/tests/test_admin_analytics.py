@@ -1,9 +1,9 @@
-import time
 from page_objects.admin_analytics_page import AdminAnalyticsPage
 from utils.test_data import TestData
+from utils.waits import NextJSWaits
 
 
-def test_admin_analytics_page_loads(driver):
+def test_admin_analytics_page_loads(driver, api_stub):
     page = AdminAnalyticsPage(driver, base_url=TestData.BASE_URL)
     page.load()
 
@@ -11,10 +11,10 @@ def test_admin_analytics_page_loads(driver):
     assert page.is_element_displayed(AdminAnalyticsPage.TITLE) or page.is_element_displayed(AdminAnalyticsPage.AUTH_INPUT)
 
 
-def test_admin_analytics_tab_navigation(driver):
+def test_admin_analytics_tab_navigation(driver, api_stub):
     page = AdminAnalyticsPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
 
     # If auth input present, set a dummy token (doesn't need to fully authenticate for our shallow checks)
     try:
@@ -25,7 +25,7 @@ def test_admin_analytics_tab_navigation(driver):
 
     # Open export tab (representative interaction)
     page.open_export_tab()
-    time.sleep(0.2)
+    NextJSWaits.wait_until_settled(driver, timeout=0.2)
     # Try to click export action if present (this is a non-destructive representative action)
     try:
         page.trigger_export()
@@ -35,5 +35,5 @@ def test_admin_analytics_tab_navigation(driver):
 
     # Open delete tab and ensure controls are present
     page.open_delete_tab()
-    time.sleep(0.2)
+    NextJSWaits.wait_until_settled(driver, timeout=0.2)
     assert page.is_element_displayed(AdminAnalyticsPage.DELETE_CONFIRM) or page.is_element_displayed(AdminAnalyticsPage.DELETE_ACTION)
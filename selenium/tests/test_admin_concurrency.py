@@ -0,0 +1,47 @@
+import pytest
+from utils.scenarios import (
+    Actor, ScenarioRunner, export_analytics, format_result, read_messages, sign_up, submit_contact,
+)
+from utils.test_data import TestData
+
+
+# These scenarios write to the live backend (contacts and users files) from
+# several browser sessions at once; the stub would hide the contention
+def _require_live_chrome():
+    if TestData.API_STUB:
+        pytest.skip("Multi-user scenarios need the live backend (--live-api)")
+    if TestData.BROWSER.lower() != "chrome":
+        pytest.skip("Multi-user scenarios lease sessions from the Chrome pool")
+
+
+def _report(result):
+    print()
+    for line in format_result(result):
+        print(line)
+
+
+def test_concurrent_contact_submissions_reach_admin(chrome_pool):
+    _require_live_chrome()
+    actors = [Actor("admin", read_messages), Actor("exporter", export_analytics)]
+    actors += [Actor(f"visitor-{i}", submit_contact) for i in range(TestData.SCENARIO_VISITORS)]
+
+    result = ScenarioRunner(chrome_pool).run(actors)
+    _report(result)
+
+    assert not result.errors, f"Actors failed: {result.errors}"
+    contacts = result.stores["contacts"]
+    assert contacts.acknowledged == TestData.SCENARIO_VISITORS, \
+        f"Every submission should be accepted: {contacts.statuses}"
+    assert not contacts.lost, f"Acknowledged messages never reached the admin: {contacts.lost}"
+
+
+def test_concurrent_signups_are_all_kept(chrome_pool):
+    _require_live_chrome()
+    actors = [Actor(f"signup-{i}", sign_up) for i in range(TestData.SCENARIO_VISITORS)]
+
+    result = ScenarioRunner(chrome_pool).run(actors)
+    _report(result)
+
+    assert not result.errors, f"Actors failed: {result.errors}"
+    users = result.stores["users"]
+    assert not users.lost, f"Accounts lost to concurrent writes of the users file: {users.lost}"
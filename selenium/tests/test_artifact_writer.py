@@ -0,0 +1,48 @@
+import os
+
+import pytest
+from utils.artifact_writer import enforce_limit
+
+
+pytestmark = pytest.mark.unit
+
+
+def _artifact(directory, name, size, used_at):
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    os.utime(path, (used_at, used_at))
+    return path
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    worker = tmp_path / "gw1"
+    worker.mkdir()
+    return {
+        "oldest": _artifact(tmp_path, "oldest.zip", 100, 1_000),
+        "older": _artifact(worker, "older.zip", 100, 2_000),
+        "recent": _artifact(tmp_path, "recent.zip", 100, 3_000),
+        "newest": _artifact(worker, "newest.zip", 100, 4_000),
+    }
+
+
+def test_least_recently_used_files_go_first(tmp_path, artifacts):
+    assert enforce_limit(tmp_path, max_bytes=250) == 2
+    assert sorted(path.name for path in tmp_path.rglob("*.zip")) == ["newest.zip", "recent.zip"]
+
+
+def test_kept_paths_are_never_evicted(tmp_path, artifacts):
+    assert enforce_limit(tmp_path, max_bytes=250, keep=[str(artifacts["oldest"])]) == 2
+    assert sorted(path.name for path in tmp_path.rglob("*.zip")) == ["newest.zip", "oldest.zip"]
+
+
+def test_reading_a_file_keeps_it(tmp_path, artifacts):
+    # A recent access (atime) counts as use, like a bundle someone just opened
+    os.utime(artifacts["oldest"], (5_000, 1_000))
+    enforce_limit(tmp_path, max_bytes=250)
+    assert artifacts["oldest"].exists() and not artifacts["older"].exists()
+
+
+def test_under_the_cap_nothing_is_evicted(tmp_path, artifacts):
+    assert enforce_limit(tmp_path, max_bytes=400) == 0
+    assert all(path.exists() for path in artifacts.values())
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+from utils.asset_cache import AssetCache, _cache_key, find_build_id, resolve_build_id
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("html, expected", [
+    ('<script id="__NEXT_DATA__">{"props":{},"buildId":"a1b2c3d4","isFallback":false}</script>', "a1b2c3d4"),
+    ('<script src="/_next/static/XyZ_build-9/_buildManifest.js"></script>', "XyZ_build-9"),
+    # Next 14 app router: AppRouter props in the flight data
+    ('self.__next_f.push([1,"0:[\\"$\\",\\"$L1\\",null,{\\"buildId\\":\\"development\\",\\"assetPrefix\\":\\"\\"}]"])',
+     "development"),
+    # Next 15 app router: root flight row
+    ('self.__next_f.push([1,"0:{\\"P\\":null,\\"b\\":\\"k3Jd9_Qx\\",\\"p\\":\\"\\"}"])', "k3Jd9_Qx"),
+    ('self.__next_f.push([1,"1:I[123]\\n0:{\\"b\\":\\"rootBuild\\",\\"p\\":\\"\\"}"])', "rootBuild"),
+])
+def test_find_build_id(html, expected):
+    assert find_build_id(html) == expected
+
+
+@pytest.mark.parametrize("html", [
+    "<html><body>No build here</body></html>",
+    # A "b" key in ordinary flight data is not the build ID
+    'self.__next_f.push([1,"5:{\\"a\\":1,\\"b\\":\\"abcdef12\\"}"])',
+    '<script>window.flags = {"b": "feature"}</script>',
+])
+def test_find_build_id_ignores_other_b_keys(html):
+    assert find_build_id(html) is None
+
+
+def test_dev_builds_are_keyed_by_the_source_fingerprint(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "page.tsx").write_text("export default 1")
+    dev = resolve_build_id('{"buildId":"development"}', str(tmp_path))
+    assert dev.startswith("development-") and len(dev) == len("development-") + 12
+    assert resolve_build_id("", str(tmp_path)).startswith("unknown-")
+    assert resolve_build_id('{"buildId":"prod123"}', str(tmp_path)) == "prod123"
+
+    (tmp_path / "src" / "page.tsx").write_text("export default 22")
+    assert resolve_build_id('{"buildId":"development"}', str(tmp_path)) != dev
+
+
+def test_cache_key_ignores_the_origin():
+    assert _cache_key("http://localhost:9002/_next/static/chunks/app.js") == "/_next/static/chunks/app.js"
+    assert _cache_key("http://127.0.0.1:3000/_next/image?url=%2Fa.png&w=64") == "/_next/image?url=%2Fa.png&w=64"
+
+
+class FakeHttp:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append(url)
+        return SimpleNamespace(status_code=200, content=b"body of " + url.encode(),
+                               headers={"Content-Type": "text/javascript", "Set-Cookie": "x=1"})
+
+
+def request(url, method="GET"):
+    return {"url": url, "method": method, "headers": {"Accept": "*/*", "Cookie": "x=1"}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AssetCache(tmp_path / "assets", "http://localhost:9002", app_root=str(tmp_path))
+    cache.build_id = "build-1"
+    cache._http = FakeHttp()
+    return cache
+
+
+def test_miss_records_and_hit_replays_across_origins(cache):
+    recorded = cache.intercept(request("http://localhost:9002/_next/static/chunks/app.js"))
+    replayed = cache.intercept(request("http://127.0.0.1:9002/_next/static/chunks/app.js"))
+    assert cache._http.calls == ["http://localhost:9002/_next/static/chunks/app.js"]
+    assert replayed.body == recorded.body == b"body of http://localhost:9002/_next/static/chunks/app.js"
+    assert replayed.headers == {"Content-Type": "text/javascript"}  # Set-Cookie is not kept
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_entries_are_per_build_and_pruned(cache):
+    cache.intercept(request("http://localhost:9002/_next/static/chunks/app.js"))
+    cache.build_id = "build-2"
+    assert cache.prune() == 1  # the build-1 object is no longer referenced
+    cache.intercept(request("http://localhost:9002/_next/static/chunks/app.js"))
+    assert len(cache._http.calls) == 2 and cache.stats["hits"] == 0
+
+
+@pytest.mark.parametrize("url, method", [
+    ("http://localhost:9002/_next/static/chunks/app.js", "POST"),
+    ("http://localhost:9002/_next/static/webpack/abc.webpack.hot-update.json", "GET"),
+])
+def test_writes_and_hot_reload_are_passed_through(cache, url, method):
+    assert cache.intercept(request(url, method)) is None
+    assert cache._http.calls == []
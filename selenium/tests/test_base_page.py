@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from page_objects.base_page import BasePage
+from utils.dom_driver import DomDriver, parse_html
+from utils.perf import OBSERVER_SCRIPT
+from utils.test_data import TestData
+
+
+pytestmark = pytest.mark.unit
+
+
+PRESENT = (By.CSS_SELECTOR, "[data-qa='present']")
+MISSING = (By.CSS_SELECTOR, "[data-qa='missing']")
+
+
+@pytest.fixture
+def page():
+    driver = DomDriver()
+    driver._root = parse_html('<main><p data-qa="present">Here</p></main>')
+    return BasePage(driver, base_url="http://fixture.invalid", timeout=5)
+
+
+def test_zero_wait_hit_returns_the_element(page):
+    assert page.find_element(PRESENT, timeout=0).text == "Here"
+    assert len(page.find_elements(PRESENT, timeout=0)) == 1
+
+
+@pytest.mark.parametrize("find", ["find_element", "find_elements"])
+def test_zero_wait_miss_fails_without_polling(page, find):
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        getattr(page, find)(MISSING, timeout=0)
+    assert time.monotonic() - started < BasePage.POLL_FREQUENCY
+
+
+def test_presence_probes(page):
+    assert page.is_present(PRESENT)
+    assert not page.is_present(MISSING)
+    assert page.is_absent(MISSING)
+    assert not page.is_absent(PRESENT)
+
+
+class NavigatingDriver:
+    """Chrome-like driver recording the scripts registered for new documents."""
+
+    def __init__(self):
+        self.registered = []
+        self.visited = []
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Page.addScriptToEvaluateOnNewDocument":
+            self.registered.append(params["source"])
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_async_script(self, script, *args):
+        return {"settled": True}
+
+    def set_script_timeout(self, seconds):
+        pass
+
+
+@pytest.mark.parametrize("collect", [False, True])
+def test_perf_observers_only_with_perf_collect(monkeypatch, collect):
+    monkeypatch.setattr(TestData, "PERF_COLLECT", collect)
+    driver = NavigatingDriver()
+    page = BasePage(driver, base_url="http://fixture.invalid", timeout=5)
+    monkeypatch.setattr(page.perf, "collect", lambda route: {"route": route})
+    monkeypatch.setattr(page.perf, "write_report", lambda metrics: None)
+
+    page.navigate_to("/")
+
+    assert driver.visited == ["http://fixture.invalid/"]
+    assert (OBSERVER_SCRIPT in driver.registered) is collect
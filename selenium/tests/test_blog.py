@@ -18,14 +18,14 @@ import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.waits import NextJSWaits
 
 
 @pytest.mark.smoke
 class TestBlogPageLoad:
     """Blog page load and rendering tests."""
 
-    def test_blog_page_loads(self, driver):
+    def test_blog_page_loads(self, driver, wait_for_element):
         """
         TEST B1.1: Blog page loads successfully
         
@@ -35,18 +35,18 @@ class TestBlogPageLoad:
         - Title present and visible
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Find blog container
-        blog_container = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-container']")
+        blog_container = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-container']"))
         assert blog_container.is_displayed(), "Blog container not visible"
         
         # Find blog title
-        blog_title = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-title']")
+        blog_title = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-title']"))
         assert blog_title.is_displayed(), "Blog title not visible"
         assert "Journal" in blog_title.text, f"Unexpected title: {blog_title.text}"
 
-    def test_blog_grid_visible(self, driver):
+    def test_blog_grid_visible(self, driver, wait_for_element):
         """
         TEST B1.2: Blog post grid renders
         
@@ -55,9 +55,9 @@ class TestBlogPageLoad:
         - At least one blog post present
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
-        blog_grid = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-grid']")
+        blog_grid = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-grid']"))
         assert blog_grid.is_displayed(), "Blog grid not visible"
         
         posts = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-post-card-']")
@@ -68,7 +68,7 @@ class TestBlogPageLoad:
 class TestBlogPostDisplay:
     """Blog post rendering and metadata tests."""
 
-    def test_blog_posts_have_metadata(self, driver):
+    def test_blog_posts_have_metadata(self, driver, wait_for_element):
         """
         TEST B1.3: Blog posts display required metadata
         
@@ -78,22 +78,22 @@ class TestBlogPostDisplay:
         - Post date present
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Check first post has all metadata
-        title = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-post-title-0']")
+        title = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-post-title-0']"))
         assert title.is_displayed(), "Post title not visible"
         assert len(title.text) > 0, "Post title is empty"
         
-        excerpt = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-post-excerpt-0']")
+        excerpt = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-post-excerpt-0']"))
         assert excerpt.is_displayed(), "Post excerpt not visible"
         assert len(excerpt.text) > 0, "Post excerpt is empty"
         
-        date = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-post-date-0']")
+        date = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-post-date-0']"))
         assert date.is_displayed(), "Post date not visible"
         assert len(date.text) > 0, "Post date is empty"
 
-    def test_blog_posts_clickable(self, driver):
+    def test_blog_posts_clickable(self, driver, wait_for_element):
         """
         TEST B1.4: Blog posts are clickable and navigate
         
@@ -102,10 +102,10 @@ class TestBlogPostDisplay:
         - Click navigates to post detail page
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Get the first post card
-        post_card = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-post-card-0']")
+        post_card = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-post-card-0']"))
         assert post_card.is_displayed(), "Post card not visible"
         
         # Click using JavaScript (more reliable for Next.js routing)
@@ -124,7 +124,7 @@ class TestBlogPostDisplay:
 class TestBlogFiltering:
     """Blog post filtering functionality tests."""
 
-    def test_blog_filter_controls_present(self, driver):
+    def test_blog_filter_controls_present(self, driver, wait_for_element):
         """
         TEST B1.5: Blog filter controls are present
         
@@ -133,15 +133,15 @@ class TestBlogFiltering:
         - At least one tag filter available
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
-        filter_section = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-filter']")
+        filter_section = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-filter']"))
         assert filter_section.is_displayed(), "Filter section not visible"
         
         tag_filters = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-filter-tag-']")
         assert len(tag_filters) > 0, "No tag filters found"
 
-    def test_blog_filter_functionality(self, driver):
+    def test_blog_filter_functionality(self, driver, wait_for_element):
         """
         TEST B1.6: Blog filtering works correctly
         
@@ -152,7 +152,7 @@ class TestBlogFiltering:
         - Clear resets to all posts
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Get initial post count
         initial_posts = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-post-card-']")
@@ -163,13 +163,13 @@ class TestBlogFiltering:
         tag_filters = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-filter-tag-']")
         if len(tag_filters) > 0:
             tag_filters[0].click()
-            time.sleep(1)
+            NextJSWaits.wait_until_settled(driver, timeout=1)
             
             # Check if clear button appears
             try:
-                clear_btn = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-filter-clear']")
+                clear_btn = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-filter-clear']"), timeout=2)
                 clear_btn.click()
-                time.sleep(1)
+                NextJSWaits.wait_until_settled(driver, timeout=1)
                 
                 # Verify posts are shown again
                 posts_after_clear = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-post-card-']")
@@ -183,7 +183,7 @@ class TestBlogFiltering:
 class TestBlogNavigation:
     """Blog navigation and integration tests."""
 
-    def test_blog_accessible_from_navigation(self, driver):
+    def test_blog_accessible_from_navigation(self, driver, wait_for_element):
         """
         TEST B1.7: Blog accessible from main navigation
         
@@ -192,19 +192,19 @@ class TestBlogNavigation:
         - Clicking navigates to blog page
         """
         driver.get("http://localhost:9002")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Find blog navigation link
         try:
-            blog_nav_link = driver.find_element(By.CSS_SELECTOR, "a[href='/blog']")
+            blog_nav_link = wait_for_element((By.CSS_SELECTOR, "a[href='/blog']"))
             assert blog_nav_link.is_displayed(), "Blog nav link not visible"
             
             blog_nav_link.click()
-            time.sleep(1.5)
+            NextJSWaits.wait_for_route_change(driver, "/blog", timeout=1.5)
             
             # Verify on blog page
             assert "/blog" in driver.current_url, "Navigation to blog failed"
-            blog_container = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-container']")
+            blog_container = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-container']"))
             assert blog_container.is_displayed(), "Blog page not loaded"
         except:
             # Blog link might not be visible on all nav layouts
@@ -219,7 +219,7 @@ class TestBlogNavigation:
         - Page loads without critical issues
         """
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         logs = driver.get_log('browser')
         severe_errors = [log for log in logs if log['level'] == 'SEVERE']
@@ -236,7 +236,7 @@ class TestBlogNavigation:
 class TestBlogResponsive:
     """Blog responsive design tests."""
 
-    def test_blog_responsive_desktop(self, driver):
+    def test_blog_responsive_desktop(self, driver, wait_for_element):
         """
         TEST B1.9: Blog page responsive on desktop
         
@@ -245,15 +245,15 @@ class TestBlogResponsive:
         """
         driver.set_window_size(1024, 768)
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
-        blog_container = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-container']")
+        blog_container = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-container']"))
         assert blog_container.is_displayed(), "Blog container not visible on desktop"
         
         posts = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-post-card-']")
         assert len(posts) > 0, "No posts visible on desktop"
 
-    def test_blog_responsive_mobile(self, driver):
+    def test_blog_responsive_mobile(self, driver, wait_for_element):
         """
         TEST B1.10: Blog page responsive on mobile
         
@@ -262,9 +262,9 @@ class TestBlogResponsive:
         """
         driver.set_window_size(375, 667)
         driver.get("http://localhost:9002/blog")
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
-        blog_container = driver.find_element(By.CSS_SELECTOR, "[data-testid='blog-container']")
+        blog_container = wait_for_element((By.CSS_SELECTOR, "[data-testid='blog-container']"))
         assert blog_container.is_displayed(), "Blog container not visible on mobile"
         
         posts = driver.find_elements(By.CSS_SELECTOR, "[data-testid^='blog-post-card-']")
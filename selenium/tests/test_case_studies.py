@@ -1,13 +1,13 @@
-import time
 from selenium.webdriver.common.by import By
 from page_objects.case_studies_page import CaseStudiesPage, CaseStudyDetailPage
 from utils.test_data import TestData
+from utils.waits import NextJSWaits
 
 
 def test_case_studies_list_and_navigate(driver):
     page = CaseStudiesPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
 
     cards = page.get_case_cards()
     if not cards:
@@ -17,7 +17,7 @@ def test_case_studies_list_and_navigate(driver):
     first = cards[0]
     link = first.find_element(By.TAG_NAME, 'a')
     link.click()
-    time.sleep(0.6)
+    NextJSWaits.wait_until_settled(driver, timeout=0.6)
 
     detail = CaseStudyDetailPage(driver, base_url=TestData.BASE_URL)
     assert detail.is_loaded(), "Case study detail did not load problem section"
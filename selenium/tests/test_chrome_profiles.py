@@ -0,0 +1,23 @@
+import pytest
+from utils.chrome_profiles import PROFILES, chrome_options
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_fidelity_keeps_the_original_launch_flags():
+    # create_chrome_driver's flags before launch profiles existed
+    assert set(chrome_options("fidelity", headless=False).arguments) == {
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--start-maximized",
+        "--disable-blink-features=AutomationControlled",
+    }
+
+
+@pytest.mark.parametrize("name", [name for name, profile in PROFILES.items() if profile.headless])
+def test_headless_profiles_size_the_window_at_launch(name):
+    arguments = chrome_options(name).arguments
+    assert "--headless=new" in arguments
+    assert any(argument.startswith("--window-size=") for argument in arguments)
@@ -1,6 +1,6 @@
 import pytest
-import time
 from page_objects.contact_page import ContactPage
+from utils.waits import NextJSWaits
 
 
 class TestContactPageLoad:
@@ -10,14 +10,14 @@ class TestContactPageLoad:
         """Test that contact page loads successfully."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.verify_contact_page_loaded()
     
     def test_contact_form_visible(self, driver):
         """Test that contact form is visible."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.is_form_visible()
 
 
@@ -28,14 +28,14 @@ class TestContactFormFields:
         """Test that all form fields are present."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.verify_all_form_fields_present()
     
     def test_form_fields_accept_input(self, driver):
         """Test that form fields accept input."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         contact_page.fill_form(
             "Test User",
@@ -58,14 +58,14 @@ class TestContactMethods:
         """Test that contact methods sidebar is visible."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.verify_contact_methods_sidebar_visible()
     
     def test_contact_methods_available(self, driver):
         """Test that contact methods are available."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         methods = contact_page.get_available_contact_methods()
         assert len(methods) > 0
@@ -74,7 +74,7 @@ class TestContactMethods:
         """Test that email contact method is clickable."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         methods = contact_page.get_available_contact_methods()
         # If email is available, try to click it
@@ -94,14 +94,14 @@ class TestContactSubmit:
         """Test that submit button is visible."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.is_submit_button_visible()
     
     def test_submit_button_enabled(self, driver):
         """Test that submit button is enabled."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert contact_page.is_submit_button_enabled()
 
 
@@ -113,7 +113,7 @@ class TestContactResponsive:
         driver.set_window_size(1024, 768)
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert contact_page.verify_contact_page_loaded()
         assert contact_page.verify_contact_methods_sidebar_visible()
@@ -123,7 +123,7 @@ class TestContactResponsive:
         driver.set_window_size(375, 667)
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert contact_page.verify_contact_page_loaded()
         assert contact_page.verify_all_form_fields_present()
@@ -136,7 +136,7 @@ class TestContactPageTitle:
         """Test that page has a title."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         title = contact_page.get_form_title()
         assert title is not None and len(title) > 0
@@ -145,7 +145,7 @@ class TestContactPageTitle:
         """Test that page has a description."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         description = contact_page.get_page_description()
         assert description is not None and len(description) > 0
@@ -158,7 +158,7 @@ class TestContactAccessibility:
         """Test that page text is visible and readable."""
         contact_page = ContactPage(driver)
         contact_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Check that key elements have text content
         title = contact_page.get_form_title()
@@ -0,0 +1,146 @@
+import pytest
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.webdriver.common.by import By
+from utils.dom_driver import DomElement, parse_html, select
+
+
+pytestmark = pytest.mark.unit
+
+
+PAGE = """
+<!DOCTYPE html>
+<html><head><title>Fixture</title><script>var x = "<div id='fake'>";</script></head>
+<body>
+  <nav id="top" class="nav main-nav">
+    <a href="/" class="link active">Home</a>
+    <a href="/blog" class="link" data-qa="nav-blog">Blog posts</a>
+  </nav>
+  <main>
+    <section data-qa="hero-section" lang="en-US">
+      <h1 data-qa="hero-title">Hello<br>world</h1>
+      <p class="lead">First</p>
+      <p class="lead note">Second</p>
+      <span>Third</span>
+    </section>
+    <ul data-qa="project-list">
+      <li data-qa="project-card-0" data-tags="ai web">Zero</li>
+      <li data-qa="project-card-1" data-tags="web">One</li>
+      <li data-qa="project-card-featured" hidden>Featured</li>
+    </ul>
+    <form>
+      <input name="email" type="email" disabled>
+      <input name="token" type="hidden" value="secret">
+      <div style="display: none"><span data-qa="ghost">Ghost</span></div>
+    </form>
+  </main>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def root():
+    return parse_html(PAGE)
+
+
+def _qa(nodes):
+    return [node.attrs.get("data-qa") for node in nodes]
+
+
+def _css(root, selector):
+    return select(root, By.CSS_SELECTOR, selector)
+
+
+@pytest.mark.parametrize("selector, expected", [
+    ("h1", 1),
+    ("*", 24),
+    ("#top", 1),
+    (".link", 2),
+    (".link.active", 1),
+    ("nav.main-nav > a", 2),
+    ("[data-qa]", 8),
+    ("[data-qa='hero-title']", 1),
+    ('[data-qa="hero-title"]', 1),
+    ("[data-qa=hero-title]", 1),
+    ("[data-qa^='project-card-']", 3),
+    ("[data-qa$='-list']", 1),
+    ("[data-qa*='card']", 3),
+    ("[data-tags~='web']", 2),
+    ("[data-tags~='we']", 0),
+    ("[lang|='en']", 1),
+    ("[data-qa^='']", 0),
+    ("li:not([hidden])", 2),
+    ("p:not(.note)", 1),
+    ("main p", 2),
+    ("main > p", 0),
+    ("h1 + p", 1),
+    ("h1 ~ p", 2),
+    ("h1 ~ span", 1),
+    ("p + p.note", 1),
+    ("h1, .lead, h1", 3),
+])
+def test_css_selector_counts(root, selector, expected):
+    assert len(_css(root, selector)) == expected, selector
+
+
+def test_css_results_are_in_document_order_without_duplicates(root):
+    nodes = _css(root, "li, [data-qa^='project-card']")
+    assert _qa(nodes) == ["project-card-0", "project-card-1", "project-card-featured"]
+
+
+def test_script_content_is_not_parsed_as_markup(root):
+    assert _css(root, "#fake") == []
+
+
+def test_descendant_combinator_checks_every_ancestor(root):
+    assert _qa(_css(root, "main section h1")) == ["hero-title"]
+    assert _css(root, "nav h1") == []
+
+
+@pytest.mark.parametrize("by, value, expected", [
+    (By.ID, "top", 1),
+    (By.NAME, "email", 1),
+    (By.CLASS_NAME, "lead", 2),
+    (By.TAG_NAME, "LI", 3),
+    (By.LINK_TEXT, "Home", 1),
+    (By.PARTIAL_LINK_TEXT, "posts", 1),
+    (By.LINK_TEXT, "Blog", 0),
+])
+def test_other_strategies(root, by, value, expected):
+    assert len(select(root, by, value)) == expected
+
+
+@pytest.mark.parametrize("by, value", [
+    (By.XPATH, "//h1"),
+    (By.CSS_SELECTOR, "li:first-child"),
+    (By.CSS_SELECTOR, "a::before"),
+    (By.CSS_SELECTOR, ".lead h1("),
+    (By.CSS_SELECTOR, ""),
+    (By.CSS_SELECTOR, "h1,"),
+])
+def test_unsupported_selectors_raise(root, by, value):
+    with pytest.raises(InvalidSelectorException):
+        select(root, by, value)
+
+
+def test_visibility_follows_markup(root):
+    def displayed(selector):
+        return DomElement(None, _css(root, selector)[0]).is_displayed()
+
+    assert displayed("[data-qa='hero-title']")
+    assert not displayed("[data-qa='project-card-featured']")
+    assert not displayed("[data-qa='ghost']")
+    assert not displayed("input[name='token']")
+    assert not displayed("title")
+
+
+def test_element_text_and_attributes(root):
+    title = DomElement(None, _css(root, "h1")[0])
+    assert title.text == "Hello\nworld"
+    assert DomElement(None, _css(root, "ul")[0]).text == "Zero\nOne"
+    assert DomElement(None, _css(root, "[data-qa='ghost']")[0]).text == ""
+
+    email = DomElement(None, _css(root, "input[name='email']")[0])
+    assert not email.is_enabled()
+    assert email.get_attribute("disabled") == "true"
+    assert email.get_attribute("type") == "email"
+    assert DomElement(None, _css(root, "a")[0]).get_attribute("className") == "link active"
@@ -0,0 +1,59 @@
+import pytest
+from selenium.webdriver.common.by import By
+from utils.dom_snapshot import ElementState, PageSnapshot, script_args
+
+
+pytestmark = pytest.mark.unit
+
+
+LOCATORS = {
+    "title": (By.CSS_SELECTOR, "[data-qa='title']"),
+    "cards": (By.CLASS_NAME, "card"),
+    "banner": (By.ID, "banner"),
+}
+
+
+def test_script_args_keep_locator_order():
+    specs, max_texts = script_args(LOCATORS, max_texts=5)
+    assert specs == [
+        ["title", "css selector", "[data-qa='title']"],
+        ["cards", "class name", "card"],
+        ["banner", "id", "banner"],
+    ]
+    assert max_texts == 5
+
+
+def test_script_args_reject_unsupported_strategies():
+    with pytest.raises(ValueError, match="'shadow'"):
+        script_args({"shadow": ("-ios predicate string", "x")})
+
+
+def test_snapshot_from_script_result():
+    snap = PageSnapshot.from_script_result(LOCATORS, {
+        "title": {"count": 1, "visible": True, "text": "Hello", "texts": ["Hello"],
+                  "attributes": {"data-qa": "title"}, "rect": {"x": 0, "y": 0, "width": 10, "height": 5}},
+        "cards": {"count": 3, "visible": False, "text": "A", "texts": ["A", "B", "C"]},
+    })
+
+    assert snap["title"].text == "Hello" and snap["title"].attributes == {"data-qa": "title"}
+    assert snap["cards"].count == 3 and snap["cards"].texts == ["A", "B", "C"]
+    # Names the script did not answer for are absent, not errors
+    assert not snap["banner"] and snap["banner"].error is None
+    assert "banner" in snap and "footer" not in snap
+    assert snap.all_present("title", "cards")
+    assert not snap.all_present()
+    assert not snap.all_visible("title", "cards")
+    assert snap.missing() == ["banner"]
+    assert snap.missing(visible=True) == ["cards", "banner"]
+
+
+def test_empty_script_result_leaves_every_locator_missing():
+    snap = PageSnapshot.from_script_result(LOCATORS, None)
+    assert [state.name for state in snap] == ["title", "cards", "banner"]
+    assert snap.missing() == list(LOCATORS)
+
+
+def test_element_state_carries_script_errors():
+    state = ElementState("bad", (By.XPATH, "//["), error="Invalid XPath")
+    assert not state.present and state.error == "Invalid XPath"
+    assert "present=False" in repr(state)
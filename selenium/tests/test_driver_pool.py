@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+from utils.driver_pool import DriverPool
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSwitch:
+    def window(self, handle):
+        pass
+
+
+class FakeCdpDriver:
+    """Records CDP commands; one tab whose handle is its CDP target id."""
+
+    def __init__(self):
+        self.cdp = []
+        self.window_handles = ["T1"]
+        self.current_window_handle = "T1"
+        self.switch_to = FakeSwitch()
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+        if command == "Target.getTargets":
+            return {"targetInfos": [{"type": "page", "targetId": "T1"}]}
+        return {}
+
+    def get(self, url):
+        pass
+
+    def set_window_size(self, width, height):
+        pass
+
+    def quit(self):
+        pass
+
+
+class LoggingCdpDriver(FakeCdpDriver):
+    """Buffers log entries until read, like ChromeDriver."""
+
+    def __init__(self):
+        super().__init__()
+        self.logs = {"browser": [], "performance": []}
+
+    def get_log(self, log_type):
+        entries, self.logs[log_type] = self.logs[log_type], []
+        return entries
+
+
+@pytest.fixture
+def pool():
+    return DriverPool(FakeCdpDriver, size=2, max_uses=0, base_url="http://localhost:9002/")
+
+
+def test_reset_clears_service_workers_and_cache_storage(pool):
+    with pool.lease():
+        pass
+    driver = pool.acquire()
+    cleared = [params for command, params in driver.cdp if command == "Storage.clearDataForOrigin"]
+    assert cleared and cleared[0]["origin"] == "http://localhost:9002"
+    assert {"service_workers", "cache_storage", "local_storage", "indexeddb"} <= set(
+        cleared[0]["storageTypes"].split(","))
+
+
+def test_stats_add_up_under_concurrent_leases(pool):
+    def worker():
+        for _ in range(50):
+            with pool.lease():
+                pass
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.stats
+    assert stats["created"] + stats["reused"] == 400
+    # Every created session is either idle or was recycled because the pool was full
+    assert stats["created"] - stats["recycled"] == len(pool._idle) <= 2
+
+
+def test_reset_discards_logs_and_network_tracker():
+    pool = DriverPool(LoggingCdpDriver, size=1, max_uses=0, base_url="http://localhost:9002/")
+    with pool.lease() as driver:
+        driver.logs["browser"].append({"level": "SEVERE", "message": "boom"})
+        driver.logs["performance"].append({"message": "{}"})
+        driver._e2e_network_tracker = object()
+
+    reused = pool.acquire()
+    assert reused is driver
+    assert reused.get_log("browser") == []
+    assert reused.get_log("performance") == []
+    assert not hasattr(reused, "_e2e_network_tracker")
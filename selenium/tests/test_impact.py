@@ -0,0 +1,42 @@
+import pytest
+from utils.impact import ImpactMap
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def impact():
+    return ImpactMap(coverage_path="/nonexistent/impact-coverage.json")
+
+
+def test_page_change_selects_the_tests_of_its_route(impact):
+    affected = impact.tests_for("src/app/blog/page.tsx")
+    assert affected, "Blog page changes should select tests"
+    assert all(key.startswith(("tests/test_blog.py::", "tests/test_performance.py::")) for key in affected)
+
+
+@pytest.mark.parametrize("path", [
+    "src/components/Gone.tsx",
+    "src/app/removed-route/page.tsx",
+    "selenium/page_objects/gone_page.py",
+])
+def test_deleted_or_renamed_file_runs_everything(impact, path):
+    assert impact.tests_for(path) is None
+    selection = impact.select([path])
+    assert selection.run_all and selection.run_all_because == [path]
+    assert all(selection.selects(key) for key in impact.index.tests)
+
+
+def test_deleted_test_file_selects_nothing(impact):
+    assert impact.tests_for("selenium/tests/test_gone.py") == set()
+
+
+@pytest.mark.parametrize("path", ["package.json", "next.config.mjs", "selenium/utils/waits.py"])
+def test_shared_files_run_everything(impact, path):
+    assert impact.tests_for(path) is None
+
+
+def test_docs_are_ignored(impact):
+    assert impact.tests_for("docs/TEST_STRATEGY.md") == set()
+    assert impact.select(["README.md"]).ignored == ["README.md"]
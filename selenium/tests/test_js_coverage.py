@@ -0,0 +1,62 @@
+import pytest
+from utils.js_coverage import MappedScript, decode_mappings, flatten_ranges, src_path
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_decode_mappings_accumulates_across_lines():
+    # Line 0: col 0 -> line 0; col 4 -> line 1. Line 1 (column resets): col 2 -> line 17, then back to line 16
+    assert decode_mappings("AAAA,IACA;EAgBC,CADA") == [
+        (0, 0, 0, 0),
+        (0, 4, 0, 1),
+        (1, 2, 0, 17),
+        (1, 3, 0, 16),
+    ]
+
+
+def test_decode_mappings_skips_empty_and_unmapped_segments():
+    # Empty lines, and one-field segments (generated column only) have no source
+    assert decode_mappings(";;AAAA,C,CCAA") == [(2, 0, 0, 0), (2, 2, 1, 0)]
+
+
+def ranges(*triples):
+    return [{"startOffset": start, "endOffset": end, "count": count} for start, end, count in triples]
+
+
+def test_flatten_ranges_innermost_wins():
+    functions = [{"ranges": ranges((0, 100, 1), (10, 20, 0), (30, 40, 0))}]
+    assert flatten_ranges(functions) == [(0, 10, 1), (10, 20, 0), (20, 30, 1), (30, 40, 0), (40, 100, 1)]
+
+
+def test_flatten_ranges_across_functions():
+    functions = [
+        {"ranges": ranges((0, 50, 1))},
+        {"ranges": ranges((10, 20, 3), (12, 14, 0))},
+        {"ranges": ranges((60, 70, 0))},
+    ]
+    assert flatten_ranges(functions) == [
+        (0, 10, 1), (10, 12, 3), (12, 14, 0), (14, 20, 3), (20, 50, 1), (60, 70, 0),
+    ]
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("webpack://_N_E/./src/components/Header.tsx?abc", "src/components/Header.tsx"),
+    ("webpack://_N_E/src/app/page.tsx", "src/app/page.tsx"),
+    ("webpack://_N_E/./node_modules/react/index.js", None),
+    ("webpack://_N_E/webpack/bootstrap", None),
+])
+def test_src_path(name, expected):
+    assert src_path(name) == expected
+
+
+def test_mapped_script_reports_executed_lines():
+    text = "aaaa\nbbbb\n"
+    source_map = {
+        "sources": ["webpack://_N_E/./src/lib/util.ts", "webpack://_N_E/./node_modules/x.js"],
+        # Line 0 col 0 -> util.ts:1; line 1 col 0 -> util.ts:2; line 1 col 2 -> node_modules
+        "mappings": "AAAA;AACA,ECAA",
+    }
+    script = MappedScript(text, source_map)
+    # Offset 0-5 (line 0) ran, offset 5-10 (line 1) did not
+    assert script.lines([(0, 5, 1), (5, 10, 0)]) == {"src/lib/util.ts": ({1, 2}, {1})}
@@ -0,0 +1,43 @@
+import pytest
+from utils.load_test import LatencyHistogram
+
+
+pytestmark = pytest.mark.unit
+
+
+def histogram(values):
+    hist = LatencyHistogram()
+    for seconds in values:
+        hist.record(seconds)
+    return hist
+
+
+def test_percentiles_of_uniform_latencies():
+    # 1ms .. 1000ms; the true pN is N * 10ms
+    hist = histogram(ms / 1000 for ms in range(1, 1001))
+    for percent in (50, 90, 95, 99):
+        true = percent * 10 / 1000
+        reported = hist.percentile(percent)
+        assert true <= reported <= true * (1 + 1 / 64), (percent, reported)
+    assert hist.percentile(100) == pytest.approx(1.0)
+    assert hist.to_dict()["min"] == 1.0
+
+
+@pytest.mark.parametrize("seconds", [0.000_05, 0.001_234, 0.087_654, 1.5, 42.0])
+def test_every_value_is_reported_within_one_sub_bucket(seconds):
+    hist = histogram([seconds, seconds * 10])
+    reported = hist.percentile(50)
+    assert seconds <= reported <= seconds * (1 + 1 / 64)
+
+
+def test_merge_matches_recording_everything_in_one():
+    first = histogram(ms / 1000 for ms in range(1, 501))
+    second = histogram(ms / 1000 for ms in range(501, 1001))
+    first.merge(second)
+    whole = histogram(ms / 1000 for ms in range(1, 1001))
+    assert first.to_dict() == whole.to_dict()
+
+
+def test_empty_histogram_has_no_percentiles():
+    assert LatencyHistogram().percentile(99) is None
+    assert LatencyHistogram().to_dict()["p50"] is None
@@ -0,0 +1,37 @@
+import pytest
+from utils.locators import DynamicTestId, InvalidLocator, TestIdIndex
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_dynamic_testid_builds_exact_and_prefix_locators():
+    card = DynamicTestId("blog-post-card-{}")
+    assert card.id(3) == "blog-post-card-3"
+    assert card(3) == ("css selector", "[data-testid='blog-post-card-3']")
+    assert card.all() == ("css selector", "[data-testid^='blog-post-card-']")
+
+
+def test_dynamic_testid_needs_a_placeholder():
+    template = "blog-post-card"
+    with pytest.raises(InvalidLocator):
+        DynamicTestId(template)
+
+
+def test_index_placeholder_keeps_featured_cards_out():
+    loose = DynamicTestId("project-card-{}")
+    indexed = DynamicTestId("project-card-{}", DynamicTestId.INDEX)
+    assert loose.matches("project-card-featured-0")
+    assert not indexed.matches("project-card-featured-0")
+    assert indexed.matches("project-card-12")
+
+
+def test_matching_sorts_numeric_indices():
+    index = TestIdIndex({
+        "project-card-10": "c10",
+        "project-card-featured-0": "f0",
+        "project-card-2": "c2",
+        "project-title-0": "t0",
+    })
+    found = index.matching(DynamicTestId("project-card-{}", DynamicTestId.INDEX))
+    assert [value for _, value in found] == ["c2", "c10"]
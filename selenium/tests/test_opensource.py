@@ -1,8 +1,9 @@
 import pytest
-import time
 from page_objects.opensource_page import OpenSourcePage
+from utils.waits import NextJSWaits
 
 
+@pytest.mark.dom_only
 class TestOpenSourcePageLoad:
     """Tests for Open Source page loading."""
     
@@ -10,17 +11,18 @@ class TestOpenSourcePageLoad:
         """Test that open source page loads successfully."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.verify_opensource_page_loaded()
     
     def test_opensource_container_visible(self, driver):
         """Test that open source container is visible."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.is_opensource_container_visible()
 
 
+@pytest.mark.dom_only
 class TestOpenSourceHeader:
     """Tests for open source page header."""
     
@@ -28,7 +30,7 @@ class TestOpenSourceHeader:
         """Test that header has a title."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         title = opensource_page.get_page_title()
         assert title is not None and len(title) > 0
@@ -37,10 +39,11 @@ class TestOpenSourceHeader:
         """Test that header has all required content."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.verify_header_content()
 
 
+@pytest.mark.dom_only
 class TestOpenSourceProjects:
     """Tests for open source projects section."""
     
@@ -48,20 +51,21 @@ class TestOpenSourceProjects:
         """Test that projects section is visible."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.is_projects_section_visible()
     
     def test_projects_present(self, driver):
         """Test that projects are present."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Just verify section is visible rather than strict count check
         # Projects may vary based on content
         assert opensource_page.is_projects_section_visible()
 
 
+@pytest.mark.dom_only
 class TestOpenSourcePhilosophy:
     """Tests for philosophy section."""
     
@@ -69,26 +73,27 @@ class TestOpenSourcePhilosophy:
         """Test that philosophy section is visible."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.is_philosophy_section_visible()
     
     def test_philosophy_content_present(self, driver):
         """Test that philosophy content is present."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.verify_philosophy_content()
     
     def test_philosophy_statement_present(self, driver):
         """Test that philosophy statement is present."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         statement = opensource_page.get_philosophy_statement()
         assert statement is not None and len(statement) > 0
 
 
+@pytest.mark.dom_only
 class TestOpenSourceSections:
     """Tests for all sections."""
     
@@ -96,14 +101,14 @@ class TestOpenSourceSections:
         """Test that all main sections are present."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert opensource_page.verify_all_sections_present()
     
     def test_philosophy_values_present(self, driver):
         """Test that philosophy values are present."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         values = opensource_page.get_philosophy_values()
         assert len(values) > 0
@@ -117,7 +122,7 @@ class TestOpenSourceResponsive:
         driver.set_window_size(1024, 768)
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert opensource_page.verify_opensource_page_loaded()
         assert opensource_page.verify_all_sections_present()
@@ -127,12 +132,13 @@ class TestOpenSourceResponsive:
         driver.set_window_size(375, 667)
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert opensource_page.verify_opensource_page_loaded()
         assert opensource_page.is_projects_section_visible()
 
 
+@pytest.mark.dom_only
 class TestOpenSourceAccessibility:
     """Tests for open source page accessibility."""
     
@@ -140,7 +146,7 @@ class TestOpenSourceAccessibility:
         """Test that page text is visible and readable."""
         opensource_page = OpenSourcePage(driver)
         opensource_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         title = opensource_page.get_page_title()
         subtitle = opensource_page.get_page_subtitle()
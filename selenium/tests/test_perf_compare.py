@@ -0,0 +1,43 @@
+import pytest
+from utils.perf_compare import compare, mann_whitney_greater
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_clearly_larger_sample():
+    # U = 9 of 9; z = (9 - 4.5 - 0.5) / sqrt(5.25) = 1.7457
+    u, p = mann_whitney_greater([4, 5, 6], [1, 2, 3])
+    assert u == 9
+    assert p == pytest.approx(0.04043, abs=1e-4)
+
+
+def test_ties_use_mid_ranks_and_the_tie_correction():
+    # Ranks 1, 3, 3 | 3, 5.5, 5.5 -> U = 1; variance = 9/12 * (7 - 30/30) = 4.5
+    u, p = mann_whitney_greater([1, 2, 2], [2, 3, 3])
+    assert u == 1
+    assert p == pytest.approx(0.97033, abs=1e-4)
+
+
+def test_u_statistics_of_both_samples_add_up():
+    recent, baseline = [1.2, 3.4, 2.2, 5.0, 0.7], [2.0, 2.2, 4.1, 1.1]
+    u_recent, _ = mann_whitney_greater(recent, baseline)
+    u_baseline, _ = mann_whitney_greater(baseline, recent)
+    assert u_recent + u_baseline == len(recent) * len(baseline)
+
+
+def test_identical_values_are_never_significant():
+    assert mann_whitney_greater([1.0] * 4, [1.0] * 4)[1] == 1.0
+
+
+def test_compare_flags_only_significant_and_large_increases():
+    series = {
+        "slower": {"r1": [2.0, 2.1], "r2": [2.2, 2.3], "b1": [1.0, 1.1], "b2": [1.2, 1.05]},
+        "noise": {"r1": [1.0, 1.02], "r2": [0.99, 1.01], "b1": [1.0, 1.01], "b2": [0.98, 1.02]},
+        "too-few": {"r1": [9.0], "b1": [1.0, 1.0, 1.0]},
+    }
+    results = {r["key"]: r for r in compare(series, ["r1", "r2"], ["b1", "b2"],
+                                            alpha=0.05, min_effect=0.10, min_samples=3)}
+    assert set(results) == {"slower", "noise"}
+    assert results["slower"]["regressed"] and results["slower"]["change"] > 0.5
+    assert not results["noise"]["regressed"]
@@ -0,0 +1,38 @@
+"""
+PERFORMANCE TESTS - Web Vitals Budgets
+
+Loads every route in TestData.PAGES and checks its metrics against
+TestData.PERFORMANCE_BENCHMARKS:
+- Page load time (loadEventEnd)
+- First paint / First Contentful Paint
+- Largest Contentful Paint
+- Cumulative Layout Shift
+- First Input Delay (only when the browser reports one)
+
+A JSON report per route is written to TestData.PERF_REPORT_DIR.
+Run with --cache-mode warm to measure repeat visits instead of first visits.
+"""
+
+import pytest
+from page_objects.base_page import BasePage
+from utils.test_data import TestData
+
+
+@pytest.mark.parametrize("route", TestData.PAGES.values(), ids=TestData.PAGES.keys())
+def test_route_within_performance_budget(driver, route):
+    """Route loads within the performance budgets."""
+    page = BasePage(driver, base_url=TestData.BASE_URL)
+
+    # Warm-up: the Next.js dev server compiles a route on its first request
+    page.navigate_to(route)
+    # Cold cache mode measures a first visit; warm mode keeps the cached bundle
+    if TestData.CACHE_MODE == "cold" and hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+    metrics = page.measure_navigation(route)
+
+    print(f"\n⏱️  {route}: load {metrics['page_load_time']}s, "
+          f"FCP {metrics['first_contentful_paint']}s, "
+          f"LCP {metrics['largest_contentful_paint']}s, "
+          f"CLS {metrics['cumulative_layout_shift']}")
+    page.perf.assert_budgets(metrics)
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from utils import profile_template
+from utils.profile_template import ProfileTemplate, _pid_alive
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_own_process_is_alive():
+    assert _pid_alive(os.getpid())
+
+
+def test_exited_process_is_not_alive():
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    assert not _pid_alive(child.pid)
+
+
+def test_windows_never_signals_the_process(monkeypatch):
+    calls = []
+    monkeypatch.setattr(profile_template.os, "name", "nt")
+    monkeypatch.setattr(profile_template.os, "kill", lambda *args: calls.append(args))
+    monkeypatch.setattr(profile_template, "_windows_pid_alive", lambda pid: pid == 1234)
+    assert _pid_alive(1234) and not _pid_alive(4321)
+    assert calls == []
+
+
+class WarmingDriver:
+    """Records what the template build does to the browser."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url):
+        self.calls.append(("get", url))
+
+    def execute_async_script(self, script):
+        return "active"
+
+    def execute_cdp_cmd(self, command, params):
+        self.calls.append((command, params))
+
+    def quit(self):
+        self.calls.append(("quit",))
+
+
+def test_build_clears_cookies_and_storage_but_keeps_caches(tmp_path):
+    driver = WarmingDriver()
+    template = ProfileTemplate(tmp_path, "http://localhost:9002/")
+    template._build(lambda profile_dir: driver, ["/", "/warm-up"], "build-1")
+
+    commands = [call[0] for call in driver.calls]
+    assert commands[-3:] == ["Network.clearBrowserCookies", "Storage.clearDataForOrigin", "quit"]
+    cleared = driver.calls[-2][1]
+    assert cleared["origin"] == "http://localhost:9002"
+    storage = set(cleared["storageTypes"].split(","))
+    assert {"local_storage", "indexeddb"} <= storage
+    assert not storage & {"service_workers", "cache_storage"}
@@ -1,8 +1,8 @@
 import pytest
-import time
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from page_objects.projects_page import ProjectsPage
+from utils.waits import NextJSWaits
 
 
 class TestProjectsPageLoad:
@@ -12,14 +12,14 @@ class TestProjectsPageLoad:
         """Test that projects page loads successfully."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert projects_page.verify_projects_page_loaded()
     
     def test_projects_grid_visible(self, driver):
         """Test that projects grid is visible."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert projects_page.verify_projects_are_visible()
 
 
@@ -30,7 +30,7 @@ class TestProjectsDisplay:
         """Test that displayed projects have required metadata."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Check featured projects
         featured_count = projects_page.get_featured_project_count()
@@ -56,7 +56,7 @@ class TestProjectsDisplay:
         """Test that project titles are accessible."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Check featured projects
         featured_count = projects_page.get_featured_project_count()
@@ -81,7 +81,7 @@ class TestProjectsFiltering:
         """Test that category filters are available."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         categories = projects_page.get_filter_categories()
         assert len(categories) > 0
@@ -90,7 +90,7 @@ class TestProjectsFiltering:
         """Test that technology filters are available."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         techs = projects_page.get_filter_technologies()
         assert len(techs) > 0
@@ -99,7 +99,7 @@ class TestProjectsFiltering:
         """Test that clear filters button is available."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Try to find the clear button
         try:
@@ -117,7 +117,7 @@ class TestProjectsSearch:
         """Test that search input is accessible."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert projects_page.is_search_visible()
     
@@ -125,7 +125,7 @@ class TestProjectsSearch:
         """Test that search field accepts input."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         search_result = projects_page.search_projects("design")
         assert search_result
@@ -138,7 +138,7 @@ class TestProjectsNavigation:
         """Test that projects page is accessible from home."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert projects_page.driver.current_url.endswith("/projects")
     
@@ -146,7 +146,7 @@ class TestProjectsNavigation:
         """Test that clicking a project navigates to detail page."""
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         project_count = projects_page.get_project_count()
         featured_count = projects_page.get_featured_project_count()
@@ -156,7 +156,7 @@ class TestProjectsNavigation:
         if featured_count > 0:
             try:
                 projects_page.click_project(0, is_featured=True)
-                time.sleep(1.0)
+                projects_page.wait_for_url_change("/projects/", timeout=1.0)
                 clicked = "/projects/" in projects_page.driver.current_url
                 if clicked:
                     assert clicked
@@ -167,7 +167,7 @@ class TestProjectsNavigation:
         if project_count > 0:
             try:
                 projects_page.click_project(0, is_featured=False)
-                time.sleep(1.0)
+                projects_page.wait_for_url_change("/projects/", timeout=1.0)
                 clicked = "/projects/" in projects_page.driver.current_url
                 assert clicked
             except:
@@ -183,7 +183,7 @@ class TestProjectsResponsive:
         driver.set_window_size(1024, 768)
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert projects_page.verify_projects_page_loaded()
         assert projects_page.verify_projects_are_visible()
@@ -193,7 +193,7 @@ class TestProjectsResponsive:
         driver.set_window_size(375, 667)
         projects_page = ProjectsPage(driver)
         projects_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert projects_page.verify_projects_page_loaded()
         assert projects_page.verify_projects_are_visible()
@@ -0,0 +1,136 @@
+import pytest
+from utils import rate_governor
+from utils.rate_governor import WINDOW_SLACK, Budget, RateGovernor, allowance, load_budgets
+
+
+pytestmark = pytest.mark.unit
+
+
+CONTACT = Budget("/api/contact", 5, 3600, method="POST")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_governor, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def governor(tmp_path):
+    return RateGovernor(budgets=[CONTACT], state_path=str(tmp_path / "buckets.json"),
+                        headroom=0.9, max_wait=60)
+
+
+def test_allowance_rounds_down_to_at_least_one():
+    assert allowance(CONTACT, 0.9) == 4
+    assert allowance(CONTACT, 1.0) == 5
+    assert allowance(CONTACT, 0.1) == 1
+    assert allowance(Budget("/api/search", 100, 60), 0.9) == 90
+
+
+def test_take_allows_the_budget_then_waits_for_the_window(clock, governor):
+    key = "/api/contact|POST|/api/contact"
+    assert [governor._take(key, CONTACT) for _ in range(4)] == [0.0] * 4
+    clock.now += 600
+    assert governor._take(key, CONTACT) == pytest.approx(3600 + WINDOW_SLACK - 600)
+
+    clock.now += 3000 + WINDOW_SLACK
+    assert governor._take(key, CONTACT) == 0.0
+
+
+def test_bucket_state_is_shared_through_the_state_file(clock, governor):
+    key = "/api/contact|POST|/api/contact"
+    for _ in range(4):
+        governor._take(key, CONTACT)
+    other_worker = RateGovernor(budgets=[CONTACT], state_path=governor.state_path, headroom=0.9)
+    assert other_worker._take(key, CONTACT) > 0
+
+
+def test_acquire_reports_requests_past_max_wait_as_over_budget(clock, governor):
+    governor.start_test("tests/test_contact.py::test_submit")
+    for _ in range(5):
+        governor.acquire("POST", "http://localhost:9002/api/contact/")
+    assert governor.acquire("GET", "http://localhost:9002/api/contact") == 0.0
+    assert governor.acquire("POST", "http://localhost:9002/_next/static/app.js") == 0.0
+
+    entry = governor.finish_test()
+    # Only governed requests count: the GET and the static asset are not
+    assert entry["requests"] == 5
+    assert entry["over_budget"] == 1
+    assert clock.slept == []
+
+
+def test_acquire_sleeps_for_short_waits(clock, tmp_path):
+    budget = Budget("/api/search", 2, 10)
+    governor = RateGovernor(budgets=[budget], state_path=str(tmp_path / "buckets.json"),
+                            headroom=1.0, max_wait=60)
+    governor.start_test("t")
+    for _ in range(3):
+        governor.acquire("GET", "http://localhost:9002/api/search?q=x")
+
+    assert clock.slept == [pytest.approx(10 + WINDOW_SLACK)]
+    entry = governor.finish_test()
+    assert entry["waited"] == 1 and entry["over_budget"] == 0
+    assert entry["paths"] == {"/api/search": pytest.approx(10 + WINDOW_SLACK)}
+
+
+CONTACT_ROUTE = """
+const RATE_LIMIT_WINDOW = 30 * 60 * 1000;
+const MAX_REQUESTS_PER_WINDOW = 3;
+"""
+
+ENDPOINT_LIMITS = """
+const ENDPOINT_LIMITS = {
+  '/api/auth': {
+    maxRequests: 5,
+    windowMs: 15 * 60 * 1000,
+  },
+};
+"""
+
+
+@pytest.fixture
+def app_root(tmp_path):
+    contact = tmp_path / "src" / "app" / "api" / "contact"
+    contact.mkdir(parents=True)
+    (contact / "route.ts").write_text(CONTACT_ROUTE)
+    (tmp_path / "src" / "lib").mkdir()
+    (tmp_path / "src" / "lib" / "rate-limit.ts").write_text(ENDPOINT_LIMITS + "export function applyRateLimit() {}")
+    return tmp_path
+
+
+def test_load_budgets_reads_the_contact_limiter_only(app_root):
+    assert load_budgets(str(app_root)) == (
+        Budget("/api/contact", 3, 1800.0, method="POST", source=rate_governor.CONTACT_SOURCE),
+    )
+
+
+def test_endpoint_limits_count_once_a_route_applies_them(app_root):
+    advisory = load_budgets(str(app_root), advisory=True)
+    assert advisory[1].prefix == "/api/auth" and advisory[1].source.endswith("advisory")
+
+    auth = app_root / "src" / "app" / "api" / "auth"
+    auth.mkdir()
+    (auth / "route.ts").write_text("await applyRateLimit(request, '/api/auth');")
+    enforced = load_budgets(str(app_root))
+    assert [(b.prefix, b.max_requests, b.window) for b in enforced] == [
+        ("/api/contact", 3, 1800.0), ("/api/auth", 5, 900.0)]
+    assert enforced[1].source == rate_governor.ENDPOINT_LIMITS_SOURCE
+
+
+def test_unreadable_sources_fall_back_to_the_defaults(tmp_path):
+    assert load_budgets(str(tmp_path)) == rate_governor.DEFAULT_BUDGETS
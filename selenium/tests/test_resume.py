@@ -1,8 +1,9 @@
 import pytest
-import time
 from page_objects.resume_page import ResumePage
+from utils.waits import NextJSWaits
 
 
+@pytest.mark.dom_only
 class TestResumePageLoad:
     """Tests for Resume page loading."""
     
@@ -10,17 +11,18 @@ class TestResumePageLoad:
         """Test that resume page loads successfully."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.verify_resume_page_loaded()
     
     def test_resume_container_visible(self, driver):
         """Test that resume container is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_resume_container_visible()
 
 
+@pytest.mark.dom_only
 class TestResumeHeader:
     """Tests for resume header content."""
     
@@ -28,7 +30,7 @@ class TestResumeHeader:
         """Test that header has a title."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         title = resume_page.get_resume_title()
         assert title is not None and len(title) > 0
@@ -37,10 +39,11 @@ class TestResumeHeader:
         """Test that header has all required content."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.verify_header_content()
 
 
+@pytest.mark.dom_only
 class TestResumeExpertise:
     """Tests for expertise section."""
     
@@ -48,20 +51,21 @@ class TestResumeExpertise:
         """Test that expertise section is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_expertise_section_visible()
     
     def test_expertise_cards_present(self, driver):
         """Test that expertise cards are present."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Just verify the grid is visible rather than counting cards
         # which may vary based on content structure
         assert resume_page.is_expertise_section_visible()
 
 
+@pytest.mark.dom_only
 class TestResumeExperience:
     """Tests for experience section."""
     
@@ -69,19 +73,20 @@ class TestResumeExperience:
         """Test that experience section is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_experience_section_visible()
     
     def test_experience_entries_present(self, driver):
         """Test that experience entries are present."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         count = resume_page.get_experience_entries_count()
         assert count > 0
 
 
+@pytest.mark.dom_only
 class TestResumeProjects:
     """Tests for projects section."""
     
@@ -89,19 +94,20 @@ class TestResumeProjects:
         """Test that projects section is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_projects_section_visible()
     
     def test_projects_present(self, driver):
         """Test that projects are present."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         count = resume_page.get_projects_count()
         assert count > 0
 
 
+@pytest.mark.dom_only
 class TestResumeContact:
     """Tests for contact section."""
     
@@ -109,17 +115,18 @@ class TestResumeContact:
         """Test that contact section is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_contact_section_visible()
     
     def test_github_button_visible(self, driver):
         """Test that GitHub button is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_github_button_visible()
 
 
+@pytest.mark.dom_only
 class TestResumeDownload:
     """Tests for resume download."""
     
@@ -127,14 +134,14 @@ class TestResumeDownload:
         """Test that download button is visible."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.is_download_button_visible()
     
     def test_all_sections_present(self, driver):
         """Test that all key sections are present."""
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         assert resume_page.verify_key_sections_present()
 
 
@@ -146,7 +153,7 @@ class TestResumeResponsive:
         driver.set_window_size(1024, 768)
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert resume_page.verify_resume_page_loaded()
         assert resume_page.verify_key_sections_present()
@@ -156,7 +163,7 @@ class TestResumeResponsive:
         driver.set_window_size(375, 667)
         resume_page = ResumePage(driver)
         resume_page.load_page()
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         assert resume_page.verify_resume_page_loaded()
         assert resume_page.is_expertise_section_visible()
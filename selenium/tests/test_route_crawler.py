@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+from utils.route_crawler import HttpPool, discover_routes, generate_slug
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("name, slug", [
+    ("Cygnus", "cygnus"),
+    ("Neura-Link: AI Assistant", "neura-link-ai-assistant"),
+    ("Real  Time -- Pipeline", "real-time-pipeline"),
+    ("Café Ops", "caf-ops"),
+])
+def test_generate_slug_matches_projects_ts(name, slug):
+    assert generate_slug(name) == slug
+
+
+def test_discover_routes_merges_sources_without_duplicates(tmp_path):
+    blog = tmp_path / "src" / "content" / "blog"
+    blog.mkdir(parents=True)
+    (blog / "first-post.mdx").write_text("---\ntitle: First\n---\n")
+    (blog / "notes.txt").write_text("")
+    (tmp_path / "src" / "content" / "projects.json").write_text(json.dumps([{"name": "Quantum Core"}]))
+    data = tmp_path / "src" / "data"
+    data.mkdir()
+    (data / "research.json").write_text(json.dumps({"researchEntries": [{"slug": "edge-ml"}]}))
+    sitemap = ("<urlset><url><loc>https://example.com/</loc></url>"
+               "<url><loc>https://example.com/blog/first-post</loc></url></urlset>")
+
+    routes = {route.path: route for route in discover_routes(app_root=str(tmp_path), sitemap_xml=sitemap)}
+
+    assert routes["/"].source == "pages"
+    # The sitemap listed the post first; the path is only checked once
+    assert routes["/blog/first-post"].source == "sitemap"
+    assert routes["/projects/quantum-core"].marker == "<h1"
+    assert routes["/research/edge-ml"].source == "research"
+    assert not any("notes" in path for path in routes)
+
+
+class FakeServer:
+    """Local HTTP server replaying canned responses, one list per connection."""
+
+    def __init__(self, *connections):
+        self.connections = list(connections)
+        self.accepted = 0
+
+    async def handle(self, reader, writer):
+        responses = self.connections[self.accepted]
+        self.accepted += 1
+        for response in responses:
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            writer.write(response)
+            await writer.drain()
+        # Closing after the last response mimics a server dropping an idle keep-alive connection
+        writer.close()
+
+    def run(self, scenario):
+        async def main():
+            server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            pool = HttpPool(f"http://127.0.0.1:{port}", size=1, timeout=5)
+            try:
+                return await scenario(pool)
+            finally:
+                await pool.close()
+                server.close()
+                await server.wait_closed()
+        return asyncio.run(main())
+
+
+OK = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+
+
+def test_chunked_body_is_reassembled():
+    chunked = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+               b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n")
+    server = FakeServer([chunked, OK])
+
+    async def scenario(pool):
+        first = await pool.get("/")
+        second = await pool.get("/")
+        return first, second
+
+    (status, headers, body, _), (_, _, second_body, _) = server.run(scenario)
+    assert (status, body) == (200, b"hello world")
+    assert headers["transfer-encoding"] == "chunked"
+    # Trailers were consumed, so the connection was reusable for the next response
+    assert second_body == b"ok"
+    assert server.accepted == 1
+
+
+def test_dropped_keep_alive_connection_is_retried_once():
+    server = FakeServer([OK], [OK])
+
+    async def scenario(pool):
+        await pool.get("/")
+        await asyncio.sleep(0.05)  # let the server's close reach the idle connection
+        return await pool.get("/again")
+
+    status, _, body, _ = server.run(scenario)
+    assert (status, body) == (200, b"ok")
+    assert server.accepted == 2
+
+
+def test_fresh_connection_failure_is_not_retried():
+    server = FakeServer([], [OK])
+
+    async def scenario(pool):
+        return await pool.get("/")
+
+    with pytest.raises(ConnectionError):
+        server.run(scenario)
+    assert server.accepted == 1
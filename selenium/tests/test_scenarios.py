@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+from utils.scenarios import _fetch
+
+
+pytestmark = pytest.mark.unit
+
+
+class FetchDriver:
+    def __init__(self, script_timeout):
+        self.timeouts = SimpleNamespace(script=script_timeout)
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        return {"status": 200}
+
+
+def test_fetch_restores_a_lower_script_timeout():
+    driver = FetchDriver(script_timeout=5)
+    assert _fetch(driver, "/api/auth", "POST", {}) == {"status": 200}
+    assert driver.script_timeouts == [30, 5]
+
+
+def test_fetch_keeps_a_longer_script_timeout():
+    driver = FetchDriver(script_timeout=60)
+    _fetch(driver, "/api/auth", "POST", {})
+    assert driver.script_timeouts == []
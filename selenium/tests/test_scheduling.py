@@ -0,0 +1,80 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from utils.scheduling import DurationHistory, LongestFirstScheduling
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.options = {"tx": [f"{workers}*popen"], "maxschedchunk": None}
+
+    def getvalue(self, name):
+        return self.options[name]
+
+    getoption = getvalue
+
+
+class FakeNode:
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.sent = []
+        self.shutdown_called = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutdown_called = True
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(tmp_path / "durations.json")
+
+
+def test_order_is_longest_first_with_unknown_tests_at_the_median(history):
+    history.merge({"slow": 9.0, "mid": 3.0, "fast": 1.0})
+    nodeids = ["fast", "new", "slow", "mid"]
+    # "new" is estimated at the median (3.0) and ties with "mid" in collection order
+    assert [nodeids[i] for i in history.order(nodeids)] == ["slow", "new", "mid", "fast"]
+
+
+def test_order_without_history_keeps_collection_order(history):
+    assert history.order(["a", "b", "c"]) == [0, 1, 2]
+
+
+def test_merge_smooths_and_persists(tmp_path, history):
+    history.merge({"test": 4.0})
+    history.merge({"test": 2.0, "other": 1.23456})
+    assert history.estimate("test") == 3.0
+    with open(tmp_path / "durations.json") as f:
+        assert json.load(f) == {"durations": {"other": 1.2346, "test": 3.0}}
+    assert DurationHistory(tmp_path / "durations.json").estimate("test") == 3.0
+
+
+def test_unreadable_history_starts_empty(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text("not json")
+    assert DurationHistory(path).durations == {}
+
+
+def test_scheduler_deals_the_slowest_tests_first(history):
+    history.merge({"t0": 1.0, "t1": 8.0, "t2": 2.0, "t3": 6.0, "t4": 4.0})
+    collection = ["t0", "t1", "t2", "t3", "t4"]
+    scheduler = LongestFirstScheduling(FakeConfig(2), history=history)
+    nodes = [FakeNode("gw0"), FakeNode("gw1")]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+
+    # Two rounds of one test each, slowest first: t1, t3 then t4, t2; t0 stays pending
+    assert [collection[i] for i in nodes[0].sent] == ["t1", "t4"]
+    assert [collection[i] for i in nodes[1].sent] == ["t3", "t2"]
+    assert [collection[i] for i in scheduler.pending] == ["t0"]
+    assert not any(node.shutdown_called for node in nodes)
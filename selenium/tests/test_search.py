@@ -1,6 +1,6 @@
+import pytest
 import random
 import string
-import time
 
 from selenium.webdriver.common.by import By
 from page_objects.search_page import SearchPage
@@ -11,7 +11,7 @@ def rand_str(length=8):
     return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
 
 
-def test_search_page_loads(driver):
+def test_search_page_loads(driver, api_stub):
     page = SearchPage(driver, base_url=TestData.BASE_URL)
     page.load()
 
@@ -21,15 +21,15 @@ def test_search_page_loads(driver):
     assert page.is_element_displayed((By.CSS_SELECTOR, "[data-testid='search-title']")), "Search title missing"
 
 
-def test_search_interaction_and_accessibility(driver):
+def test_search_interaction_and_accessibility(driver, api_stub):
     page = SearchPage(driver, base_url=TestData.BASE_URL)
     page.load()
 
     # Representative interaction: type a random query and search
     q = "noresults-" + rand_str(6)
     page.enter_query(q)
-    # give suggestions a moment to appear if backend replies
-    time.sleep(0.5)
+    # wait for the per-keystroke suggestion requests to return
+    page.wait_for_suggestions()
 
     # Accessibility sanity: focus + tab should move focus (returns data-testid of active element)
     active = page.focus_input_and_tab()
@@ -37,10 +37,25 @@ def test_search_interaction_and_accessibility(driver):
 
     # Submit search and verify system responded (either results, no-results, or error)
     page.submit_search()
-    time.sleep(0.5)
+    page.wait_for_search_response()
 
     has_results = page.get_results_count() > 0
     has_no_results = page.has_no_results()
     has_error = page.has_error()
 
     assert any([has_results, has_no_results, has_error]), "Search did not return results, no-results, or error state"
+
+
+def test_search_results_from_stubbed_api(driver, api_stub):
+    if api_stub is None:
+        pytest.skip("Needs the API stub (Chromium browser, without --live-api)")
+    page = SearchPage(driver, base_url=TestData.BASE_URL)
+    page.load()
+
+    page.enter_query("distributed")
+    page.submit_search()
+    page.wait_for_search_response()
+
+    # fixtures/api/search.json returns one blog post, one research paper and one project
+    assert page.get_results_count() == 3, "All stubbed search results should be rendered"
+    assert api_stub.requests_for("/api/search"), "Search request should have been answered by the stub"
@@ -17,14 +17,14 @@ Target: 100% pass rate
 
 import pytest
 from selenium.webdriver.common.by import By
-import time
+from utils.waits import NextJSWaits
 
 
 @pytest.mark.smoke
 class TestHomePageSmoke:
     """Smoke tests for home page."""
 
-    def test_home_page_loads(self, driver):
+    def test_home_page_loads(self, driver, wait_for_element):
         """
         TEST 1.1: Home page loads successfully
         
@@ -37,7 +37,7 @@ class TestHomePageSmoke:
         driver.get("http://localhost:9002")
         
         # Wait for main content
-        main = driver.find_element(By.TAG_NAME, "main")
+        main = wait_for_element((By.TAG_NAME, "main"))
         assert main.is_displayed(), "Main content not visible"
 
     def test_hero_section_visible(self, home_page):
@@ -52,8 +52,7 @@ class TestHomePageSmoke:
         home_page.load_page()
         
         # Wait for Framer Motion animations (0.8s)
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         # Verify title
         assert home_page.is_hero_section_visible(), "Hero section not visible"
@@ -72,8 +71,7 @@ class TestHomePageSmoke:
         home_page.load_page()
         
         # Wait for animations to settle
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         home_page.verify_explore_button_visible()
 
@@ -89,8 +87,7 @@ class TestHomePageSmoke:
         home_page.load_page()
         
         # Wait for animations to settle
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         home_page.verify_contact_button_visible()
 
@@ -105,8 +102,7 @@ class TestHomePageSmoke:
         home_page.load_page()
         
         # Wait for all scripts to load
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         home_page.verify_no_console_errors()
 
@@ -127,13 +123,12 @@ class TestNavigationSmoke:
         home_page.load_page()
         
         # Wait for animations
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         home_page.click_explore_button()
         
         # Wait for scroll animation and verify systems section visible
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         # Verify systems section is now visible
         assert home_page.is_element_displayed((By.ID, "systems")), "Systems section not visible after click"
@@ -150,8 +145,7 @@ class TestNavigationSmoke:
         home_page.load_page()
         
         # Wait for animations
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         home_page.click_contact_button()
         
@@ -166,7 +160,7 @@ class TestNavigationSmoke:
 class TestContactFormSmoke:
     """Smoke tests for contact form."""
 
-    def test_contact_page_loads(self, driver):
+    def test_contact_page_loads(self, driver, wait_for_element):
         """
         TEST 3.1: Contact page loads successfully
         
@@ -178,14 +172,13 @@ class TestContactFormSmoke:
         driver.get("http://localhost:9002/contact")
         
         # Wait for page to load
-        import time
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Look for contact form
-        form = driver.find_element(By.TAG_NAME, "form")
+        form = wait_for_element((By.TAG_NAME, "form"))
         assert form.is_displayed(), "Contact form not visible"
 
-    def test_contact_form_has_all_fields(self, driver):
+    def test_contact_form_has_all_fields(self, driver, wait_for_element):
         """
         TEST 3.2: Contact form has all required fields
         
@@ -199,10 +192,10 @@ class TestContactFormSmoke:
         driver.get("http://localhost:9002/contact")
         
         # Check all fields exist
-        name_field = driver.find_element(By.NAME, "name")
-        email_field = driver.find_element(By.NAME, "email")
-        subject_field = driver.find_element(By.NAME, "subject")
-        message_field = driver.find_element(By.NAME, "message")
+        name_field = wait_for_element((By.NAME, "name"))
+        email_field = wait_for_element((By.NAME, "email"))
+        subject_field = wait_for_element((By.NAME, "subject"))
+        message_field = wait_for_element((By.NAME, "message"))
         
         assert name_field, "Name field missing"
         assert email_field, "Email field missing"
@@ -227,13 +220,12 @@ class TestPageAccessibility:
         home_page.load_page()
         
         # Wait for animations
-        import time
-        time.sleep(1.5)
+        home_page.wait_until_settled(timeout=1.5)
         
         h1_elements = home_page.find_elements((By.TAG_NAME, "h1"))
         assert len(h1_elements) == 1, f"Expected 1 H1, found {len(h1_elements)}"
 
-    def test_navigation_structure_present(self, driver):
+    def test_navigation_structure_present(self, driver, wait_for_element):
         """
         TEST 4.2: Page has semantic navigation structure
         
@@ -244,11 +236,10 @@ class TestPageAccessibility:
         driver.get("http://localhost:9002")
         
         # Wait for page to load
-        import time
-        time.sleep(1.5)
+        NextJSWaits.wait_until_settled(driver, timeout=1.5)
         
         # Look for navigation header via data-testid
-        nav_header = driver.find_element(By.CSS_SELECTOR, "[data-testid='navigation-header']")
+        nav_header = wait_for_element((By.CSS_SELECTOR, "[data-testid='navigation-header']"))
         assert nav_header.is_displayed(), "Navigation header not found"
 
 
@@ -256,7 +247,7 @@ class TestPageAccessibility:
 class TestSearchFunctionality:
     """Smoke tests for search feature."""
 
-    def test_search_page_loads(self, driver):
+    def test_search_page_loads(self, driver, api_stub, wait_for_element):
         """
         TEST 5.1: Search page loads successfully
         
@@ -265,18 +256,18 @@ class TestSearchFunctionality:
         - Search input visible
         """
         driver.get("http://localhost:9002/search")
-        time.sleep(1)
+        NextJSWaits.wait_until_settled(driver, timeout=1)
         
         # Look for search input with data-testid (now available)
         try:
-            search_input = driver.find_element(By.CSS_SELECTOR, "[data-testid='search-input']")
+            search_input = wait_for_element((By.CSS_SELECTOR, "[data-testid='search-input']"))
         except Exception:
             # Fallback to any input if testid not found
-            search_input = driver.find_element(By.TAG_NAME, "input")
+            search_input = wait_for_element((By.TAG_NAME, "input"))
         
         assert search_input.is_displayed(), "Search input not visible"
 
-    def test_search_input_accepts_text(self, driver):
+    def test_search_input_accepts_text(self, driver, wait_for_element):
         """
         TEST 5.2: Search input accepts text
         
@@ -286,7 +277,7 @@ class TestSearchFunctionality:
         """
         driver.get("http://localhost:9002/search")
         
-        search_input = driver.find_element(By.TAG_NAME, "input")
+        search_input = wait_for_element((By.TAG_NAME, "input"))
         search_input.send_keys("test")
         
         value = search_input.get_attribute("value")
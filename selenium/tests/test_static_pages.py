@@ -1,4 +1,4 @@
-import time
+import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -12,33 +12,38 @@ from page_objects.static_pages import (
     SplashPage,
 )
 from utils.test_data import TestData
+from utils.waits import NextJSWaits
 
 
+@pytest.mark.dom_only
 def test_ai_page_loads(driver):
     page = AIPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
     assert page.is_loaded(), "AI page should load"
 
 
+@pytest.mark.dom_only
 def test_hardware_page_loads(driver):
     page = HardwarePage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
     assert page.is_loaded(), "Hardware page should load"
 
 
+@pytest.mark.dom_only
 def test_research_page_loads(driver):
     page = ResearchPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
     assert page.is_loaded(), "Research page should load"
 
 
+@pytest.mark.dom_only
 def test_newsletter_page_loads(driver):
     page = NewsletterPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.3)
+    NextJSWaits.wait_until_settled(driver, timeout=0.3)
     assert page.is_loaded(), "Newsletter page should load"
 
 
@@ -54,10 +59,11 @@ def test_3d_models_page_loads(driver):
     assert page_container is not None, "3D Models page container should be present"
 
 
+@pytest.mark.dom_only
 def test_systems_page_loads(driver):
     page = SystemsPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.5)
+    NextJSWaits.wait_until_settled(driver, timeout=0.5)
     assert page.is_loaded(), "Systems page should load"
     assert page.get_header(), "Systems header should be visible"
     assert page.get_architecture_diagram(), "Architecture diagram should be visible"
@@ -66,10 +72,11 @@ def test_systems_page_loads(driver):
     assert page.get_philosophy_grid(), "Philosophy grid should be visible"
 
 
+@pytest.mark.dom_only
 def test_splash_page_loads(driver):
     page = SplashPage(driver, base_url=TestData.BASE_URL)
     page.load()
-    time.sleep(0.5)
+    NextJSWaits.wait_until_settled(driver, timeout=0.5)
     assert page.is_loaded(), "Splash page should load"
     assert page.get_splash_content(), "Splash content should be visible"
     title = page.get_splash_title()
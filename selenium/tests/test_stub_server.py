@@ -0,0 +1,23 @@
+import pytest
+from utils.stub_server import ApiStub
+from utils.test_data import TestData
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_default_fixtures_load_from_any_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stub = ApiStub(TestData.API_FIXTURES_DIR)
+    assert "search" in stub.routes
+
+
+def test_missing_fixture_directory_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="API_FIXTURES_DIR"):
+        ApiStub(str(tmp_path / "nowhere"))
+
+
+def test_fixture_directory_without_json_raises(tmp_path):
+    (tmp_path / "README.txt").write_text("")
+    with pytest.raises(ValueError, match="No <route>.json fixtures"):
+        ApiStub(str(tmp_path))
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, JavascriptException
+from utils.waits import SETTLE_SHIM, NextJSWaits
+
+
+pytestmark = pytest.mark.unit
+
+
+class ScriptedDriver:
+    """Answers execute_async_script from a list of results (exceptions are raised)."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.cdp = []
+        self.timeouts = SimpleNamespace(script=30)
+        self.script_timeouts = []
+
+    def execute_async_script(self, script, *args):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+
+def test_unloaded_document_is_retried():
+    driver = ScriptedDriver(JavascriptException("document unloaded while waiting for result"), {"settled": True})
+    assert NextJSWaits.wait_until_settled(driver, timeout=1) is True
+
+
+def test_session_errors_propagate():
+    driver = ScriptedDriver(InvalidSessionIdException("invalid session id"))
+    with pytest.raises(InvalidSessionIdException):
+        NextJSWaits.wait_until_settled(driver, timeout=1)
+
+
+def test_shim_is_registered_once_per_session():
+    driver = ScriptedDriver({"settled": True}, {"settled": True})
+    NextJSWaits.wait_until_settled(driver, timeout=1)
+    NextJSWaits.wait_until_settled(driver, timeout=1)
+    assert driver.cdp == [("Page.addScriptToEvaluateOnNewDocument", {"source": SETTLE_SHIM})]
+
+
+def test_raised_script_timeout_is_restored():
+    driver = ScriptedDriver({"settled": True})
+    NextJSWaits.wait_until_settled(driver, timeout=40)
+    assert driver.script_timeouts == [45, 30]
+
+
+def test_script_timeout_is_restored_when_the_wait_fails():
+    driver = ScriptedDriver(InvalidSessionIdException("invalid session id"))
+    with pytest.raises(InvalidSessionIdException):
+        NextJSWaits.wait_until_settled(driver, timeout=40)
+    assert driver.timeouts.script == 30
+
+
+def test_short_waits_leave_the_script_timeout_alone():
+    driver = ScriptedDriver({"settled": True})
+    NextJSWaits.wait_until_settled(driver, timeout=5)
+    assert driver.script_timeouts == []
@@ -0,0 +1,213 @@
+"""
+Background Failure Artifacts
+
+Captures the state a failed test left behind without writing to disk on the
+test thread:
+- Test thread only collects raw data: screenshot PNG bytes, the DOM, the
+  browser console and the page's network log (2-3 WebDriver commands)
+- A writer thread compresses it into one zip bundle per failure:
+  <worker>/<test>_<timestamp>_<random>_FAILED.zip
+- Total size of ARTIFACTS_DIR is capped (ARTIFACTS_MAX_MB); the least
+  recently used files, legacy *_FAILED.png screenshots included, are
+  evicted first
+
+Usage:
+    writer = ArtifactWriter()
+    path = writer.submit(item.name, capture_failure(driver), meta={...})
+    writer.close()                 # end of session: flush the queue
+"""
+
+import json
+import os
+import queue
+import threading
+import uuid
+import zipfile
+
+from selenium.common.exceptions import WebDriverException
+
+from .artifacts import artifact_path
+from .test_data import TestData
+
+
+# Everything the bundle needs from the page, in one round-trip
+PAGE_STATE_SCRIPT = """
+var resources = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {
+    url: location.href,
+    title: document.title,
+    dom: document.documentElement ? document.documentElement.outerHTML : '',
+    resources: resources.map(function(r) {
+        return {
+            name: r.name, type: r.initiatorType || r.entryType,
+            start: Math.round(r.startTime), duration: Math.round(r.duration),
+            transfer_size: r.transferSize, status: r.responseStatus
+        };
+    })
+};
+"""
+
+# Already compressed: stored as-is in the bundle
+STORED_SUFFIXES = (".png", ".jpg", ".webp", ".zip", ".gz")
+
+
+class ArtifactWriter:
+    """Writes failure bundles on a background thread and enforces the disk cap."""
+
+    def __init__(self, base_dir=None, max_bytes=None, queue_size=32):
+        """
+        Initialize writer and start its thread.
+
+        Args:
+            base_dir: Root artifact directory (default: TestData.ARTIFACTS_DIR)
+            max_bytes: Disk cap for base_dir (default: TestData.ARTIFACTS_MAX_MB; 0 = no cap)
+            queue_size: Bundles waiting to be written before submit() blocks
+        """
+        self.base_dir = base_dir or TestData.ARTIFACTS_DIR
+        self.max_bytes = (TestData.ARTIFACTS_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.stats = {"bundles": 0, "bytes": 0, "evicted": 0, "errors": 0}
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def submit(self, name, files, meta=None):
+        """
+        Queue one bundle for writing (returns immediately).
+
+        Args:
+            name: Descriptive name (usually the test name)
+            files: {file name inside the bundle: bytes or str}
+            meta: JSON-serializable details stored as meta.json
+
+        Returns:
+            Path the bundle will be written to
+        """
+        path = artifact_path(name, suffix="_FAILED.zip", base_dir=self.base_dir)
+        if meta is not None:
+            files = dict(files, **{"meta.json": json.dumps(meta, indent=2, default=str)})
+        self._queue.put((path, files))
+        return path
+
+    def flush(self):
+        """Block until every queued bundle is on disk."""
+        self._queue.join()
+
+    def close(self, timeout=30):
+        """Flush the queue and stop the writer thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, files = item
+                self.stats["bytes"] += _write_bundle(path, files)
+                self.stats["bundles"] += 1
+                if self.max_bytes:
+                    self.stats["evicted"] += enforce_limit(self.base_dir, self.max_bytes, keep=(path,))
+            except Exception as exc:  # never let one bad bundle stop the writer
+                self.stats["errors"] += 1
+                print(f"\n⚠️ Failed to write artifact bundle: {exc}")
+            finally:
+                self._queue.task_done()
+
+
+def capture_failure(driver):
+    """
+    Raw failure state of a driver (runs on the test thread, no disk I/O).
+
+    Returns:
+        {file name: bytes or str} for ArtifactWriter.submit(); parts the
+        browser can't provide are left out
+    """
+    files = {}
+    try:
+        files["screenshot.png"] = driver.get_screenshot_as_png()
+    except WebDriverException:
+        pass
+    try:
+        state = driver.execute_script(PAGE_STATE_SCRIPT)
+        files["dom.html"] = state.pop("dom")
+        network = {"url": state["url"], "title": state["title"], "resources": state["resources"]}
+    except (WebDriverException, TypeError, KeyError):
+        network = {}
+    tracker = getattr(driver, "_e2e_network_tracker", None)
+    if tracker is not None:
+        # Requests seen by BasePage network waits, including ones still pending
+        network["tracked_responses"] = [
+            {k: v for k, v in response.items() if k != "ended"} for response in tracker.responses
+        ]
+        network["in_flight"] = list(tracker.inflight.values())
+    if network:
+        files["network.json"] = json.dumps(network, indent=2, default=str)
+    try:
+        files["console.json"] = json.dumps(driver.get_log("browser"), indent=2)
+    except (WebDriverException, AttributeError):
+        pass  # Firefox has no browser log endpoint
+    return files
+
+
+def enforce_limit(base_dir, max_bytes, keep=()):
+    """
+    Delete least recently used files under base_dir until it fits max_bytes.
+
+    Args:
+        base_dir: Artifact directory (all worker sub-directories are counted)
+        max_bytes: Size cap in bytes
+        keep: Paths never to evict (e.g. the bundle just written)
+
+    Returns:
+        Number of files evicted
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    entries = []
+    total = 0
+    for root, _, filenames in os.walk(base_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # evicted by another worker
+            total += stat.st_size
+            entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) in keep or path.endswith(".tmp"):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def _write_bundle(path, files):
+    """Write a zip atomically (readers never see half a bundle); returns its size."""
+    tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as bundle:
+        for filename, data in files.items():
+            compression = zipfile.ZIP_STORED if filename.endswith(STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+            bundle.writestr(filename, data, compress_type=compression)
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+__all__ = ['ArtifactWriter', 'capture_failure', 'enforce_limit']
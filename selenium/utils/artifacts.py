@@ -0,0 +1,64 @@
+"""
+Worker-Safe Artifact Paths
+
+Screenshots and other per-test files written under pytest-xdist:
+- One sub-directory per worker (gw0, gw1, ... or "main" without xdist)
+- Microsecond timestamps plus a random suffix, so two tests can never
+  overwrite each other's files
+- File names safe for parametrized test ids ("test_x[chrome-375]")
+"""
+
+import os
+import re
+import uuid
+from datetime import datetime
+
+from .test_data import TestData
+
+
+def worker_id():
+    """xdist worker id of this process ("main" when not running under xdist)."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_dir(base_dir=None):
+    """
+    Artifact directory of this worker (created if missing).
+
+    Args:
+        base_dir: Root artifact directory (default: TestData.ARTIFACTS_DIR)
+
+    Returns:
+        Directory path
+    """
+    path = os.path.join(base_dir or TestData.ARTIFACTS_DIR, worker_id())
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def artifact_path(name, suffix=".png", base_dir=None, unique=True):
+    """
+    Path for a new artifact of this worker.
+
+    Args:
+        name: Descriptive name (usually the test name)
+        suffix: File extension including the dot
+        base_dir: Root artifact directory (default: TestData.ARTIFACTS_DIR)
+        unique: Append timestamp + random suffix (False keeps the name as given)
+
+    Returns:
+        File path inside the worker's directory
+    """
+    name = safe_name(name)
+    if unique:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        name = f"{name}_{stamp}_{uuid.uuid4().hex[:6]}"
+    return os.path.join(worker_dir(base_dir), f"{name}{suffix}")
+
+
+def safe_name(name):
+    """Replace characters that are awkward in file names."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "artifact"
+
+
+__all__ = ['worker_id', 'worker_dir', 'artifact_path', 'safe_name']
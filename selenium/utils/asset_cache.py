@@ -0,0 +1,265 @@
+"""
+Static Asset Replay
+
+Opt-in record/replay cache for the app's static assets, so page loads in
+tests don't pay for dev-server compilation and transfer every time:
+- Captures /_next/static/*, /_next/image, fonts and public/ images on a miss
+- Stores bodies content-addressed on disk (objects/<sha256>), shared by
+  all workers and runs
+- Replays them through CDP Fetch.fulfillRequest (zero server hits)
+- Entries are keyed by the Next.js build ID found in the HTML; a new build
+  starts a fresh index and unreferenced objects are pruned
+
+Dev server builds are all called "development", so in dev mode the build ID
+is combined with a fingerprint of the app sources (src/, public/, content/).
+
+Usage:
+    cache = AssetCache(TestData.ASSET_CACHE_DIR, TestData.BASE_URL)
+    cache.attach(driver)       # once per browser session
+    cache.stats                # {"hits", "misses", "bytes_served", ...}
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from urllib.parse import urlsplit
+
+import requests
+
+from .cdp_interceptor import FetchInterceptor
+from .stub_server import StubResponse
+
+
+ASSET_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "svg", "webp", "avif", "ico",
+    "woff", "woff2", "ttf", "otf",
+)
+
+# Never replayed: dev-server hot reloading traffic
+UNCACHEABLE = re.compile(r"webpack-hmr|hot-update|__nextjs_original-stack-frame")
+
+# Response headers kept with each entry
+KEPT_HEADERS = ("content-type", "cache-control", "content-language", "vary")
+
+BUILD_ID_PATTERNS = (
+    re.compile(r'\\?"buildId\\?"\s*:\s*\\?"([^"\\]+)'),               # __NEXT_DATA__ / flight data
+    re.compile(r"/_next/static/([^/\"']+)/_(?:buildManifest|ssgManifest)\.js"),
+    # Next 15 app router: the root flight row 0:{"P":...,"b":"<id>",...}; a bare "b" key
+    # anywhere else in the payload is just data
+    re.compile(r'(?:"|\\n)0:\{(?:\\?"P\\?":[^,]*,)?\\?"b\\?"\s*:\s*\\?"([^"\\]+)'),
+)
+
+SOURCE_DIRS = ("src", "public", "content")
+
+
+class AssetCache:
+    """Content-addressed static asset cache replayed through CDP Fetch."""
+
+    def __init__(self, cache_dir, base_url, app_root=None):
+        """
+        Initialize cache (the build ID is read lazily on first attach).
+
+        Args:
+            cache_dir: Cache directory (objects/ + builds/<build id>/)
+            base_url: Application URL whose assets are replayed
+            app_root: Next.js project root, for the dev-mode source fingerprint
+        """
+        self.cache_dir = str(cache_dir)
+        self.base_url = base_url.rstrip("/")
+        self.app_root = app_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.build_id = None
+        self.enabled = True
+        self.stats = {"hits": 0, "misses": 0, "bytes_served": 0, "bytes_recorded": 0}
+        self._http = requests.Session()
+        self._lock = threading.Lock()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    @property
+    def patterns(self):
+        """Fetch URL patterns covering the cached asset types."""
+        return [f"{self.base_url}/_next/static/*", f"{self.base_url}/_next/image*"] + [
+            f"{self.base_url}/*.{extension}" for extension in ASSET_EXTENSIONS
+        ]
+
+    def attach(self, driver):
+        """
+        Replay assets for this browser session (idempotent, Chromium only).
+
+        Returns:
+            bool: True if replay is active for the driver
+        """
+        if getattr(driver, "_e2e_asset_replay", None) is not None:
+            return True
+        if not FetchInterceptor.supported(driver) or not self._ensure_build():
+            return False
+        interceptor = FetchInterceptor(driver, self.patterns, self.intercept).start()
+        driver._e2e_asset_replay = interceptor
+        return True
+
+    def intercept(self, request):
+        """FetchInterceptor handler: serve from cache, record on a miss."""
+        if request["method"] != "GET" or UNCACHEABLE.search(request["url"]):
+            return None
+        key = _cache_key(request["url"])
+        entry = self._lookup(key)
+        if entry is not None:
+            body = self._read_object(entry["sha256"])
+            if body is not None:
+                with self._lock:
+                    self.stats["hits"] += 1
+                    self.stats["bytes_served"] += len(body)
+                return StubResponse(status=entry["status"], body=body, headers=entry["headers"])
+        return self._record(key, request)
+
+    def prune(self):
+        """Delete indexes of other builds and objects no index references."""
+        builds_dir = os.path.join(self.cache_dir, "builds")
+        if not os.path.isdir(builds_dir):
+            return 0
+        for build in os.listdir(builds_dir):
+            if build != _safe(self.build_id):
+                shutil.rmtree(os.path.join(builds_dir, build), ignore_errors=True)
+        referenced = set()
+        for root, _, files in os.walk(builds_dir):
+            for filename in files:
+                try:
+                    with open(os.path.join(root, filename), encoding="utf-8") as f:
+                        referenced.add(json.load(f)["sha256"])
+                except (OSError, ValueError, KeyError):
+                    continue
+        removed = 0
+        objects_dir = os.path.join(self.cache_dir, "objects")
+        for root, _, files in os.walk(objects_dir):
+            for filename in files:
+                if filename not in referenced and not filename.endswith(".tmp"):
+                    os.remove(os.path.join(root, filename))
+                    removed += 1
+        return removed
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _ensure_build(self):
+        """Read the build ID once; disable replay if the app is unreachable."""
+        with self._lock:
+            if self.build_id is not None or not self.enabled:
+                return self.enabled
+            try:
+                html = self._http.get(self.base_url + "/", timeout=30).text
+            except requests.RequestException as exc:
+                print(f"\n⚠️  Asset replay disabled: {self.base_url} unreachable ({exc})")
+                self.enabled = False
+                return False
+            self.build_id = resolve_build_id(html, self.app_root)
+        pruned = self.prune()
+        print(f"\n🔧 Asset replay: build {self.build_id}"
+              + (f" (pruned {pruned} stale object(s))" if pruned else ""))
+        return True
+
+    def _lookup(self, key):
+        try:
+            with open(self._index_path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _record(self, key, request):
+        headers = {k: v for k, v in request["headers"].items()
+                   if k.lower() in ("accept", "accept-language", "user-agent")}
+        try:
+            response = self._http.get(request["url"], headers=headers, timeout=60)
+        except requests.RequestException:
+            return None  # let the browser try (and fail) on its own
+        if response.status_code != 200:
+            return None
+        body = response.content
+        sha256 = hashlib.sha256(body).hexdigest()
+        entry = {
+            "url": key,
+            "sha256": sha256,
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS},
+        }
+        self._write_atomic(self._object_path(sha256), body)
+        self._write_atomic(self._index_path(key), json.dumps(entry).encode("utf-8"))
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["bytes_recorded"] += len(body)
+        return StubResponse(status=entry["status"], body=body, headers=entry["headers"])
+
+    def _read_object(self, sha256):
+        try:
+            with open(self._object_path(sha256), "rb") as f:
+                return f.read()
+        except OSError:
+            return None  # pruned by another worker: re-record
+
+    def _object_path(self, sha256):
+        return os.path.join(self.cache_dir, "objects", sha256[:2], sha256)
+
+    def _index_path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "builds", _safe(self.build_id), digest[:2], digest + ".json")
+
+    @staticmethod
+    def _write_atomic(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+def find_build_id(html):
+    """Next.js build ID from a server-rendered page (None if not found)."""
+    for pattern in BUILD_ID_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    return None
+
+
+def resolve_build_id(html, app_root):
+    """Build ID that changes whenever the served assets can (see module docstring)."""
+    build_id = find_build_id(html) or "unknown"
+    if build_id in ("development", "unknown"):
+        build_id = f"{build_id}-{source_fingerprint(app_root)}"
+    return build_id
+
+
+def source_fingerprint(app_root):
+    """Short hash of (path, size, mtime) of the app sources (dev-mode build ID)."""
+    digest = hashlib.sha256()
+    for directory in SOURCE_DIRS:
+        top = os.path.join(app_root, directory)
+        for root, dirs, files in os.walk(top):
+            dirs[:] = sorted(d for d in dirs if d not in ("node_modules", ".next"))
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{os.path.relpath(path, app_root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:12]
+
+
+def _cache_key(url):
+    """Origin-independent key: path plus query."""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def _safe(name):
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name or "none")
+
+
+__all__ = ['AssetCache', 'find_build_id', 'resolve_build_id', 'source_fingerprint']
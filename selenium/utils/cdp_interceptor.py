@@ -0,0 +1,168 @@
+"""
+CDP Request Interception
+
+Pauses matching requests with CDP Fetch.enable and lets a Python handler
+answer them, so the page never reaches the real backend:
+- Runs Selenium's bidi_connection (trio) on a background thread
+- Each paused request is handled concurrently on a worker thread (slow
+  responses or blocking handlers don't hold up other requests)
+- Chromium only (Chrome / Edge); check FetchInterceptor.supported(driver)
+
+The handler receives {method, url, headers, post_data, resource_type} and returns:
+- None: continue to the network unchanged
+- str: continue with this URL instead (not observable by the page)
+- response object (status, headers, body_bytes, latency, abort),
+  e.g. utils.stub_server.StubResponse: fulfilled from memory
+
+Usage:
+    interceptor = FetchInterceptor(driver, ["http://localhost:9002/api/*"], handler)
+    interceptor.start()
+    ...
+    interceptor.stop()
+"""
+
+import base64
+import threading
+
+import trio
+
+from selenium.common.exceptions import WebDriverException
+
+
+class FetchInterceptor:
+    """Answer paused requests of one driver from a Python handler."""
+
+    START_TIMEOUT = 10  # seconds to connect to DevTools and enable Fetch
+
+    def __init__(self, driver, patterns, handler):
+        """
+        Initialize interceptor.
+
+        Args:
+            driver: Chromium WebDriver instance
+            patterns: Fetch URL patterns ("*" and "?" wildcards)
+            handler: Callable(request dict) -> None | str | response object
+                     (thread-safe: called from worker threads)
+        """
+        self.driver = driver
+        self.patterns = list(patterns)
+        self.handler = handler
+        self.intercepted = 0
+        self.errors = []
+        self._thread = None
+        self._ready = threading.Event()
+        self._token = None
+        self._scope = None
+
+    @staticmethod
+    def supported(driver):
+        """True if the driver exposes Chrome DevTools (Chrome, Edge)."""
+        return hasattr(driver, "execute_cdp_cmd")
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def start(self):
+        """
+        Connect to DevTools and enable interception (blocks until active).
+
+        Raises:
+            WebDriverException: DevTools connection or Fetch.enable failed
+        """
+        self._ready.clear()
+        self.errors = []
+        self._thread = threading.Thread(target=trio.run, args=(self._run,),
+                                        name="cdp-fetch-interceptor", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(self.START_TIMEOUT):
+            raise WebDriverException("Timed out enabling CDP Fetch interception")
+        if self.errors:
+            self._thread.join(timeout=1)
+            self._thread = None
+            raise WebDriverException(f"CDP Fetch interception failed: {self.errors[0]!r}")
+        return self
+
+    def stop(self):
+        """Disable interception and close the DevTools connection."""
+        if self._thread is None:
+            return
+        try:
+            trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+        except (trio.RunFinishedError, AttributeError):
+            pass  # connection already closed (e.g. browser quit)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ============================================================================
+    # EVENT LOOP (background thread)
+    # ============================================================================
+
+    async def _run(self):
+        self._token = trio.lowlevel.current_trio_token()
+        with trio.CancelScope() as self._scope:
+            try:
+                async with self.driver.bidi_connection() as connection:
+                    session, devtools = connection.session, connection.devtools
+                    await session.execute(devtools.fetch.enable(patterns=[
+                        devtools.fetch.RequestPattern(url_pattern=pattern) for pattern in self.patterns
+                    ]))
+                    events = session.listen(devtools.fetch.RequestPaused, buffer_size=256)
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            nursery.start_soon(self._handle, session, devtools, event)
+            except Exception as exc:  # surfaced by start(), or kept for debugging
+                self.errors.append(exc)
+            finally:
+                self._ready.set()
+
+    async def _handle(self, session, devtools, event):
+        request = event.request
+        self.intercepted += 1
+        try:
+            action = await trio.to_thread.run_sync(self.handler, {
+                "method": request.method,
+                "url": request.url + (request.url_fragment or ""),
+                "headers": dict(request.headers),
+                "post_data": request.post_data,
+                "resource_type": event.resource_type.value if event.resource_type else None,
+            })
+        except Exception as exc:
+            self.errors.append(exc)
+            action = None  # never leave the request paused
+        try:
+            if action is None:
+                await session.execute(devtools.fetch.continue_request(request_id=event.request_id))
+            elif isinstance(action, str):
+                await session.execute(devtools.fetch.continue_request(request_id=event.request_id, url=action))
+            else:
+                if action.latency:
+                    await trio.sleep(action.latency)
+                if action.abort:
+                    await session.execute(devtools.fetch.fail_request(
+                        request_id=event.request_id,
+                        error_reason=devtools.network.ErrorReason.CONNECTION_RESET,
+                    ))
+                    return
+                await session.execute(devtools.fetch.fulfill_request(
+                    request_id=event.request_id,
+                    response_code=action.status,
+                    response_headers=[
+                        devtools.fetch.HeaderEntry(name=name, value=str(value))
+                        for name, value in action.headers.items()
+                    ],
+                    body=base64.b64encode(action.body_bytes).decode("ascii"),
+                ))
+        except Exception as exc:
+            # Page navigated away / browser closed while the request was paused
+            self.errors.append(exc)
+
+
+__all__ = ['FetchInterceptor']
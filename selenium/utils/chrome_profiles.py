@@ -0,0 +1,176 @@
+"""
+Chrome Launch Profiles
+
+Named, curated Chrome flag sets (pytest --profile NAME, CHROME_PROFILE):
+- fast: new headless, no background networking / timer throttling /
+  renderer backgrounding, no extensions, component updates or first-run
+  work, two renderer processes at most
+- dom: fast plus blocked images, for DOM-only tests run in the browser
+  (--no-dom-only parity runs)
+- fidelity (default): the flags create_chrome_driver used before profiles
+  existed (--disable-gpu, --start-maximized, window sized after launch);
+  headed unless HEADLESS, images and background behaviour left alone
+- perf-measure: new headless without throttling of timers or background
+  tabs and without background traffic, so web-vitals numbers are stable
+  between runs; precise memory info enabled
+
+Every profile keeps the container flags (--no-sandbox,
+--disable-dev-shm-usage) and hides the automation banner. Headless always
+means --headless=new (what plain --headless selects since Chrome 132; the
+legacy mode is a different browser). The headless profiles pass
+--window-size=BROWSER_WIDTH,BROWSER_HEIGHT, since --start-maximized is a
+no-op without a window.
+
+Usage:
+    options = chrome_options("fast")
+    pytest tests/ --profile fast
+    python -m utils.chrome_profiles              # list profiles and their flags
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass, field
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from .test_data import TestData
+
+
+# Needed in containers / CI whatever the profile
+BASE_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+)
+
+# Work Chrome does on its own that tests never need
+QUIET_ARGUMENTS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-extensions",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions",
+)
+
+# Keep timers and rendering at full speed in background / occluded tabs
+NO_THROTTLING_ARGUMENTS = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+)
+
+BLOCK_IMAGES = {"profile.managed_default_content_settings.images": 2}
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """A named Chrome configuration."""
+    name: str
+    description: str
+    arguments: tuple = ()
+    prefs: dict = field(default_factory=dict)
+    headless: bool = None  # None = follow TestData.HEADLESS
+    window_size: bool = True  # pass --window-size=BROWSER_WIDTH,BROWSER_HEIGHT at launch
+
+    def is_headless(self, headless=None):
+        if self.headless is not None:
+            return self.headless
+        return TestData.HEADLESS if headless is None else headless
+
+
+PROFILES = {
+    "fast": LaunchProfile(
+        "fast", "Headless, no background work, 2 renderers",
+        QUIET_ARGUMENTS + NO_THROTTLING_ARGUMENTS + ("--disable-gpu", "--renderer-process-limit=2"),
+        headless=True,
+    ),
+    "dom": LaunchProfile(
+        "dom", "fast + images blocked (DOM-only checks)",
+        QUIET_ARGUMENTS + NO_THROTTLING_ARGUMENTS + ("--disable-gpu", "--renderer-process-limit=2",
+                                                     "--blink-settings=imagesEnabled=false"),
+        prefs=BLOCK_IMAGES, headless=True,
+    ),
+    "fidelity": LaunchProfile(
+        "fidelity", "User-like Chrome (headed unless HEADLESS)",
+        ("--disable-gpu", "--start-maximized"),
+        window_size=False,  # the driver factory sizes the window after launch
+    ),
+    "perf-measure": LaunchProfile(
+        "perf-measure", "Headless, unthrottled and quiet, for stable web vitals",
+        QUIET_ARGUMENTS + NO_THROTTLING_ARGUMENTS + ("--enable-precise-memory-info",),
+        headless=True,
+    ),
+}
+
+
+def get_profile(name=None):
+    """
+    Profile by name (default: TestData.CHROME_PROFILE).
+
+    Raises:
+        ValueError: Unknown profile name
+    """
+    name = name or TestData.CHROME_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown Chrome profile {name!r} (choose from {', '.join(PROFILES)})") from None
+
+
+def chrome_options(profile=None, headless=None, profile_dir=None, options=None):
+    """
+    ChromeOptions for a launch profile.
+
+    Args:
+        profile: Profile name or LaunchProfile (default: TestData.CHROME_PROFILE)
+        headless: Override TestData.HEADLESS for profiles that follow it
+        profile_dir: --user-data-dir to use
+        options: Existing ChromeOptions to extend
+
+    Returns:
+        ChromeOptions
+    """
+    profile = profile if isinstance(profile, LaunchProfile) else get_profile(profile)
+    options = options or ChromeOptions()
+    if profile.is_headless(headless):
+        options.add_argument("--headless=new")
+    for argument in BASE_ARGUMENTS + profile.arguments:
+        options.add_argument(argument)
+    if profile.window_size:
+        options.add_argument(f"--window-size={TestData.BROWSER_WIDTH},{TestData.BROWSER_HEIGHT}")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    if profile.prefs:
+        options.add_experimental_option("prefs", dict(profile.prefs))
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    return options
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="chrome_profiles", description=__doc__.split("\n\n")[0])
+    parser.add_argument("name", nargs="?", help="Print only this profile's flags")
+    args = parser.parse_args(argv)
+    names = [args.name] if args.name else list(PROFILES)
+    for name in names:
+        profile = get_profile(name)
+        headless = "headless" if profile.is_headless() else "headed"
+        print(f"{profile.name:<13} {profile.description} [{headless}]")
+        for argument in chrome_options(profile).arguments:
+            print(f"    {argument}")
+    return 0
+
+
+__all__ = ['LaunchProfile', 'PROFILES', 'get_profile', 'chrome_options', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+WebDriver Command Counting
+
+Counts the WebDriver commands (HTTP round-trips to the driver) each test
+issues, so changes that add round-trips show up in the results store.
+With --profile-commands each command is also timed (CommandProfiler).
+"""
+
+import time
+from collections import Counter
+
+from .command_profiler import CommandProfiler
+
+
+class CommandLog:
+    """Per-process command counter; reset at the start of every test by conftest."""
+
+    counts = Counter()
+
+    @classmethod
+    def attach(cls, driver):
+        """Count every command sent through this driver (idempotent)."""
+        if getattr(driver, "_e2e_command_log", False):
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            cls.counts[driver_command] += 1
+            if not CommandProfiler.enabled:
+                return original(driver_command, params)
+            started = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                CommandProfiler.record_command(driver_command, params, time.perf_counter() - started)
+
+        driver.execute = execute
+        driver._e2e_command_log = True
+        return driver
+
+    @classmethod
+    def reset(cls):
+        """Forget counted commands (start of a test)."""
+        cls.counts = Counter()
+
+    @classmethod
+    def total(cls):
+        return sum(cls.counts.values())
+
+
+__all__ = ['CommandLog']
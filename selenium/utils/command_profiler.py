@@ -0,0 +1,388 @@
+"""
+WebDriver Command Profiler
+
+Shows where test time goes, so BasePage and the page objects can be tuned
+with data (pytest --profile-commands):
+- Every WebDriver command: name, locator, duration and the page-object
+  method chain that issued it (hooked into CommandLog's driver.execute wrapper)
+- Explicit waits (WebDriverWait.until / until_not and the wait_* polling
+  loops) and plain time.sleep calls
+- Per test: time by category (navigation, find, read, script, interaction,
+  other; "wait" is all time blocked in explicit waits, including the
+  commands they poll with; "sleep" is time.sleep outside waits), slowest
+  commands, most-used locators and folded stacks for a flame graph; shown
+  as a panel in the pytest-html report
+- Per run: hot-path JSON (slowest commands, most-called locators, hottest
+  page-object methods) merged across xdist workers
+
+Implicit waits are always 0 here (BasePage waits explicitly), so "find"
+time is the lookup itself.
+
+Usage:
+    pytest tests/ --profile-commands --html=reports/report.html
+    python -m utils.command_profiler              # print the last run's hot paths
+"""
+
+import argparse
+import glob
+import html
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.wait import WebDriverWait
+
+from .test_data import TestData
+
+
+CATEGORIES = {
+    Command.GET: "navigation", Command.REFRESH: "navigation",
+    Command.GO_BACK: "navigation", Command.GO_FORWARD: "navigation",
+    Command.FIND_ELEMENT: "find", Command.FIND_ELEMENTS: "find",
+    Command.FIND_CHILD_ELEMENT: "find", Command.FIND_CHILD_ELEMENTS: "find",
+    Command.GET_ELEMENT_TEXT: "read", Command.GET_ELEMENT_ATTRIBUTE: "read",
+    Command.GET_ELEMENT_PROPERTY: "read", Command.GET_ELEMENT_TAG_NAME: "read",
+    Command.GET_ELEMENT_RECT: "read", Command.IS_ELEMENT_ENABLED: "read",
+    Command.IS_ELEMENT_SELECTED: "read", Command.GET_CURRENT_URL: "read",
+    Command.GET_TITLE: "read", Command.GET_PAGE_SOURCE: "read",
+    Command.W3C_EXECUTE_SCRIPT: "script", Command.W3C_EXECUTE_SCRIPT_ASYNC: "script",
+    Command.CLICK_ELEMENT: "interaction", Command.SEND_KEYS_TO_ELEMENT: "interaction",
+    Command.CLEAR_ELEMENT: "interaction", Command.W3C_ACTIONS: "interaction",
+}
+
+TIME_CATEGORIES = ("navigation", "find", "read", "script", "interaction", "other", "wait", "sleep")
+
+# Frames from these directories make up the caller chain
+CALLER_DIRS = (os.sep + "page_objects" + os.sep, os.sep + "tests" + os.sep)
+
+TOP = 25
+
+
+class CommandProfiler:
+    """Per-process profiler; reset at the start of every test by conftest."""
+
+    enabled = False
+    events = []
+    _started = 0.0
+    _thread = None
+    _wait_stack = []  # seconds already accounted for (commands, nested waits) per open wait
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    @classmethod
+    def install(cls):
+        """Start profiling (patches WebDriverWait and time.sleep; idempotent)."""
+        if cls.enabled:
+            return
+        cls.enabled = True
+        for name in ("until", "until_not"):
+            setattr(WebDriverWait, name, _profiled_wait(cls, getattr(WebDriverWait, name)))
+        time.sleep = _profiled_sleep(cls, time.sleep)
+        cls.reset()
+
+    @classmethod
+    def reset(cls):
+        """Forget recorded events (start of a test)."""
+        cls.events = []
+        cls._wait_stack = []
+        cls._started = time.perf_counter()
+        cls._thread = threading.get_ident()
+
+    @classmethod
+    def record_command(cls, name, params, seconds):
+        """Called by CommandLog's execute wrapper for every command."""
+        if threading.get_ident() != cls._thread:
+            return  # pool reset / CDP threads are not test time
+        locator = None
+        if params and "using" in params:
+            locator = f"{params['using']}={params.get('value')}"
+        if cls._wait_stack:
+            cls._wait_stack[-1] += seconds
+        cls.events.append({
+            "kind": "command", "name": name, "category": CATEGORIES.get(name, "other"),
+            "locator": locator, "seconds": seconds, "stack": _caller_chain(),
+            "in_wait": bool(cls._wait_stack),
+        })
+
+    @classmethod
+    def summarize(cls, test):
+        """
+        Summary of the current test (call before fixture teardown).
+
+        Returns:
+            Dict: time by category, slowest commands, locators, flame stacks
+        """
+        wall = time.perf_counter() - cls._started
+        spent = dict.fromkeys(TIME_CATEGORIES, 0.0)
+        flame = defaultdict(float)
+        locators = Counter()
+        commands = [e for e in cls.events if e["kind"] == "command"]
+        for event in cls.events:
+            if event["kind"] == "command":
+                if not event["in_wait"]:
+                    spent[event["category"]] += event["seconds"]
+                else:
+                    spent["wait"] += event["seconds"]
+                if event["locator"]:
+                    locators[event["locator"]] += 1
+                label = event["name"] + (f" {event['locator']}" if event["locator"] else "")
+                flame[";".join(event["stack"] + [label])] += event["seconds"]
+            else:
+                spent[event["kind"]] += event["self_seconds"]
+                flame[";".join(event["stack"] + [f"[{event['kind']}]"])] += event["self_seconds"]
+        tracked = sum(spent.values())
+        profile = {
+            "test": test,
+            "seconds": round(wall, 4),
+            "commands": len(commands),
+            "time": {k: round(v, 4) for k, v in spent.items()},
+            "untracked": round(max(0.0, wall - tracked), 4),
+            "slowest": [
+                {k: e[k] for k in ("name", "locator", "seconds")} | {"caller": ";".join(e["stack"][-2:])}
+                for e in sorted(commands, key=lambda e: -e["seconds"])[:10]
+            ],
+            "locators": dict(locators.most_common(TOP)),
+            "flame": {stack: round(seconds, 4) for stack, seconds in flame.items()},
+        }
+        return profile
+
+    @classmethod
+    def write(cls, profile, report_dir=None, worker="main"):
+        """Append a test profile to this worker's JSON-lines file (survives a crashed worker)."""
+        report_dir = report_dir or TestData.PROFILE_DIR
+        os.makedirs(report_dir, exist_ok=True)
+        with open(os.path.join(report_dir, f"tests-{worker}.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(profile) + "\n")
+
+
+def _profiled_wait(profiler, original):
+    def wait(self, method, message=""):
+        if threading.get_ident() != profiler._thread:
+            return original(self, method, message)
+        stack = _caller_chain()
+        profiler._wait_stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return original(self, method, message)
+        finally:
+            seconds = time.perf_counter() - started
+            accounted = profiler._wait_stack.pop()
+            if profiler._wait_stack:
+                profiler._wait_stack[-1] += seconds  # an enclosing wait must not count it again
+            profiler.events.append({
+                "kind": "wait", "seconds": seconds, "self_seconds": seconds - accounted, "stack": stack,
+            })
+    wait.__wrapped__ = original
+    return wait
+
+
+def _profiled_sleep(profiler, original):
+    def sleep(seconds):
+        if threading.get_ident() != profiler._thread or profiler._wait_stack:
+            return original(seconds)  # WebDriverWait polling is part of its wait
+        started = time.perf_counter()
+        original(seconds)
+        elapsed = time.perf_counter() - started
+        # wait_for_response / wait_until_settled poll in their own loops: that's waiting too
+        caller = sys._getframe(1).f_code.co_name
+        profiler.events.append({
+            "kind": "wait" if caller.startswith("wait_") else "sleep",
+            "seconds": elapsed, "self_seconds": elapsed,
+            "stack": _caller_chain(),
+        })
+    sleep.__wrapped__ = original
+    return sleep
+
+
+def _caller_chain():
+    """Test function and page-object methods on the stack, outermost first."""
+    chain = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if any(part in filename for part in CALLER_DIRS) and not filename.endswith("conftest.py"):
+            chain.append(getattr(frame.f_code, "co_qualname", frame.f_code.co_name))
+            if os.path.basename(filename).startswith("test_"):
+                break
+        frame = frame.f_back
+    return chain[::-1]
+
+
+# ============================================================================
+# RUN REPORT
+# ============================================================================
+
+def hot_paths(profiles):
+    """
+    Aggregate test profiles into the run's hot-path report.
+
+    Returns:
+        Dict: totals by category, slowest commands, most-called locators,
+        hottest page-object methods, slowest tests
+    """
+    totals = dict.fromkeys(TIME_CATEGORIES + ("untracked",), 0.0)
+    locators = defaultdict(lambda: {"calls": 0, "tests": 0})
+    methods = defaultdict(float)
+    slowest = []
+    for profile in profiles:
+        for category, seconds in profile["time"].items():
+            totals[category] += seconds
+        totals["untracked"] += profile["untracked"]
+        for locator, calls in profile["locators"].items():
+            locators[locator]["calls"] += calls
+            locators[locator]["tests"] += 1
+        for stack, seconds in profile["flame"].items():
+            # Inclusive time of every page-object method on the stack
+            for frame in set(stack.split(";")[1:-1]):
+                methods[frame] += seconds
+        slowest.extend(dict(command, test=profile["test"]) for command in profile["slowest"])
+    return {
+        "tests": len(profiles),
+        "commands": sum(p["commands"] for p in profiles),
+        "time": {k: round(v, 3) for k, v in totals.items()},
+        "slowest_commands": sorted(slowest, key=lambda c: -c["seconds"])[:TOP],
+        "top_locators": sorted(
+            ({"locator": k, **v} for k, v in locators.items()), key=lambda l: -l["calls"]
+        )[:TOP],
+        "hot_methods": [
+            {"method": k, "seconds": round(v, 3)}
+            for k, v in sorted(methods.items(), key=lambda kv: -kv[1])[:TOP]
+        ],
+        "slowest_tests": [
+            {"test": p["test"], "seconds": p["seconds"], "commands": p["commands"]}
+            for p in sorted(profiles, key=lambda p: -p["seconds"])[:TOP]
+        ],
+    }
+
+
+def merge_reports(report_dir=None):
+    """Combine every worker's tests-*.jsonl into hot_paths.json; returns the report."""
+    report_dir = report_dir or TestData.PROFILE_DIR
+    profiles = []
+    for path in sorted(glob.glob(os.path.join(report_dir, "tests-*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            profiles.extend(json.loads(line) for line in f if line.strip())
+    report = hot_paths(profiles)
+    with open(os.path.join(report_dir, "hot_paths.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def clear_reports(report_dir=None):
+    """Remove the previous run's worker files (controller, before workers start)."""
+    for path in glob.glob(os.path.join(report_dir or TestData.PROFILE_DIR, "tests-*.jsonl")):
+        os.remove(path)
+
+
+def format_report(report, limit=10):
+    """Printable summary lines of a hot-path report."""
+    total = sum(report["time"].values()) or 1.0
+    lines = [f"{report['tests']} test(s), {report['commands']} WebDriver command(s)", "Time by category:"]
+    for category, seconds in sorted(report["time"].items(), key=lambda kv: -kv[1]):
+        lines.append(f"  {category:12s} {seconds:9.2f}s  {seconds / total:6.1%}")
+    lines.append("Slowest commands:")
+    for command in report["slowest_commands"][:limit]:
+        lines.append(f"  {command['seconds']:7.3f}s  {command['name']} {command['locator'] or ''}  "
+                     f"({command['caller'] or command['test']})")
+    lines.append("Most-called locators:")
+    for locator in report["top_locators"][:limit]:
+        lines.append(f"  {locator['calls']:6d}x in {locator['tests']:3d} test(s)  {locator['locator']}")
+    lines.append("Hottest page-object methods (inclusive):")
+    for method in report["hot_methods"][:limit]:
+        lines.append(f"  {method['seconds']:9.2f}s  {method['method']}")
+    return lines
+
+
+# ============================================================================
+# PYTEST-HTML PANEL
+# ============================================================================
+
+def html_panel(profile):
+    """HTML for one test's profile (category bar, icicle flame graph, slowest commands)."""
+    total = profile["seconds"] or 1.0
+    colors = {
+        "navigation": "#4e79a7", "find": "#f28e2b", "read": "#edc948", "script": "#76b7b2",
+        "interaction": "#59a14f", "other": "#bab0ac", "wait": "#e15759", "sleep": "#b07aa1",
+    }
+    bar = "".join(
+        f'<div title="{category} {seconds:.3f}s" style="width:{seconds / total:.2%};'
+        f'background:{colors[category]}"></div>'
+        for category, seconds in profile["time"].items() if seconds > 0
+    )
+    legend = " ".join(
+        f'<span style="color:{colors[category]}">&#9632;</span> {category} {seconds:.2f}s'
+        for category, seconds in profile["time"].items() if seconds > 0
+    )
+    rows = "".join(
+        f"<tr><td>{c['seconds']:.3f}s</td><td>{html.escape(c['name'])}</td>"
+        f"<td>{html.escape(c['locator'] or '')}</td><td>{html.escape(c['caller'])}</td></tr>"
+        for c in profile["slowest"]
+    )
+    return (
+        '<div class="command-profile" style="font:12px sans-serif;margin:6px 0">'
+        f"<b>WebDriver profile</b>: {profile['commands']} command(s) in {profile['seconds']:.2f}s "
+        f"(untracked {profile['untracked']:.2f}s)<br>{legend}"
+        f'<div style="display:flex;height:10px;margin:4px 0">{bar}</div>'
+        f"{_flame_html(profile['flame'], total)}"
+        '<table style="margin-top:6px"><tr><th>Time</th><th>Command</th><th>Locator</th><th>Caller</th></tr>'
+        f"{rows}</table></div>"
+    )
+
+
+def _flame_html(flame, total):
+    """Icicle graph: one row per stack depth, widths proportional to time."""
+    tree = {"children": {}, "seconds": 0.0}
+    for stack, seconds in flame.items():
+        node = tree
+        node["seconds"] += seconds
+        for frame in stack.split(";"):
+            node = node["children"].setdefault(frame, {"children": {}, "seconds": 0.0})
+            node["seconds"] += seconds
+
+    def render(node):
+        parts = []
+        for name, child in sorted(node["children"].items(), key=lambda kv: -kv[1]["seconds"]):
+            width = child["seconds"] / node["seconds"] if node["seconds"] else 0
+            if width < 0.005:
+                continue
+            parts.append(
+                f'<div style="width:{width:.2%};min-width:0;overflow:hidden">'
+                f'<div title="{html.escape(name)} {child["seconds"]:.3f}s" style="background:#fdd49e;'
+                f'border:1px solid #fff;white-space:nowrap;overflow:hidden;padding:0 2px">'
+                f'{html.escape(name)}</div>'
+                f'<div style="display:flex">{render(child)}</div></div>'
+            )
+        return "".join(parts)
+
+    covered = tree["seconds"] / total if total else 0
+    return f'<div style="display:flex;width:{min(covered, 1):.2%}">{render(tree)}</div>'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="command_profiler", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dir", default=TestData.PROFILE_DIR, help="Profile directory of the run")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+    path = os.path.join(args.dir, "hot_paths.json")
+    if not os.path.exists(path):
+        print(f"No profile in {args.dir} (run pytest with --profile-commands)")
+        return 1
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    for line in format_report(report, limit=args.limit):
+        print(line)
+    return 0
+
+
+__all__ = ['CommandProfiler', 'hot_paths', 'merge_reports', 'clear_reports', 'format_report',
+           'html_panel', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
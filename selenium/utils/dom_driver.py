@@ -0,0 +1,616 @@
+"""
+DOM-Only Driver
+
+A browserless stand-in for WebDriver, for tests that only check the
+server-rendered HTML (data-testid elements exist and hold text):
+- get() fetches the page with requests; html.parser builds the tree
+- find_element(s) by CSS (tag, #id, .class, [attr], [attr=|^=|$=|*=|~=],
+  :not(), descendant / > / + / ~ combinators), ID, NAME, CLASS_NAME,
+  TAG_NAME and link text
+- Elements support .text, get_attribute(), is_displayed(), is_enabled()
+  and nested finds; BasePage.snapshot(), BasePage.testid_index() and the
+  settle / readyState waits are answered in Python
+- No JavaScript, layout or input: click(), send_keys(), screenshots and
+  other scripts raise DomOnlyUnsupported
+
+Tests opt in with @pytest.mark.dom_only (the driver fixture then hands out
+a DomDriver unless --no-dom-only). An element is "displayed" unless it or an
+ancestor is hidden in the markup (hidden attribute, inline display:none /
+visibility:hidden, <template>, <head>); entrance animations are assumed to
+have finished.
+"""
+
+import re
+from html.parser import HTMLParser
+
+import requests
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from .artifact_writer import PAGE_STATE_SCRIPT
+from .dom_snapshot import SNAPSHOT_SCRIPT
+from .locators import TESTID_INDEX_SCRIPT
+from .waits import SETTLE_SCRIPT
+
+
+class DomOnlyUnsupported(WebDriverException):
+    """The call needs a real browser (JavaScript, layout or input)."""
+
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}
+
+# Elements whose content is never rendered as text
+NON_RENDERED = {"head", "script", "style", "template", "noscript", "title"}
+
+BLOCK_ELEMENTS = {
+    "address", "article", "aside", "blockquote", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary", "table",
+    "tr", "ul",
+}
+
+# get_attribute() returns "true" / None for these, like Selenium
+BOOLEAN_ATTRIBUTES = {
+    "async", "autofocus", "checked", "default", "defer", "disabled", "hidden", "multiple",
+    "novalidate", "open", "readonly", "required", "reversed", "selected",
+}
+
+# Layout-only scripts page objects run before reading elements
+NO_OP_SCRIPTS = re.compile(r"scrollIntoView|window\.scroll(To|By)?\(")
+
+
+class DomDriver:
+    """WebDriver subset backed by an HTTP fetch and a parsed HTML tree."""
+
+    dom_only = True
+
+    def __init__(self, timeout=30, session=None):
+        """
+        Initialize driver (no page is loaded until get()).
+
+        Args:
+            timeout: HTTP timeout per page in seconds
+            session: requests.Session to reuse (default: a new one)
+        """
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.setdefault("User-Agent", "e2e-dom-driver")
+        self.current_url = "about:blank"
+        self.status_code = None
+        self.page_source = ""
+        self._root = _Node("#document")
+        self._window_size = {"width": 1024, "height": 768}
+
+    # ============================================================================
+    # NAVIGATION
+    # ============================================================================
+
+    def get(self, url):
+        """Fetch and parse a page (server redirects are followed; client-side ones are not)."""
+        response = self.session.get(url, timeout=self.timeout)
+        self.current_url = response.url
+        self.status_code = response.status_code
+        self.page_source = response.text
+        self._root = parse_html(self.page_source)
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    @property
+    def title(self):
+        node = next(self._root.iter_tag("title"), None)
+        return _collapse(node.text_content()) if node else ""
+
+    # ============================================================================
+    # ELEMENT LOOKUP
+    # ============================================================================
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_first(self, self._root, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return [DomElement(self, node) for node in select(self._root, by, value)]
+
+    # ============================================================================
+    # SCRIPTS (answered in Python where BasePage depends on them)
+    # ============================================================================
+
+    def execute_script(self, script, *args):
+        if script == SNAPSHOT_SCRIPT:
+            return self._snapshot(*args)
+        if script == TESTID_INDEX_SCRIPT:
+            index = {}
+            for node in self._root.descendants():
+                if "data-testid" in node.attrs:
+                    index.setdefault(node.attrs["data-testid"], DomElement(self, node))
+            return index
+        if script == PAGE_STATE_SCRIPT:
+            return {"url": self.current_url, "title": self.title, "dom": self.page_source, "resources": []}
+        if script.strip() == "return document.readyState":
+            return "complete"
+        if NO_OP_SCRIPTS.search(script):
+            return None
+        raise DomOnlyUnsupported(f"JavaScript is not available in dom-only mode: {script.strip()[:60]!r}")
+
+    def execute_async_script(self, script, *args):
+        if script == SETTLE_SCRIPT:
+            return {"settled": True}  # a parsed document never changes
+        raise DomOnlyUnsupported(f"JavaScript is not available in dom-only mode: {script.strip()[:60]!r}")
+
+    def _snapshot(self, specs, max_texts):
+        """Python version of SNAPSHOT_SCRIPT over the parsed tree."""
+        out = {}
+        for name, by, value in specs:
+            try:
+                nodes = select(self._root, by, value)
+            except InvalidSelectorException as exc:
+                out[name] = {"error": exc.msg}
+                continue
+            state = {"count": len(nodes), "visible": False, "text": "", "texts": [],
+                     "attributes": {}, "rect": None}
+            if nodes:
+                first = nodes[0]
+                state.update(
+                    visible=first.is_displayed(),
+                    text=first.rendered_text(),
+                    texts=[node.rendered_text() for node in nodes[:max_texts]],
+                    attributes=dict(first.attrs),
+                )
+            out[name] = state
+        return out
+
+    # ============================================================================
+    # SESSION (no-ops and browser-only calls)
+    # ============================================================================
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        self.timeout = seconds
+
+    def set_window_size(self, width, height, windowHandle="current"):
+        self._window_size = {"width": width, "height": height}  # no layout: recorded only
+
+    def get_window_size(self, windowHandle="current"):
+        return dict(self._window_size)
+
+    def maximize_window(self):
+        pass
+
+    @property
+    def window_handles(self):
+        return ["dom"]
+
+    @property
+    def current_window_handle(self):
+        return "dom"
+
+    def get_cookies(self):
+        return [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+                for c in self.session.cookies]
+
+    def delete_all_cookies(self):
+        self.session.cookies.clear()
+
+    def get_log(self, log_type):
+        if log_type == "browser":
+            return []  # no scripts run, so nothing is logged
+        raise DomOnlyUnsupported(f"No {log_type!r} log in dom-only mode")
+
+    def get_screenshot_as_png(self):
+        raise DomOnlyUnsupported("Screenshots need a browser")
+
+    def save_screenshot(self, filename):
+        raise DomOnlyUnsupported("Screenshots need a browser")
+
+    def quit(self):
+        self.session.close()
+
+
+class DomElement:
+    """WebElement subset for one parsed node."""
+
+    def __init__(self, parent, node):
+        self.parent = parent  # the DomDriver, as on WebElement
+        self._node = node
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return self._node.rendered_text() if self._node.is_displayed() else ""
+
+    @property
+    def id(self):
+        return str(id(self._node))
+
+    def get_attribute(self, name):
+        node = self._node
+        if name in ("outerHTML", "innerHTML"):
+            return node.to_html(outer=name == "outerHTML")
+        if name == "textContent":
+            return node.text_content()
+        if name == "innerText":
+            return node.rendered_text()
+        if name == "className":
+            name = "class"
+        if name in BOOLEAN_ATTRIBUTES:
+            return "true" if name in node.attrs else None
+        return node.attrs.get(name)
+
+    get_dom_attribute = get_attribute
+    get_property = get_attribute
+
+    def is_displayed(self):
+        return self._node.is_displayed()
+
+    def is_enabled(self):
+        return "disabled" not in self._node.attrs
+
+    def is_selected(self):
+        return "checked" in self._node.attrs or "selected" in self._node.attrs
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_first(self.parent, self._node, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return [DomElement(self.parent, node) for node in select(self._node, by, value)]
+
+    @property
+    def location(self):
+        return {"x": 0, "y": 0}  # no layout
+
+    @property
+    def size(self):
+        return {"width": 0, "height": 0}
+
+    @property
+    def rect(self):
+        return {"x": 0, "y": 0, "width": 0, "height": 0}
+
+    def click(self):
+        raise DomOnlyUnsupported("click() needs a browser (drop the dom_only marker)")
+
+    def send_keys(self, *value):
+        raise DomOnlyUnsupported("send_keys() needs a browser (drop the dom_only marker)")
+
+    def clear(self):
+        raise DomOnlyUnsupported("clear() needs a browser (drop the dom_only marker)")
+
+    def submit(self):
+        raise DomOnlyUnsupported("submit() needs a browser (drop the dom_only marker)")
+
+    def __eq__(self, other):
+        return isinstance(other, DomElement) and other._node is self._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    def __repr__(self):
+        testid = self._node.attrs.get("data-testid")
+        return f"<DomElement {self._node.tag}{f' data-testid={testid!r}' if testid else ''}>"
+
+
+# ============================================================================
+# HTML TREE
+# ============================================================================
+
+class _Node:
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []  # _Node or str
+        self.parent = parent
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def elements(self):
+        return [child for child in self.children if isinstance(child, _Node)]
+
+    def descendants(self):
+        """Element descendants in document order."""
+        stack = list(reversed(self.elements()))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.elements()))
+
+    def iter_tag(self, tag):
+        return (node for node in self.descendants() if node.tag == tag)
+
+    def is_displayed(self):
+        node = self
+        while _is_element(node):
+            if not node.is_displayed_locally():
+                return False
+            node = node.parent
+        return True
+
+    def text_content(self):
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.text_content())
+        return "".join(parts)
+
+    def rendered_text(self):
+        """Approximation of innerText: visible text, one line per block element."""
+        parts = []
+        self._collect_text(parts)
+        lines = [_collapse(line) for line in "".join(parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+                continue
+            if not child.is_displayed_locally():
+                continue
+            if child.tag == "br":
+                parts.append("\n")
+            block = child.tag in BLOCK_ELEMENTS
+            if block:
+                parts.append("\n")
+            child._collect_text(parts)
+            if block:
+                parts.append("\n")
+
+    def is_displayed_locally(self):
+        if self.tag in NON_RENDERED or "hidden" in self.attrs:
+            return False
+        if self.tag == "input" and self.attrs.get("type") == "hidden":
+            return False
+        style = self.attrs.get("style", "").replace(" ", "").lower()
+        return "display:none" not in style and "visibility:hidden" not in style
+
+    def to_html(self, outer=True):
+        inner = "".join(
+            _escape(child) if isinstance(child, str) else child.to_html() for child in self.children
+        )
+        if not outer:
+            return inner
+        attrs = "".join(f' {name}="{_escape(value, quote=True)}"' for name, value in self.attrs.items())
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{attrs}>"
+        return f"<{self.tag}{attrs}>{inner}</{self.tag}>"
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document")
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        parent = self._stack[-1]
+        node = _Node(tag, {name: ("" if value is None else value) for name, value in attrs}, parent)
+        parent.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element; ignore stray end tags
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+
+def parse_html(html):
+    """Parse an HTML document into a node tree (comments and doctype dropped)."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# ============================================================================
+# SELECTORS
+# ============================================================================
+
+_SIMPLE = re.compile(r"""
+    (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:.-]+)\s*
+        (?:(?P<op>[~^$*|]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+  | :not\((?P<not>[^()]*)\)
+""", re.X)
+
+_COMBINATOR = re.compile(r"\s*([>+~])\s*|\s+")
+
+_SELECTOR_CACHE = {}
+
+
+def select(root, by, value):
+    """
+    Element descendants of root matching a locator, in document order.
+
+    Raises:
+        InvalidSelectorException: Unsupported strategy or selector syntax
+    """
+    if by == By.CSS_SELECTOR:
+        groups = _compile(value)
+        return [node for node in root.descendants() if any(_match(node, steps, len(steps) - 1) for steps in groups)]
+    if by == By.ID:
+        return [node for node in root.descendants() if node.attrs.get("id") == value]
+    if by == By.NAME:
+        return [node for node in root.descendants() if node.attrs.get("name") == value]
+    if by == By.CLASS_NAME:
+        return [node for node in root.descendants() if value in node.classes]
+    if by == By.TAG_NAME:
+        return list(root.iter_tag(value.lower()))
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        partial = by == By.PARTIAL_LINK_TEXT
+        return [node for node in root.iter_tag("a")
+                if (value in node.rendered_text() if partial else node.rendered_text() == value)]
+    raise InvalidSelectorException(f"{by} locators are not supported in dom-only mode")
+
+
+def _find_first(driver, root, by, value):
+    nodes = select(root, by, value)
+    if not nodes:
+        raise NoSuchElementException(f"Unable to locate element: {{'method': {by!r}, 'selector': {value!r}}}")
+    return DomElement(driver, nodes[0])
+
+
+def _compile(selector):
+    """CSS selector -> list of alternatives, each [(combinator, compound), ...]."""
+    if selector not in _SELECTOR_CACHE:
+        groups = []
+        for part in _split_top_level(selector):
+            steps, combinator, pos = [], None, 0
+            part = part.strip()
+            while pos < len(part):
+                if steps:
+                    match = _COMBINATOR.match(part, pos)
+                    if match:
+                        combinator, pos = match.group(1) or " ", match.end()
+                compound, pos = _compile_compound(part, pos, selector)
+                steps.append((combinator, compound))
+                combinator = None
+            if not steps:
+                raise InvalidSelectorException(f"Empty selector in {selector!r}")
+            groups.append(steps)
+        _SELECTOR_CACHE[selector] = groups
+    return _SELECTOR_CACHE[selector]
+
+
+def _compile_compound(text, pos, selector):
+    compound = {"tag": None, "ids": [], "classes": [], "attrs": [], "nots": []}
+    start = pos
+    while pos < len(text):
+        match = _SIMPLE.match(text, pos)
+        if not match:
+            break
+        if match.group("tag"):
+            if pos != start:
+                raise InvalidSelectorException(f"Unexpected type selector in {selector!r}")
+            compound["tag"] = match.group("tag").lower()
+        elif match.group("id"):
+            compound["ids"].append(match.group("id"))
+        elif match.group("cls"):
+            compound["classes"].append(match.group("cls"))
+        elif match.group("attr"):
+            value = match.group("value")
+            if value and value[0] in "\"'":
+                value = value[1:-1]
+            compound["attrs"].append((match.group("attr").lower(), match.group("op"), value))
+        else:
+            compound["nots"].append(_compile_compound(match.group("not").strip(), 0, selector)[0])
+        pos = match.end()
+    if pos == start or (pos < len(text) and not _COMBINATOR.match(text, pos)):
+        raise InvalidSelectorException(f"Unsupported CSS in dom-only mode: {selector!r}")
+    return compound, pos
+
+
+def _split_top_level(selector):
+    parts, depth, current = [], 0, []
+    for char in selector:
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def _match(node, steps, index):
+    combinator, compound = steps[index]
+    if not _matches_compound(node, compound):
+        return False
+    if index == 0:
+        return True
+    if combinator == ">":
+        return _is_element(node.parent) and _match(node.parent, steps, index - 1)
+    if combinator == " ":
+        ancestor = node.parent
+        while _is_element(ancestor):
+            if _match(ancestor, steps, index - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+    siblings = node.parent.elements()
+    previous = siblings[:siblings.index(node)]
+    if combinator == "+":
+        return bool(previous) and _match(previous[-1], steps, index - 1)
+    return any(_match(sibling, steps, index - 1) for sibling in previous)  # "~"
+
+
+def _matches_compound(node, compound):
+    if compound["tag"] not in (None, "*") and node.tag != compound["tag"]:
+        return False
+    if any(node.attrs.get("id") != value for value in compound["ids"]):
+        return False
+    classes = node.classes
+    if any(value not in classes for value in compound["classes"]):
+        return False
+    for name, op, value in compound["attrs"]:
+        actual = node.attrs.get(name)
+        if actual is None or not _attr_matches(actual, op, value):
+            return False
+    return not any(_matches_compound(node, other) for other in compound["nots"])
+
+
+def _attr_matches(actual, op, value):
+    if op is None:
+        return True
+    if op == "=":
+        return actual == value
+    if not value:
+        return False  # [x^=""], [x*=""], ... never match
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    if op == "*=":
+        return value in actual
+    if op == "~=":
+        return value in actual.split()
+    return actual == value or actual.startswith(value + "-")  # "|="
+
+
+def _is_element(node):
+    return node is not None and node.tag != "#document"
+
+
+def _collapse(text):
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _escape(text, quote=False):
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.replace('"', "&quot;") if quote else text
+
+
+__all__ = ['DomDriver', 'DomElement', 'DomOnlyUnsupported', 'parse_html', 'select']
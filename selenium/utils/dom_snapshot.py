@@ -0,0 +1,167 @@
+"""
+Batched DOM Snapshots
+
+Reads the state of many locators in a single execute_script call instead of
+one WebDriver round-trip per find / .text / is_displayed:
+- Presence and match count
+- Visibility (display, visibility, opacity, non-zero size)
+- Visible text of the first match and of every match
+- Attributes and bounding rect of the first match
+
+Used through BasePage.snapshot(); page-object verifiers are built on it.
+"""
+
+from selenium.webdriver.common.by import By
+
+
+SUPPORTED_STRATEGIES = {
+    By.CSS_SELECTOR, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME,
+    By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT,
+}
+
+
+# Resolves every [by, value] pair in the page and serializes the matches.
+SNAPSHOT_SCRIPT = """
+var specs = arguments[0], maxTexts = arguments[1];
+function byXPath(xpath) {
+    var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+    return nodes;
+}
+function byLinkText(text, partial) {
+    return Array.prototype.filter.call(document.querySelectorAll('a'), function(a) {
+        var t = (a.innerText || '').trim();
+        return partial ? t.indexOf(text) !== -1 : t === text;
+    });
+}
+function resolve(by, value) {
+    switch (by) {
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'id': return Array.from(document.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'name': return Array.from(document.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'xpath': return byXPath(value);
+        case 'link text': return byLinkText(value, false);
+        case 'partial link text': return byLinkText(value, true);
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function isVisible(el) {
+    if (el.checkVisibility) {
+        if (!el.checkVisibility({opacityProperty: true, visibilityProperty: true})) return false;
+    } else {
+        var style = window.getComputedStyle(el);
+        if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function text(el) {
+    return (el.innerText !== undefined ? el.innerText : el.textContent || '').trim();
+}
+var out = {};
+specs.forEach(function(spec) {
+    var name = spec[0], nodes;
+    try {
+        nodes = resolve(spec[1], spec[2]);
+    } catch (e) {
+        out[name] = {error: String(e && e.message || e)};
+        return;
+    }
+    var first = nodes[0];
+    var state = {count: nodes.length, visible: false, text: '', texts: [], attributes: {}, rect: null};
+    if (first) {
+        state.visible = isVisible(first);
+        state.text = text(first);
+        state.texts = nodes.slice(0, maxTexts).map(text);
+        for (var i = 0; i < first.attributes.length; i++) {
+            state.attributes[first.attributes[i].name] = first.attributes[i].value;
+        }
+        var r = first.getBoundingClientRect();
+        state.rect = {x: r.x, y: r.y, width: r.width, height: r.height};
+    }
+    out[name] = state;
+});
+return out;
+"""
+
+
+class ElementState:
+    """State of one locator at snapshot time (first match unless noted)."""
+
+    def __init__(self, name, locator, count=0, visible=False, text="",
+                 texts=None, attributes=None, rect=None, error=None):
+        self.name = name
+        self.locator = locator
+        self.count = count  # number of matches
+        self.visible = visible
+        self.text = text
+        self.texts = texts or []  # text of every match (capped)
+        self.attributes = attributes or {}
+        self.rect = rect  # {"x", "y", "width", "height"} or None
+        self.error = error  # invalid selector etc.
+
+    @property
+    def present(self):
+        return self.count > 0
+
+    def __bool__(self):
+        return self.present
+
+    def __repr__(self):
+        return (f"ElementState({self.name!r}, present={self.present}, "
+                f"visible={self.visible}, count={self.count}, text={self.text[:40]!r})")
+
+
+class PageSnapshot:
+    """Named ElementStates from one snapshot call."""
+
+    def __init__(self, states):
+        self.states = states
+
+    @classmethod
+    def from_script_result(cls, locators, result):
+        """Build from the locator dict and the raw script return value."""
+        result = result or {}
+        return cls({
+            name: ElementState(name, locator, **(result.get(name) or {}))
+            for name, locator in locators.items()
+        })
+
+    def __getitem__(self, name):
+        return self.states[name]
+
+    def __iter__(self):
+        return iter(self.states.values())
+
+    def __contains__(self, name):
+        return name in self.states
+
+    def all_present(self, *names):
+        """True if every named locator (default: all) matched."""
+        return all(self.states[n].present for n in (names or self.states))
+
+    def all_visible(self, *names):
+        """True if every named locator (default: all) is visible."""
+        return all(self.states[n].visible for n in (names or self.states))
+
+    def missing(self, visible=False):
+        """Names that are absent (or not visible when visible=True)."""
+        return [s.name for s in self if not (s.visible if visible else s.present)]
+
+    def __repr__(self):
+        return f"PageSnapshot({list(self.states.values())!r})"
+
+
+def script_args(locators, max_texts=50):
+    """Arguments for SNAPSHOT_SCRIPT from a {name: (By.X, value)} dict."""
+    for name, (by, _) in locators.items():
+        if by not in SUPPORTED_STRATEGIES:
+            raise ValueError(f"Unsupported locator strategy for {name!r}: {by}")
+    specs = [[name, by, value] for name, (by, value) in locators.items()]
+    return specs, max_texts
+
+
+__all__ = ['SNAPSHOT_SCRIPT', 'ElementState', 'PageSnapshot', 'script_args']
@@ -0,0 +1,286 @@
+"""
+Warm WebDriver Session Pool
+
+Keeps browser sessions alive across tests instead of launching a fresh
+browser for every test:
+- Hands one warm session to each test (lease/release)
+- Resets cookies, storage (including service workers and Cache Storage),
+  tabs, window size and buffered browser/performance logs between tests
+- Recycles a session after a configurable number of uses
+- Discards crashed sessions and replaces them on the next lease
+
+Chrome sessions are reset through CDP; other browsers fall back to
+plain WebDriver commands.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Origin data a test writes itself (also cleared from the warm profile template)
+STATE_STORAGE_TYPES = "local_storage,indexeddb,websql"
+
+# Origin data cleared between tests (CDP Storage.clearDataForOrigin); the app
+# registers a service worker, whose caches would otherwise outlive the test
+ORIGIN_STORAGE_TYPES = STATE_STORAGE_TYPES + ",service_workers,cache_storage"
+
+# Same for browsers without CDP, from inside the page
+CLEAR_ORIGIN_SCRIPT = """
+var done = arguments[arguments.length - 1];
+window.localStorage.clear();
+window.sessionStorage.clear();
+var pending = [];
+if (navigator.serviceWorker) {
+    pending.push(navigator.serviceWorker.getRegistrations().then(function(registrations) {
+        return Promise.all(registrations.map(function(r) { return r.unregister(); }));
+    }));
+}
+if (window.caches) {
+    pending.push(caches.keys().then(function(keys) {
+        return Promise.all(keys.map(function(key) { return caches.delete(key); }));
+    }));
+}
+Promise.all(pending).then(function() { done(true); }, function() { done(false); });
+"""
+
+# Buffered logs read (and so emptied) on reset; console errors from one test
+# must not show up in the next test's checks or failure bundle
+LOG_TYPES = ("browser", "performance")
+
+
+class PooledSession:
+    """A browser session owned by the pool, with usage bookkeeping."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    """Pool of warm WebDriver sessions for one pytest process (xdist worker)."""
+
+    def __init__(self, factory, size=1, max_uses=25, window_size=(1024, 768), base_url=None):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable returning a new, configured WebDriver
+            size: Number of warm sessions kept idle between tests
+            max_uses: Leases after which a session is quit and replaced (0 = never)
+            window_size: (width, height) restored on every reset
+            base_url: Application URL whose storage is cleared on reset
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.window_size = window_size
+        self.origin = self._origin(base_url) if base_url else None
+        self._idle = deque()
+        self._leased = {}
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "crashed": 0}
+
+    # ============================================================================
+    # LEASING
+    # ============================================================================
+
+    def acquire(self):
+        """
+        Take a session from the pool, creating one if none is idle.
+
+        Returns:
+            WebDriver ready for a test
+        """
+        with self._lock:
+            session = self._idle.popleft() if self._idle else None
+
+        if session is not None and not self._is_alive(session.driver):
+            self._discard(session, reason="crashed")
+            session = None
+
+        reused = session is not None
+        if session is None:
+            session = PooledSession(self.factory())
+
+        session.uses += 1
+        with self._lock:
+            self.stats["reused" if reused else "created"] += 1
+            self._leased[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver):
+        """
+        Return a session to the pool.
+
+        The session is reset for the next test, or quit if it crashed,
+        failed to reset, reached max_uses, or the pool is already full.
+        """
+        with self._lock:
+            session = self._leased.pop(id(driver), None)
+        if session is None:
+            return
+
+        if not self._is_alive(driver):
+            self._discard(session, reason="crashed")
+            return
+        if self.max_uses and session.uses >= self.max_uses:
+            self._discard(session, reason="recycled")
+            return
+
+        try:
+            self.reset(driver)
+        except Exception:
+            # Connection errors from a dead driver process are not WebDriverExceptions
+            self._discard(session, reason="crashed")
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(session)
+                return
+        self._discard(session, reason="recycled")
+
+    @contextmanager
+    def lease(self):
+        """Context manager: acquire a session and always release it."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def warm(self):
+        """Start sessions until `size` are idle (optional pre-warming)."""
+        while True:
+            with self._lock:
+                if len(self._idle) >= self.size:
+                    return
+            session = PooledSession(self.factory())
+            with self._lock:
+                self.stats["created"] += 1
+                self._idle.append(session)
+
+    def shutdown(self):
+        """Quit every session owned by the pool."""
+        with self._lock:
+            sessions = list(self._idle) + list(self._leased.values())
+            self._idle.clear()
+            self._leased.clear()
+        for session in sessions:
+            self._quit(session.driver)
+
+    # ============================================================================
+    # STATE RESET
+    # ============================================================================
+
+    def reset(self, driver):
+        """Reset browser state between tests."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            self._reset_with_cdp(driver)
+        else:
+            self._reset_with_webdriver(driver)
+        self._drain_logs(driver)
+
+    def _drain_logs(self, driver):
+        """Discard buffered console and performance logs so the next test starts clean."""
+        for log_type in LOG_TYPES:
+            try:
+                driver.get_log(log_type)
+            except (WebDriverException, AttributeError):
+                # Log type not enabled, or a driver without get_log
+                pass
+        # The tracker's in-flight requests and responses belong to the previous test
+        if hasattr(driver, "_e2e_network_tracker"):
+            del driver._e2e_network_tracker
+
+    def _reset_with_cdp(self, driver):
+        """Chrome: close extra tabs, clear cookies, storage, service workers and caches via CDP."""
+        keep = self._keep_window(driver)
+        targets = driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        for target in targets:
+            # ChromeDriver window handles are CDP target ids
+            if target["type"] == "page" and target["targetId"] != keep:
+                driver.execute_cdp_cmd("Target.closeTarget", {"targetId": target["targetId"]})
+        driver.switch_to.window(keep)
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        if self.origin:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": self.origin,
+                "storageTypes": ORIGIN_STORAGE_TYPES,
+            })
+            # sessionStorage lives on the tab, not the origin store
+            driver.execute_cdp_cmd("DOMStorage.enable", {})
+            driver.execute_cdp_cmd("DOMStorage.clear", {
+                "storageId": {"securityOrigin": self.origin, "isLocalStorage": False},
+            })
+            driver.execute_cdp_cmd("DOMStorage.disable", {})
+
+        driver.get("about:blank")
+        driver.set_window_size(*self.window_size)
+
+    def _reset_with_webdriver(self, driver):
+        """Other browsers: same reset through standard WebDriver commands."""
+        keep = self._keep_window(driver)
+        for handle in driver.window_handles:
+            if handle != keep:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(keep)
+
+        if self.origin and self._origin(driver.current_url) == self.origin:
+            driver.execute_async_script(CLEAR_ORIGIN_SCRIPT)
+        driver.delete_all_cookies()
+
+        driver.get("about:blank")
+        driver.set_window_size(*self.window_size)
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _keep_window(self, driver):
+        """Pick the window to keep (current one if it still exists)."""
+        handles = driver.window_handles
+        try:
+            current = driver.current_window_handle
+        except WebDriverException:
+            current = None
+        return current if current in handles else handles[0]
+
+    def _is_alive(self, driver):
+        """Check the session still answers commands."""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, session, reason):
+        """Quit a session and count why it left the pool (never called holding _lock)."""
+        with self._lock:
+            self.stats[reason] += 1
+        self._quit(session.driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url)
+        if not parts.scheme.startswith("http"):
+            return None
+        return f"{parts.scheme}://{parts.netloc}"
+
+
+__all__ = ['DriverPool', 'PooledSession', 'ORIGIN_STORAGE_TYPES', 'STATE_STORAGE_TYPES']
@@ -0,0 +1,177 @@
+"""
+Driver Binary Resolution
+
+Resolves the chromedriver/geckodriver path once per session instead of
+calling webdriver-manager for every browser launch:
+- Pinned local path from the environment (CHROMEDRIVER_PATH / GECKODRIVER_PATH)
+- Lock-protected on-disk cache shared by all xdist workers on the machine
+- webdriver-manager download (skipped when DRIVER_OFFLINE=true)
+- Selenium Manager's offline cache (~/.cache/selenium)
+- Selenium Manager itself as a last resort
+
+Each resolution records where the path came from and how long it took.
+"""
+
+import glob
+import json
+import os
+import time
+from pathlib import Path
+
+from .file_lock import FileLock
+
+
+DEFAULT_CACHE_DIR = Path(os.getenv(
+    "DRIVER_CACHE_DIR",
+    Path.home() / ".cache" / "portfolio-e2e" / "drivers",
+))
+
+
+class DriverResolution:
+    """Result of resolving one browser's driver binary."""
+
+    def __init__(self, browser, path, source, seconds):
+        self.browser = browser
+        self.path = path  # None means "let Selenium Manager decide"
+        self.source = source
+        self.seconds = seconds
+
+    def __repr__(self):
+        return (f"DriverResolution(browser={self.browser!r}, path={self.path!r}, "
+                f"source={self.source!r}, seconds={self.seconds:.3f})")
+
+
+class DriverResolver:
+    """Resolve and cache WebDriver binaries for this machine."""
+
+    DRIVERS = {
+        "chrome": {"env": "CHROMEDRIVER_PATH", "binary": "chromedriver"},
+        "firefox": {"env": "GECKODRIVER_PATH", "binary": "geckodriver"},
+    }
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_hours=24, offline=None):
+        """
+        Initialize resolver.
+
+        Args:
+            cache_dir: Directory holding the shared cache file and its lock
+            ttl_hours: Age after which a cached path is re-resolved
+            offline: Skip network downloads (default: DRIVER_OFFLINE env var)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / "drivers.json"
+        self.lock = FileLock(self.cache_dir / "drivers.lock")
+        self.ttl_seconds = ttl_hours * 3600
+        if offline is None:
+            offline = os.getenv("DRIVER_OFFLINE", "False").lower() == "true"
+        self.offline = offline
+        self._resolved = {}
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def resolve(self, browser):
+        """
+        Resolve driver binary for a browser (memoized per process).
+
+        Args:
+            browser: "chrome" or "firefox"
+
+        Returns:
+            DriverResolution
+        """
+        browser = browser.lower()
+        if browser not in self._resolved:
+            started = time.perf_counter()
+            path, source = self._resolve_uncached(browser)
+            self._resolved[browser] = DriverResolution(
+                browser, path, source, time.perf_counter() - started
+            )
+        return self._resolved[browser]
+
+    def invalidate(self, browser):
+        """Forget a resolution (e.g. the cached driver no longer matches the browser)."""
+        browser = browser.lower()
+        self._resolved.pop(browser, None)
+        with self.lock:
+            cache = self._read_cache()
+            cache.pop(browser, None)
+            self._write_cache(cache)
+
+    # ============================================================================
+    # RESOLUTION CHAIN
+    # ============================================================================
+
+    def _resolve_uncached(self, browser):
+        pinned = os.getenv(self.DRIVERS[browser]["env"])
+        if pinned and Path(pinned).is_file():
+            return pinned, "pinned"
+
+        # One worker resolves while the others wait, then all read the cache
+        with self.lock:
+            cache = self._read_cache()
+            entry = cache.get(browser)
+            if entry and Path(entry["path"]).is_file() \
+                    and time.time() - entry["resolved_at"] < self.ttl_seconds:
+                return entry["path"], "cache"
+
+            path, source = None, "selenium-manager"
+            if not self.offline:
+                path = self._download(browser)
+                source = "webdriver-manager"
+            if not path:
+                path = self._find_in_selenium_cache(browser)
+                source = "selenium-manager-cache" if path else "selenium-manager"
+
+            if path:
+                cache[browser] = {"path": path, "source": source, "resolved_at": time.time()}
+                self._write_cache(cache)
+            return path, source
+
+    def _download(self, browser):
+        """Resolve through webdriver-manager (version probe + download)."""
+        try:
+            if browser == "firefox":
+                from webdriver_manager.firefox import GeckoDriverManager
+                return GeckoDriverManager().install()
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        except Exception as e:
+            print(f"\n⚠️ webdriver-manager failed for {browser}: {e}")
+            return None
+
+    def _find_in_selenium_cache(self, browser):
+        """Newest driver already present in Selenium Manager's cache."""
+        binary = self.DRIVERS[browser]["binary"]
+        root = os.getenv("SE_CACHE_PATH", str(Path.home() / ".cache" / "selenium"))
+        candidates = glob.glob(os.path.join(root, binary, "*", "*", binary)) + \
+            glob.glob(os.path.join(root, binary, "*", "*", binary + ".exe"))
+        if not candidates:
+            return None
+        return max(candidates, key=lambda p: self._version_key(Path(p).parent.name))
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_file)
+
+    @staticmethod
+    def _version_key(version):
+        return [int(part) if part.isdigit() else 0 for part in version.split(".")]
+
+
+__all__ = ['DriverResolver', 'DriverResolution']
@@ -0,0 +1,84 @@
+"""
+Cross-Process File Lock
+
+Small advisory lock used to coordinate pytest-xdist workers that share
+on-disk state (driver cache, history files, profile templates).
+The OS releases the lock automatically if a worker dies while holding it.
+"""
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock on a lock file, usable as a context manager."""
+
+    def __init__(self, path, timeout=120.0, poll_interval=0.05):
+        """
+        Initialize lock.
+
+        Args:
+            path: Lock file path (created if missing)
+            timeout: Seconds to wait before raising TimeoutError
+            poll_interval: Seconds between acquisition attempts
+        """
+        self.path = str(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def acquire(self):
+        """Block until the lock is held (or raise TimeoutError)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock(fd)
+                self._fd = fd
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Timed out waiting for lock: {self.path}")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Release the lock if held."""
+        if self._fd is None:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    @staticmethod
+    def _lock(fd):
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _unlock(fd):
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+__all__ = ['FileLock']
@@ -0,0 +1,624 @@
+"""
+Test Impact Analysis
+
+Maps Next.js source files to the E2E tests that exercise them, so a run can
+be limited to the tests a change can affect:
+- Source graph: every src/app route (page + enclosing layouts, middleware)
+  and what it reaches through imports (static, dynamic, @/ aliases),
+  fetch('/api/...') literals and path.join(process.cwd(), ...) data dirs
+- Tests, read statically (ast): the routes each test visits (URLs,
+  navigate_to(), TestData.PAGES, the page objects' load()), the page
+  objects and fixtures it uses and the data-testids it looks up
+- Optional JS coverage (IMPACT_COVERAGE, {"tests": {test: [src files]}})
+  adds what the browser actually executed
+- Conservative: files outside src/ and the test tree (package.json, config,
+  selenium/utils, conftest), deleted or renamed files and src/ files reached
+  in ways the map doesn't follow select every test; tests with no known
+  route or testid always run
+
+Usage:
+    python -m utils.impact --changed-since origin/main      # affected tests
+    python -m utils.impact --explain src/components/Navigation.tsx
+    pytest tests/ --changed-since origin/main               # run only those
+"""
+
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from .test_data import TestData
+from .testid_coverage import ScanCache, scan_python
+from .testid_source import locate, scan_text
+
+
+SELENIUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_ROOT = os.path.dirname(SELENIUM_DIR)
+
+PAGE_FILES = ("page.tsx", "page.ts", "page.jsx", "page.js")
+ROUTE_FILES = ("route.ts", "route.js")
+# Files of a directory that wrap every route below it
+WRAPPER_FILES = ("layout", "template", "loading", "error", "global-error")
+RESOLVE_SUFFIXES = ("", ".tsx", ".ts", ".jsx", ".js", ".json", ".mdx",
+                    "/index.tsx", "/index.ts", "/index.jsx", "/index.js")
+ALIASES = {"@/": "src/", "@content/": "src/content/"}
+
+# import x from 'y' / export * from 'y' / import 'y' / import('y') / require('y')
+IMPORT = re.compile(r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*)(['"`])([^'"`\n]+)\1""")
+API_LITERAL = re.compile(r"""['"`](/api/[\w\-/\[\]]*)""")
+CWD_PATH = re.compile(r"""\bjoin\(\s*process\.cwd\(\)\s*((?:,\s*['"][^'"]+['"]\s*)+)\)""")
+QUOTED = re.compile(r"""['"]([^'"]+)['"]""")
+
+# Pseudo-route for paths no page matches (rendered by app/not-found.tsx)
+NOT_FOUND = "/_not-found"
+
+# Changes here never affect test outcomes
+IGNORED_SUFFIXES = (".md", ".txt", ".log")
+IGNORED_DIRS = ("docs/",)
+
+
+# ============================================================================
+# SOURCE GRAPH (Next.js side)
+# ============================================================================
+
+class SourceGraph:
+    """src/ files, their dependencies and the routes that reach them."""
+
+    def __init__(self, app_root=None):
+        self.app_root = app_root or APP_ROOT
+        self.files = set()
+        self.deps = defaultdict(set)
+        self.routes = {}  # route pattern -> entry files
+        self._route_regex = []
+        self._scan()
+        self.file_routes = self._reach()
+        self.importers = defaultdict(set)
+        for path, deps in self.deps.items():
+            for dep in deps:
+                self.importers[dep].add(path)
+        self._config_text = self._read_configs()
+
+    def is_orphan(self, path):
+        """Nothing in src/ or the root config files references the file (dead code)."""
+        if path in self.file_routes or self.importers.get(path):
+            return False
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return stem not in self._config_text
+
+    def match_route(self, path):
+        """Route pattern serving a URL path (None if no page / route handler does)."""
+        path = "/" + path.strip("/") if path != "/" else "/"
+        if path in self.routes:
+            return path
+        for pattern, regex in self._route_regex:
+            if regex.match(path):
+                return pattern
+        return None
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _scan(self):
+        src = os.path.join(self.app_root, "src")
+        for root, dirs, filenames in os.walk(src):
+            dirs[:] = [d for d in dirs if d != "node_modules" and not d.startswith(".")]
+            for name in filenames:
+                self.files.add(self._rel(os.path.join(root, name)))
+
+        app = "src/app/"
+        for path in sorted(self.files):
+            if not path.startswith(app):
+                continue
+            directory, name = os.path.split(path)
+            if name in PAGE_FILES or name in ROUTE_FILES:
+                route = _route_of(directory[len(app) - 1:])
+                self.routes.setdefault(route, set()).update(self._wrappers(directory) | {path})
+        self.routes[NOT_FOUND] = self._wrappers("src/app") | {
+            f for f in self.files if re.match(r"src/app/not-found\.\w+$", f)
+        }
+        for route in self.routes:
+            if "[" in route:
+                self._route_regex.append((route, _route_regex(route)))
+        for path in self.files:
+            if path.endswith((".ts", ".tsx", ".js", ".jsx", ".mjs")):
+                self._parse(path)
+
+    def _wrappers(self, directory):
+        """Layouts / error boundaries of a directory and its ancestors, middleware."""
+        found = {f for f in self.files if re.match(r"src/middleware\.\w+$", f)}
+        while directory.startswith("src/app"):
+            for f in self.files:
+                head, name = os.path.split(f)
+                if head == directory and os.path.splitext(name)[0] in WRAPPER_FILES:
+                    found.add(f)
+            directory = os.path.dirname(directory)
+        return found
+
+    def _parse(self, path):
+        try:
+            with open(os.path.join(self.app_root, path), encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return
+        directory = os.path.dirname(path)
+        for _, spec in IMPORT.findall(text):
+            self.deps[path].update(self._resolve(spec, directory))
+        for api_path in API_LITERAL.findall(text):
+            route = self.match_route(api_path)
+            if route:
+                self.deps[path].update(self.routes[route])
+        for parts in CWD_PATH.findall(text):
+            target = "/".join(QUOTED.findall(parts)).strip("/")
+            prefix = target + "/"
+            self.deps[path].update(f for f in self.files if f == target or f.startswith(prefix))
+
+    def _resolve(self, spec, directory):
+        for alias, target in ALIASES.items():
+            if spec.startswith(alias):
+                base = target + spec[len(alias):]
+                break
+        else:
+            if not spec.startswith("."):
+                return set()  # package import
+            base = os.path.normpath(os.path.join(directory, spec)).replace(os.sep, "/")
+        if "${" in base:  # import(`@/i18n/messages/${locale}.json`)
+            pattern = re.sub(r"\$\{[^}]*\}", "*", base)
+            return {f for f in self.files if fnmatch.fnmatch(f, pattern)}
+        for suffix in RESOLVE_SUFFIXES:
+            if base + suffix in self.files:
+                return {base + suffix}
+        return set()
+
+    def _reach(self):
+        """file -> routes whose entry files reach it."""
+        reached = defaultdict(set)
+        for route, entries in self.routes.items():
+            seen, stack = set(), list(entries)
+            while stack:
+                path = stack.pop()
+                if path in seen:
+                    continue
+                seen.add(path)
+                stack.extend(self.deps.get(path, ()))
+            for path in seen:
+                reached[path].add(route)
+        return reached
+
+    def _read_configs(self):
+        """Root config files (next.config.mjs, tailwind.config.ts, ...), which may point into src/."""
+        text = []
+        for name in os.listdir(self.app_root):
+            if ".config." in name or name == "package.json":
+                try:
+                    with open(os.path.join(self.app_root, name), encoding="utf-8") as f:
+                        text.append(f.read())
+                except (OSError, UnicodeDecodeError):
+                    pass
+        return "\n".join(text)
+
+    def _rel(self, path):
+        return os.path.relpath(path, self.app_root).replace(os.sep, "/")
+
+
+def _route_of(app_relative_dir):
+    """URL pattern of an app directory ("/(marketing)/blog/[slug]" -> "/blog/[slug]")."""
+    segments = [s for s in app_relative_dir.strip("/").split("/")
+                if s and not (s.startswith("(") and s.endswith(")")) and not s.startswith("@")]
+    return "/" + "/".join(segments)
+
+
+def _route_regex(route):
+    parts = []
+    for segment in route.strip("/").split("/"):
+        if segment.startswith("[[..."):
+            parts.append(r"(?:/.*)?")
+        elif segment.startswith("[..."):
+            parts.append(r"/.+")
+        elif segment.startswith("["):
+            parts.append(r"/[^/]+")
+        else:
+            parts.append("/" + re.escape(segment))
+    return re.compile("^" + "".join(parts) + "$")
+
+
+# ============================================================================
+# TEST INDEX (Python side)
+# ============================================================================
+
+@dataclass
+class TestRefs:
+    """What one test (or page object / fixture) touches."""
+    __test__ = False  # not a pytest test class
+
+    routes: set = field(default_factory=set)
+    testids: dict = field(default_factory=lambda: {"exact": set(), "prefix": set(), "pattern": set()})
+    names: set = field(default_factory=set)  # identifiers used (page object classes, fixtures)
+    file: str = None
+
+    def update(self, other):
+        self.routes |= other.routes
+        for kind, values in other.testids.items():
+            self.testids[kind] |= values
+
+    @property
+    def mapped(self):
+        return bool(self.routes or any(self.testids.values()))
+
+
+class TestIndex:
+    """Tests of the selenium tree with the routes and testids each one touches."""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, graph, selenium_dir=None):
+        self.graph = graph
+        self.selenium_dir = selenium_dir or SELENIUM_DIR
+        self.page_objects = {}  # class name -> TestRefs
+        self.fixtures = {}      # fixture name -> (TestRefs, argument names)
+        self.tests = {}         # "tests/test_x.py::Class::test_y" -> TestRefs
+        self._index_page_objects()
+        tests_dir = os.path.join(self.selenium_dir, "tests")
+        modules = [_parse_py(os.path.join(tests_dir, name)) for name in sorted(os.listdir(tests_dir))
+                   if name.endswith(".py")]
+        for tree, path in modules:
+            self._index_fixtures(tree)
+        for tree, path in modules:
+            if os.path.basename(path).startswith("test_"):
+                self._index_tests(tree, path)
+
+    def tests_using_module(self, relative_path):
+        """Tests that use a page object defined in a page_objects module."""
+        classes = {name for name, refs in self.page_objects.items() if refs.file == relative_path}
+        return {key for key, refs in self.tests.items() if refs.names & classes}
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _index_page_objects(self):
+        directory = os.path.join(self.selenium_dir, "page_objects")
+        bases = {}
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".py") or name in ("__init__.py", "base_page.py"):
+                continue
+            tree, path = _parse_py(os.path.join(directory, name))
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    refs = self._refs([node])
+                    refs.file = f"page_objects/{name}"
+                    self.page_objects[node.name] = refs
+                    bases[node.name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+        for name, parents in bases.items():  # inherited load() routes / locators
+            for parent in parents:
+                if parent in self.page_objects:
+                    self.page_objects[name].update(self.page_objects[parent])
+
+    def _index_fixtures(self, tree):
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef) and any(_is_fixture(d) for d in node.decorator_list):
+                self.fixtures[node.name] = (self._refs([node]), [a.arg for a in node.args.args])
+
+    def _index_tests(self, tree, path):
+        relative = os.path.relpath(path, self.selenium_dir).replace(os.sep, "/")
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+                self.tests[f"{relative}::{node.name}"] = self._test_refs(node, [])
+            elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                shared = [n for n in node.body if not (isinstance(n, ast.FunctionDef) and n.name.startswith("test"))]
+                shared += node.decorator_list
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef) and item.name.startswith("test"):
+                        self.tests[f"{relative}::{node.name}::{item.name}"] = self._test_refs(item, shared)
+
+    def _test_refs(self, node, shared):
+        refs = self._refs([node] + shared)
+        fixtures, pending = set(), [a.arg for a in node.args.args]
+        for extra in shared:
+            if isinstance(extra, ast.FunctionDef):
+                pending += [a.arg for a in extra.args.args]
+        while pending:
+            name = pending.pop()
+            if name in fixtures or name not in self.fixtures:
+                continue
+            fixtures.add(name)
+            fixture_refs, arguments = self.fixtures[name]
+            refs.update(fixture_refs)
+            refs.names |= fixture_refs.names
+            pending += arguments
+        for name in refs.names & set(self.page_objects):
+            refs.update(self.page_objects[name])
+        return refs
+
+    def _refs(self, nodes):
+        """Routes, testids and names referenced anywhere in the given ast nodes."""
+        refs = TestRefs()
+        strings = []
+        subscripted = set()
+        for root in nodes:
+            for node in ast.walk(root):
+                if isinstance(node, ast.Subscript) and _is_pages(node.value):
+                    subscripted.add(id(node.value))
+                    if isinstance(node.slice, ast.Constant) and node.slice.value in TestData.PAGES:
+                        strings.append(TestData.PAGES[node.slice.value])
+        for root in nodes:
+            for node in ast.walk(root):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    strings.append(node.value)
+                elif isinstance(node, ast.JoinedStr):
+                    strings.append("".join(
+                        part.value if isinstance(part, ast.Constant) else "{}" for part in node.values
+                    ))
+                elif isinstance(node, ast.Name):
+                    refs.names.add(node.id)
+                elif isinstance(node, ast.Attribute):
+                    refs.names.add(node.attr)
+                    if _is_pages(node) and id(node) not in subscripted:
+                        strings.extend(TestData.PAGES.values())  # every page (parametrized tests)
+                elif isinstance(node, ast.Call) and _is_base_url_get(node):
+                    strings.append("/")
+        if "navigate_to_home" in refs.names:
+            strings.append("/")
+
+        for value in strings:
+            path = _path_of(value)
+            if path is None:
+                continue
+            route = self.graph.match_route(path)
+            if route:
+                refs.routes.add(route)
+            elif not path.startswith("/api") and re.match(r"^/[\w\-./]{2,}$", path):
+                refs.routes.add(NOT_FOUND)
+        for kind, value, _ in scan_python("\n".join(strings)):
+            refs.testids[kind].add(value)
+        return refs
+
+
+def _parse_py(path):
+    with open(path, encoding="utf-8") as f:
+        return ast.parse(f.read(), filename=path), path
+
+
+def _is_fixture(decorator):
+    target = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return isinstance(target, ast.Attribute) and target.attr == "fixture"
+
+
+def _is_pages(node):
+    return isinstance(node, ast.Attribute) and node.attr == "PAGES"
+
+
+def _is_base_url_get(node):
+    """driver.get(TestData.BASE_URL) / driver.get(base_url): the home page."""
+    if not (isinstance(node.func, ast.Attribute) and node.func.attr == "get" and node.args):
+        return False
+    arg = node.args[0]
+    name = arg.attr if isinstance(arg, ast.Attribute) else arg.id if isinstance(arg, ast.Name) else ""
+    return name.lower() == "base_url"
+
+
+def _path_of(value):
+    """URL path in a string ("http://host/blog", "{}/blog", "/blog"), or None."""
+    value = value.strip()
+    if value.startswith(("http://", "https://")):
+        path = urlsplit(value.replace("{}", "x")).path or "/"
+    elif value.startswith("{}/"):
+        path = value[2:]
+    elif value.startswith("/"):
+        path = value
+    else:
+        return None
+    path = path.split("?")[0].split("#")[0].replace("{}", "x")
+    return path if " " not in path else None
+
+
+# ============================================================================
+# IMPACT MAP
+# ============================================================================
+
+@dataclass
+class Selection:
+    tests: set                                          # affected test keys (everything if run_all)
+    run_all: bool = False
+    reasons: dict = field(default_factory=dict)         # test key -> [changed files]
+    run_all_because: list = field(default_factory=list)
+    ignored: list = field(default_factory=list)         # changed files that affect no test
+    always: set = field(default_factory=set)            # unmapped tests (always run)
+    known: set = field(default_factory=set)             # every indexed test key
+
+    def selects(self, key):
+        """Whether a test key is selected (tests the index doesn't know always are)."""
+        return self.run_all or key in self.tests or key in self.always or key not in self.known
+
+
+class ImpactMap:
+    """Source file -> tests, from routes, testids and (optionally) JS coverage."""
+
+    def __init__(self, app_root=None, selenium_dir=None, coverage_path=None):
+        started = time.perf_counter()
+        self.app_root = app_root or APP_ROOT
+        self.selenium_dir = selenium_dir or SELENIUM_DIR
+        self.graph = SourceGraph(self.app_root)
+        self.index = TestIndex(self.graph, self.selenium_dir)
+        self.route_tests = defaultdict(set)
+        for key, refs in self.index.tests.items():
+            for route in refs.routes:
+                self.route_tests[route].add(key)
+        self.testid_files = self._testid_files()
+        self.coverage = load_coverage(coverage_path)
+        self.seconds = time.perf_counter() - started
+
+    def tests_for(self, path):
+        """
+        Tests affected by one changed file (path relative to the app root).
+
+        Returns:
+            Set of test keys, or None if the change can affect every test
+        """
+        selenium_prefix = os.path.relpath(self.selenium_dir, self.app_root).replace(os.sep, "/") + "/"
+        if path.endswith(IGNORED_SUFFIXES) or path.startswith(IGNORED_DIRS):
+            return set()
+        if not os.path.exists(os.path.join(self.app_root, path)):
+            # Deleted or renamed: the map is built from the current tree and
+            # can't tell what used the old file (a deleted test just doesn't run)
+            if path.startswith(selenium_prefix + "tests/test_"):
+                return set()
+            return None
+        if path.startswith(selenium_prefix):
+            return self._selenium_change(path[len(selenium_prefix):])
+        if not path.startswith("src/"):
+            return None  # package.json, next.config, public/, ...
+        affected = set()
+        for route in self.graph.file_routes.get(path, ()):
+            affected |= self.route_tests.get(route, set())
+        affected |= self.testid_files.get(path, set())
+        affected |= {key for key, files in self.coverage.items() if path in files}
+        if not affected and path not in self.graph.file_routes:
+            if self.graph.is_orphan(path):
+                return set()  # not imported anywhere: can't change what a test sees
+            return None  # reached some way the map doesn't follow: stay safe
+        return affected
+
+    def select(self, changed):
+        """Selection for a list of changed files (relative to the app root)."""
+        selection = Selection(tests=set(), known=set(self.index.tests))
+        selection.always = {key for key, refs in self.index.tests.items()
+                            if not refs.mapped and key not in self.coverage}
+        for path in changed:
+            affected = self.tests_for(path)
+            if affected is None:
+                selection.run_all = True
+                selection.run_all_because.append(path)
+            elif not affected:
+                selection.ignored.append(path)
+            for key in affected or ():
+                selection.tests.add(key)
+                selection.reasons.setdefault(key, []).append(path)
+        return selection
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _selenium_change(self, path):
+        if path.startswith("tests/test_") and path.endswith(".py"):
+            return {key for key in self.index.tests if key.startswith(path + "::")}
+        if path.startswith("page_objects/") and path not in ("page_objects/base_page.py",
+                                                              "page_objects/__init__.py"):
+            return self.index.tests_using_module(path)
+        if path.endswith(".py") or path.startswith(("fixtures/", "requirements")):
+            return None  # conftest, utils, base page, recorded API fixtures
+        return set()
+
+    def _testid_files(self):
+        """TSX file -> tests that look up a testid it renders."""
+        cache = ScanCache()
+        source = {"exact": {}, "pattern": {}}
+        for path in sorted(self.graph.files):
+            if path.endswith((".tsx", ".jsx")):
+                for kind, value, line in cache.scan(os.path.join(self.app_root, path), scan_text):
+                    source[kind].setdefault(value, []).append(f"{path}:{line}")
+        cache.save()
+        found = defaultdict(set)
+        for key, refs in self.index.tests.items():
+            for kind, values in refs.testids.items():
+                for value in values:
+                    for place in locate(value, source, kind):
+                        found[place.rsplit(":", 1)[0]].add(key)
+        return found
+
+
+def load_coverage(path=None):
+    """{test key: set of src files} from a JS coverage map (empty if absent)."""
+    path = path or TestData.IMPACT_COVERAGE
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {key: set(files) for key, files in data.get("tests", {}).items()}
+
+
+def changed_files(ref, app_root=None):
+    """
+    Files changed since a git ref: committed, staged, unstaged and untracked.
+
+    Raises:
+        ValueError: Unknown ref or not a git checkout
+    """
+    app_root = app_root or APP_ROOT
+
+    def git(*args):
+        result = subprocess.run(["git", *args], cwd=app_root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"git {' '.join(args)}: {result.stderr.strip()}")
+        return [line for line in result.stdout.splitlines() if line]
+
+    return sorted(set(git("diff", "--name-only", "--relative", ref, "--"))
+                  | set(git("ls-files", "--others", "--exclude-standard")))
+
+
+def test_key(item, selenium_dir=None):
+    """Key of a pytest item in TestIndex ("tests/test_x.py::Class::test_y")."""
+    relative = os.path.relpath(str(item.path), selenium_dir or SELENIUM_DIR).replace(os.sep, "/")
+    parts = [relative]
+    if getattr(item, "cls", None) is not None:
+        parts.append(item.cls.__name__)
+    parts.append(getattr(item, "originalname", None) or item.name)
+    return "::".join(parts)
+
+
+test_key.__test__ = False  # not a pytest test function
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="impact", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--changed-since", metavar="REF", help="Select tests affected since a git ref")
+    parser.add_argument("--explain", metavar="FILE", nargs="+", help="Tests affected by these files")
+    parser.add_argument("--coverage", default=None, help="JS coverage map (default: IMPACT_COVERAGE)")
+    parser.add_argument("--json", action="store_true", help="Print the selection as JSON")
+    args = parser.parse_args(argv)
+
+    impact = ImpactMap(coverage_path=args.coverage)
+    try:
+        changed = args.explain or changed_files(args.changed_since or "HEAD")
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        return 2
+    selection = impact.select(changed)
+    total = len(impact.index.tests)
+    selected = sorted(impact.index.tests) if selection.run_all else sorted(selection.tests | selection.always)
+
+    if args.json:
+        print(json.dumps({
+            "changed": changed, "run_all": selection.run_all, "run_all_because": selection.run_all_because,
+            "selected": selected, "reasons": selection.reasons, "total": total,
+        }, indent=2))
+        return 0
+    print(f"{len(changed)} changed file(s) -> {len(selected)} of {total} test(s) "
+          f"(map built in {impact.seconds * 1000:.0f}ms)")
+    for path in selection.run_all_because:
+        print(f"  ALL       {path}")
+    for path in selection.ignored:
+        print(f"  NONE      {path}")
+    if not selection.run_all:
+        for key in selected:
+            because = selection.reasons.get(key)
+            print(f"  {key}  <- {', '.join(because) if because else 'unmapped test (always runs)'}")
+    return 0
+
+
+__all__ = ['SourceGraph', 'TestIndex', 'TestRefs', 'ImpactMap', 'Selection',
+           'changed_files', 'load_coverage', 'test_key', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+"""
+JS Coverage (Chrome)
+
+Which parts of src/ the E2E suite actually executes in the browser
+(pytest --js-coverage):
+- Per session: CDP Profiler.startPreciseCoverage (block level)
+- Per test: a single Profiler.takePreciseCoverage on the test thread; the
+  raw result is queued for a background thread
+- Background thread: fetches each script once (cached by URL), maps the
+  executed ranges through its source map (inline, .map file, or the dev
+  server's webpack eval modules) back to src/ files and lines, and merges
+  the test into running totals
+- End of session: one partial per worker (JS_COVERAGE_DIR/coverage-<worker>.json);
+  the controller merges them into coverage.json, lcov.info and the per-test
+  file map test impact analysis reads (IMPACT_COVERAGE)
+
+Scripts without a usable source map still count at file level when their
+URL names a src/ module (webpack-internal:///./src/...).
+
+Usage:
+    pytest tests/ --js-coverage
+    python -m utils.js_coverage                # summary of the last merged report
+"""
+
+import argparse
+import base64
+import bisect
+import glob
+import json
+import os
+import queue
+import re
+import sys
+import threading
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from .test_data import TestData
+
+
+# base64 VLQ digits used by source map "mappings"
+VLQ_DIGITS = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+SOURCE_MAPPING_URL = re.compile(r"//[#@] sourceMappingURL=(\S+)\s*$", re.M)
+SOURCE_URL = re.compile(r"//[#@] sourceURL=(\S+)")
+# eval("...") / eval(__webpack_require__.ts("...")) module bodies of webpack's eval-source-map
+EVAL_MODULE = re.compile(r"""eval\((?:__webpack_require__\.ts\()?("(?:[^"\\]|\\.)*")""")
+SRC_PATH = re.compile(r"(?:^|[/!])(src/[^?#\s]+)")
+
+
+def src_path(name):
+    """src/ relative path of a source-map source or script URL (None outside src/)."""
+    if not name or "node_modules" in name:
+        return None
+    match = SRC_PATH.search(name.replace("\\", "/").replace("/./", "/"))
+    return match.group(1) if match else None
+
+
+def decode_mappings(mappings):
+    """
+    Decode a source map "mappings" string.
+
+    Returns:
+        List of (generated line, generated column, source index, original line)
+    """
+    segments = []
+    source = original_line = 0
+    for line_number, line in enumerate(mappings.split(";")):
+        column = 0
+        for segment in line.split(","):
+            if not segment:
+                continue
+            values, value, shift = [], 0, 0
+            for char in segment:
+                digit = VLQ_DIGITS[char]
+                value += (digit & 31) << shift
+                if digit & 32:
+                    shift += 5
+                else:
+                    values.append(-(value >> 1) if value & 1 else value >> 1)
+                    value = shift = 0
+            column += values[0]
+            if len(values) >= 4:
+                source += values[1]
+                original_line += values[2]
+                segments.append((line_number, column, source, original_line))
+    return segments
+
+
+def flatten_ranges(functions):
+    """
+    Disjoint (start, end, count) segments from V8 block coverage; nested ranges
+    override their parents (innermost wins).
+    """
+    ranges = sorted(
+        ((r["startOffset"], r["endOffset"], r["count"]) for f in functions for r in f["ranges"]),
+        key=lambda r: (r[0], -r[1]),
+    )
+    segments, stack, cursor = [], [], 0
+
+    def emit(end, count):
+        if end > cursor:
+            segments.append((cursor, end, count))
+
+    for start, end, count in ranges:
+        while stack and stack[-1][1] <= start:
+            top = stack.pop()
+            emit(top[1], top[2])
+            cursor = max(cursor, top[1])
+        if stack:
+            emit(start, stack[-1][2])
+        cursor = max(cursor, start)
+        stack.append((start, end, count))
+    while stack:
+        top = stack.pop()
+        emit(top[1], top[2])
+        cursor = max(cursor, top[1])
+    return segments
+
+
+class MappedScript:
+    """A script's source map resolved to (generated offset, src file, line), sorted by offset."""
+
+    def __init__(self, text, source_map):
+        line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+        sources = [src_path(name) for name in source_map.get("sources", [])]
+        self.points = []
+        for line, column, source, original_line in decode_mappings(source_map.get("mappings", "")):
+            if line < len(line_starts) and source < len(sources) and sources[source]:
+                self.points.append((line_starts[line] + column, sources[source], original_line + 1))
+        self.points.sort()
+
+    def lines(self, segments):
+        """{src file: (all mapped lines, executed lines)} for flattened coverage segments."""
+        starts = [segment[0] for segment in segments]
+        found = {}
+        for offset, source, line in self.points:
+            total, covered = found.setdefault(source, (set(), set()))
+            total.add(line)
+            index = bisect.bisect_right(starts, offset) - 1
+            if index >= 0 and offset < segments[index][1] and segments[index][2] > 0:
+                covered.add(line)
+        return found
+
+
+class CoverageCollector:
+    """Takes per-test V8 coverage and merges it on a background thread."""
+
+    def __init__(self, base_url=None, queue_size=64):
+        """
+        Initialize collector and start its thread.
+
+        Args:
+            base_url: Origin whose scripts are fetched for source maps (default: TestData.BASE_URL)
+            queue_size: Tests waiting to be merged before take() blocks
+        """
+        self.origin = _origin(base_url or TestData.BASE_URL)
+        self.files = {}   # src file -> {"lines": set, "covered": set}
+        self.tests = {}   # test key -> set of src files executed
+        self.stats = {"tests": 0, "scripts": 0, "unmapped": 0, "errors": 0}
+        self._scripts = {}       # url -> MappedScript | str (src file, file-level only) | None
+        self._eval_modules = {}  # webpack-internal url -> MappedScript
+        self._http = requests.Session()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="js-coverage", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def supported(driver):
+        """True if the driver exposes Chrome DevTools (Chrome, Edge)."""
+        return hasattr(driver, "execute_cdp_cmd")
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def track(self, driver):
+        """Start precise coverage for a session (once; pooled sessions keep it)."""
+        if not self.supported(driver) or getattr(driver, "_e2e_js_coverage", False):
+            return
+        driver.execute_cdp_cmd("Profiler.enable", {})
+        driver.execute_cdp_cmd("Profiler.startPreciseCoverage", {"callCount": False, "detailed": True})
+        driver._e2e_js_coverage = True
+
+    def take(self, driver, test):
+        """
+        Hand the coverage since the last take to the merger (one CDP command).
+
+        Args:
+            driver: A tracked session
+            test: Test key (utils.impact.test_key)
+        """
+        if not getattr(driver, "_e2e_js_coverage", False):
+            return
+        try:
+            result = driver.execute_cdp_cmd("Profiler.takePreciseCoverage", {})["result"]
+        except Exception:  # session died with the test: nothing to merge
+            self.stats["errors"] += 1
+            return
+        self._queue.put((test, result))
+
+    def flush(self):
+        """Block until every queued test is merged."""
+        self._queue.join()
+
+    def close(self, timeout=60):
+        """Merge what is queued and stop the thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def write_partial(self, worker, report_dir=None):
+        """Write this worker's totals (nothing if no test was covered)."""
+        if not self.stats["tests"]:
+            return None
+        report_dir = report_dir or TestData.JS_COVERAGE_DIR
+        os.makedirs(report_dir, exist_ok=True)
+        path = os.path.join(report_dir, f"coverage-{worker}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "files": {name: {"lines": sorted(data["lines"]), "covered": sorted(data["covered"])}
+                          for name, data in self.files.items()},
+                "tests": {test: sorted(files) for test, files in self.tests.items()},
+            }, f)
+        return path
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._merge(*item)
+            except Exception as exc:  # a bad script must not stop the merger
+                self.stats["errors"] += 1
+                print(f"\n⚠️ JS coverage merge failed: {exc}")
+            finally:
+                self._queue.task_done()
+
+    def _merge(self, test, result):
+        executed = self.tests.setdefault(test, set())
+        # Chunks first: fetching them registers the eval modules they contain
+        for script in sorted(result, key=lambda s: s["url"].startswith("webpack-internal:")):
+            resolved = self._resolve(script["url"])
+            if resolved is None:
+                continue
+            segments = flatten_ranges(script["functions"])
+            if isinstance(resolved, str):  # file-level only
+                data = self.files.setdefault(resolved, {"lines": set(), "covered": set()})
+                if any(count > 0 for _, _, count in segments):
+                    executed.add(resolved)
+                continue
+            for source, (total, covered) in resolved.lines(segments).items():
+                data = self.files.setdefault(source, {"lines": set(), "covered": set()})
+                data["lines"] |= total
+                data["covered"] |= covered
+                if covered:
+                    executed.add(source)
+        self.stats["tests"] += 1
+
+    def _resolve(self, url):
+        if url in self._scripts:
+            return self._scripts[url]
+        resolved = None
+        if url.startswith("webpack-internal:"):
+            resolved = self._eval_modules.get(url) or src_path(url)
+        elif _origin(url) == self.origin:
+            resolved = self._fetch(url) or src_path(url)
+        if resolved is None:
+            self.stats["unmapped"] += url.startswith("webpack-internal:") or _origin(url) == self.origin
+        else:
+            self.stats["scripts"] += 1
+        if resolved is not None or not url.startswith("webpack-internal:"):
+            self._scripts[url] = resolved  # eval modules may still show up in a later chunk
+        return resolved
+
+    def _fetch(self, url):
+        """MappedScript of a same-origin script (registers its eval modules)."""
+        try:
+            response = self._http.get(url, timeout=15)
+            response.raise_for_status()
+            text = response.text
+        except requests.RequestException:
+            return None
+        for literal in EVAL_MODULE.findall(text):
+            module = _js_string(literal)
+            source_url = SOURCE_URL.search(module or "")
+            source_map = _load_map(module, url) if source_url else None
+            if source_map:
+                self._eval_modules[source_url.group(1)] = MappedScript(module, source_map)
+        source_map = _load_map(text, url, self._http)
+        return MappedScript(text, source_map) if source_map else None
+
+
+def _load_map(text, script_url, http=None):
+    """Source map of a script: inline data: URL or a fetched .map file."""
+    matches = SOURCE_MAPPING_URL.findall(text)
+    if not matches:
+        return None
+    reference = matches[-1]
+    try:
+        if reference.startswith("data:"):
+            header, _, payload = reference.partition(",")
+            raw = base64.b64decode(payload) if ";base64" in header else payload.encode("utf-8")
+            return json.loads(raw)
+        if http is None:
+            return None
+        response = http.get(urljoin(script_url, reference), timeout=15)
+        response.raise_for_status()
+        return response.json()
+    except (ValueError, requests.RequestException):
+        return None
+
+
+def _js_string(literal):
+    """Value of a double-quoted JS string literal."""
+    literal = literal.replace("\\'", "'")
+    literal = re.sub(r"\\x([0-9a-fA-F]{2})", r"\\u00\1", literal)
+    try:
+        return json.loads(literal)
+    except ValueError:
+        return None
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+# ============================================================================
+# REPORTS
+# ============================================================================
+
+def clear_partials(report_dir=None):
+    """Remove the previous run's worker files (controller, before workers start)."""
+    for path in glob.glob(os.path.join(report_dir or TestData.JS_COVERAGE_DIR, "coverage-*.json")):
+        os.remove(path)
+
+
+def merge_partials(report_dir=None, impact_path=None):
+    """
+    Combine worker partials into coverage.json and lcov.info and update the
+    test impact map.
+
+    Returns:
+        Report dict: {"files": {src: {lines, covered, percent}}, "total": {...}, "tests": N}
+    """
+    report_dir = report_dir or TestData.JS_COVERAGE_DIR
+    files, tests = {}, {}
+    for path in sorted(glob.glob(os.path.join(report_dir, "coverage-*.json"))):
+        with open(path, encoding="utf-8") as f:
+            partial = json.load(f)
+        for name, data in partial["files"].items():
+            merged = files.setdefault(name, {"lines": set(), "covered": set()})
+            merged["lines"].update(data["lines"])
+            merged["covered"].update(data["covered"])
+        for test, executed in partial["tests"].items():
+            tests.setdefault(test, set()).update(executed)
+
+    report = {"files": {}, "tests": len(tests)}
+    total_lines = total_covered = 0
+    for name in sorted(files):
+        lines, covered = len(files[name]["lines"]), len(files[name]["covered"])
+        total_lines += lines
+        total_covered += covered
+        report["files"][name] = {"lines": lines, "covered": covered,
+                                 "percent": round(100.0 * covered / lines, 1) if lines else None}
+    report["total"] = {"lines": total_lines, "covered": total_covered,
+                       "percent": round(100.0 * total_covered / total_lines, 1) if total_lines else None}
+
+    os.makedirs(report_dir, exist_ok=True)
+    with open(os.path.join(report_dir, "coverage.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(os.path.join(report_dir, "lcov.info"), "w", encoding="utf-8") as f:
+        for name in sorted(files):
+            if not files[name]["lines"]:
+                continue
+            f.write(f"SF:{name}\n")
+            for line in sorted(files[name]["lines"]):
+                f.write(f"DA:{line},{1 if line in files[name]['covered'] else 0}\n")
+            f.write(f"LF:{len(files[name]['lines'])}\nLH:{len(files[name]['covered'])}\nend_of_record\n")
+    _update_impact_map(tests, impact_path or TestData.IMPACT_COVERAGE)
+    return report
+
+
+def _update_impact_map(tests, path):
+    """Replace the entries of the tests that ran; keep the rest (partial runs accumulate)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault("tests", {}).update({test: sorted(files) for test, files in tests.items()})
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def format_summary(report, limit=10):
+    """Printable lines: total, then the least-covered files of src/components and src/lib."""
+    total = report["total"]
+    if not total["lines"]:
+        return [f"{report['tests']} test(s); no source-mapped lines (file-level coverage only)"]
+    lines = [f"{total['covered']}/{total['lines']} lines ({total['percent']}%) "
+             f"across {len(report['files'])} src file(s), {report['tests']} test(s)"]
+    for folder in ("src/components/", "src/lib/"):
+        entries = [(data["percent"], name) for name, data in report["files"].items()
+                   if name.startswith(folder) and data["lines"]]
+        if not entries:
+            continue
+        covered = sum(report["files"][name]["covered"] for _, name in entries)
+        mapped = sum(report["files"][name]["lines"] for _, name in entries)
+        lines.append(f"{folder}: {100.0 * covered / mapped:.1f}% — least covered:")
+        for percent, name in sorted(entries)[:limit]:
+            lines.append(f"  {percent:5.1f}%  {name}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="js_coverage", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dir", default=TestData.JS_COVERAGE_DIR, help="Report directory")
+    parser.add_argument("--merge", action="store_true", help="Re-merge the worker partials first")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.merge:
+        report = merge_partials(args.dir)
+    else:
+        try:
+            with open(os.path.join(args.dir, "coverage.json"), encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            print(f"No coverage report in {args.dir}/ (run pytest --js-coverage)")
+            return 1
+    for line in format_summary(report, limit=args.limit):
+        print(line)
+    return 0
+
+
+__all__ = ['CoverageCollector', 'MappedScript', 'decode_mappings', 'flatten_ranges', 'src_path',
+           'clear_partials', 'merge_partials', 'format_summary', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+"""
+API Load Test
+
+Concurrent load against the Next.js API routes, built on the suite's own
+test data:
+- Endpoints: /api/search (TestData.SEARCH_QUERIES), /api/contact
+  (CONTACT_FORM_VALID with FORM_EDGE_CASES as messages), /api/newsletter
+  and /api/analytics (view tracking for the blog slugs)
+- Closed loop: N virtual users, each sends its next request when the last
+  one answered (max throughput at a given concurrency)
+- Open loop: requests start at a constant arrival rate whatever the
+  server does; latency is measured from the scheduled start, so queueing
+  behind a slow server is counted (no coordinated omission)
+- Pooled keep-alive connections (route_crawler.HttpPool)
+- Per endpoint: HDR-style latency histogram (p50/p95/p99/max), throughput,
+  status codes and transport errors
+
+Contact and newsletter requests use a unique address each, so the
+per-email rate limits don't turn the run into a 429 benchmark. The contact
+route stores every valid message in .data/contacts.json: point the run at a
+throwaway server.
+
+Usage:
+    python -m utils.load_test --endpoints search --users 20 --seconds 30
+    python -m utils.load_test --mode open --rate 50 --seconds 60
+    python -m utils.load_test --endpoints search=8,contact=1 --json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+
+from .route_crawler import HttpPool
+from .test_data import TestData
+
+
+# ============================================================================
+# LATENCY HISTOGRAM
+# ============================================================================
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram (HDR style): values in microseconds, 64
+    sub-buckets per power of two, so any recorded value is reported within
+    ~1.6% of its true value in constant memory.
+    """
+
+    # A bucket keeps a value's top 7 bits: 64..127, i.e. 64 sub-buckets per power of two
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = Counter()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, seconds):
+        value = max(0, int(seconds * 1_000_000))
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Seconds at or below which percent of the values fall (bucket upper bound)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._upper(bucket), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    @property
+    def mean(self):
+        return self.total / self.count / 1_000_000 if self.count else None
+
+    def to_dict(self):
+        """Percentiles in milliseconds."""
+        return {
+            "count": self.count,
+            "mean": _ms(self.mean),
+            "min": _ms(None if self.min is None else self.min / 1_000_000),
+            "p50": _ms(self.percentile(50)),
+            "p90": _ms(self.percentile(90)),
+            "p95": _ms(self.percentile(95)),
+            "p99": _ms(self.percentile(99)),
+            "max": _ms(self.max / 1_000_000 if self.count else None),
+        }
+
+    def _bucket(self, value):
+        shift = max(0, value.bit_length() - self.SUB_BUCKET_BITS)
+        return (shift, value >> shift)
+
+    @staticmethod
+    def _upper(bucket):
+        shift, sub = bucket
+        return ((sub + 1) << shift) - 1
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+# ============================================================================
+# ENDPOINTS
+# ============================================================================
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    body: bytes = None
+    headers: dict = None
+
+
+class Endpoint:
+    """An API route and the payloads sent to it (cycled through the corpus)."""
+
+    def __init__(self, name, build):
+        self.name = name
+        self._build = build
+        self._serial = itertools.count(1)
+
+    def next_request(self):
+        return self._build(next(self._serial))
+
+
+def _json_request(path, payload):
+    return Request("POST", path, json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json"})
+
+
+def _search_endpoint():
+    queries = [(kind, q) for kind, values in TestData.SEARCH_QUERIES.items() for q in values]
+
+    def build(n):
+        kind, query = queries[n % len(queries)]
+        params = {"q": query}
+        if kind in ("blog", "project") and n % 2:
+            params["type"] = kind
+        if n % 10 == 0:
+            params["suggestions"] = "true"
+        return Request("GET", f"/api/search?{urlencode(params)}")
+    return Endpoint("search", build)
+
+
+def _contact_endpoint(run_id):
+    messages = [TestData.CONTACT_FORM_VALID["message"]] + list(TestData.FORM_EDGE_CASES.values())
+
+    def build(n):
+        user, domain = TestData.CONTACT_FORM_VALID["email"].split("@")
+        form = dict(TestData.CONTACT_FORM_VALID, email=f"{user}+load{run_id}-{n}@{domain}",
+                    message=messages[n % len(messages)])
+        return _json_request("/api/contact", form)
+    return Endpoint("contact", build)
+
+
+def _newsletter_endpoint(run_id):
+    def build(n):
+        return _json_request("/api/newsletter", {"email": f"load{run_id}-{n}@example.com", "source": "load-test"})
+    return Endpoint("newsletter", build)
+
+
+def _analytics_endpoint(app_root=None):
+    app_root = app_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    blog_dir = os.path.join(app_root, "src", "content", "blog")
+    slugs = sorted(name[:-len(".mdx")] for name in os.listdir(blog_dir) if name.endswith(".mdx")) \
+        if os.path.isdir(blog_dir) else ["load-test"]
+    devices = ("desktop", "mobile", "tablet")
+
+    def build(n):
+        return _json_request("/api/analytics", {
+            "slug": slugs[n % len(slugs)], "type": "blog", "device": devices[n % len(devices)],
+            "scrollDepth": n % 101, "source": "load-test",
+        })
+    return Endpoint("analytics", build)
+
+
+def build_endpoints(names=None):
+    """
+    Endpoints by name.
+
+    Args:
+        names: Subset of search, contact, newsletter, analytics (default: all)
+    """
+    run_id = f"{int(time.time()) % 100000}"
+    factories = {
+        "search": _search_endpoint,
+        "contact": lambda: _contact_endpoint(run_id),
+        "newsletter": lambda: _newsletter_endpoint(run_id),
+        "analytics": _analytics_endpoint,
+    }
+    names = names or list(factories)
+    unknown = [name for name in names if name not in factories]
+    if unknown:
+        raise ValueError(f"Unknown endpoint(s): {', '.join(unknown)} (choose from {', '.join(factories)})")
+    return {name: factories[name]() for name in names}
+
+
+# ============================================================================
+# LOAD GENERATION
+# ============================================================================
+
+@dataclass
+class EndpointStats:
+    name: str
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    bytes: int = 0
+
+    @property
+    def requests(self):
+        return sum(self.statuses.values()) + sum(self.errors.values())
+
+    @property
+    def failures(self):
+        """Transport errors and 5xx (4xx are expected for the edge-case payloads)."""
+        return sum(self.errors.values()) + sum(n for status, n in self.statuses.items() if status >= 500)
+
+
+@dataclass
+class LoadResult:
+    mode: str
+    seconds: float
+    endpoints: dict  # name -> EndpointStats
+    concurrency: int = None
+    rate: float = None
+
+    def to_dict(self):
+        return {
+            "mode": self.mode, "seconds": round(self.seconds, 3),
+            "concurrency": self.concurrency, "rate": self.rate,
+            "endpoints": {
+                name: {
+                    "requests": stats.requests,
+                    "throughput": round(stats.requests / self.seconds, 2) if self.seconds else None,
+                    "latency_ms": stats.latency.to_dict(),
+                    "statuses": {str(k): v for k, v in sorted(stats.statuses.items())},
+                    "errors": dict(stats.errors),
+                    "bytes": stats.bytes,
+                }
+                for name, stats in self.endpoints.items()
+            },
+        }
+
+
+class LoadGenerator:
+    """Drives weighted endpoints over one pooled connection set."""
+
+    def __init__(self, base_url=None, endpoints=None, weights=None, connections=None, timeout=30):
+        """
+        Args:
+            base_url: Server under test (default: TestData.BASE_URL)
+            endpoints: {name: Endpoint} (default: build_endpoints())
+            weights: {name: relative share of requests} (default: equal)
+            connections: Pooled connections (default: LOAD_CONNECTIONS)
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url or TestData.BASE_URL
+        self.endpoints = endpoints or build_endpoints()
+        self.weights = [float((weights or {}).get(name, 1)) for name in self.endpoints]
+        self.connections = connections or TestData.LOAD_CONNECTIONS
+        self.timeout = timeout
+        self.stats = {name: EndpointStats(name) for name in self.endpoints}
+        self._pool = None
+        self._random = random.Random(0)
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    async def closed_loop(self, users, seconds, think=0.0):
+        """
+        users virtual users back to back for seconds.
+
+        Args:
+            users: Concurrent virtual users
+            seconds: Run length
+            think: Pause per user between its requests
+        """
+        deadline = time.perf_counter() + seconds
+
+        async def user():
+            while time.perf_counter() < deadline:
+                await self._send(self._pick(), time.perf_counter())
+                if think:
+                    await asyncio.sleep(think)
+
+        return await self._run("closed", lambda: asyncio.gather(*(user() for _ in range(users))),
+                               concurrency=users)
+
+    async def open_loop(self, rate, seconds, max_in_flight=1000):
+        """
+        Start rate requests per second for seconds, independent of responses.
+
+        Args:
+            rate: Arrivals per second (across all endpoints)
+            seconds: Run length
+            max_in_flight: Outstanding requests beyond which arrivals are
+                dropped (counted as "dropped" errors)
+        """
+        async def arrivals():
+            started = time.perf_counter()
+            in_flight = set()
+            for n in itertools.count():
+                scheduled = started + n / rate
+                if scheduled - started >= seconds:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                endpoint = self._pick()
+                if len(in_flight) >= max_in_flight:
+                    self.stats[endpoint.name].errors["dropped"] += 1
+                    continue
+                task = asyncio.ensure_future(self._send(endpoint, scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+
+        return await self._run("open", arrivals, rate=rate)
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    async def _run(self, mode, body, **params):
+        self._pool = HttpPool(self.base_url, size=self.connections, timeout=self.timeout, user_agent="e2e-load")
+        started = time.perf_counter()
+        try:
+            await body()
+        finally:
+            await self._pool.close()
+        return LoadResult(mode, time.perf_counter() - started, self.stats, **params)
+
+    def _pick(self):
+        endpoints = list(self.endpoints.values())
+        return self._random.choices(endpoints, weights=self.weights)[0] if len(endpoints) > 1 else endpoints[0]
+
+    async def _send(self, endpoint, scheduled):
+        """One request; latency counts from its scheduled start (includes pool waits)."""
+        stats = self.stats[endpoint.name]
+        request = endpoint.next_request()
+        try:
+            status, _, body, _ = await self._pool.request(request.method, request.path, request.body, request.headers)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+            stats.errors[type(exc).__name__] += 1
+            return
+        stats.latency.record(time.perf_counter() - scheduled)
+        stats.statuses[status] += 1
+        stats.bytes += len(body)
+
+
+def run(mode="closed", endpoints=None, weights=None, users=None, rate=None, seconds=None, base_url=None):
+    """
+    Synchronous entry point.
+
+    Returns:
+        LoadResult
+    """
+    generator = LoadGenerator(base_url, build_endpoints(endpoints), weights,
+                              connections=max(users or 0, TestData.LOAD_CONNECTIONS))
+    seconds = seconds or TestData.LOAD_SECONDS
+    if mode == "open":
+        return asyncio.run(generator.open_loop(rate or TestData.LOAD_RATE, seconds))
+    return asyncio.run(generator.closed_loop(users or TestData.LOAD_USERS, seconds))
+
+
+def format_result(result):
+    """Report lines, one per endpoint."""
+    shape = f"{result.concurrency} user(s)" if result.mode == "closed" else f"{result.rate:g} req/s offered"
+    lines = [f"{result.mode}-loop, {shape}, {result.seconds:.1f}s",
+             f"  {'endpoint':<11}{'reqs':>7}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  statuses"]
+    for name, stats in result.endpoints.items():
+        latency = stats.latency.to_dict()
+        cells = "".join(f"{latency[key]:>7.1f}ms" if latency[key] is not None else f"{'-':>9}"
+                        for key in ("p50", "p95", "p99", "max"))
+        statuses = ", ".join(f"{status}×{n}" for status, n in sorted(stats.statuses.items()))
+        errors = ", ".join(f"{kind}×{n}" for kind, n in stats.errors.items())
+        throughput = stats.requests / result.seconds if result.seconds else 0
+        lines.append(f"  {name:<11}{stats.requests:>7}{throughput:>8.1f}{cells}  "
+                     f"{statuses}{'; ' + errors if errors else ''}")
+    return lines
+
+
+def _weights(spec):
+    """"search=8,contact=1" -> (["search", "contact"], {"search": 8.0, "contact": 1.0})."""
+    names, weights = [], {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        names.append(name)
+        weights[name] = float(weight or 1)
+    return names, weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="load_test", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=TestData.BASE_URL)
+    parser.add_argument("--endpoints", default="search,contact,newsletter,analytics",
+                        help="Comma list, optional weights: search=8,contact=1")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--users", type=int, default=TestData.LOAD_USERS, help="Closed loop: virtual users")
+    parser.add_argument("--rate", type=float, default=TestData.LOAD_RATE, help="Open loop: requests per second")
+    parser.add_argument("--seconds", type=float, default=TestData.LOAD_SECONDS)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    names, weights = _weights(args.endpoints)
+    try:
+        result = run(args.mode, names, weights, users=args.users, rate=args.rate,
+                     seconds=args.seconds, base_url=args.base_url)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        for line in format_result(result):
+            print(line)
+    return 1 if any(stats.failures for stats in result.endpoints.values()) else 0
+
+
+__all__ = ['LatencyHistogram', 'Endpoint', 'EndpointStats', 'LoadGenerator', 'LoadResult',
+           'build_endpoints', 'run', 'format_result', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Locator Registry
+
+One place that knows every locator the page objects use:
+- Locator tuples declared on a page object class are registered and
+  validated when the class is created (BasePage.__init_subclass__), so a
+  malformed selector fails at import instead of mid-run
+- DynamicTestId("blog-post-card-{}") declares indexed / keyed test ids once;
+  calling it returns a cached locator
+- registry.testids() lists the data-testids the Python side expects
+  (exact, prefix and pattern); registry.source_map() finds where src/
+  renders each of them (utils.testid_source)
+- TestIdIndex: every [data-testid] element of the page from a single
+  execute_script, so indexed lookups cost no further WebDriver query
+
+Usage:
+    class BlogPage(BasePage):
+        POST_CARD = DynamicTestId("blog-post-card-{}")
+
+    page.find_element(BlogPage.POST_CARD(3))          # waited lookup
+    page.testid_index().get(BlogPage.POST_CARD.id(3))  # from the index
+"""
+
+import re
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+
+from .dom_snapshot import SUPPORTED_STRATEGIES
+from .test_data import TestData
+from .testid_source import locate, scan_sources
+
+
+class InvalidLocator(ValueError):
+    """A locator's strategy or selector syntax is invalid."""
+
+
+# [data-testid='x'], [data-testid^='x'], [data-testid*='x'] as the whole selector
+TESTID_SELECTOR = re.compile(r"""^\[data-testid\s*([\^*$]?=)\s*(["'])([^"']*)\2\]$""")
+
+# Every element with a data-testid, first occurrence per id
+TESTID_INDEX_SCRIPT = """
+var out = {}, nodes = document.querySelectorAll('[data-testid]');
+for (var i = 0; i < nodes.length; i++) {
+    var id = nodes[i].getAttribute('data-testid');
+    if (!(id in out)) out[id] = nodes[i];
+}
+return out;
+"""
+
+
+class DynamicTestId:
+    """
+    A data-testid with placeholders, e.g. "blog-post-card-{}".
+
+    placeholder is the regex a placeholder must match in matches() and
+    TestIdIndex.matching(); INDEX keeps "project-card-{}" from also matching
+    "project-card-featured-0". all() is a plain prefix locator either way.
+    """
+
+    INDEX = r"\d+"
+
+    def __init__(self, template, placeholder=".+?"):
+        if "{}" not in template:
+            raise InvalidLocator(f"DynamicTestId needs a {{}} placeholder: {template!r}")
+        self.template = template
+        self.prefix = template.split("{}", 1)[0]
+        self.regex = re.compile(
+            "^" + f"({placeholder})".join(re.escape(part) for part in template.split("{}")) + "$"
+        )
+
+    def id(self, *values):
+        """The concrete testid ("blog-post-card-3")."""
+        return self.template.format(*values)
+
+    def __call__(self, *values):
+        """Locator of the concrete testid (cached)."""
+        return testid(self.id(*values))
+
+    def all(self):
+        """Locator matching every instance by prefix."""
+        return testid_prefix(self.prefix)
+
+    def matches(self, value):
+        return bool(self.regex.match(value))
+
+    def __repr__(self):
+        return f"DynamicTestId({self.template!r})"
+
+
+@lru_cache(maxsize=4096)
+def testid(value):
+    """CSS locator for an exact data-testid."""
+    return (By.CSS_SELECTOR, f"[data-testid='{value}']")
+
+
+@lru_cache(maxsize=512)
+def testid_prefix(prefix):
+    """CSS locator for every data-testid starting with prefix."""
+    return (By.CSS_SELECTOR, f"[data-testid^='{prefix}']")
+
+
+class TestIdIndex:
+    """Elements of one page state keyed by data-testid (one DOM pass)."""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, elements):
+        self.elements = elements or {}
+
+    def get(self, testid_value, default=None):
+        return self.elements.get(testid_value, default)
+
+    def __getitem__(self, testid_value):
+        return self.elements[testid_value]
+
+    def __contains__(self, testid_value):
+        return testid_value in self.elements
+
+    def __len__(self):
+        return len(self.elements)
+
+    def matching(self, pattern):
+        """
+        Elements of a DynamicTestId (or testid prefix), in index order.
+
+        Returns:
+            List of (testid, element); numeric placeholders sort numerically
+        """
+        if isinstance(pattern, DynamicTestId):
+            found = [(k, v) for k, v in self.elements.items() if pattern.matches(k)]
+            key = pattern.regex
+        else:
+            found = [(k, v) for k, v in self.elements.items() if k.startswith(pattern)]
+            key = re.compile("^" + re.escape(pattern) + "(.*)$")
+
+        def order(item):
+            suffix = key.match(item[0]).group(1)
+            return (0, int(suffix), "") if suffix.isdigit() else (1, 0, suffix)
+        return sorted(found, key=order)
+
+
+class LocatorRegistry:
+    """Every registered locator, by owner ("BlogPage") and attribute name."""
+
+    def __init__(self):
+        self.entries = {}  # (owner, name) -> locator tuple or DynamicTestId
+
+    def register(self, owner, name, locator):
+        """
+        Validate and record a locator.
+
+        Raises:
+            InvalidLocator: Unknown strategy or malformed selector
+        """
+        if not isinstance(locator, DynamicTestId):
+            validate(locator, f"{owner}.{name}")
+        self.entries[(owner, name)] = locator
+        return locator
+
+    def register_class(self, cls):
+        """Register the locator tuples and DynamicTestIds declared on a class."""
+        for name, value in vars(cls).items():
+            if name.startswith("_"):
+                continue
+            if isinstance(value, DynamicTestId) or _is_locator(value):
+                self.register(cls.__name__, name, value)
+        return cls
+
+    def register_selectors(self, owner, selectors):
+        """Register a {name: "css selector"} dict (e.g. TestData.SELECTORS)."""
+        for name, selector in selectors.items():
+            self.register(owner, name, (By.CSS_SELECTOR, selector))
+
+    def testids(self):
+        """
+        data-testids the Python side expects.
+
+        Returns:
+            {"exact": {testid: [owner.name]}, "prefix": {...}, "pattern": {template: [...]}}
+        """
+        found = {"exact": {}, "prefix": {}, "pattern": {}}
+        for (owner, name), locator in self.entries.items():
+            where = f"{owner}.{name}"
+            if isinstance(locator, DynamicTestId):
+                found["pattern"].setdefault(locator.template, []).append(where)
+                continue
+            by, value = locator
+            if by != By.CSS_SELECTOR:
+                continue
+            match = TESTID_SELECTOR.match(value.strip())
+            if match:
+                kind = "exact" if match.group(1) == "=" else "prefix"
+                found[kind].setdefault(match.group(3), []).append(where)
+        return found
+
+    def source_map(self, source=None):
+        """
+        Where src/ renders each Python-side testid.
+
+        Args:
+            source: Result of testid_source.scan_sources() (scanned if None)
+
+        Returns:
+            {kind: {testid: ["src/...tsx:line"]}}; an empty list means no
+            TSX file renders it
+        """
+        source = scan_sources() if source is None else source
+        return {
+            kind: {value: locate(value, source, kind) for value in testids}
+            for kind, testids in self.testids().items()
+        }
+
+    def load_page_objects(self):
+        """Import every page object module (registers their locators)."""
+        import importlib
+        import pkgutil
+
+        import page_objects
+        for module in pkgutil.iter_modules(page_objects.__path__):
+            importlib.import_module(f"page_objects.{module.name}")
+        return self
+
+
+def validate(locator, where="locator"):
+    """
+    Check a (By.X, value) tuple.
+
+    Raises:
+        InvalidLocator: Unknown strategy, empty value or malformed CSS
+    """
+    if not _is_locator(locator):
+        raise InvalidLocator(f"{where}: expected (By.X, 'value'), got {locator!r}")
+    by, value = locator
+    if by not in SUPPORTED_STRATEGIES:
+        raise InvalidLocator(f"{where}: unsupported strategy {by!r}")
+    if not value.strip():
+        raise InvalidLocator(f"{where}: empty selector")
+    if by == By.CSS_SELECTOR:
+        problem = css_problem(value)
+        if problem:
+            raise InvalidLocator(f"{where}: {problem} in {value!r}")
+
+
+def css_problem(selector):
+    """Syntax problem of a CSS selector (None if it looks valid)."""
+    stack, quote = [], None
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            stack.append(char)
+        elif char in ")]":
+            if not stack or stack.pop() != {")": "(", "]": "["}[char]:
+                return f"unbalanced {char!r}"
+    if quote:
+        return "unterminated string"
+    if stack:
+        return f"unclosed {stack[-1]!r}"
+    for part in _top_level_split(selector):
+        part = part.strip()
+        if not part:
+            return "empty selector in list"
+        if part[0] in ">+~" or part[-1] in ">+~":
+            return "dangling combinator"
+    for attribute in re.findall(r"\[([^\]]*)\]", selector):
+        if not re.match(r"""^\s*[\w:.-]+\s*(?:[~^$*|]?=\s*(?:"[^"]*"|'[^']*'|[^\s"']+)\s*(?:[is]\s*)?)?$""",
+                        attribute):
+            return f"malformed attribute selector [{attribute}]"
+    return None
+
+
+def _top_level_split(selector):
+    parts, depth, current, quote = [], 0, [], None
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        if char == "," and depth == 0 and not quote:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def _is_locator(value):
+    return (isinstance(value, tuple) and len(value) == 2
+            and isinstance(value[0], str) and isinstance(value[1], str)
+            and value[0] in SUPPORTED_STRATEGIES)
+
+
+# The process-wide registry page objects register into
+LOCATORS = LocatorRegistry()
+LOCATORS.register_selectors("TestData", TestData.SELECTORS)
+
+
+__all__ = ['LOCATORS', 'LocatorRegistry', 'DynamicTestId', 'TestIdIndex', 'InvalidLocator',
+           'TESTID_INDEX_SCRIPT', 'testid', 'testid_prefix', 'validate', 'css_problem']
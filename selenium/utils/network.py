@@ -0,0 +1,274 @@
+"""
+Network-Level Waits
+
+Tracks the page's in-flight HTTP requests so tests can wait exactly as long
+as an API call takes, instead of polling for a loading spinner:
+- Chrome: CDP Network.* events read from the "performance" log
+- Other browsers: an injected fetch/XHR shim (sees requests started after
+  the shim was installed on the current document)
+
+Usage:
+    network = NetworkTracker.for_driver(driver)
+    network.mark()                       # forget earlier traffic
+    search_page.submit_search()
+    network.wait_for_response("/api/search")
+    network.wait_for_network_idle(idle_ms=300, url_filter="/api/")
+"""
+
+import json
+import re
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+# Fetch/XHR shim for browsers without CDP. Idempotent per document.
+SHIM_SCRIPT = """
+var w = window;
+if (!w.__e2eNet) {
+    var net = w.__e2eNet = {id: Math.random().toString(36).slice(2), seq: 0, inflight: {}, done: []};
+    function start(method, url) {
+        var id = ++net.seq;
+        net.inflight[id] = {method: method, url: String(url), start: performance.now()};
+        return id;
+    }
+    function finish(id, status) {
+        var req = net.inflight[id];
+        if (!req) return;
+        delete net.inflight[id];
+        req.status = status;
+        req.end = performance.now();
+        net.done.push(req);
+    }
+    if (w.fetch) {
+        var originalFetch = w.fetch;
+        w.fetch = function(input, init) {
+            var url = input && input.url ? input.url : input;
+            var method = (init && init.method) || (input && input.method) || 'GET';
+            var id = start(method.toUpperCase(), new URL(url, location.href).href);
+            return originalFetch.apply(this, arguments).then(function(response) {
+                finish(id, response.status);
+                return response;
+            }, function(error) {
+                finish(id, 0);
+                throw error;
+            });
+        };
+    }
+    var originalOpen = XMLHttpRequest.prototype.open;
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__e2eRequest = [String(method).toUpperCase(), new URL(url, location.href).href];
+        return originalOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function() {
+        var xhr = this, info = xhr.__e2eRequest || ['GET', ''];
+        var id = start(info[0], info[1]);
+        xhr.addEventListener('loadend', function() { finish(id, xhr.status); }, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+}
+var net = w.__e2eNet, cursor = arguments[0] || 0;
+return {
+    id: net.id,
+    inflight: Object.keys(net.inflight).map(function(k) { return net.inflight[k]; }),
+    done: net.done.slice(cursor),
+    total: net.done.length
+};
+"""
+
+
+class NetworkTracker:
+    """In-flight request tracking for one driver."""
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, driver):
+        """
+        Initialize tracker (prefer NetworkTracker.for_driver()).
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        self.driver = driver
+        self.mode = "cdp" if self._performance_log_available() else "shim"
+        self.inflight = {}  # request id -> {method, url, start}
+        self.responses = []  # completed requests since mark()
+        self.last_activity = time.monotonic()
+        self._document_id = None
+        self._cursor = 0
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Tracker attached to this driver (created on first use)."""
+        tracker = getattr(driver, "_e2e_network_tracker", None)
+        if tracker is None:
+            tracker = cls(driver)
+            driver._e2e_network_tracker = tracker
+        return tracker
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def mark(self):
+        """Forget completed traffic so far; later waits only see new responses."""
+        self._poll()
+        self.responses = []
+        return self
+
+    def wait_for_network_idle(self, idle_ms=500, url_filter=None, timeout=10):
+        """
+        Wait until no matching request has been in flight for idle_ms.
+
+        Args:
+            idle_ms: Required quiet window in milliseconds
+            url_filter: Only count these requests (substring, regex or callable)
+            timeout: Maximum wait in seconds
+
+        Returns:
+            bool: True if the network went idle, False on timeout
+        """
+        matches = _matcher(url_filter)
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            self._poll()
+            now = time.monotonic()
+            busy = [r for r in self.inflight.values() if matches(r["url"])]
+            # The quiet window starts no earlier than this call, so a request
+            # fired by the preceding click still has idle_ms to show up
+            activity = [started] + [r["ended"] for r in self.responses if matches(r["url"])]
+            if url_filter is None:
+                activity.append(self.last_activity)
+            if not busy and (now - max(activity)) * 1000 >= idle_ms:
+                return True
+            if now >= deadline:
+                return False
+            time.sleep(self.POLL_INTERVAL)
+
+    def wait_for_response(self, url_pattern, timeout=10, method=None):
+        """
+        Wait for a request matching url_pattern to complete (since mark()).
+
+        Args:
+            url_pattern: Substring, regex or callable matched against the URL
+            timeout: Maximum wait in seconds
+            method: Optional HTTP method ("GET", "POST", ...)
+
+        Returns:
+            Response dict: {url, method, status, duration}
+
+        Raises:
+            TimeoutException: No matching response in time
+        """
+        matches = _matcher(url_pattern)
+        deadline = time.monotonic() + timeout
+        while True:
+            self._poll()
+            for response in self.responses:
+                if matches(response["url"]) and (method is None or response["method"] == method):
+                    return response
+            if time.monotonic() >= deadline:
+                pending = [r["url"] for r in self.inflight.values() if matches(r["url"])]
+                raise TimeoutException(
+                    f"No response for {url_pattern!r} within {timeout}s (still in flight: {pending})"
+                )
+            time.sleep(self.POLL_INTERVAL)
+
+    def in_flight(self, url_filter=None):
+        """URLs of matching requests currently in flight."""
+        self._poll()
+        matches = _matcher(url_filter)
+        return [r["url"] for r in self.inflight.values() if matches(r["url"])]
+
+    # ============================================================================
+    # EVENT SOURCES
+    # ============================================================================
+
+    def _poll(self):
+        if self.mode == "cdp":
+            self._poll_cdp()
+        else:
+            self._poll_shim()
+
+    def _poll_cdp(self):
+        """Apply Network.* events from Chrome's performance log."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                url = params["request"]["url"]
+                if url.startswith("data:"):
+                    continue
+                if request_id not in self.inflight:
+                    self.inflight[request_id] = {
+                        "method": params["request"]["method"], "url": url,
+                        "start": params.get("timestamp"), "status": None,
+                    }
+                else:  # redirect: same request id, new URL
+                    self.inflight[request_id]["url"] = url
+                self.last_activity = time.monotonic()
+            elif method == "Network.responseReceived" and request_id in self.inflight:
+                self.inflight[request_id]["status"] = params["response"]["status"]
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                request = self.inflight.pop(request_id, None)
+                if request is None:
+                    continue
+                start, end = request["start"], params.get("timestamp")
+                self._complete(
+                    request["method"], request["url"],
+                    request["status"] if method == "Network.loadingFinished" else 0,
+                    (end - start) if start is not None and end is not None else None,
+                )
+
+    def _poll_shim(self):
+        """Read the injected shim's state (reinstalled after each navigation)."""
+        try:
+            state = self.driver.execute_script(SHIM_SCRIPT, self._cursor)
+        except WebDriverException:
+            return  # document unloading; try again next poll
+        if state["id"] != self._document_id:
+            # New document: its requests start from scratch
+            self._document_id = state["id"]
+            self._cursor = 0
+            self.inflight = {}
+            state = self.driver.execute_script(SHIM_SCRIPT, 0)
+        for request in state["done"]:
+            self._complete(request["method"], request["url"], request["status"],
+                           (request["end"] - request["start"]) / 1000.0)
+        self._cursor = state["total"]
+        inflight = {f"{r['method']} {r['url']} {r['start']}": r for r in state["inflight"]}
+        if set(inflight) - set(self.inflight):
+            self.last_activity = time.monotonic()
+        self.inflight = inflight
+
+    def _complete(self, method, url, status, duration):
+        now = time.monotonic()
+        self.last_activity = now
+        self.responses.append({
+            "url": url, "method": method, "status": status,
+            "duration": duration, "ended": now,
+        })
+
+    def _performance_log_available(self):
+        try:
+            self.driver.get_log("performance")
+            return True
+        except (WebDriverException, AttributeError):
+            return False
+
+
+def _matcher(pattern):
+    """Turn a substring / regex / callable / None into a URL predicate."""
+    if pattern is None:
+        return lambda url: True
+    if callable(pattern):
+        return pattern
+    if isinstance(pattern, re.Pattern):
+        return lambda url: bool(pattern.search(url))
+    return lambda url: pattern in url
+
+
+__all__ = ['NetworkTracker', 'SHIM_SCRIPT']
@@ -0,0 +1,221 @@
+"""
+Web Performance Metrics
+
+Collects Core Web Vitals and Navigation Timing for each route and checks them
+against TestData.PERFORMANCE_BENCHMARKS:
+- PerformanceObservers installed before the page's own scripts run
+  (CDP Page.addScriptToEvaluateOnNewDocument, once per Chrome session)
+- Late, buffered observers as a fallback on browsers without CDP
+- Navigation Timing, first paint / FCP, LCP, CLS, FID and long tasks
+- One JSON report per route
+
+All metrics are reported in seconds, except CLS, which has no unit.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+from .artifacts import safe_name, worker_id
+from .test_data import TestData
+
+
+# Runs before any page script; buffered observers also pick up entries that
+# happened before the script ran (fallback path).
+OBSERVER_SCRIPT = """
+(function() {
+    if (window.__e2ePerf || !window.PerformanceObserver) return;
+    var perf = window.__e2ePerf = {lcp: null, cls: 0, fid: null, longTasks: []};
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function(list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+        } catch (e) { /* entry type not supported by this browser */ }
+    }
+    observe('largest-contentful-paint', function(e) { perf.lcp = e.renderTime || e.startTime; });
+    observe('layout-shift', function(e) { if (!e.hadRecentInput) perf.cls += e.value; });
+    observe('first-input', function(e) {
+        if (perf.fid === null) perf.fid = e.processingStart - e.startTime;
+    });
+    observe('longtask', function(e) {
+        perf.longTasks.push({start: e.startTime, duration: e.duration});
+    });
+})();
+"""
+
+# Reads what the observers collected, after giving them two frames to flush
+# (or 100ms, for background tabs where animation frames are paused).
+HARVEST_SCRIPT = OBSERVER_SCRIPT + """
+var done = arguments[arguments.length - 1];
+var harvested = false;
+function harvest() {
+    if (harvested) return;
+    harvested = true;
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function(p) { paints[p.name] = p.startTime; });
+    var perf = window.__e2ePerf || {lcp: null, cls: null, fid: null, longTasks: []};
+    done({
+        url: location.href,
+        navigation: nav ? nav.toJSON() : null,
+        firstPaint: paints['first-paint'] === undefined ? null : paints['first-paint'],
+        firstContentfulPaint: paints['first-contentful-paint'] === undefined
+            ? null : paints['first-contentful-paint'],
+        lcp: perf.lcp,
+        cls: perf.cls,
+        fid: perf.fid,
+        longTasks: perf.longTasks
+    });
+}
+requestAnimationFrame(function() { requestAnimationFrame(harvest); });
+setTimeout(harvest, 100);
+"""
+
+
+class PerfCollector:
+    """Install performance observers on a driver and harvest per-route metrics."""
+
+    # Long tasks count towards blocking time above this many milliseconds
+    LONG_TASK_THRESHOLD_MS = 50
+
+    # Metrics collected during the current test (reset and stored by conftest)
+    measurements = []
+
+    def __init__(self, driver, budgets=None, report_dir=None):
+        """
+        Initialize collector.
+
+        Args:
+            driver: Selenium WebDriver instance
+            budgets: Metric budgets (default: TestData.PERFORMANCE_BENCHMARKS)
+            report_dir: Directory for per-route JSON (default: TestData.PERF_REPORT_DIR)
+        """
+        self.driver = driver
+        self.budgets = budgets or TestData.PERFORMANCE_BENCHMARKS
+        self.report_dir = report_dir or TestData.PERF_REPORT_DIR
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def install(self):
+        """
+        Register the observers for every future document (Chrome, once per session).
+
+        Returns:
+            bool: True if the observers run before page scripts
+        """
+        if getattr(self.driver, "_e2e_perf_installed", False):
+            return True
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_SCRIPT}
+            )
+        except WebDriverException:
+            return False
+        self.driver._e2e_perf_installed = True
+        return True
+
+    def collect(self, route):
+        """
+        Harvest metrics for the page currently loaded.
+
+        Args:
+            route: Route label for the report (e.g. "/blog")
+
+        Returns:
+            Dict of metric name -> value (budget keys in seconds, plus details)
+        """
+        raw = self.driver.execute_async_script(HARVEST_SCRIPT) or {}
+        metrics = self._metrics(route, raw)
+        PerfCollector.measurements.append(metrics)
+        return metrics
+
+    @classmethod
+    def reset(cls):
+        """Forget collected metrics (start of a test)."""
+        cls.measurements = []
+
+    def check(self, metrics):
+        """
+        Compare metrics with the budgets.
+
+        Metrics the browser did not report (e.g. FID without user input)
+        are skipped rather than failed.
+
+        Returns:
+            List of human-readable budget violations (empty = within budget)
+        """
+        violations = []
+        for name, budget in self.budgets.items():
+            value = metrics.get(name)
+            if value is not None and value > budget:
+                violations.append(f"{name}: {value:.3f} > {budget}")
+        return violations
+
+    def assert_budgets(self, metrics):
+        """Assert every reported metric is within budget."""
+        violations = self.check(metrics)
+        assert not violations, (
+            f"Performance budget exceeded on {metrics['route']}: " + "; ".join(violations)
+        )
+
+    def write_report(self, metrics):
+        """
+        Write the route's JSON report (latest measurement wins).
+
+        Returns:
+            Report file path
+        """
+        os.makedirs(self.report_dir, exist_ok=True)
+        name = safe_name(metrics["route"].strip("/") or "home")
+        path = os.path.join(self.report_dir, f"{name}.json")
+        report = dict(metrics, budgets=self.budgets, violations=self.check(metrics))
+        tmp = f"{path}.{uuid.uuid4().hex[:6]}.tmp"  # xdist workers may write the same route
+        with open(tmp, "w") as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp, path)
+        return path
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _metrics(self, route, raw):
+        nav = raw.get("navigation") or {}
+        long_tasks = raw.get("longTasks") or []
+        blocking_ms = sum(
+            max(0.0, task["duration"] - self.LONG_TASK_THRESHOLD_MS) for task in long_tasks
+        )
+        return {
+            "route": route,
+            "url": raw.get("url"),
+            "measured_at": datetime.now().isoformat(timespec="seconds"),
+            "worker": worker_id(),
+            "observers_preinstalled": getattr(self.driver, "_e2e_perf_installed", False),
+            # Budgeted metrics
+            "page_load_time": _seconds(nav.get("loadEventEnd") or None),
+            "first_paint": _seconds(raw.get("firstPaint")),
+            "first_contentful_paint": _seconds(raw.get("firstContentfulPaint")),
+            "largest_contentful_paint": _seconds(raw.get("lcp")),
+            "first_input_delay": _seconds(raw.get("fid")),
+            "cumulative_layout_shift": raw.get("cls"),
+            # Details
+            "time_to_first_byte": _seconds(nav.get("responseStart")),
+            "dom_content_loaded": _seconds(nav.get("domContentLoadedEventEnd") or None),
+            "transfer_size": nav.get("transferSize"),
+            "long_tasks": len(long_tasks),
+            "total_blocking_time": _seconds(blocking_ms),
+        }
+
+
+def _seconds(milliseconds):
+    return None if milliseconds is None else round(milliseconds / 1000.0, 4)
+
+
+__all__ = ['PerfCollector', 'OBSERVER_SCRIPT', 'HARVEST_SCRIPT']
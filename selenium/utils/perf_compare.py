@@ -0,0 +1,150 @@
+"""
+Performance Regression Check (perf-compare)
+
+Compares the most recent runs in the results store with the runs before them
+and flags tests / routes that got slower beyond run-to-run noise:
+- One-sided Mann-Whitney U test (recent values larger than baseline)
+- Minimum effect size on the medians, so tiny but consistent shifts
+  on noisy metrics don't fail the build
+
+Usage:
+    python -m utils.perf_compare                       # last 3 runs vs previous 10
+    python -m utils.perf_compare --recent 5 --baseline 20 --metric largest_contentful_paint
+    python -m utils.perf_compare --min-effect 0.2 --alpha 0.01
+
+Exit code 1 if any regression is flagged (usable as a CI gate).
+"""
+
+import argparse
+import math
+import statistics
+import sys
+
+from .results_store import ResultsStore
+from .test_data import TestData
+
+
+def mann_whitney_greater(recent, baseline):
+    """
+    One-sided Mann-Whitney U test: are `recent` values stochastically larger?
+
+    Uses the normal approximation with tie and continuity correction.
+
+    Returns:
+        (U statistic of `recent`, p-value)
+    """
+    n1, n2 = len(recent), len(baseline)
+    values = sorted([(v, 0) for v in recent] + [(v, 1) for v in baseline])
+
+    # Mid-ranks for ties
+    ranks = [0.0] * len(values)
+    tie_term = 0.0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2.0 + 1
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, values) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    mean = n1 * n2 / 2.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(series, recent_ids, baseline_ids, alpha, min_effect, min_samples):
+    """
+    Flag keys whose recent values regressed.
+
+    Args:
+        series: {key: {run_id: [values]}} from ResultsStore
+        recent_ids / baseline_ids: Run ids of each window
+        alpha: Significance level
+        min_effect: Minimum relative increase of the median (0.1 = +10%)
+        min_samples: Minimum values needed in each window
+
+    Returns:
+        List of result dicts (one per key with enough data), regressions flagged
+    """
+    results = []
+    for key, per_run in sorted(series.items()):
+        recent = [v for run in recent_ids for v in per_run.get(run, [])]
+        baseline = [v for run in baseline_ids for v in per_run.get(run, [])]
+        if len(recent) < min_samples or len(baseline) < min_samples:
+            continue
+        recent_median = statistics.median(recent)
+        baseline_median = statistics.median(baseline)
+        _, p_value = mann_whitney_greater(recent, baseline)
+        change = (recent_median - baseline_median) / baseline_median if baseline_median else 0.0
+        results.append({
+            "key": key,
+            "baseline_median": baseline_median,
+            "recent_median": recent_median,
+            "change": change,
+            "p_value": p_value,
+            "regressed": p_value < alpha and change >= min_effect,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="perf-compare", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", default=TestData.RESULTS_DB, help="Results database (default: RESULTS_DB)")
+    parser.add_argument("--recent", type=int, default=3, help="Runs treated as the candidate")
+    parser.add_argument("--baseline", type=int, default=10, help="Earlier runs treated as the baseline")
+    parser.add_argument("--metric", default="largest_contentful_paint",
+                        help="Route vital to compare (in addition to test durations)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
+    parser.add_argument("--min-effect", type=float, default=0.10,
+                        help="Minimum relative median increase to flag (0.10 = +10%%)")
+    parser.add_argument("--min-samples", type=int, default=3, help="Minimum values per window")
+    parser.add_argument("--cache-mode", choices=("cold", "warm"), default=None,
+                        help="Only compare runs of this cache mode (default: the latest run's)")
+    parser.add_argument("--all", action="store_true", help="Print every compared key, not only regressions")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.db)
+    cache_mode = args.cache_mode or store.latest_cache_mode()
+    run_ids = store.recent_runs(args.recent + args.baseline, cache_mode=cache_mode)
+    if len(run_ids) <= args.recent:
+        print(f"Not enough runs in {args.db}: {len(run_ids)} (need more than {args.recent})")
+        return 0
+    recent_ids, baseline_ids = run_ids[-args.recent:], run_ids[:-args.recent]
+    latest = store.run_info(recent_ids[-1])
+    print(f"Comparing {len(recent_ids)} recent run(s) (latest {latest['git_sha'][:10]}) "
+          f"with {len(baseline_ids)} baseline run(s), {cache_mode} cache")
+
+    sections = [
+        ("test duration (s)", store.test_durations(run_ids)),
+        (f"{args.metric} by route", store.route_metric(args.metric, run_ids)),
+    ]
+    regressions = 0
+    for title, series in sections:
+        results = compare(series, recent_ids, baseline_ids,
+                          args.alpha, args.min_effect, args.min_samples)
+        shown = results if args.all else [r for r in results if r["regressed"]]
+        regressions += sum(r["regressed"] for r in results)
+        print(f"\n{title}: {len(results)} compared, {sum(r['regressed'] for r in results)} regressed")
+        for r in sorted(shown, key=lambda r: -r["change"]):
+            flag = "REGRESSED" if r["regressed"] else "ok"
+            print(f"  {flag:9s} {r['baseline_median']:8.3f} -> {r['recent_median']:8.3f} "
+                  f"({r['change']:+6.1%}, p={r['p_value']:.3f})  {r['key']}")
+
+    store.close()
+    return 1 if regressions else 0
+
+
+__all__ = ['mann_whitney_greater', 'compare', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
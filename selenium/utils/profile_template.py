@@ -0,0 +1,230 @@
+"""
+Warm Browser Profile Template
+
+Builds one Chrome profile with a populated HTTP cache (and service worker,
+when the app registers one) and hands every pooled session a clone of it:
+- Template is built once per build ID: every route in TestData.PAGES is loaded
+- One xdist worker builds it; the others wait on a file lock
+- Sessions get copy-on-write clones (reflink on btrfs/XFS, clonefile on
+  APFS) and fall back to a plain copy on other filesystems
+- Clones are deleted when the worker's pool shuts down
+- Cookies and origin storage written while warming (theme, splash flags)
+  are cleared before the template is saved; only caches stay warm
+- The pool clears service workers and Cache Storage between tests, so
+  after a session's first test only the HTTP cache is still warm
+
+Used by --cache-mode warm; cold mode keeps Chrome's empty temp profile.
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import time
+import uuid
+from urllib.parse import urlsplit
+
+import requests
+
+from .asset_cache import resolve_build_id
+from .driver_pool import STATE_STORAGE_TYPES
+from .file_lock import FileLock
+
+
+# Per-process files Chrome must not find in a copied profile
+SKIP_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile", "DevToolsActivePort")
+
+MARKER = "template.json"
+
+# Resolves once the page's service worker (if any) is active
+SERVICE_WORKER_READY_SCRIPT = """
+var done = arguments[arguments.length - 1];
+if (!('serviceWorker' in navigator)) { done('unsupported'); return; }
+navigator.serviceWorker.getRegistration().then(function(registration) {
+    if (!registration) { done('none'); return; }
+    navigator.serviceWorker.ready.then(function() { done('active'); });
+    setTimeout(function() { done('timeout'); }, 5000);
+}, function() { done('error'); });
+"""
+
+
+class ProfileTemplate:
+    """A warmed Chrome user-data-dir and its per-session clones."""
+
+    def __init__(self, template_dir, base_url, app_root=None):
+        """
+        Initialize template (nothing is built until ensure()).
+
+        Args:
+            template_dir: Directory holding the template profile and its clones
+            base_url: Application URL (its build ID keys the template)
+            app_root: Next.js project root, for the dev-mode source fingerprint
+        """
+        self.root = os.path.abspath(str(template_dir))
+        self.profile_dir = os.path.join(self.root, "profile")
+        self.clones_dir = os.path.join(self.root, "clones")
+        self.base_url = base_url.rstrip("/")
+        self.app_root = app_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.clone_method = None
+        self._clones = []
+        self._ready = False
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def ensure(self, launch, routes):
+        """
+        Build the template unless one exists for the current build.
+
+        Args:
+            launch: Callable(user_data_dir) -> WebDriver
+            routes: Paths to visit while warming (e.g. TestData.PAGES.values())
+
+        Returns:
+            Template profile directory
+        """
+        if self._ready:
+            return self.profile_dir
+        with FileLock(os.path.join(self.root, ".lock"), timeout=600):
+            build_id = self._current_build()
+            if self._marker().get("build_id") != build_id or not os.path.isdir(self.profile_dir):
+                self._build(launch, list(routes), build_id)
+            self._remove_orphaned_clones()
+        self._ready = True
+        return self.profile_dir
+
+    def clone(self):
+        """
+        Copy-on-write clone of the template for one browser session.
+
+        Returns:
+            Path of the new user-data-dir
+        """
+        destination = os.path.join(self.clones_dir, f"{os.getpid()}-{uuid.uuid4().hex[:8]}")
+        os.makedirs(self.clones_dir, exist_ok=True)
+        self.clone_method = _clone_tree(self.profile_dir, destination)
+        self._clones.append(destination)
+        return destination
+
+    def cleanup(self):
+        """Delete the clones made by this process."""
+        for clone in self._clones:
+            shutil.rmtree(clone, ignore_errors=True)
+        self._clones = []
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _build(self, launch, routes, build_id):
+        started = time.monotonic()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+        os.makedirs(self.profile_dir)
+        driver = launch(self.profile_dir)
+        workers = {}
+        try:
+            for route in routes:
+                driver.get(self.base_url + route)
+                workers[route] = driver.execute_async_script(SERVICE_WORKER_READY_SCRIPT)
+            self._clear_state(driver)
+        finally:
+            driver.quit()  # flushes the disk cache to the profile
+        with open(os.path.join(self.root, MARKER), "w", encoding="utf-8") as f:
+            json.dump({
+                "build_id": build_id,
+                "routes": routes,
+                "service_worker": sorted(set(workers.values())),
+                "seconds": round(time.monotonic() - started, 1),
+            }, f, indent=2)
+        print(f"\n🔧 Profile template built for {build_id}: {len(routes)} route(s) "
+              f"in {time.monotonic() - started:.1f}s")
+
+    def _clear_state(self, driver):
+        """Drop cookies and storage written while warming; the HTTP cache and service worker stay."""
+        parts = urlsplit(self.base_url)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "storageTypes": STATE_STORAGE_TYPES,
+        })
+
+    def _remove_orphaned_clones(self):
+        """Delete clones left behind by processes that no longer exist."""
+        if not os.path.isdir(self.clones_dir):
+            return
+        for name in os.listdir(self.clones_dir):
+            pid = name.split("-", 1)[0]
+            if pid.isdigit() and not _pid_alive(int(pid)):
+                shutil.rmtree(os.path.join(self.clones_dir, name), ignore_errors=True)
+
+    def _marker(self):
+        try:
+            with open(os.path.join(self.root, MARKER), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _current_build(self):
+        try:
+            html = requests.get(self.base_url + "/", timeout=30).text
+        except requests.RequestException:
+            html = ""
+        return resolve_build_id(html, self.app_root)
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        return _windows_pid_alive(pid)  # os.kill(pid, 0) sends CTRL_C_EVENT there
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # exists but not ours
+    return True
+
+
+def _windows_pid_alive(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    ERROR_ACCESS_DENIED = 5
+    STILL_ACTIVE = 259
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED  # exists but not ours
+    try:
+        code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+            return True
+        return code.value == STILL_ACTIVE  # a handle can outlive its process
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _clone_tree(source, destination):
+    """Clone a directory tree copy-on-write where the filesystem allows it."""
+    ignore = shutil.ignore_patterns(*SKIP_FILES)
+    system = platform.system()
+    if system in ("Linux", "Darwin"):
+        command = (["cp", "-a", "--reflink=always", source, destination] if system == "Linux"
+                   else ["cp", "-c", "-R", source, destination])
+        try:
+            subprocess.run(command, check=True, capture_output=True, timeout=120)
+            for name in SKIP_FILES:
+                path = os.path.join(destination, name)
+                if os.path.lexists(path):
+                    os.remove(path)
+            return "reflink" if system == "Linux" else "clonefile"
+        except (OSError, subprocess.SubprocessError):
+            shutil.rmtree(destination, ignore_errors=True)
+    shutil.copytree(source, destination, symlinks=True, ignore=ignore)
+    return "copy"
+
+
+__all__ = ['ProfileTemplate']
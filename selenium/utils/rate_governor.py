@@ -0,0 +1,292 @@
+"""
+API Rate-Limit Governor
+
+Keeps the suite's own /api traffic under the app's rate limits, so parallel
+runs from one IP don't fail on self-inflicted 429s:
+- Budgets are the limits the app enforces: today only the contact route's
+  own limiter (POST /api/contact). src/lib/rate-limit.ts declares
+  ENDPOINT_LIMITS, but nothing calls applyRateLimit() and the middleware
+  does not rate-limit, so those budgets are advisory: used once a route
+  calls applyRateLimit(), or with advisory=True (--advisory)
+- One token bucket per (budget, path), shared by every xdist worker through
+  a locked state file: the app counts per IP, and every worker is 127.0.0.1
+- Buckets mirror the app's fixed windows: RATE_LIMIT_HEADROOM of the budget
+  (rounded down, at least 1) may go out at once, and the bucket refills in
+  full one window (plus WINDOW_SLACK) after the window's first request, as
+  the server resets its counter, so every request the budget allows is
+  one the server accepts
+- In the browser, /api requests are paused (CDP Fetch) until a token is free;
+  the wait is charged to the running test and listed in the terminal summary
+- Bucket state outlives the run, as the server's counters do (delete
+  RATE_LIMIT_STATE after restarting the dev server)
+- A wait longer than RATE_LIMIT_MAX_WAIT is not taken: the request goes out
+  and is reported as over budget instead of stalling the run
+
+Usage:
+    pytest tests/ -n 4 --live-api --rate-governor
+    python -m utils.rate_governor                  # print the budgets
+    python -m utils.rate_governor --advisory       # ... plus unenforced ENDPOINT_LIMITS
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from .file_lock import FileLock
+from .test_data import TestData
+
+
+@dataclass(frozen=True)
+class Budget:
+    """maxRequests per window for paths starting with prefix."""
+    prefix: str
+    max_requests: int
+    window: float  # seconds
+    method: str = None  # only this HTTP method (None = any)
+    source: str = "default"
+
+    def matches(self, method, path):
+        return path.startswith(self.prefix) and self.method in (None, method.upper())
+
+
+# Mirrors src/app/api/contact/route.ts, the only limiter the app enforces
+DEFAULT_BUDGETS = (
+    Budget("/api/contact", 5, 3600, method="POST"),
+)
+
+LIMIT_ENTRY = re.compile(r"""['"](/api[^'"]*)['"]\s*:\s*\{\s*maxRequests:\s*(\d+),\s*windowMs:\s*([\d\s*]+)""")
+CONTACT_WINDOW = re.compile(r"RATE_LIMIT_WINDOW\s*=\s*([\d\s*]+);")
+CONTACT_MAX = re.compile(r"MAX_REQUESTS_PER_WINDOW\s*=\s*(\d+)")
+APPLY_CALL = re.compile(r"\bapplyRateLimit\s*\(")
+
+# Added to every window: the server starts its window when the request
+# arrives, a little after the token was taken
+WINDOW_SLACK = 1.0
+
+ENDPOINT_LIMITS_SOURCE = os.path.join("src", "lib", "rate-limit.ts")
+CONTACT_SOURCE = os.path.join("src", "app", "api", "contact", "route.ts")
+
+
+def load_budgets(app_root=None, advisory=False):
+    """
+    Budgets the app enforces, most specific first.
+
+    The contact route's limiter is keyed by IP + email; tests reuse one
+    address, so it is treated as per IP (never looser than the server).
+    ENDPOINT_LIMITS only count once some route calls applyRateLimit().
+
+    Args:
+        app_root: Next.js project root (default: the repository root)
+        advisory: Also include ENDPOINT_LIMITS when nothing enforces them
+
+    Returns:
+        Tuple of Budget (DEFAULT_BUDGETS if the sources can't be read)
+    """
+    app_root = app_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    try:
+        with open(os.path.join(app_root, CONTACT_SOURCE), encoding="utf-8") as f:
+            contact = f.read()
+    except OSError:
+        return DEFAULT_BUDGETS
+    window, count = CONTACT_WINDOW.search(contact), CONTACT_MAX.search(contact)
+    if not (window and count):
+        return DEFAULT_BUDGETS
+    budgets = [Budget("/api/contact", int(count.group(1)), _product(window.group(1)) / 1000.0,
+                      method="POST", source=CONTACT_SOURCE)]
+
+    enforced = _applies_endpoint_limits(app_root)
+    if enforced or advisory:
+        try:
+            with open(os.path.join(app_root, ENDPOINT_LIMITS_SOURCE), encoding="utf-8") as f:
+                limits = f.read()
+        except OSError:
+            limits = ""
+        source = ENDPOINT_LIMITS_SOURCE if enforced else f"{ENDPOINT_LIMITS_SOURCE}, advisory"
+        budgets.extend(Budget(prefix, int(count), _product(window) / 1000.0, source=source)
+                       for prefix, count, window in LIMIT_ENTRY.findall(limits))
+    return tuple(budgets)
+
+
+def _applies_endpoint_limits(app_root):
+    """Whether any source outside rate-limit.ts calls applyRateLimit()."""
+    limits_file = os.path.normpath(os.path.join(app_root, ENDPOINT_LIMITS_SOURCE))
+    for directory, dirs, files in os.walk(os.path.join(app_root, "src")):
+        dirs[:] = [name for name in dirs if name != "node_modules"]
+        for name in files:
+            path = os.path.join(directory, name)
+            if not name.endswith((".ts", ".tsx")) or os.path.normpath(path) == limits_file:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    if APPLY_CALL.search(f.read()):
+                        return True
+            except (OSError, UnicodeDecodeError):
+                continue
+    return False
+
+
+def _product(expression):
+    """Value of "15 * 60 * 1000"."""
+    value = 1
+    for factor in expression.split("*"):
+        value *= int(factor.strip())
+    return value
+
+
+class RateGovernor:
+    """Token buckets for the app's rate limits, shared across processes."""
+
+    def __init__(self, budgets=None, state_path=None, headroom=None, max_wait=None):
+        """
+        Initialize governor.
+
+        Args:
+            budgets: Budgets, most specific first (default: load_budgets())
+            state_path: Bucket state file shared by workers (default: RATE_LIMIT_STATE)
+            headroom: Fraction of each budget the suite may use (default: RATE_LIMIT_HEADROOM)
+            max_wait: Longest wait for one request in seconds (default: RATE_LIMIT_MAX_WAIT)
+        """
+        self.budgets = tuple(budgets or load_budgets())
+        self.state_path = state_path or TestData.RATE_LIMIT_STATE
+        self.headroom = TestData.RATE_LIMIT_HEADROOM if headroom is None else headroom
+        self.max_wait = TestData.RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self.test = None
+        self.waits = {}  # test -> {"requests", "waited", "seconds", "over_budget", "paths"}
+        self._lock = threading.Lock()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def budget_for(self, method, path):
+        """The budget that governs a request (None for non-/api paths)."""
+        for budget in self.budgets:
+            if budget.matches(method, path):
+                return budget
+        return None
+
+    def acquire(self, method, url):
+        """
+        Block until a request may be sent without exceeding its budget.
+
+        Returns:
+            Seconds waited
+        """
+        path = urlsplit(url).path.rstrip("/") or "/"
+        budget = self.budget_for(method, path)
+        if budget is None:
+            return 0.0
+        key = f"{budget.prefix}|{budget.method or '*'}|{path}"
+        waited, over_budget = 0.0, False
+        while True:
+            wait = self._take(key, budget)
+            if wait <= 0:
+                break
+            if waited + wait > self.max_wait:
+                over_budget = True
+                break
+            time.sleep(wait)
+            waited += wait
+        self._record(path, waited, over_budget)
+        return waited
+
+    def intercept(self, request):
+        """FetchInterceptor handler: hold the request for its budget, then continue it."""
+        self.acquire(request["method"], request["url"])
+        return None
+
+    def start_test(self, test):
+        self.test = test
+
+    def finish_test(self):
+        """This test's totals (None if it sent no governed request)."""
+        with self._lock:
+            entry = self.waits.get(self.test)
+        self.test = None
+        return entry
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _take(self, key, budget):
+        """Take a token (returns 0) or the seconds until the bucket refills."""
+        capacity = allowance(budget, self.headroom)
+        window = budget.window + WINDOW_SLACK
+        with FileLock(f"{self.state_path}.lock"):
+            state = self._load()
+            now = time.time()
+            tokens, started = state.get(key, (capacity, now))
+            if now - started >= window:
+                # Window over: full bucket, and the next request opens a new window
+                tokens, started = capacity, now
+            if tokens >= 1:
+                state[key] = (tokens - 1, started)
+                self._save(state)
+                return 0.0
+            return started + window - now
+
+    def _load(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return {key: tuple(value) for key, value in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, state):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def _record(self, path, waited, over_budget):
+        with self._lock:
+            entry = self.waits.setdefault(self.test, {
+                "requests": 0, "waited": 0, "seconds": 0.0, "over_budget": 0, "paths": {},
+            })
+            entry["requests"] += 1
+            entry["waited"] += waited > 0
+            entry["seconds"] += waited
+            entry["over_budget"] += over_budget
+            if waited or over_budget:
+                entry["paths"][path] = round(entry["paths"].get(path, 0.0) + waited, 3)
+
+
+def allowance(budget, headroom):
+    """Requests per window the suite may send: headroom of the budget, rounded down, at least 1."""
+    return max(1, int(budget.max_requests * headroom + 1e-9))
+
+
+def format_budgets(budgets, headroom=None):
+    """Printable budget table."""
+    headroom = TestData.RATE_LIMIT_HEADROOM if headroom is None else headroom
+    lines = []
+    for budget in budgets:
+        method = budget.method or "*"
+        lines.append(f"  {method:<5}{budget.prefix:<16}{budget.max_requests:>5} / {budget.window:>6.0f}s  "
+                     f"(suite uses {allowance(budget, headroom)}; {budget.source})")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="rate_governor", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--app-root", default=None, help="Next.js project root")
+    parser.add_argument("--advisory", action="store_true", help="Include ENDPOINT_LIMITS nothing enforces")
+    args = parser.parse_args(argv)
+    for line in format_budgets(load_budgets(args.app_root, advisory=args.advisory)):
+        print(line)
+    return 0
+
+
+__all__ = ['Budget', 'RateGovernor', 'DEFAULT_BUDGETS', 'allowance', 'load_budgets', 'format_budgets', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
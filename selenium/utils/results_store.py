@@ -0,0 +1,239 @@
+"""
+Historical Results Store
+
+Local SQLite database that every test run appends to, keyed by git SHA:
+- runs: one row per pytest session (SHA, branch, browser, cache mode, start/finish)
+- test_results: outcome and duration (setup + call + teardown) per test
+- route_vitals: web vitals harvested by PerfCollector during each test
+- command_counts: WebDriver commands issued by each test
+
+xdist workers write to the same file concurrently (WAL mode); the controller
+creates the run and hands its id to the workers. Read by utils.perf_compare.
+"""
+
+import os
+import sqlite3
+import subprocess
+import uuid
+from datetime import datetime
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_key TEXT UNIQUE NOT NULL,
+    git_sha TEXT,
+    git_branch TEXT,
+    git_dirty INTEGER,
+    browser TEXT,
+    cache_mode TEXT,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    worker TEXT
+);
+CREATE TABLE IF NOT EXISTS route_vitals (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    route TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS command_counts (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    command TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results(nodeid, run_id);
+CREATE INDEX IF NOT EXISTS idx_route_vitals_route ON route_vitals(route, metric, run_id);
+"""
+
+# Vitals kept in the store (PerfCollector also reports non-numeric details)
+STORED_VITALS = (
+    "page_load_time", "first_paint", "first_contentful_paint",
+    "largest_contentful_paint", "first_input_delay", "cumulative_layout_shift",
+    "time_to_first_byte", "total_blocking_time",
+)
+
+
+class ResultsStore:
+    """Append-only access to the results database."""
+
+    def __init__(self, path):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = str(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    # ============================================================================
+    # WRITING
+    # ============================================================================
+
+    def start_run(self, browser=None, run_key=None, cache_mode=None):
+        """
+        Register a run (controller process).
+
+        Args:
+            browser: Browser name
+            run_key: Existing key (workers joining a run), or None for a new one
+            cache_mode: "cold" or "warm" (runs are only compared within one mode)
+
+        Returns:
+            run_key to hand to xdist workers
+        """
+        run_key = run_key or uuid.uuid4().hex
+        sha, branch, dirty = git_state()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs "
+                "(run_key, git_sha, git_branch, git_dirty, browser, cache_mode, started_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_key, sha, branch, int(dirty), browser, cache_mode, _now()),
+            )
+        return run_key
+
+    def finish_run(self, run_key):
+        with self.conn:
+            self.conn.execute("UPDATE runs SET finished_at = ? WHERE run_key = ?", (_now(), run_key))
+
+    def record_test(self, run_key, nodeid, outcome, duration, worker=None,
+                    vitals=(), commands=None):
+        """
+        Append one test's results.
+
+        Args:
+            run_key: Run from start_run()
+            nodeid: pytest node id
+            outcome: "passed", "failed" or "skipped"
+            duration: Seconds for setup + call + teardown
+            worker: xdist worker id
+            vitals: PerfCollector metrics dicts measured during the test
+            commands: Dict of {WebDriver command: count}
+        """
+        with self.conn:
+            run_id = self._run_id(run_key)
+            self.conn.execute(
+                "INSERT INTO test_results (run_id, nodeid, outcome, duration, worker) VALUES (?, ?, ?, ?, ?)",
+                (run_id, nodeid, outcome, duration, worker),
+            )
+            self.conn.executemany(
+                "INSERT INTO route_vitals (run_id, nodeid, route, metric, value) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, metrics["route"], name, metrics[name])
+                    for metrics in vitals
+                    for name in STORED_VITALS
+                    if metrics.get(name) is not None
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO command_counts (run_id, nodeid, command, count) VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, command, count) for command, count in (commands or {}).items()],
+            )
+
+    # ============================================================================
+    # READING
+    # ============================================================================
+
+    def recent_runs(self, limit, cache_mode=None):
+        """Ids of the latest runs that recorded anything, oldest first."""
+        rows = self.conn.execute(
+            "SELECT id FROM runs WHERE id IN (SELECT DISTINCT run_id FROM test_results) "
+            "AND (? IS NULL OR COALESCE(cache_mode, 'cold') = ?) "
+            "ORDER BY id DESC LIMIT ?", (cache_mode, cache_mode, limit)
+        ).fetchall()
+        return [row["id"] for row in reversed(rows)]
+
+    def latest_cache_mode(self):
+        """Cache mode of the most recent run ("cold" for runs recorded before modes existed)."""
+        row = self.conn.execute(
+            "SELECT COALESCE(cache_mode, 'cold') AS mode FROM runs "
+            "WHERE id IN (SELECT DISTINCT run_id FROM test_results) ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        return row["mode"] if row else None
+
+    def test_durations(self, run_ids):
+        """{nodeid: {run_id: [seconds, ...]}} for passed tests in the given runs."""
+        return self._series(
+            "SELECT nodeid AS key, run_id, duration AS value FROM test_results "
+            "WHERE outcome = 'passed' AND run_id IN ({})", run_ids,
+        )
+
+    def route_metric(self, metric, run_ids):
+        """{route: {run_id: [value, ...]}} for one vital in the given runs."""
+        return self._series(
+            "SELECT route AS key, run_id, value FROM route_vitals "
+            "WHERE metric = ? AND run_id IN ({})", run_ids, metric,
+        )
+
+    def run_info(self, run_id):
+        return self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+
+    def close(self):
+        self.conn.close()
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _migrate(self):
+        """Add columns introduced after a database was created."""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(runs)")}
+        if "cache_mode" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE runs ADD COLUMN cache_mode TEXT")
+
+    def _run_id(self, run_key):
+        row = self.conn.execute("SELECT id FROM runs WHERE run_key = ?", (run_key,)).fetchone()
+        if row is None:  # worker started without a controller-created run
+            self.start_run(run_key=run_key)
+            row = self.conn.execute("SELECT id FROM runs WHERE run_key = ?", (run_key,)).fetchone()
+        return row["id"]
+
+    def _series(self, query, run_ids, *params):
+        series = {}
+        if not run_ids:
+            return series
+        placeholders = ", ".join("?" for _ in run_ids)
+        for row in self.conn.execute(query.format(placeholders), (*params, *run_ids)):
+            series.setdefault(row["key"], {}).setdefault(row["run_id"], []).append(row["value"])
+        return series
+
+
+def git_state():
+    """(sha, branch, dirty) of the working tree, or env fallbacks outside git."""
+    def git(*args):
+        try:
+            return subprocess.run(
+                ["git", *args], capture_output=True, text=True, timeout=5, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    sha = git("rev-parse", "HEAD") or os.getenv("GIT_SHA") or os.getenv("GITHUB_SHA") or "unknown"
+    branch = git("rev-parse", "--abbrev-ref", "HEAD") or os.getenv("GITHUB_REF_NAME")
+    dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    return sha, branch, dirty
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+__all__ = ['ResultsStore', 'STORED_VITALS', 'git_state']
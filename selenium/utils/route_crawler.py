@@ -0,0 +1,336 @@
+"""
+Route Preflight Crawler
+
+Checks every route over raw HTTP, concurrently, before any browser starts,
+so a broken page fails the run in seconds instead of minutes:
+- Routes: TestData.PAGES, /sitemap.xml and the dynamic slugs behind
+  /blog/[slug], /projects/[slug], /research/[slug], /case-studies/[slug]
+- Checks: HTTP status, the server-rendered marker (a data-testid from
+  TestData.ROUTE_MARKERS, <h1> for detail pages) and response time
+- Pooled keep-alive asyncio HTTP/1.1 client (no extra dependencies)
+
+Usage:
+    python -m utils.route_crawler                  # exit 1 on any failure
+    python -m utils.route_crawler --concurrency 4 --max-seconds 5
+    pytest tests/ --preflight                      # crawl first, abort run on failure
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from .test_data import TestData
+
+
+@dataclass
+class Route:
+    """A path to check and the marker its server-rendered HTML must contain."""
+    path: str
+    marker: str = None
+    source: str = "pages"
+
+
+@dataclass
+class RouteResult:
+    route: Route
+    status: int = None
+    seconds: float = None
+    marker_found: bool = None
+    error: str = None
+
+    @property
+    def problems(self):
+        if self.error:
+            return [self.error]
+        problems = []
+        if self.status is None or self.status >= 400 or (self.route.marker and self.status != 200):
+            problems.append(f"HTTP {self.status}")
+        if self.route.marker and self.status == 200 and not self.marker_found:
+            problems.append(f"missing {self.route.marker}")
+        if self.seconds is not None and self.seconds > TestData.PREFLIGHT_MAX_SECONDS:
+            problems.append(f"slow ({self.seconds:.2f}s > {TestData.PREFLIGHT_MAX_SECONDS}s)")
+        return problems
+
+    @property
+    def ok(self):
+        return not self.problems
+
+
+# ============================================================================
+# ROUTE DISCOVERY
+# ============================================================================
+
+def discover_routes(app_root=None, sitemap_xml=None):
+    """
+    All routes to check (static pages, sitemap entries, dynamic slugs).
+
+    Args:
+        app_root: Next.js project root (default: parent of the selenium dir)
+        sitemap_xml: Body of /sitemap.xml, if already fetched
+
+    Returns:
+        List of Route, de-duplicated by path
+    """
+    app_root = app_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    routes = {}
+
+    def add(path, marker, source):
+        if path not in routes:
+            routes[path] = Route(path, marker, source)
+
+    for path in TestData.PAGES.values():
+        add(path, TestData.ROUTE_MARKERS.get(path), "pages")
+
+    for path in _sitemap_paths(sitemap_xml or ""):
+        add(path, TestData.ROUTE_MARKERS.get(path), "sitemap")
+
+    blog_dir = os.path.join(app_root, "src", "content", "blog")
+    if os.path.isdir(blog_dir):
+        for filename in sorted(os.listdir(blog_dir)):
+            if filename.endswith(".mdx"):
+                add(f"/blog/{filename[:-len('.mdx')]}", "<h1", "blog")
+
+    for project in _load_json(app_root, "src/content/projects.json") or []:
+        slug = generate_slug(project.get("name") or project.get("title") or "")
+        if slug:
+            add(f"/projects/{slug}", "<h1", "projects")
+
+    for entry in (_load_json(app_root, "src/data/research.json") or {}).get("researchEntries", []):
+        if entry.get("slug"):
+            add(f"/research/{entry['slug']}", "<h1", "research")
+
+    for study in (_load_json(app_root, "src/data/case-studies.json") or {}).get("caseStudies", []):
+        if study.get("slug"):
+            add(f"/case-studies/{study['slug']}", 'data-testid="case-study-detail-page"', "case-studies")
+
+    return list(routes.values())
+
+
+def generate_slug(name):
+    """Python port of generateSlug() in src/lib/projects.ts."""
+    slug = re.sub(r"[^\w\s-]", "", name.lower(), flags=re.ASCII)
+    slug = re.sub(r"\s+", "-", slug)
+    return re.sub(r"-+", "-", slug).strip()
+
+
+def _sitemap_paths(xml):
+    paths = []
+    for loc in re.findall(r"<loc>\s*([^<]+?)\s*</loc>", xml):
+        path = urlsplit(loc).path or "/"
+        paths.append(path)
+    return paths
+
+
+def _load_json(app_root, relative_path):
+    try:
+        with open(os.path.join(app_root, relative_path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ============================================================================
+# HTTP CLIENT
+# ============================================================================
+
+class HttpPool:
+    """Minimal keep-alive HTTP/1.1 client with a bounded connection pool."""
+
+    def __init__(self, base_url, size=6, timeout=30, user_agent="e2e-preflight"):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = parts.scheme == "https"
+        self.netloc = parts.netloc
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._slots = asyncio.Semaphore(size)
+        self._idle = []
+
+    async def get(self, path):
+        """
+        GET a path.
+
+        Returns:
+            (status, headers dict, body bytes, seconds)
+        """
+        return await self.request("GET", path)
+
+    async def request(self, method, path, body=None, headers=None):
+        """
+        Send a request (body bytes are sent with a Content-Length).
+
+        Returns:
+            (status, headers dict, body bytes, seconds); seconds start once a
+            connection slot is free (queueing in the pool is not counted) and
+            include connecting and the retry on a dropped keep-alive connection
+        """
+        async with self._slots:
+            started = time.perf_counter()  # after the slot wait: per-route response time, not queue time
+            for attempt in (1, 2):
+                reused = bool(self._idle)
+                connection = self._idle.pop() if reused else await self._connect()
+                try:
+                    status, headers, body, keep = await asyncio.wait_for(
+                        self._request(connection, method, path, body, headers), self.timeout
+                    )
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # A reused connection may have been closed by the server: retry once
+                    _close(connection)
+                    if not reused or attempt == 2:
+                        raise
+                except BaseException:
+                    _close(connection)
+                    raise
+            seconds = time.perf_counter() - started
+            if keep:
+                self._idle.append(connection)
+            else:
+                _close(connection)
+            return status, headers, body, seconds
+
+    async def close(self):
+        while self._idle:
+            _close(self._idle.pop())
+
+    async def _connect(self):
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+
+    async def _request(self, connection, method, path, body=None, headers=None):
+        reader, writer = connection
+        extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        if body is not None:
+            extra += f"Content-Length: {len(body)}\r\n"
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.netloc}\r\nAccept: text/html,*/*\r\n"
+            f"Accept-Encoding: identity\r\nUser-Agent: {self.user_agent}\r\nConnection: keep-alive\r\n"
+            f"{extra}\r\n".encode("latin-1") + (body or b"")
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass  # trailers
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep = False
+        return status, headers, body, keep
+
+
+def _close(connection):
+    connection[1].close()
+
+
+# ============================================================================
+# CRAWL
+# ============================================================================
+
+async def crawl_async(base_url, routes=None, concurrency=6, timeout=30):
+    """Check routes concurrently (discovers them, sitemap included, if not given)."""
+    pool = HttpPool(base_url, size=concurrency, timeout=timeout)
+    try:
+        if routes is None:
+            try:
+                status, _, body, _ = await pool.get("/sitemap.xml")
+                sitemap = body.decode("utf-8", "replace") if status == 200 else ""
+            except (OSError, asyncio.TimeoutError, ValueError):
+                sitemap = ""
+            routes = discover_routes(sitemap_xml=sitemap)
+        return await asyncio.gather(*(_check(pool, route) for route in routes))
+    finally:
+        await pool.close()
+
+
+def crawl(base_url=None, routes=None, concurrency=None, timeout=30):
+    """
+    Synchronous entry point (pytest --preflight, CLI).
+
+    Returns:
+        List of RouteResult in route order
+    """
+    return asyncio.run(crawl_async(
+        base_url or TestData.BASE_URL, routes,
+        concurrency=concurrency or TestData.PREFLIGHT_CONCURRENCY, timeout=timeout,
+    ))
+
+
+async def _check(pool, route):
+    result = RouteResult(route)
+    try:
+        result.status, _, body, result.seconds = await pool.get(route.path)
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+        result.error = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+        return result
+    if route.marker:
+        result.marker_found = route.marker.encode("utf-8") in body
+    return result
+
+
+def format_results(results, show_all=False):
+    """Report lines, failures first."""
+    lines = []
+    for result in sorted(results, key=lambda r: (r.ok, -(r.seconds or 0))):
+        if result.ok and not show_all:
+            continue
+        flag = "ok" if result.ok else "FAIL"
+        seconds = f"{result.seconds:6.2f}s" if result.seconds is not None else "     - "
+        detail = "" if result.ok else "  " + ", ".join(result.problems)
+        lines.append(f"  {flag:4s} {result.status or '---'} {seconds}  {result.route.path}{detail}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="route_crawler", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=TestData.BASE_URL)
+    parser.add_argument("--concurrency", type=int, default=TestData.PREFLIGHT_CONCURRENCY)
+    parser.add_argument("--max-seconds", type=float, default=TestData.PREFLIGHT_MAX_SECONDS,
+                        help="Slowest acceptable response per route")
+    parser.add_argument("--all", action="store_true", help="Print every route, not only failures")
+    args = parser.parse_args(argv)
+    TestData.PREFLIGHT_MAX_SECONDS = args.max_seconds
+
+    started = time.perf_counter()
+    results = crawl(args.base_url, concurrency=args.concurrency)
+    failed = [r for r in results if not r.ok]
+    print(f"Checked {len(results)} route(s) in {time.perf_counter() - started:.2f}s: "
+          f"{len(failed)} failed")
+    for line in format_results(results, show_all=args.all):
+        print(line)
+    return 1 if failed else 0
+
+
+__all__ = ['Route', 'RouteResult', 'HttpPool', 'discover_routes', 'generate_slug',
+           'crawl', 'crawl_async', 'format_results', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+"""
+Multi-User Scenarios
+
+Several browser sessions from the pool driving scripted flows at the same
+time against the live backend:
+- Actors: contact submitters, an admin reading /admin/messages, an admin
+  exporting content from /admin/analytics, and account signups
+- All actors start together (barrier) on their own thread and session
+- End-to-end latency until each actor sees its update: submit -> success
+  status, submit -> message listed for the admin, signup -> login works,
+  export click -> "exported" message
+- Contention report per store: writes acknowledged by the API but missing
+  afterwards (lost read-modify-write updates of .data/contacts.json and of
+  the users file behind src/lib/user-storage.ts), error statuses, and the
+  export slowdown while writes run (content read through
+  src/lib/content-storage.ts) against a solo export before the barrier
+
+Flows mutate server state: run them with --live-api against a dev server.
+
+Usage:
+    result = ScenarioRunner(chrome_pool).run([
+        Actor("admin", read_messages),
+        Actor("exporter", export_analytics),
+        *[Actor(f"visitor-{i}", submit_contact) for i in range(3)],
+    ])
+    for line in format_result(result):
+        print(line)
+"""
+
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from page_objects.admin_analytics_page import AdminAnalyticsPage
+from page_objects.admin_messages_page import AdminMessagesPage
+from page_objects.contact_page import ContactPage
+
+from .load_test import LatencyHistogram
+from .test_data import TestData
+from .waits import script_timeout
+
+
+# In-page fetch for flows without UI (returns {status, body} or {error})
+FETCH_SCRIPT = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {method: arguments[1], headers: {'Content-Type': 'application/json'},
+                     body: arguments[2]})
+    .then(function (r) { return r.text().then(function (t) { done({status: r.status, body: t}); }); })
+    .catch(function (e) { done({error: String(e)}); });
+"""
+
+
+@dataclass
+class Actor:
+    """A named flow: flow(driver, context, actor, barrier) runs on its own session."""
+    name: str
+    flow: object
+    writes: bool = None  # default: the built-in writer flows
+
+    @property
+    def is_writer(self):
+        return self.writes if self.writes is not None else self.flow in WRITER_FLOWS
+
+
+@dataclass
+class StoreStats:
+    """Writes to one server-side store during a scenario."""
+    attempted: int = 0
+    acknowledged: int = 0
+    verified: int = 0
+    lost: list = field(default_factory=list)
+    statuses: dict = field(default_factory=dict)
+
+    def status(self, code):
+        self.statuses[code] = self.statuses.get(code, 0) + 1
+
+
+class ScenarioContext:
+    """State shared by the actors of one run (thread-safe)."""
+
+    def __init__(self, writers, timeout, base_url):
+        self.base_url = base_url
+        self.run_id = uuid.uuid4().hex[:8]
+        self.deadline = time.monotonic() + timeout
+        self.latency = {}        # measure name -> LatencyHistogram
+        self.stores = {}         # store name -> StoreStats
+        self.submitted = {}      # contact marker -> acknowledged at (monotonic)
+        self.seen = {}           # contact marker -> first seen by the admin
+        self.baselines = {}      # measure name -> solo seconds
+        self.errors = []         # (actor, message)
+        self.writes_done = threading.Event()
+        self.lock = threading.Lock()  # guards stores, submitted and seen
+        self._writers = writers
+        self._finished = set()   # writer actors done writing
+        if not writers:
+            self.writes_done.set()
+
+    def record(self, measure, seconds):
+        with self.lock:
+            self.latency.setdefault(measure, LatencyHistogram()).record(seconds)
+
+    def store(self, name):
+        with self.lock:
+            return self.stores.setdefault(name, StoreStats())
+
+    def writer_finished(self, actor):
+        """
+        Mark an actor's writes as done (idempotent). Writer flows call it
+        right after their write so they can wait on writes_done themselves;
+        the runner calls it again when the flow ends, whatever happened.
+        """
+        with self.lock:
+            if actor.name in self._finished:
+                return
+            self._finished.add(actor.name)
+            self._writers -= 1
+            if self._writers <= 0:
+                self.writes_done.set()
+
+    @property
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+
+@dataclass
+class ScenarioResult:
+    actors: list
+    seconds: float
+    latency: dict
+    stores: dict
+    baselines: dict
+    errors: list
+
+    @property
+    def lost_writes(self):
+        return sum(len(stats.lost) for stats in self.stores.values())
+
+
+class ScenarioRunner:
+    """Runs actors concurrently, each on a session leased from a DriverPool."""
+
+    def __init__(self, pool, base_url=None, timeout=None):
+        """
+        Args:
+            pool: DriverPool (sessions beyond its size are created and discarded)
+            base_url: Application URL (default: TestData.BASE_URL)
+            timeout: Seconds the whole scenario may take (default: SCENARIO_TIMEOUT)
+        """
+        self.pool = pool
+        self.base_url = base_url or TestData.BASE_URL
+        self.timeout = timeout or TestData.SCENARIO_TIMEOUT
+
+    def run(self, actors):
+        """
+        Run every actor's flow at the same time.
+
+        Returns:
+            ScenarioResult
+        """
+        context = ScenarioContext(sum(actor.is_writer for actor in actors), self.timeout, self.base_url)
+        barrier = threading.Barrier(len(actors))
+
+        def play(actor):
+            with self.pool.lease() as driver:
+                try:
+                    actor.flow(driver, context, actor, barrier)
+                except threading.BrokenBarrierError:
+                    context.errors.append((actor.name, "another actor failed before the start"))
+                except Exception as exc:
+                    context.errors.append((actor.name, f"{type(exc).__name__}: {exc}"))
+                    barrier.abort()
+                finally:
+                    if actor.is_writer:
+                        context.writer_finished(actor)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(actors), thread_name_prefix="scenario") as executor:
+            list(executor.map(play, actors))
+        return ScenarioResult(
+            actors=[actor.name for actor in actors], seconds=time.perf_counter() - started,
+            latency=context.latency, stores=context.stores, baselines=context.baselines,
+            errors=context.errors,
+        )
+
+
+# ============================================================================
+# FLOWS
+# ============================================================================
+
+def submit_contact(driver, context, actor, barrier):
+    """Visitor: submit the contact form; latency until the success status shows."""
+    page = ContactPage(driver, base_url=context.base_url)
+    page.load_page()
+    marker = f"scenario-{context.run_id}-{actor.name}"
+    user, domain = TestData.CONTACT_FORM_VALID["email"].split("@")
+    page.fill_form(TestData.CONTACT_FORM_VALID["name"], f"{user}+{marker}@{domain}",
+                   marker, TestData.CONTACT_FORM_VALID["message"])
+    barrier.wait(context.remaining)
+
+    stats = context.store("contacts")
+    started = time.monotonic()
+    response = page.submit_form_and_wait_for_response(timeout=context.remaining)
+    acknowledged = 200 <= response["status"] < 300
+    with context.lock:
+        stats.attempted += 1
+        stats.status(response["status"])
+        if acknowledged:
+            stats.acknowledged += 1
+            context.submitted[marker] = time.monotonic()
+    context.writer_finished(actor)
+    if not acknowledged:
+        return
+    page.wait_for_status("successfully", timeout=context.remaining)
+    context.record("contact: submit -> success shown", time.monotonic() - started)
+
+
+def read_messages(driver, context, actor, barrier):
+    """Admin: reload /admin/messages until every acknowledged submission is listed."""
+    page = AdminMessagesPage(driver, base_url=context.base_url)
+    page.load()
+    barrier.wait(context.remaining)
+
+    final = False
+    while True:
+        final = context.writes_done.is_set()
+        page.load()
+        try:
+            listed = page.find_element(page.LIST, timeout=2).text
+        except Exception:
+            listed = ""
+        now = time.monotonic()
+        with context.lock:
+            fresh = [(marker, acknowledged) for marker, acknowledged in context.submitted.items()
+                     if marker not in context.seen and marker in listed]
+            for marker, _ in fresh:
+                context.seen[marker] = now
+        for marker, acknowledged in fresh:
+            context.record("contact: acknowledged -> listed for admin", now - acknowledged)
+        if final or not context.remaining:
+            break
+        time.sleep(TestData.SCENARIO_POLL)
+
+    stats = context.store("contacts")
+    with context.lock:
+        stats.verified = len(context.seen)
+        stats.lost = sorted(set(context.submitted) - set(context.seen))
+
+
+def export_analytics(driver, context, actor, barrier):
+    """Admin: export content; the first export runs solo (baseline), the rest under load."""
+    page = AdminAnalyticsPage(driver, base_url=context.base_url)
+    page.load()
+    page.authenticate(TestData.ADMIN_TOKEN)
+    page.open_export_tab()
+    context.baselines["export"] = _export(page, context)
+    barrier.wait(context.remaining)
+
+    for _ in range(TestData.SCENARIO_EXPORTS):
+        seconds = _export(page, context)
+        if seconds is not None:
+            context.record("export: click -> exported message", seconds)
+        if not context.remaining:
+            break
+
+
+def sign_up(driver, context, actor, barrier):
+    """Visitor: create an account, then log in once every writer is done."""
+    driver.get(context.base_url)
+    email = f"scenario-{context.run_id}-{actor.name}@example.com"
+    password = f"Scenario-{context.run_id}-Pass1!"
+    barrier.wait(context.remaining)
+
+    stats = context.store("users")
+    started = time.monotonic()
+    result = _fetch(driver, "/api/auth?action=signup", "POST",
+                    {"email": email, "name": f"Scenario {actor.name}", "password": password})
+    acknowledged = 200 <= result.get("status", 0) < 300
+    with context.lock:
+        stats.attempted += 1
+        stats.status(result.get("status", "error"))
+        stats.acknowledged += acknowledged
+    context.writer_finished(actor)  # before waiting on writes_done, which includes this actor
+    if not acknowledged:
+        return
+    if _login(driver, email, password):
+        context.record("signup: submit -> can log in", time.monotonic() - started)
+
+    # Concurrent signups read-modify-write one users file: check again at the end
+    context.writes_done.wait(context.remaining)
+    verified = _login(driver, email, password)
+    with context.lock:
+        if verified:
+            stats.verified += 1
+        else:
+            stats.lost.append(email)
+
+
+WRITER_FLOWS = (submit_contact, sign_up)
+
+
+def _export(page, context):
+    """Seconds from the export click to the success message (None on failure)."""
+    page.network.mark()
+    started = time.monotonic()
+    page.trigger_export()
+    try:
+        response = page.wait_for_response("/api/import-export", timeout=context.remaining or 1)
+    except Exception:
+        response = {"status": "timeout"}
+    stats = context.store("content export")
+    with context.lock:
+        stats.status(response["status"])
+    if response["status"] != 200 or not page.has_message():
+        return None
+    return time.monotonic() - started
+
+
+def _login(driver, email, password):
+    return _fetch(driver, "/api/auth?action=login", "POST", {"email": email, "password": password}).get("status") == 200
+
+
+def _fetch(driver, path, method, payload):
+    with script_timeout(driver, 30):
+        return driver.execute_async_script(FETCH_SCRIPT, path, method, json.dumps(payload)) or {}
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def format_result(result):
+    """Report lines: latencies, stores, errors."""
+    lines = [f"{len(result.actors)} actor(s) in {result.seconds:.1f}s: {', '.join(result.actors)}"]
+    for measure, histogram in sorted(result.latency.items()):
+        latency = histogram.to_dict()
+        lines.append(f"  {measure:<44} n={latency['count']:<3} p50 {latency['p50']:>8.1f}ms  "
+                     f"p95 {latency['p95']:>8.1f}ms  max {latency['max']:>8.1f}ms")
+    export = result.latency.get("export: click -> exported message")
+    if export and result.baselines.get("export"):
+        slowdown = export.percentile(50) / result.baselines["export"]
+        lines.append(f"  export p50 under concurrent writes: {slowdown:.2f}x the solo export "
+                     f"({result.baselines['export'] * 1000:.0f}ms)")
+    for name, stats in sorted(result.stores.items()):
+        statuses = ", ".join(f"{code}×{n}" for code, n in sorted(stats.statuses.items(), key=str))
+        line = f"  store {name:<15} statuses {statuses or '-'}"
+        if stats.attempted:
+            line += (f"; {stats.acknowledged}/{stats.attempted} acknowledged, "
+                     f"{stats.verified} verified, {len(stats.lost)} lost")
+        lines.append(line)
+        for lost in stats.lost:
+            lines.append(f"    LOST  {lost}")
+    for actor, message in result.errors:
+        lines.append(f"  ERROR {actor}: {message}")
+    return lines
+
+
+__all__ = ['Actor', 'ScenarioRunner', 'ScenarioResult', 'ScenarioContext', 'StoreStats',
+           'submit_contact', 'read_messages', 'export_analytics', 'sign_up', 'format_result']
@@ -0,0 +1,164 @@
+"""
+Duration-Aware xdist Scheduling
+
+Longest-processing-time-first (LPT) distribution for `pytest -n N`:
+- Per-test durations (setup + call + teardown) are recorded by the
+  controller process into a local history file after every run
+- The next run hands out the slowest known tests first, so one slow
+  test started last cannot keep a single worker busy after the rest finish
+- Tests without history are treated as "average" and keep collection order
+
+The history file is shared by concurrent runs on the same machine and is
+updated under a file lock.
+"""
+
+import json
+import os
+import statistics
+from collections import defaultdict
+
+from xdist.scheduler import LoadScheduling
+
+from .file_lock import FileLock
+
+
+class DurationHistory:
+    """Smoothed per-test durations persisted as JSON."""
+
+    def __init__(self, path, smoothing=0.5):
+        """
+        Initialize history.
+
+        Args:
+            path: JSON file holding {"durations": {nodeid: seconds}}
+            smoothing: Weight of the newest run when merging (1.0 = replace)
+        """
+        self.path = str(path)
+        self.smoothing = smoothing
+        self.lock = FileLock(self.path + ".lock")
+        self.durations = self._read()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def estimate(self, nodeid, default=None):
+        """Expected duration of a test (default if it has never run)."""
+        return self.durations.get(nodeid, default)
+
+    def order(self, nodeids):
+        """
+        Indices of nodeids, longest expected duration first.
+
+        Unknown tests get the median known duration; ties keep collection order.
+        """
+        known = [self.durations[n] for n in nodeids if n in self.durations]
+        default = statistics.median(known) if known else 0.0
+        return sorted(
+            range(len(nodeids)),
+            key=lambda i: -self.estimate(nodeids[i], default),
+        )
+
+    def merge(self, run_durations):
+        """
+        Fold one run's durations into the history on disk.
+
+        Args:
+            run_durations: Dict of {nodeid: seconds}
+        """
+        if not run_durations:
+            return
+        with self.lock:
+            durations = self._read()
+            for nodeid, seconds in run_durations.items():
+                previous = durations.get(nodeid)
+                if previous is None:
+                    durations[nodeid] = round(seconds, 4)
+                else:
+                    durations[nodeid] = round(
+                        self.smoothing * seconds + (1 - self.smoothing) * previous, 4
+                    )
+            self._write(durations)
+            self.durations = durations
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("durations", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _write(self, durations):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"durations": durations}, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+class DurationRecorder:
+    """Plugin that sums per-test phase durations and saves them at session end."""
+
+    def __init__(self, history):
+        self.history = history
+        self.durations = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        # Under xdist the controller receives every worker's reports here
+        self.durations[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        self.history.merge(dict(self.durations))
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """
+    xdist "load" scheduling with the pending queue sorted longest-first.
+
+    Each worker is kept at most two tests ahead, so the order of the queue
+    (not xdist's initial chunking) decides which worker runs what.
+    """
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log=log)
+        self.history = history
+        if self.maxschedchunk is None:
+            self.maxschedchunk = 1
+
+    def schedule(self):
+        """Initial distribution: deal the slowest tests out one per worker."""
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, reschedule on all nodes
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        self.pending[:] = self.history.order(self.collection)
+        if not self.collection:
+            return
+
+        # Two rounds so every worker has its next test queued while it runs the first
+        for _ in range(2):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+
+__all__ = ['DurationHistory', 'DurationRecorder', 'LongestFirstScheduling']
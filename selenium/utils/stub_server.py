@@ -0,0 +1,319 @@
+"""
+Hermetic API Stub
+
+Serves recorded responses for the app's /api/* routes so E2E tests don't
+depend on live backend state:
+- Fixtures: one JSON file per route in TestData.API_FIXTURES_DIR
+  (fixtures/api/search.json answers /api/search, ...)
+- Latency injection: global delay, or per-route slow-backend scenarios
+- Error injection: HTTP error statuses or dropped connections, optionally
+  only for the next N matching requests
+- Request log for assertions on what the page sent
+
+In tests the stub is answered in-process through CDP Fetch interception
+(utils.cdp_interceptor); it can also run as a plain HTTP server:
+
+    python -m utils.stub_server --port 9003 --latency 0.2
+
+Usage:
+    api_stub.fault("/api/search", status=500)             # next searches fail
+    api_stub.fault("/api/contact", latency=2.0, times=1)  # one slow response
+    api_stub.requests_for("/api/search")                  # what the page sent
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from .test_data import TestData
+
+
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8", "Cache-Control": "no-store"}
+
+
+@dataclass
+class StubResponse:
+    """A canned response (abort=True means the connection is dropped)."""
+    status: int = 200
+    body: object = None
+    headers: dict = field(default_factory=lambda: dict(JSON_HEADERS))
+    latency: float = 0.0
+    abort: bool = False
+
+    @property
+    def body_bytes(self):
+        if self.body is None:
+            return b""
+        if isinstance(self.body, (bytes, bytearray)):
+            return bytes(self.body)
+        if isinstance(self.body, str):
+            return self.body.encode("utf-8")
+        return json.dumps(self.body).encode("utf-8")
+
+
+class ApiStub:
+    """Fixture-backed responder for /api/* requests (thread-safe)."""
+
+    def __init__(self, fixtures_dir=None, latency=0.0):
+        """
+        Load fixtures.
+
+        Args:
+            fixtures_dir: Directory of <route>.json files (default: API_FIXTURES_DIR)
+            latency: Delay in seconds added to every response
+
+        Raises:
+            FileNotFoundError: fixtures_dir does not exist
+            ValueError: fixtures_dir holds no *.json fixtures
+        """
+        self.fixtures_dir = fixtures_dir or TestData.API_FIXTURES_DIR
+        self.default_latency = latency
+        self.latency = latency
+        self.routes = _load_fixtures(self.fixtures_dir)
+        self.requests = []
+        self._faults = []
+        self._lock = threading.Lock()
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def respond(self, method, url, body=None):
+        """
+        Build the response for one request.
+
+        Args:
+            method: HTTP method
+            url: Full or path-only request URL
+            body: Request body (str) if any
+
+        Returns:
+            StubResponse
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        method = method.upper()
+        with self._lock:
+            self.requests.append({
+                "method": method, "path": path, "query": query,
+                "body": _decode_body(body), "time": time.time(),
+            })
+            fault = self._take_fault(method, path)
+            latency = self.latency
+
+        response = self._fixture_response(method, path, query)
+        if fault is not None:
+            if fault["latency"] is not None:
+                latency = fault["latency"]
+            if fault["abort"]:
+                response = StubResponse(abort=True)
+            elif fault["status"] is not None:
+                body = fault["body"] if fault["body"] is not None else {
+                    "success": False, "error": "Injected fault", "message": f"HTTP {fault['status']}",
+                }
+                response = StubResponse(status=fault["status"], body=body)
+        response.latency = latency
+        return response
+
+    def intercept(self, request):
+        """FetchInterceptor handler: answer a paused request from the fixtures."""
+        return self.respond(request["method"], request["url"], request["post_data"])
+
+    def fault(self, path, status=None, latency=None, abort=False, body=None, method=None, times=None):
+        """
+        Inject an error or delay for matching requests (latest fault wins).
+
+        Args:
+            path: Route path or glob ("/api/search", "/api/*")
+            status: HTTP status to return instead of the fixture
+            latency: Delay in seconds for these responses (overrides set_latency)
+            abort: Drop the connection (the page sees a network error)
+            body: Response body for the injected status
+            method: Only this HTTP method
+            times: Only the next N matching requests (None = until cleared)
+
+        Returns:
+            self (chainable)
+        """
+        with self._lock:
+            self._faults.insert(0, {
+                "path": path.rstrip("/") or "/", "method": method.upper() if method else None,
+                "status": status, "latency": latency, "abort": abort, "body": body,
+                "remaining": times,
+            })
+        return self
+
+    def set_latency(self, seconds):
+        """Delay every response by `seconds` (slow-backend scenarios)."""
+        self.latency = seconds
+        return self
+
+    def requests_for(self, path, method=None):
+        """Logged requests for a route path (or glob)."""
+        with self._lock:
+            return [
+                r for r in self.requests
+                if fnmatch.fnmatchcase(r["path"], path) and (method is None or r["method"] == method.upper())
+            ]
+
+    def reset(self):
+        """Clear faults, latency and the request log (start of a test)."""
+        with self._lock:
+            self._faults = []
+            self.requests = []
+            self.latency = self.default_latency
+
+    # ============================================================================
+    # HELPER METHODS (Private)
+    # ============================================================================
+
+    def _take_fault(self, method, path):
+        for fault in self._faults:
+            if fault["method"] not in (None, method) or not fnmatch.fnmatchcase(path, fault["path"]):
+                continue
+            if fault["remaining"] is not None:
+                fault["remaining"] -= 1
+                if fault["remaining"] <= 0:
+                    self._faults.remove(fault)
+            return fault
+        return None
+
+    def _fixture_response(self, method, path, query):
+        for entry in self.routes.get(_route_name(path), []):
+            if entry.get("method", "GET").upper() != method:
+                continue
+            if not fnmatch.fnmatchcase(path, entry.get("path", f"/api/{_route_name(path)}")):
+                continue
+            if not all(k in query and fnmatch.fnmatchcase(query[k], v)
+                       for k, v in entry.get("query", {}).items()):
+                continue
+            headers = dict(JSON_HEADERS, **entry.get("headers", {}))
+            return StubResponse(status=entry.get("status", 200), body=entry.get("body"), headers=headers)
+        return StubResponse(status=404, body={
+            "success": False, "error": "Not stubbed", "message": f"No fixture for {method} {path}",
+        })
+
+
+class StubServer:
+    """Serve an ApiStub over HTTP (manual runs against the stubbed routes)."""
+
+    def __init__(self, stub=None, host="127.0.0.1", port=0):
+        self.stub = stub or ApiStub()
+        self.httpd = ThreadingHTTPServer((host, port), _handler_for(self.stub))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="api-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _handler_for(stub):
+    class Handler(BaseHTTPRequestHandler):
+        def _serve(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8", "replace") if length else None
+            response = stub.respond(self.command, self.path, body)
+            if response.latency:
+                time.sleep(response.latency)
+            if response.abort:
+                self.close_connection = True
+                return
+            payload = response.body_bytes
+            self.send_response(response.status)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _route_name(path):
+    """/api/search -> "search", /api/analytics/track -> "analytics"."""
+    parts = [p for p in path.split("/") if p]
+    if len(parts) >= 2 and parts[0] == "api":
+        return parts[1]
+    return ""
+
+
+def _decode_body(body):
+    if body is None:
+        return None
+    try:
+        return json.loads(body)
+    except (TypeError, ValueError):
+        return body
+
+
+def _load_fixtures(directory):
+    # A silently empty stub turns every /api/* call into a 404, so fail loudly
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"API fixture directory not found: {os.path.abspath(directory)} "
+                                f"(set API_FIXTURES_DIR, or API_STUB=False to hit the live backend)")
+    routes = {}
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".json"):
+            with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                routes[filename[:-len(".json")]] = json.load(f)["responses"]
+    if not routes:
+        raise ValueError(f"No <route>.json fixtures in {os.path.abspath(directory)}")
+    return routes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="stub_server", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9003)
+    parser.add_argument("--fixtures", default=TestData.API_FIXTURES_DIR, help="Fixture directory")
+    parser.add_argument("--latency", type=float, default=TestData.API_STUB_LATENCY,
+                        help="Delay in seconds added to every response")
+    args = parser.parse_args(argv)
+
+    server = StubServer(ApiStub(args.fixtures, latency=args.latency), host=args.host, port=args.port)
+    print(f"🔧 API stub serving {len(server.stub.routes)} route(s) on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+__all__ = ['ApiStub', 'StubServer', 'StubResponse']
+
+
+if __name__ == "__main__":
+    main()
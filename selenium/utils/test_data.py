@@ -8,6 +8,9 @@ Single source of truth for test inputs.
 import os
 from typing import Dict, List, Any
 
+# selenium/ (anchors caches that must not depend on the working directory)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 class TestData:
     """Test data constants and fixtures."""
@@ -24,10 +27,84 @@ class TestData:
     
     HEADLESS = os.getenv("HEADLESS", "False").lower() == "true"
     BROWSER = os.getenv("BROWSER", "chrome")
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "10"))
-    EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", "15"))
+    EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", "15"))  # No implicit wait: BasePage waits explicitly
+    SLOW_LOOKUP_THRESHOLD = float(os.getenv("SLOW_LOOKUP_THRESHOLD", "0.5"))  # seconds
     BROWSER_WIDTH = int(os.getenv("BROWSER_WIDTH", "1024"))
     BROWSER_HEIGHT = int(os.getenv("BROWSER_HEIGHT", "768"))
+    CHROME_PROFILE = os.getenv("CHROME_PROFILE", "fidelity")  # Launch flags: fast, dom, fidelity, perf-measure
+
+    # ========================================================================
+    # FRAMEWORK BENCHMARKS (python -m benchmarks.*)
+    # ========================================================================
+    
+    BENCHMARK_REPEAT = int(os.getenv("BENCHMARK_REPEAT", "7"))  # Timed runs per framework benchmark
+    BENCHMARK_WARMUP = int(os.getenv("BENCHMARK_WARMUP", "2"))  # Untimed runs first
+    BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "reports/benchmarks")  # <suite>.json results
+    BENCHMARK_SITE_DIR = os.getenv("BENCHMARK_SITE_DIR", "benchmarks/site")  # Frozen page snapshots
+    BENCHMARK_SNAPSHOT_SIZE = int(os.getenv("BENCHMARK_SNAPSHOT_SIZE", "12"))  # Locators per snapshot() benchmark
+
+    # ========================================================================
+    # DRIVER POOL SETTINGS
+    # ========================================================================
+    
+    POOL_SIZE = int(os.getenv("POOL_SIZE", "1"))  # Warm sessions per worker
+    POOL_MAX_USES = int(os.getenv("POOL_MAX_USES", "25"))  # Tests before a session is recycled
+
+    # ========================================================================
+    # STATIC ASSET REPLAY (--asset-replay)
+    # ========================================================================
+    
+    ASSET_REPLAY = os.getenv("ASSET_REPLAY", "False").lower() == "true"  # Replay static assets from disk
+    ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR", ".asset_cache")  # Content-addressed, per build ID
+
+    # ========================================================================
+    # BROWSER CACHE MODE (--cache-mode)
+    # ========================================================================
+    
+    CACHE_MODE = os.getenv("CACHE_MODE", "cold").lower()  # "warm" = sessions clone a pre-warmed profile
+    PROFILE_TEMPLATE_DIR = os.getenv("PROFILE_TEMPLATE_DIR", ".profile_template")
+
+    # ========================================================================
+    # DOM-ONLY TESTS (@pytest.mark.dom_only)
+    # ========================================================================
+    
+    DOM_ONLY = os.getenv("DOM_ONLY", "True").lower() == "true"  # dom_only tests skip the browser
+
+    # ========================================================================
+    # PARALLEL EXECUTION (pytest-xdist)
+    # ========================================================================
+    
+    ARTIFACTS_DIR = os.getenv("ARTIFACTS_DIR", "screenshots")  # Namespaced per worker
+    ARTIFACTS_MAX_MB = int(os.getenv("ARTIFACTS_MAX_MB", "200"))  # Oldest bundles evicted above this (0 = no cap)
+    DURATION_HISTORY = os.getenv("DURATION_HISTORY", ".test_durations.json")
+    RESULTS_DB = os.getenv("RESULTS_DB", "reports/results.sqlite")  # Run history for perf_compare
+    
+    # ========================================================================
+    # API STUB (hermetic /api/* responses)
+    # ========================================================================
+    
+    API_STUB = os.getenv("API_STUB", "True").lower() == "true"  # False = hit the live backend
+    API_FIXTURES_DIR = os.getenv("API_FIXTURES_DIR", os.path.join(PROJECT_DIR, "fixtures", "api"))  # One <route>.json per route
+    API_STUB_LATENCY = float(os.getenv("API_STUB_LATENCY", "0"))  # seconds added to every response
+
+    # ========================================================================
+    # API RATE LIMITS (--rate-governor)
+    # ========================================================================
+    
+    RATE_GOVERNOR = os.getenv("RATE_GOVERNOR", "False").lower() == "true"  # Pace live /api calls to the app's limits
+    RATE_LIMIT_STATE = os.getenv("RATE_LIMIT_STATE", "reports/rate_buckets.json")  # Token buckets shared by workers
+    RATE_LIMIT_HEADROOM = float(os.getenv("RATE_LIMIT_HEADROOM", "0.9"))  # Share of each budget the suite may use
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "60"))  # Longer waits send the request anyway
+
+    # ========================================================================
+    # MULTI-USER SCENARIOS (utils.scenarios)
+    # ========================================================================
+    
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "admin")  # x-admin-token the admin pages send (NEXT_PUBLIC_ADMIN_TOKEN)
+    SCENARIO_TIMEOUT = float(os.getenv("SCENARIO_TIMEOUT", "90"))  # Whole multi-user scenario
+    SCENARIO_POLL = float(os.getenv("SCENARIO_POLL", "0.5"))  # Admin reload interval while waiting for updates
+    SCENARIO_EXPORTS = int(os.getenv("SCENARIO_EXPORTS", "3"))  # Exports per exporter actor under load
+    SCENARIO_VISITORS = int(os.getenv("SCENARIO_VISITORS", "3"))  # Concurrent writer sessions per scenario
 
     # ========================================================================
     # VIEWPORT SIZES
@@ -147,6 +224,62 @@ class TestData:
         "newsletter": "/newsletter",
         "search": "/search",
     }
+    
+    # Server-rendered marker each page's HTML must contain (route preflight)
+    ROUTE_MARKERS = {
+        "/": 'data-testid="hero-section"',
+        "/blog": 'data-testid="blog-container"',
+        "/projects": 'data-testid="projects-container"',
+        "/resume": 'data-testid="resume-container"',
+        "/contact": 'data-testid="contact-container"',
+        "/ai": 'data-testid="ai-page"',
+        "/research": 'data-testid="research-page"',
+        "/open-source": 'data-testid="opensource-container"',
+        "/hardware": 'data-testid="hardware-page"',
+        "/case-studies": 'data-testid="case-studies-page"',
+        "/3d-models": 'data-testid="3d-models-page"',
+        "/newsletter": 'data-testid="newsletter-page"',
+        "/search": 'data-testid="search-page"',
+        "/systems": 'data-testid="systems-page"',
+    }
+
+    # ========================================================================
+    # ROUTE PREFLIGHT (utils.route_crawler)
+    # ========================================================================
+    
+    PREFLIGHT = os.getenv("PREFLIGHT", "False").lower() == "true"  # Crawl all routes before browser tests
+    PREFLIGHT_CONCURRENCY = int(os.getenv("PREFLIGHT_CONCURRENCY", "6"))  # Parallel HTTP connections
+    PREFLIGHT_MAX_SECONDS = float(os.getenv("PREFLIGHT_MAX_SECONDS", "15"))  # Dev server compiles on first hit
+
+    # ========================================================================
+    # TESTID COVERAGE (utils.testid_coverage)
+    # ========================================================================
+    
+    TESTID_GATE = os.getenv("TESTID_GATE", "False").lower() == "true"  # Stop the run on dead testid locators
+    TESTID_CACHE = os.getenv("TESTID_CACHE", os.path.join(PROJECT_DIR, ".cache", "testid_scan.json"))  # mtime-keyed scan cache ("" = off)
+
+    # ========================================================================
+    # TEST IMPACT (utils.impact)
+    # ========================================================================
+    
+    CHANGED_SINCE = os.getenv("CHANGED_SINCE", "")  # git ref: run only tests affected since (test impact)
+    IMPACT_COVERAGE = os.getenv("IMPACT_COVERAGE", "reports/impact_coverage.json")  # {"tests": {test: [src files]}}
+
+    # ========================================================================
+    # JS COVERAGE (utils.js_coverage)
+    # ========================================================================
+    
+    JS_COVERAGE = os.getenv("JS_COVERAGE", "False").lower() == "true"  # CDP precise coverage per test (Chrome)
+    JS_COVERAGE_DIR = os.getenv("JS_COVERAGE_DIR", "reports/js_coverage")  # coverage.json + lcov.info
+
+    # ========================================================================
+    # API LOAD TEST (utils.load_test)
+    # ========================================================================
+    
+    LOAD_USERS = int(os.getenv("LOAD_USERS", "10"))  # Closed-loop virtual users (utils.load_test)
+    LOAD_RATE = float(os.getenv("LOAD_RATE", "20"))  # Open-loop arrivals per second
+    LOAD_SECONDS = float(os.getenv("LOAD_SECONDS", "30"))  # Length of a load run
+    LOAD_CONNECTIONS = int(os.getenv("LOAD_CONNECTIONS", "10"))  # Pooled keep-alive connections
 
     # ========================================================================
     # SELECTORS (Centralized for easy updates)
@@ -156,10 +289,6 @@ class TestData:
     SELECTORS = {
         "explore_button": "[data-testid='explore-work-button']",
         "contact_button": "[data-testid='contact-button']",
-        "submit_button": "[data-testid='submit-button']",
-        "loading_spinner": "[data-testid='loading-spinner']",
-        "success_message": "[data-testid='success-message']",
-        "error_message": "[data-testid='error-message']",
     }
 
     # ========================================================================
@@ -223,6 +352,11 @@ class TestData:
         "first_input_delay": 0.1,
         "cumulative_layout_shift": 0.1,
     }
+    
+    PERF_COLLECT = os.getenv("PERF_COLLECT", "False").lower() == "true"  # Measure every navigate_to()
+    PERF_REPORT_DIR = os.getenv("PERF_REPORT_DIR", "reports/perf")  # One JSON per route
+    PROFILE_COMMANDS = os.getenv("PROFILE_COMMANDS", "False").lower() == "true"  # Time every WebDriver command
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "reports/profile")  # Per-test profiles + hot_paths.json
 
     # ========================================================================
     # RESPONSIVE BREAKPOINTS
@@ -263,9 +397,16 @@ class TestData:
         print(f"Base URL: {cls.BASE_URL}")
         print(f"Browser: {cls.BROWSER}")
         print(f"Headless: {cls.HEADLESS}")
-        print(f"Implicit Wait: {cls.IMPLICIT_WAIT}s")
+        print(f"Chrome Profile: {cls.CHROME_PROFILE}")
+        print(f"Slow Lookup Threshold: {cls.SLOW_LOOKUP_THRESHOLD}s")
         print(f"Explicit Wait: {cls.EXPLICIT_WAIT}s")
         print(f"Viewport: {cls.BROWSER_WIDTH}x{cls.BROWSER_HEIGHT}")
+        print(f"Driver Pool: {cls.POOL_SIZE} session(s), recycle after {cls.POOL_MAX_USES} uses")
+        print(f"Asset Replay: {'on (' + cls.ASSET_CACHE_DIR + ')' if cls.ASSET_REPLAY else 'off'}")
+        print(f"Cache Mode: {cls.CACHE_MODE}")
+        print(f"DOM-Only Tests: {'DomDriver' if cls.DOM_ONLY else 'browser'}")
+        print(f"Artifacts: {cls.ARTIFACTS_DIR}/<worker>/ (cap {cls.ARTIFACTS_MAX_MB} MB)")
+        print(f"API Stub: {'on' if cls.API_STUB else 'off (live backend)'}, latency {cls.API_STUB_LATENCY}s")
         print("="*80 + "\n")
 
 
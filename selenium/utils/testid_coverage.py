@@ -0,0 +1,306 @@
+"""
+Static testid Coverage
+
+Cross-references the data-testids the Next.js source renders with the ones
+the Python side looks up, without a browser:
+- Source side: src/**/*.tsx (utils.testid_source: literals, `${}` templates,
+  testid props)
+- Python side: page_objects/*.py, tests/*.py and utils/test_data.py, read as
+  text: [data-testid=...] selectors (f-string fields become "{}"),
+  DynamicTestId templates, testid("x") / testid_prefix("x") and
+  page_testid="x"
+- Report: dead locators (no TSX file renders them), pattern mismatches
+  (a dynamic Python id whose shape matches no template with the same
+  prefix) and untested testids (rendered, never looked up)
+- Parse results are cached by file mtime (TESTID_CACHE), so a warm run only
+  stats the tree
+
+Usage:
+    python -m utils.testid_coverage              # exit 1 on dead locators / mismatches
+    python -m utils.testid_coverage --untested   # also list untested testids
+    pytest tests/ --testid-gate                  # check before any browser starts
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+
+from .test_data import TestData
+from .testid_source import default_src_dir, locate, pattern_regex, scan_text, source_files
+
+
+SELENIUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bump when the scanners change so stale cache entries are re-parsed
+CACHE_VERSION = 1
+
+# [data-testid='x'] / [data-testid^='x'] inside a Python string
+PY_SELECTOR = re.compile(r"""\[data-testid\s*(\^?=)\s*(["'])(.+?)\2\s*\]""")
+PY_DYNAMIC = re.compile(r"""DynamicTestId\(\s*(["'])(.+?)\1\s*\)""")
+PY_CALL = re.compile(r"""\b(testid|testid_prefix)\(\s*(["'])([^"'{}]+)\2\s*\)""")
+PY_PAGE_TESTID = re.compile(r"""\bpage_testid\s*=\s*(["'])([^"']+)\1""")
+# data-testid="x" outside a selector (TestData.ROUTE_MARKERS)
+PY_MARKER = re.compile(r"""(?<!\[)data-testid=(["'])([^"']+)\1""")
+FIELD = re.compile(r"\{[^{}]*\}")
+
+
+@dataclass
+class CoverageReport:
+    dead: list = field(default_factory=list)        # (kind, value, [python places])
+    mismatches: list = field(default_factory=list)  # (value, [python places], [similar source ids])
+    untested: list = field(default_factory=list)    # (value, [source places])
+    files: int = 0
+    parsed: int = 0                                 # files parsed (not served from the cache)
+    seconds: float = 0.0
+
+    @property
+    def failed(self):
+        return bool(self.dead or self.mismatches)
+
+    def to_dict(self):
+        return {
+            "dead": [{"kind": k, "testid": v, "used_in": w} for k, v, w in self.dead],
+            "mismatches": [{"testid": v, "used_in": w, "source_has": s} for v, w, s in self.mismatches],
+            "untested": [{"testid": v, "rendered_in": w} for v, w in self.untested],
+            "files": self.files, "parsed": self.parsed, "seconds": round(self.seconds, 4),
+        }
+
+
+class ScanCache:
+    """Per-file scan results keyed by (mtime_ns, size), stored as one JSON file."""
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else TestData.TESTID_CACHE
+        self.entries = {}
+        self.parsed = 0
+        self._dirty = False
+        if self.path:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+
+    def scan(self, path, scanner):
+        """scanner(text) for a file, from the cache while the file is unchanged."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return []
+        key = os.path.abspath(path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached = self.entries.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, encoding="utf-8") as f:
+                found = [list(entry) for entry in scanner(f.read())]
+        except (OSError, UnicodeDecodeError):
+            found = []
+        self.entries[key] = [stamp, found]
+        self.parsed += 1
+        self._dirty = True
+        return found
+
+    def save(self, keep=None):
+        """Write the cache (dropping files that no longer exist when keep is given)."""
+        if keep is not None:
+            keep = {os.path.abspath(path) for path in keep}
+            removed = [key for key in self.entries if key not in keep]
+            for key in removed:
+                del self.entries[key]
+            self._dirty = self._dirty or bool(removed)
+        if not self.path or not self._dirty:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "files": self.entries}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only checkout: the next run just parses again
+
+
+# ============================================================================
+# SCANNING
+# ============================================================================
+
+def scan_python(text):
+    """
+    data-testids a Python file looks up.
+
+    Returns:
+        List of (kind, value, line): kind "exact", "prefix" or "pattern"
+    """
+    found = []
+
+    def line_of(position):
+        return text.count("\n", 0, position) + 1
+
+    def add(kind, value, position):
+        if FIELD.search(value):
+            value = FIELD.sub("{}", value)
+            if kind == "exact":
+                kind = "pattern"
+        if value.strip("{}-"):
+            found.append((kind, value, line_of(position)))
+
+    for match in PY_SELECTOR.finditer(text):
+        add("exact" if match.group(1) == "=" else "prefix", match.group(3), match.start())
+    for match in PY_DYNAMIC.finditer(text):
+        add("pattern", match.group(2), match.start())
+    for match in PY_CALL.finditer(text):
+        add("exact" if match.group(1) == "testid" else "prefix", match.group(3), match.start())
+    for match in PY_PAGE_TESTID.finditer(text):
+        add("exact", match.group(2), match.start())
+    for match in PY_MARKER.finditer(text):
+        add("exact", match.group(2), match.start())
+    return found
+
+
+def python_files(selenium_dir=None):
+    """Page objects, tests and TestData."""
+    selenium_dir = selenium_dir or SELENIUM_DIR
+    paths = []
+    for folder in ("page_objects", "tests"):
+        directory = os.path.join(selenium_dir, folder)
+        if os.path.isdir(directory):
+            paths.extend(os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                         if name.endswith(".py"))
+    paths.append(os.path.join(selenium_dir, "utils", "test_data.py"))
+    return paths
+
+
+def collect(paths, scanner, cache, base):
+    """{kind: {value: ["file:line"]}} over paths."""
+    collected = {"exact": {}, "prefix": {}, "pattern": {}}
+    for path in paths:
+        where = os.path.relpath(path, base)
+        for kind, value, line in cache.scan(path, scanner):
+            collected[kind].setdefault(value, []).append(f"{where}:{line}")
+    return collected
+
+
+# ============================================================================
+# CROSS-REFERENCE
+# ============================================================================
+
+def analyze(src_dir=None, selenium_dir=None, cache_path=None):
+    """
+    Cross-reference src/ with the Python locators.
+
+    Args:
+        src_dir: Next.js src directory (default: the selenium dir's sibling)
+        selenium_dir: Selenium project root (default: this checkout)
+        cache_path: Scan cache file ("" disables; default TestData.TESTID_CACHE)
+
+    Returns:
+        CoverageReport
+    """
+    started = time.perf_counter()
+    src_dir = src_dir or default_src_dir()
+    selenium_dir = selenium_dir or SELENIUM_DIR
+    cache = ScanCache(cache_path)
+
+    tsx = source_files(src_dir)
+    py = python_files(selenium_dir)
+    source = collect(tsx, scan_text, cache, os.path.dirname(src_dir))
+    python = collect(py, scan_python, cache, selenium_dir)
+    cache.save(keep=tsx + py)
+
+    report = CoverageReport(files=len(tsx) + len(py), parsed=cache.parsed)
+    for kind in ("exact", "prefix", "pattern"):
+        for value, places in sorted(python[kind].items()):
+            if locate(value, source, kind):
+                continue
+            similar = _similar(value, source) if kind == "pattern" else []
+            if similar:
+                report.mismatches.append((value, places, similar))
+            else:
+                report.dead.append((kind, value, places))
+
+    for kind in ("exact", "pattern"):
+        for value, places in sorted(source[kind].items()):
+            if not _looked_up(value, kind, python):
+                report.untested.append((value, places))
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _similar(template, source):
+    """Source ids sharing a dynamic Python id's static prefix (the likely intended target)."""
+    stem = template.split("{}", 1)[0].rstrip("-")
+    if not stem:
+        return []
+    stem = stem.rsplit("-", 1)[0] if "-" in stem else stem
+    return sorted(value for bucket in source.values() for value in bucket if value.startswith(stem + "-"))
+
+
+def _looked_up(value, kind, python):
+    """Whether any Python locator would find a source id / template."""
+    static = value.split("{}", 1)[0]
+    if kind == "exact":
+        if value in python["exact"]:
+            return True
+        if any(pattern_regex(template).match(value) for template in python["pattern"]):
+            return True
+    else:
+        if value in python["pattern"]:
+            return True
+        regex = pattern_regex(value)
+        if any(regex.match(exact) for exact in python["exact"]):
+            return True
+    return any(static.startswith(prefix) or value.startswith(prefix) for prefix in python["prefix"])
+
+
+def format_report(report, show_untested=False):
+    """Report lines (problems first)."""
+    lines = []
+    for kind, value, places in report.dead:
+        lines.append(f"  DEAD      {value}  ({kind}; {', '.join(places[:3])}{' ...' if len(places) > 3 else ''})")
+    for value, places, similar in report.mismatches:
+        lines.append(f"  MISMATCH  {value}  ({', '.join(places[:3])}) source has: {', '.join(similar[:5])}")
+    if show_untested:
+        for value, places in report.untested:
+            lines.append(f"  UNTESTED  {value}  ({places[0]})")
+    return lines
+
+
+def summary(report):
+    """One-line summary."""
+    return (f"{len(report.dead)} dead locator(s), {len(report.mismatches)} pattern mismatch(es), "
+            f"{len(report.untested)} untested testid(s) across {report.files} file(s) "
+            f"in {report.seconds * 1000:.0f}ms ({report.parsed} parsed)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="testid_coverage", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--src", default=None, help="Next.js src directory")
+    parser.add_argument("--untested", action="store_true", help="List testids no Python locator looks up")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every file")
+    args = parser.parse_args(argv)
+
+    report = analyze(src_dir=args.src, cache_path="" if args.no_cache else None)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(summary(report))
+        for line in format_report(report, show_untested=args.untested):
+            print(line)
+    return 1 if report.failed else 0
+
+
+__all__ = ['CoverageReport', 'ScanCache', 'analyze', 'scan_python', 'python_files',
+           'format_report', 'summary', 'main']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
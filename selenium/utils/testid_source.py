@@ -0,0 +1,138 @@
+"""
+data-testid Source Scanner
+
+Reads the data-testids the Next.js source declares, so the Python locators
+can be checked against them without a browser:
+- data-testid="x" / data-testid='x' literals
+- data-testid={`blog-post-card-${index}`} templates, kept as the pattern
+  "blog-post-card-{}"
+- String literals inside data-testid={...} expressions (ternaries)
+- testid: 'x' properties of config objects rendered with
+  data-testid={item.testid}
+
+Usage:
+    source = scan_sources()                    # {"exact": {...}, "pattern": {...}}
+    locate("blog-post-card-3", source)         # ["src/app/blog/page.tsx:88"]
+"""
+
+import os
+import re
+
+
+# data-testid="x" or data-testid='x'
+LITERAL = re.compile(r"""data-testid=(["'])([^"']+)\1""")
+# data-testid={ ... } up to the matching brace (one nesting level for ${...})
+EXPRESSION = re.compile(r"data-testid=\{((?:[^{}]|\{[^{}]*\})*)\}")
+# testid: 'x' in object literals
+PROPERTY = re.compile(r"""\btestid\s*:\s*(["'])([^"']+)\1""")
+TEMPLATE = re.compile(r"`([^`]*)`")
+STRING = re.compile(r"""(["'])([\w-]+)\1""")
+PLACEHOLDER = re.compile(r"\$\{(?:[^{}]|\{[^{}]*\})*\}")
+
+SOURCE_SUFFIXES = (".tsx", ".jsx")
+
+
+def default_src_dir():
+    """src/ of the Next.js app (the selenium directory's sibling)."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(root, "src")
+
+
+def scan_text(text):
+    """
+    data-testids declared in one file's source.
+
+    Returns:
+        List of (kind, value, line): kind "exact" or "pattern"
+    """
+    found = []
+
+    def line_of(position):
+        return text.count("\n", 0, position) + 1
+
+    for match in LITERAL.finditer(text):
+        found.append(("exact", match.group(2), line_of(match.start())))
+    for match in EXPRESSION.finditer(text):
+        expression, line = match.group(1), line_of(match.start())
+        for template in TEMPLATE.findall(expression):
+            if "${" in template:
+                found.append(("pattern", PLACEHOLDER.sub("{}", template), line))
+            else:
+                found.append(("exact", template, line))
+        for _, value in STRING.findall(TEMPLATE.sub("", expression)):
+            found.append(("exact", value, line))
+    for match in PROPERTY.finditer(text):
+        found.append(("exact", match.group(2), line_of(match.start())))
+    return found
+
+
+def scan_file(path):
+    """scan_text() of a file (empty if unreadable)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return scan_text(f.read())
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def source_files(src_dir=None):
+    """Every .tsx / .jsx file under src_dir, sorted."""
+    src_dir = src_dir or default_src_dir()
+    paths = []
+    for root, dirs, filenames in os.walk(src_dir):
+        dirs[:] = [d for d in dirs if d != "node_modules" and not d.startswith(".")]
+        paths.extend(os.path.join(root, name) for name in filenames if name.endswith(SOURCE_SUFFIXES))
+    return sorted(paths)
+
+
+def scan_sources(src_dir=None):
+    """
+    data-testids declared under src_dir.
+
+    Returns:
+        {"exact": {testid: ["src/...tsx:line"]}, "pattern": {template: [...]}}
+    """
+    src_dir = src_dir or default_src_dir()
+    base = os.path.dirname(src_dir)
+    source = {"exact": {}, "pattern": {}}
+    for path in source_files(src_dir):
+        where = os.path.relpath(path, base)
+        for kind, value, line in scan_file(path):
+            source[kind].setdefault(value, []).append(f"{where}:{line}")
+    return source
+
+
+def pattern_regex(template):
+    """Regex matching the concrete ids of a "{}" template."""
+    return re.compile("^" + "(.+?)".join(re.escape(part) for part in template.split("{}")) + "$")
+
+
+def locate(testid, source, kind="exact"):
+    """
+    Source locations that can render a Python-side testid.
+
+    Args:
+        testid: Concrete id, id prefix or "{}" template
+        source: Result of scan_sources()
+        kind: "exact", "prefix" or "pattern" (as in LocatorRegistry.testids())
+
+    Returns:
+        List of "file:line" (empty if src/ never renders it)
+    """
+    if kind == "pattern":
+        if testid in source["pattern"]:
+            return list(source["pattern"][testid])
+        # A Python pattern is also covered by literals that fit it (nav-link-{} vs nav-link-home)
+        regex = pattern_regex(testid)
+        return [where for value, places in source["exact"].items() if regex.match(value) for where in places]
+    if kind == "prefix":
+        return [where for bucket in source.values()
+                for value, places in bucket.items() if value.startswith(testid) for where in places]
+    if testid in source["exact"]:
+        return list(source["exact"][testid])
+    return [where for template, places in source["pattern"].items()
+            if pattern_regex(template).match(testid) for where in places]
+
+
+__all__ = ['scan_text', 'scan_file', 'scan_sources', 'source_files', 'locate',
+           'pattern_regex', 'default_src_dir']
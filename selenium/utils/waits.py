@@ -7,16 +7,174 @@ Custom wait conditions for Next.js-specific challenges:
 - Animation completion
 - API response waiting
 - Code splitting delays
+- Page "settled" detection (network, animations, DOM, fonts)
+- Network idle / specific API responses (NetworkTracker)
 """
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    JavascriptException, StaleElementReferenceException, TimeoutException, WebDriverException,
+)
+from .network import NetworkTracker
+from contextlib import contextmanager
 import time
 
 
+# WebDriver's default async-script timeout (seconds)
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+# Fetch/XHR counter and DOM mutation clock, installed once per document.
+# Registered with Page.addScriptToEvaluateOnNewDocument it runs before the
+# page's own scripts; otherwise SETTLE_SCRIPT installs it on first check and
+# requests already in flight by then are not counted.
+SETTLE_SHIM = """
+(function() {
+var w = window;
+if (!w.__e2eSettle) {
+    var s = w.__e2eSettle = {pending: 0, lastMutation: performance.now()};
+    if (w.fetch) {
+        var originalFetch = w.fetch;
+        w.fetch = function() {
+            s.pending++;
+            return originalFetch.apply(this, arguments).finally(function() { s.pending--; });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        s.pending++;
+        this.addEventListener('loadend', function() { s.pending--; }, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    // document, not documentElement: on a new document <html> may not exist yet
+    new MutationObserver(function() { s.lastMutation = performance.now(); }).observe(
+        document,
+        {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+}
+})();
+"""
+
+# Polls until the page is quiet or the time budget runs out.
+SETTLE_SCRIPT = SETTLE_SHIM + """
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var w = window;
+function runningAnimations() {
+    if (!document.getAnimations) return 0;
+    return document.getAnimations().filter(function(a) {
+        if (a.playState !== 'running') return false;
+        // Infinite loops (spinners, orbits) never finish; they don't block settling
+        var timing = a.effect && a.effect.getComputedTiming ? a.effect.getComputedTiming() : null;
+        return !timing || timing.endTime !== Infinity;
+    }).length;
+}
+var start = performance.now();
+function check() {
+    var s = w.__e2eSettle, now = performance.now();
+    var state = {
+        ready: document.readyState === 'complete',
+        fonts: !document.fonts || document.fonts.status === 'loaded',
+        pending: s.pending,
+        animations: runningAnimations(),
+        quietFor: now - s.lastMutation
+    };
+    state.settled = state.ready && state.fonts && state.pending === 0 &&
+        state.animations === 0 && state.quietFor >= quietMs;
+    if (state.settled || now - start >= timeoutMs) {
+        state.elapsed = now - start;
+        done(state);
+    } else {
+        setTimeout(check, 16);
+    }
+}
+check();
+"""
+
+
+@contextmanager
+def script_timeout(driver, seconds):
+    """
+    Raise the session's async-script timeout to at least `seconds` for a block.
+
+    The previous value is restored afterwards, so pooled sessions don't
+    carry a raised timeout into later tests.
+    """
+    try:
+        previous = driver.timeouts.script
+    except (AttributeError, WebDriverException):
+        previous = DEFAULT_SCRIPT_TIMEOUT
+    if previous is None or previous >= seconds:
+        yield
+        return
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+
 class NextJSWaits:
     """Custom wait conditions for Next.js applications."""
 
+    @staticmethod
+    def install_settle_shim(driver):
+        """
+        Register the settle shim for every future document (Chrome, once per session),
+        so fetches the page starts before the first settle check are counted.
+
+        Returns:
+            bool: True if the shim runs before page scripts
+        """
+        if getattr(driver, "_e2e_settle_installed", False):
+            return True
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SETTLE_SHIM})
+        except WebDriverException:
+            return False
+        driver._e2e_settle_installed = True
+        return True
+
+    @staticmethod
+    def wait_until_settled(driver, timeout=5, quiet_ms=100):
+        """
+        Wait until the page is quiet, returning as soon as it is.
+        Replaces fixed sleeps: the timeout is an upper bound, not a cost.
+        
+        Quiet means: document complete, fonts loaded, no fetch/XHR in
+        flight, no finite Web Animations running, and no DOM mutations
+        for quiet_ms. Without install_settle_shim() (no CDP) requests
+        started before the first check are invisible, and only the
+        timeout bounds the wait for them.
+        
+        Args:
+            driver: Selenium WebDriver
+            timeout: Maximum time to wait in seconds
+            quiet_ms: Required mutation-free window in milliseconds
+            
+        Returns:
+            bool: True if the page settled, False if the timeout was reached
+        """
+        NextJSWaits.install_settle_shim(driver)  # covers the next document
+        deadline = time.monotonic() + timeout
+        with script_timeout(driver, timeout + 5):
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                try:
+                    state = driver.execute_async_script(
+                        SETTLE_SCRIPT, quiet_ms, int(remaining * 1000)
+                    )
+                    return bool(state and state.get("settled"))
+                except (JavascriptException, StaleElementReferenceException, TimeoutException):
+                    # Document unloaded mid-check (navigation); retry on the new page.
+                    # Session errors (InvalidSessionIdException ...) propagate.
+                    time.sleep(0.05)
+
     @staticmethod
     def wait_for_route_change(driver, expected_path, timeout=10):
         """
@@ -89,30 +247,67 @@ class NextJSWaits:
             duration: Known animation duration (used as hint)
             timeout: Max wait time
         """
-        # Simple approach: wait for known duration
-        time.sleep(duration)
+        # Let the animation finish (duration is the upper bound)
+        NextJSWaits.wait_until_settled(driver, timeout=duration)
         
         # Then verify element is fully opaque
         wait = WebDriverWait(driver, timeout)
         wait.until(lambda d: NextJSWaits._element_fully_visible(d, locator))
 
     @staticmethod
-    def wait_for_api_response(driver, response_indicator_locator, timeout=10):
+    def wait_for_api_response(driver, response_indicator_locator, timeout=10, url_filter="/api/"):
         """
-        Wait for API response to complete (loading spinner disappears).
+        Wait for in-flight API requests to finish, then for the response UI.
         
         Args:
             driver: Selenium WebDriver
             response_indicator_locator: Locator for success/error message
             timeout: Wait timeout
+            url_filter: Requests to wait for (substring, regex or callable)
         """
+        NetworkTracker.for_driver(driver).wait_for_network_idle(
+            idle_ms=100, url_filter=url_filter, timeout=timeout
+        )
         wait = WebDriverWait(driver, timeout)
-        # First wait for spinner to disappear
-        wait.until(EC.invisibility_of_element_located(
-            (By.CLASS_NAME, "loading-spinner")
-        ))
-        # Then wait for response message
-        wait.until(EC.presence_of_element_located(response_indicator_locator))
+        return wait.until(EC.presence_of_element_located(response_indicator_locator))
+
+    @staticmethod
+    def wait_for_network_idle(driver, idle_ms=500, url_filter=None, timeout=10):
+        """
+        Wait until no (matching) request has been in flight for idle_ms.
+        
+        Args:
+            driver: Selenium WebDriver
+            idle_ms: Required quiet window in milliseconds
+            url_filter: Only count these requests (e.g. "/api/search")
+            timeout: Maximum wait in seconds
+            
+        Returns:
+            bool: True if the network went idle, False on timeout
+        """
+        return NetworkTracker.for_driver(driver).wait_for_network_idle(
+            idle_ms=idle_ms, url_filter=url_filter, timeout=timeout
+        )
+
+    @staticmethod
+    def wait_for_response(driver, url_pattern, timeout=10, method=None):
+        """
+        Wait for a request matching url_pattern to complete.
+        Only responses after the tracker's last mark() count; call
+        NetworkTracker.for_driver(driver).mark() before the triggering action.
+        
+        Args:
+            driver: Selenium WebDriver
+            url_pattern: Substring, regex or callable matched against the URL
+            timeout: Maximum wait in seconds
+            method: Optional HTTP method filter
+            
+        Returns:
+            Response dict: {url, method, status, duration}
+        """
+        return NetworkTracker.for_driver(driver).wait_for_response(
+            url_pattern, timeout=timeout, method=method
+        )
 
     @staticmethod
     def wait_for_code_split_component(driver, component_locator, timeout=10):
@@ -144,26 +339,26 @@ class NextJSWaits:
         return wait.until(EC.visibility_of_element_located(error_locator))
 
     @staticmethod
-    def wait_for_form_submission_response(driver, response_message_locator, timeout=10):
+    def wait_for_form_submission_response(driver, response_message_locator, timeout=10,
+                                          url_pattern="/api/"):
         """
         Wait for form submission response.
-        Handles loading state and API response.
+        Waits for the submit request itself, then for the message it produces.
         
         Args:
             driver: Selenium WebDriver
             response_message_locator: Locator for success/error message
             timeout: Wait timeout
+            url_pattern: Request the form submits to (e.g. "/api/contact")
         """
-        wait = WebDriverWait(driver, timeout)
-        # Wait for spinner to disappear
-        try:
-            wait.until(EC.invisibility_of_element_located(
-                (By.CLASS_NAME, "loading-spinner")
-            ))
-        except:
-            pass  # Spinner may not exist, proceed
+        network = NetworkTracker.for_driver(driver)
+        if not network.wait_for_network_idle(idle_ms=100, url_filter=url_pattern, timeout=timeout):
+            raise TimeoutException(
+                f"Form submission still in flight after {timeout}s: {network.in_flight(url_pattern)}"
+            )
         
         # Wait for response message
+        wait = WebDriverWait(driver, timeout)
         return wait.until(EC.visibility_of_element_located(response_message_locator))
 
     @staticmethod
@@ -182,8 +377,8 @@ class NextJSWaits:
         )
         driver.execute_script("arguments[0].scrollIntoView(true);", element)
         
-        # Wait for reveal animation
-        time.sleep(0.5)  # ScrollReveal trigger delay
+        # Wait for reveal animation (ScrollReveal trigger delay is the upper bound)
+        NextJSWaits.wait_until_settled(driver, timeout=0.5)
         return element
 
     @staticmethod
@@ -210,7 +405,7 @@ class NextJSWaits:
             driver: Selenium WebDriver
             timeout: Max wait time
         """
-        time.sleep(0.5)  # Known animation duration
+        NextJSWaits.wait_until_settled(driver, timeout=timeout)
 
     # ========================================================================
     # HELPER METHODS (Private)
@@ -242,8 +437,4 @@ class NextJSWaits:
             return False
 
 
-# Import By for use in other modules
-from selenium.webdriver.common.by import By
-
-
-__all__ = ['NextJSWaits']
+__all__ = ['NextJSWaits', 'script_timeout']
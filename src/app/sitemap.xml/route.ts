@@ -1,6 +1,5 @@
 import { generateSitemapXml, defaultSitemapRoutes, SitemapEntry } from '@/lib/seo';
-import fs from 'fs';
-import path from 'path';
+import { getBlogPosts } from '@/lib/blog';
 
 /**
  * Dynamic sitemap.xml generation
@@ -10,25 +9,17 @@ export async function GET() {
   // Start with default routes
   const routes: SitemapEntry[] = [...defaultSitemapRoutes];
 
-  // Add blog posts dynamically if they exist
-  try {
-    const blogDir = path.join(process.cwd(), 'content', 'blog');
-    if (fs.existsSync(blogDir)) {
-      const files = fs.readdirSync(blogDir);
-      files.forEach((file) => {
-        if (file.endsWith('.mdx')) {
-          const slug = file.replace('.mdx', '');
-          routes.push({
-            url: `/blog/${slug}`,
-            changeFrequency: 'weekly',
-            priority: 0.8,
-          });
-        }
+  // Add blog posts from the same directory /blog/[slug] serves (src/content/blog);
+  // drafts 404 outside development, so leave them out
+  getBlogPosts()
+    .filter((post) => !post.metadata.draft)
+    .forEach((post) => {
+      routes.push({
+        url: `/blog/${post.slug}`,
+        changeFrequency: 'weekly',
+        priority: 0.8,
       });
-    }
-  } catch (error) {
-    console.log('No blog directory found, skipping blog posts in sitemap');
-  }
+    });
 
   // Generate sitemap XML
   const sitemap = generateSitemapXml(routes);
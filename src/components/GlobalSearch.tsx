@@ -196,6 +196,7 @@ export function GlobalSearch() {
             <button
               key={type}
               onClick={() => handleTypeFilter(type)}
+              data-testid={`search-filter-type-${type}`}
               className={`px-3 py-1 rounded-full text-sm font-medium transition ${
                 activeFilters.type === type
                   ? 'bg-accent text-accent-foreground'
@@ -216,6 +217,7 @@ export function GlobalSearch() {
                 <button
                   key={tag}
                   onClick={() => handleTagToggle(tag)}
+                  data-testid={`search-filter-tag-${tag}`}
                   className={`flex items-center gap-1 px-3 py-1 rounded-full text-xs font-medium transition ${
                     activeFilters.tags.includes(tag)
                       ? 'bg-blue-600 text-white'
@@ -233,7 +235,7 @@ export function GlobalSearch() {
 
         {/* Active Filters Display */}
         {(activeFilters.type || activeFilters.tags.length > 0) && (
-          <div className="flex items-center gap-2 flex-wrap pt-2">
+          <div className="flex items-center gap-2 flex-wrap pt-2" data-testid="search-active-filters">
             <span className="text-xs text-muted-foreground">Active:</span>
             {activeFilters.type && (
               <button
@@ -260,7 +262,7 @@ export function GlobalSearch() {
 
       {/* Error Message */}
       {error && (
-        <Card className="bg-red-500/10 border-red-500/20">
+        <Card className="bg-red-500/10 border-red-500/20" data-testid="search-error">
           <CardContent className="pt-6">
             <p className="text-red-600 dark:text-red-400">{error}</p>
           </CardContent>